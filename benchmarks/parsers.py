@@ -0,0 +1,513 @@
+"""
+Offline microbenchmarks of the HTML parsers over the captured fixtures.
+
+Every parser is timed on the pages it parses in production:
+  - OddsParser.parse_market_odds, OddsParser.parse_bookmaker_rows, the passive submarket row
+    parser (parse_visible_submarkets) and the match event header parser, once per parser backend
+    (OH_PARSER_BACKEND), on match pages;
+  - OddsParser.parse_odds_history_modal on odds history modals;
+  - the listing row parser behind BaseScraper.extract_match_rows (_parse_match_rows) on listings;
+  - parse_top_predictions on the Top Predictions page and parse_user_profile on profile pages.
+
+Pages come from three places:
+  1. the pages committed under tests/data (SAMPLE_PAGES): a saved Top Predictions page, and
+     hand-written synthetic samples of a user profile, a league listing, 1X2 / Over/Under /
+     Correct Score match pages and an odds history modal. The synthetic samples are 2-27 KB
+     where real pages are several MB, so their ops/sec overstate real parser throughput; they
+     are there so that every parser has an input with rows, and a run fails if one parses none;
+  2. the HTML documents recorded in the HARs under tests/integration/fixtures. These are the
+     server-rendered shells (rows, odds tables and modals are rendered client-side), so they
+     measure the cost of parsing a full document rather than of extracting its data;
+  3. pages captured from the HARs: `--capture` replays each HAR once in Chromium (offline) and
+     saves the rendered page, plus a few odds history modals per match page, under
+     benchmarks/pages/. Later runs read them from there, without a browser. These are the
+     reference inputs: only they are compared with an earlier run.
+
+For each (parser, page) the runner reports ops/sec and mean time over at least --min-time
+seconds, the peak memory of one call (tracemalloc) and the number of items parsed. Results are
+written as JSON (benchmarks/results/ by default); `--compare` prints the change on the captured
+pages against an earlier result file. The exit status is 1 when a parser has no input page,
+parses no item from any rendered page, returns different data with each parser backend, or
+(with --compare) slowed down by more than --threshold on a captured page, or there is none.
+
+Usage:
+    uv run python benchmarks/parsers.py
+    uv run python benchmarks/parsers.py --capture
+    uv run python benchmarks/parsers.py --only parse_market_odds --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import gc
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = PROJECT_ROOT / "tests" / "integration" / "fixtures"
+DATA_DIR = PROJECT_ROOT / "tests" / "data"
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PAGES_DIR = BENCHMARKS_DIR / "pages"
+RESULTS_DIR = BENCHMARKS_DIR / "results"
+PAGES_INDEX = "index.json"
+
+from oddsharvester.core.base_scraper import _parse_event_header_html, _parse_match_rows  # noqa: E402
+from oddsharvester.core.community.top_predictions_parser import parse_top_predictions  # noqa: E402
+from oddsharvester.core.community.user_profile_parser import parse_user_profile  # noqa: E402
+from oddsharvester.core.market_extraction import OddsParser  # noqa: E402
+from oddsharvester.core.market_extraction.submarket_extractor import parse_visible_submarkets  # noqa: E402
+from oddsharvester.core.parser_backend import PARSER_BACKENDS  # noqa: E402
+from oddsharvester.utils.constants import ODDSPORTAL_BASE_URL  # noqa: E402
+
+MODALS_PER_MATCH = 5
+MATCH_URL = f"{ODDSPORTAL_BASE_URL}/football/england/premier-league/arsenal-chelsea-WbDmMwm1/"
+
+
+@dataclass(frozen=True)
+class BenchPage:
+    """
+    An HTML input.
+
+    `kind` is "document" or "odds_history_modal"; `match` marks match pages, and `market` names
+    the main market a match page shows (the one its submarket list belongs to). `synthetic`
+    marks the hand-written samples and `captured` the pages saved by `--capture`.
+    """
+
+    name: str
+    url: str
+    html: str
+    rendered: bool
+    match: bool
+    kind: str = "document"
+    market: str = "1X2"
+    synthetic: bool = False
+    captured: bool = False
+
+
+# (file under tests/data, page URL, match page, kind, main market, synthetic)
+SAMPLE_PAGES = [
+    ("community/top_predictions_football.html", f"{ODDSPORTAL_BASE_URL}/predictions/", False, "document", None, False),
+    ("community/user_profile_public.html", f"{ODDSPORTAL_BASE_URL}/profile/BLAPRO/", False, "document", None, True),
+    (
+        "listing/league_listing.html",
+        f"{ODDSPORTAL_BASE_URL}/football/england/premier-league/",
+        False,
+        "document",
+        None,
+        True,
+    ),
+    ("match/match_1x2.html", MATCH_URL, True, "document", "1X2", True),
+    ("match/match_over_under.html", f"{MATCH_URL}#over-under;2", True, "document", "Over/Under", True),
+    ("match/match_correct_score.html", f"{MATCH_URL}#cs;2", True, "document", "Correct Score", True),
+    ("match/odds_history_modal.html", MATCH_URL, True, "odds_history_modal", None, True),
+]
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """
+    A parser call, which pages it runs on, and how many items a result holds.
+
+    Cases run once per parser backend share a `name` of the form "parser[backend]"; their results
+    on a page must be identical.
+    """
+
+    name: str
+    applies: Callable[[BenchPage], bool]
+    run: Callable[[BenchPage], Any]
+    count: Callable[[Any], int] = len
+
+
+def _is_match_document(page: BenchPage) -> bool:
+    return page.kind == "document" and page.match
+
+
+def _url_path(page: BenchPage) -> str:
+    return urlsplit(page.url).path
+
+
+def _is_listing(page: BenchPage) -> bool:
+    path = _url_path(page)
+    return page.kind == "document" and not page.match and not re.search(r"/(predictions|profile|set-time-zone)/", path)
+
+
+def build_cases() -> list[BenchCase]:
+    cases = []
+    for backend in PARSER_BACKENDS:
+        parser = OddsParser(backend)
+        cases.append(
+            BenchCase(
+                f"parse_market_odds[{backend}]",
+                lambda page: _is_match_document(page) and page.market == "1X2",
+                lambda page, parser=parser: parser.parse_market_odds(page.html, "FullTime", ["1", "X", "2"]),
+            )
+        )
+        cases.append(
+            BenchCase(
+                f"parse_bookmaker_rows[{backend}]",
+                _is_match_document,
+                lambda page, parser=parser: parser.parse_bookmaker_rows(page.html),
+            )
+        )
+        cases.append(
+            BenchCase(
+                f"parse_visible_submarkets[{backend}]",
+                lambda page: _is_match_document(page) and page.market != "1X2",
+                lambda page, backend=backend: parse_visible_submarkets(
+                    page.html, page.market, "FullTime", None, backend
+                ),
+            )
+        )
+        cases.append(
+            BenchCase(
+                f"parse_event_header[{backend}]",
+                _is_match_document,
+                lambda page, backend=backend: _parse_event_header_html(page.html, UTC, backend),
+                lambda result: int("error" not in result),
+            )
+        )
+    history_parser = OddsParser()
+    cases += [
+        BenchCase(
+            "parse_odds_history_modal",
+            lambda page: page.kind == "odds_history_modal",
+            lambda page: history_parser.parse_odds_history_modal(page.html),
+            lambda result: len(result.get("odds_history", [])),
+        ),
+        BenchCase(
+            "extract_match_rows",
+            _is_listing,
+            lambda page: _parse_match_rows(
+                page.html, ODDSPORTAL_BASE_URL, None, False, True, "UTC", UTC, False, False, None
+            )["rows"],
+        ),
+        BenchCase(
+            "parse_top_predictions",
+            lambda page: page.kind == "document" and "/predictions/" in _url_path(page),
+            lambda page: parse_top_predictions(page.html, "UTC"),
+        ),
+        BenchCase(
+            "parse_user_profile",
+            lambda page: page.kind == "document" and "/profile/" in _url_path(page),
+            lambda page: parse_user_profile(page.html, "UTC"),
+            lambda result: len(result["statistics"]) + len(result["predictions"]),
+        ),
+    ]
+    return cases
+
+
+def sample_pages() -> list[BenchPage]:
+    """The pages committed under tests/data (mostly hand-written synthetic samples)."""
+    return [
+        BenchPage(
+            name=f"data/{file_name}{' (synthetic)' if synthetic else ''}",
+            url=url,
+            html=(DATA_DIR / file_name).read_text(encoding="utf-8"),
+            rendered=True,
+            match=match,
+            kind=kind,
+            market=market or "1X2",
+            synthetic=synthetic,
+        )
+        for file_name, url, match, kind, market, synthetic in SAMPLE_PAGES
+    ]
+
+
+def _fixture_hars() -> list[Path]:
+    return sorted(FIXTURES_DIR.rglob("*.har"))
+
+
+def _is_match_har(har_path: Path) -> bool:
+    return (har_path.parent / "metadata.json").exists()
+
+
+def _html_documents(har_path: Path) -> list[tuple[str, str]]:
+    """(url, body) of every non-empty HTML response recorded in a HAR."""
+    documents = []
+    for entry in json.loads(har_path.read_text(encoding="utf-8"))["log"]["entries"]:
+        content = entry["response"].get("content", {})
+        if "html" in content.get("mimeType", "") and content.get("text") and content.get("encoding") != "base64":
+            documents.append((entry["request"]["url"], content["text"]))
+    return documents
+
+
+def har_pages() -> list[BenchPage]:
+    """The HTML documents recorded in the fixture HARs (server-rendered)."""
+    pages = []
+    for har_path in _fixture_hars():
+        for url, html in _html_documents(har_path):
+            pages.append(
+                BenchPage(
+                    name=f"{har_path.relative_to(FIXTURES_DIR)} {urlsplit(url).path}",
+                    url=url,
+                    html=html,
+                    rendered=False,
+                    match=_is_match_har(har_path),
+                )
+            )
+    return pages
+
+
+def rendered_pages(pages_dir: Path) -> list[BenchPage]:
+    """Pages saved by `--capture`, the reference inputs of `--compare`."""
+    index_path = pages_dir / PAGES_INDEX
+    if not index_path.exists():
+        return []
+    pages = []
+    for item in json.loads(index_path.read_text(encoding="utf-8")):
+        html_path = pages_dir / item["file"]
+        if html_path.exists():
+            pages.append(
+                BenchPage(
+                    name=f"{item['har']} {item['file']} (rendered)",
+                    url=item["url"],
+                    html=html_path.read_text(encoding="utf-8"),
+                    rendered=True,
+                    match=item["match"],
+                    kind=item["kind"],
+                    captured=True,
+                )
+            )
+    return pages
+
+
+async def capture(pages_dir: Path) -> int:
+    """Replay every fixture HAR in Chromium and save the rendered pages (and match page modals)."""
+    from oddsharvester.core.browser.readiness import PageReadiness
+    from oddsharvester.core.market_extraction import OddsHistoryExtractor
+    from oddsharvester.core.playwright_manager import HAR_REPLAY_ENV_VAR, PlaywrightManager
+    from oddsharvester.utils.constants import DYNAMIC_CONTENT_WAIT_MS
+
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    index = []
+    for har_path in _fixture_hars():
+        documents = _html_documents(har_path)
+        if not documents:
+            continue
+        url = documents[0][0]
+        match = _is_match_har(har_path)
+        if match:
+            url = json.loads((har_path.parent / "metadata.json").read_text())["match_url"]
+        stem = str(har_path.relative_to(FIXTURES_DIR).with_suffix("")).replace(os.sep, "__")
+
+        os.environ[HAR_REPLAY_ENV_VAR] = str(har_path)
+        manager = PlaywrightManager()
+        try:
+            await manager.initialize(headless=True, timezone_id="UTC")
+            page = manager.page
+            await page.goto(url, wait_until="domcontentloaded")
+            readiness = PageReadiness()
+            if match:
+                await readiness.odds_rendered(page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
+            await readiness.settled(page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
+            html = await page.content()
+            files = [(f"{stem}.html", "document", html)]
+            if match:
+                names = [row["bookmaker_name"] for row in OddsParser().parse_bookmaker_rows(html)][:MODALS_PER_MATCH]
+                modals = await OddsHistoryExtractor().extract_odds_history_for_bookmakers(page, names)
+                for number, modal in enumerate(modal for bookmaker in names for modal in modals.get(bookmaker, [])):
+                    files.append((f"{stem}.modal{number}.html", "odds_history_modal", modal))
+        except Exception as e:
+            print(f"  {har_path.relative_to(FIXTURES_DIR)}: capture failed ({e})")
+            continue
+        finally:
+            await manager.cleanup()
+            os.environ.pop(HAR_REPLAY_ENV_VAR, None)
+
+        har_name = str(har_path.relative_to(FIXTURES_DIR))
+        for file_name, kind, content in files:
+            (pages_dir / file_name).write_text(content, encoding="utf-8")
+            index.append({"file": file_name, "har": har_name, "url": url, "match": match, "kind": kind})
+        print(f"  {har_path.relative_to(FIXTURES_DIR)}: saved {len(files)} pages")
+
+    (pages_dir / PAGES_INDEX).write_text(json.dumps(index, indent=2), encoding="utf-8")
+    print(f"{len(index)} rendered pages saved under {pages_dir}")
+    return 0 if index else 1
+
+
+def measure(case: BenchCase, page: BenchPage, min_time: float, min_rounds: int) -> tuple[dict[str, Any], Any]:
+    """
+    ops/sec and mean time of one parser call over at least `min_time` s, and the peak memory of one call.
+
+    Also returns what the parser returned.
+    """
+    result = case.run(page)  # warm-up (imports, regex compilation)
+
+    gc.collect()
+    tracemalloc.start()
+    case.run(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rounds = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while rounds < min_rounds or elapsed < min_time:
+        case.run(page)
+        rounds += 1
+        elapsed = time.perf_counter() - started
+    stats = {
+        "items": case.count(result),
+        "rounds": rounds,
+        "ops_per_sec": round(rounds / elapsed, 2),
+        "mean_ms": round(elapsed / rounds * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+    return stats, result
+
+
+def run_benchmarks(
+    pages: list[BenchPage], cases: list[BenchCase], args: argparse.Namespace
+) -> tuple[list[dict], list[str]]:
+    """Time every selected case on its pages; also returns the problems that make the run invalid."""
+    results = []
+    problems = []
+    # (parser, page name) -> {backend: serialized result}, to check that the backends agree.
+    outputs: dict[tuple[str, str], dict[str, str]] = {}
+    for case in cases:
+        if args.only and not any(case.name.startswith(prefix) for prefix in args.only):
+            continue
+        case_pages = [page for page in pages if case.applies(page)]
+        if not case_pages:
+            problems.append(f"{case.name}: no input page")
+            continue
+        for page in case_pages:
+            stats, result = measure(case, page, args.min_time, args.min_rounds)
+            results.append(
+                {
+                    "case": case.name,
+                    "page": page.name,
+                    "rendered": page.rendered,
+                    "synthetic": page.synthetic,
+                    "captured": page.captured,
+                    "bytes": len(page.html),
+                    **stats,
+                }
+            )
+            print(
+                f"{case.name:<36} {stats['ops_per_sec']:>10.1f} ops/s {stats['mean_ms']:>9.3f} ms "
+                f"{stats['peak_kib']:>9.1f} KiB peak  {stats['items']:>4} items  {page.name}"
+            )
+            # Server-rendered shells hold no rows; a rendered page that yields none means the parser broke.
+            if page.rendered and not stats["items"]:
+                problems.append(f"{case.name}: parsed 0 items from rendered page {page.name}")
+            parser_name, _, backend = case.name.partition("[")
+            if backend:
+                serialized = json.dumps(result, sort_keys=True, default=str)
+                outputs.setdefault((parser_name, page.name), {})[backend.rstrip("]")] = serialized
+    for (parser_name, page_name), by_backend in outputs.items():
+        if len(set(by_backend.values())) > 1:
+            problems.append(f"{parser_name}: backends {', '.join(by_backend)} disagree on {page_name}")
+    return results, problems
+
+
+def compare(results: list[dict], baseline_path: Path, threshold: float) -> bool:
+    """
+    Print the ops/sec change per (case, page) against a previous run; True if none regressed.
+
+    Only the pages saved by `--capture` are compared: the synthetic samples are too small to time
+    real parsing and the server-rendered shells hold no rows.
+    """
+    baseline = {
+        (item["case"], item["page"]): item
+        for item in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+        if item.get("captured")
+    }
+    print(f"\nCompared with {baseline_path}:")
+    compared = 0
+    ok = True
+    for item in results:
+        previous = baseline.get((item["case"], item["page"])) if item["captured"] else None
+        if previous is None:
+            continue
+        compared += 1
+        change = item["ops_per_sec"] / previous["ops_per_sec"] - 1
+        memory_change = item["peak_kib"] - previous["peak_kib"]
+        regressed = change < -threshold
+        ok = ok and not regressed
+        print(
+            f"{'REGRESSION ' if regressed else '           '}{item['case']:<36} {change:>+8.1%} ops/s "
+            f"{memory_change:>+9.1f} KiB peak  {item['page']}"
+        )
+    if not compared:
+        print("  no captured page in both runs; run --capture first, then time a new baseline")
+        return False
+    return ok
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmark the HTML parsers on the captured fixtures.")
+    parser.add_argument("--capture", action="store_true", help="Replay the HARs and save rendered pages, then exit.")
+    parser.add_argument("--pages-dir", type=Path, default=PAGES_DIR, help="Where rendered pages are saved and read.")
+    parser.add_argument("--only", nargs="*", default=[], help="Run only the parsers whose name starts with these.")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to time each parser per page.")
+    parser.add_argument("--min-rounds", type=int, default=5, help="Calls to time each parser per page, at least.")
+    parser.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/).")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results file to compare with.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown (fraction) reported as a regression.")
+    args = parser.parse_args()
+
+    if args.capture:
+        return asyncio.run(capture(args.pages_dir))
+
+    # The parsers warn on every page that lacks their rows (e.g. the server-rendered shells).
+    logging.disable(logging.WARNING)
+    pages = sample_pages() + har_pages() + rendered_pages(args.pages_dir)
+    results, problems = run_benchmarks(pages, build_cases(), args)
+    started_at = datetime.now(UTC)
+    output = args.output or RESULTS_DIR / f"parsers-{started_at:%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "meta": {
+                    "created_at": started_at.isoformat(timespec="seconds"),
+                    "git_revision": _git_revision(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "min_time": args.min_time,
+                },
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\nResults written to {output}")
+
+    if problems:
+        print(f"\nERROR: {len(problems)} benchmark(s) did not time real parsing:")
+        for problem in problems:
+            print(f"  - {problem}")
+    if args.compare and not compare(results, args.compare, args.threshold):
+        return 1
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
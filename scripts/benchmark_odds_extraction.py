@@ -0,0 +1,125 @@
+"""
+Bookmaker odds table extraction cost against the recorded HAR fixtures.
+
+For each HAR under tests/integration/fixtures/<sport>/<league>/<match-id>/ (next to a
+metadata.json), the match page is replayed offline and its bookmaker table is read twice:
+  1. html: page.content() over CDP, then OddsParser.parse_bookmaker_rows (BeautifulSoup);
+  2. in-page: BookmakerTableExtractor.read_rows (one page.evaluate returning compact JSON).
+
+Prints bytes transferred, transfer and parse time (median of --repeat runs) for each mode,
+and whether both modes returned the same rows.
+
+Usage:
+    uv run python scripts/benchmark_odds_extraction.py
+    uv run python scripts/benchmark_odds_extraction.py --match-id leicester-brentford-xQ77QTN0 --repeat 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = PROJECT_ROOT / "tests" / "integration" / "fixtures"
+
+from oddsharvester.core.browser.readiness import PageReadiness  # noqa: E402
+from oddsharvester.core.market_extraction import BookmakerTableExtractor, OddsParser  # noqa: E402
+from oddsharvester.core.playwright_manager import HAR_REPLAY_ENV_VAR, PlaywrightManager  # noqa: E402
+from oddsharvester.utils.constants import DYNAMIC_CONTENT_WAIT_MS  # noqa: E402
+
+
+def discover_hars(match_filter: str | None) -> list[tuple[Path, dict]]:
+    """(HAR path, match metadata) for every HAR that sits next to a metadata.json."""
+    hars = []
+    for metadata_path in sorted(FIXTURES_DIR.glob("*/*/*/metadata.json")):
+        match_dir = metadata_path.parent
+        if match_filter and match_dir.name != match_filter:
+            continue
+        metadata = json.loads(metadata_path.read_text())
+        hars.extend((har_path, metadata) for har_path in sorted(match_dir.glob("*.har")))
+    return hars
+
+
+async def benchmark_har(har_path: Path, metadata: dict, repeat: int) -> dict:
+    os.environ[HAR_REPLAY_ENV_VAR] = str(har_path)
+    manager = PlaywrightManager()
+    await manager.initialize(headless=True, timezone_id="UTC")
+    try:
+        page = manager.page
+        await page.goto(metadata["match_url"], wait_until="domcontentloaded")
+        await PageReadiness().odds_rendered(page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
+        parser = OddsParser()
+        extractor = BookmakerTableExtractor(parser)
+
+        html_runs, in_page_runs = [], []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            html = await page.content()
+            transferred = time.perf_counter()
+            html_rows = parser.parse_bookmaker_rows(html)
+            html_runs.append((len(html.encode()), transferred - started, time.perf_counter() - transferred))
+
+            started = time.perf_counter()
+            result = await extractor.read_rows(page)
+            in_page_rows = result["rows"] if result else None
+            in_page_runs.append((len(json.dumps(result).encode()), time.perf_counter() - started, 0.0))
+
+        return {
+            "har": str(har_path.relative_to(FIXTURES_DIR)),
+            "rows": len(html_rows),
+            "html": _summary(html_runs),
+            "in_page": _summary(in_page_runs),
+            "identical": in_page_rows == html_rows,
+        }
+    finally:
+        await manager.cleanup()
+        os.environ.pop(HAR_REPLAY_ENV_VAR, None)
+
+
+def _summary(runs: list[tuple[int, float, float]]) -> dict:
+    return {
+        "bytes": runs[-1][0],
+        "transfer_ms": round(statistics.median(run[1] for run in runs) * 1000, 1),
+        "parse_ms": round(statistics.median(run[2] for run in runs) * 1000, 1),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    hars = discover_hars(args.match_id)
+    if not hars:
+        print("No HAR fixtures found. Capture them with scripts/capture_all_hars.py.")
+        return 1
+
+    results = []
+    for har_path, metadata in hars:
+        print(f"\n=== {har_path.relative_to(FIXTURES_DIR)} ===")
+        result = await benchmark_har(har_path, metadata, args.repeat)
+        results.append(result)
+        for mode in ("html", "in_page"):
+            stats = result[mode]
+            print(
+                f"  {mode:<8} {stats['bytes']:>10,} bytes  transfer {stats['transfer_ms']:>7.1f} ms  "
+                f"parse {stats['parse_ms']:>7.1f} ms"
+            )
+        print(f"  {result['rows']} bookmaker rows, identical: {result['identical']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark odds table extraction against the HAR fixtures.")
+    parser.add_argument("--match-id", default=None, help="Limit to one match directory.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode (the median is reported).")
+    parser.add_argument("--output", default=None, help="Also write the results as JSON to this path.")
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Odds history capture throughput against the recorded HAR fixtures.
+
+For each HAR under tests/integration/fixtures/<sport>/<league>/<match-id>/ (next to a
+metadata.json), the match page is replayed offline and the odds history of every listed
+bookmaker is captured twice:
+  1. batched: OddsHistoryExtractor.extract_odds_history_for_bookmakers (one in-page pass);
+  2. sequential: extract_odds_history_for_bookmaker per bookmaker (real hovers + fixed waits).
+
+Prints modals captured, elapsed time and modals/s for each mode, and whether both modes
+returned the same modals. The sequential pass takes minutes per match; skip it with
+--batched-only.
+
+Usage:
+    uv run python scripts/benchmark_odds_history.py
+    uv run python scripts/benchmark_odds_history.py --match-id leicester-brentford-xQ77QTN0
+    uv run python scripts/benchmark_odds_history.py --max-bookmakers 5 --batched-only
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = PROJECT_ROOT / "tests" / "integration" / "fixtures"
+
+from oddsharvester.core.browser.readiness import PageReadiness  # noqa: E402
+from oddsharvester.core.market_extraction import OddsHistoryExtractor  # noqa: E402
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors  # noqa: E402
+from oddsharvester.core.playwright_manager import HAR_REPLAY_ENV_VAR, PlaywrightManager  # noqa: E402
+from oddsharvester.utils.constants import DYNAMIC_CONTENT_WAIT_MS  # noqa: E402
+
+
+def discover_hars(match_filter: str | None) -> list[tuple[Path, dict]]:
+    """(HAR path, match metadata) for every HAR that sits next to a metadata.json."""
+    hars = []
+    for metadata_path in sorted(FIXTURES_DIR.glob("*/*/*/metadata.json")):
+        match_dir = metadata_path.parent
+        if match_filter and match_dir.name != match_filter:
+            continue
+        metadata = json.loads(metadata_path.read_text())
+        hars.extend((har_path, metadata) for har_path in sorted(match_dir.glob("*.har")))
+    return hars
+
+
+async def benchmark_har(har_path: Path, metadata: dict, max_bookmakers: int | None, batched_only: bool) -> dict:
+    os.environ[HAR_REPLAY_ENV_VAR] = str(har_path)
+    manager = PlaywrightManager()
+    await manager.initialize(headless=True, timezone_id="UTC")
+    try:
+        page = manager.page
+        await page.goto(metadata["match_url"], wait_until="domcontentloaded")
+        await PageReadiness().odds_rendered(page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
+        titles = await page.eval_on_selector_all(
+            f"{OddsPortalSelectors.BOOKMAKER_ROW_CSS} {OddsPortalSelectors.BOOKMAKER_LOGO_CSS}",
+            "logos => logos.map(logo => logo.getAttribute('title')).filter(Boolean)",
+        )
+        bookmakers = list(dict.fromkeys(titles))[:max_bookmakers]
+        extractor = OddsHistoryExtractor()
+
+        started = time.perf_counter()
+        batched = await extractor.extract_odds_history_for_bookmakers(page, bookmakers)
+        result = {"har": str(har_path.relative_to(FIXTURES_DIR)), "bookmakers": len(bookmakers)}
+        result["batched"] = _throughput(batched, time.perf_counter() - started)
+
+        if not batched_only:
+            started = time.perf_counter()
+            sequential = {name: await extractor.extract_odds_history_for_bookmaker(page, name) for name in bookmakers}
+            result["sequential"] = _throughput(sequential, time.perf_counter() - started)
+            result["identical"] = batched == sequential
+        return result
+    finally:
+        await manager.cleanup()
+        os.environ.pop(HAR_REPLAY_ENV_VAR, None)
+
+
+def _throughput(modals_by_bookmaker: dict[str, list[str]], elapsed_s: float) -> dict:
+    modals = sum(len(modals) for modals in modals_by_bookmaker.values())
+    return {
+        "modals": modals,
+        "elapsed_s": round(elapsed_s, 2),
+        "modals_per_s": round(modals / elapsed_s, 2) if elapsed_s else 0.0,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    hars = discover_hars(args.match_id)
+    if not hars:
+        print("No HAR fixtures found. Capture them with scripts/capture_all_hars.py.")
+        return 1
+
+    results = []
+    for har_path, metadata in hars:
+        print(f"\n=== {har_path.relative_to(FIXTURES_DIR)} ===")
+        result = await benchmark_har(har_path, metadata, args.max_bookmakers, args.batched_only)
+        results.append(result)
+        for mode in ("batched", "sequential"):
+            if mode in result:
+                stats = result[mode]
+                print(
+                    f"  {mode:<10} {stats['modals']:>4} modals in {stats['elapsed_s']:>7.2f} s "
+                    f"({stats['modals_per_s']:.2f} modals/s)"
+                )
+        if "identical" in result:
+            print(f"  identical modals: {result['identical']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark odds history capture against the HAR fixtures.")
+    parser.add_argument("--match-id", default=None, help="Limit to one match directory.")
+    parser.add_argument("--max-bookmakers", type=int, default=None, help="Only capture the first N bookmakers.")
+    parser.add_argument("--batched-only", action="store_true", help="Skip the (slow) sequential baseline.")
+    parser.add_argument("--output", default=None, help="Also write the results as JSON to this path.")
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import logging
 import click
 
 from oddsharvester import __version__
-from oddsharvester.cli.commands import community, historic, live, upcoming
+from oddsharvester.cli.commands import community, historic, live, upcoming, worker
 from oddsharvester.utils.setup_logging import setup_logger
 
 
@@ -26,6 +26,8 @@ def cli(ctx, verbose, quiet):
         oddsharvester historic -s football -l england-premier-league --season 2024-2025 -m 1x2
 
         oddsharvester community -s football -o top_predictions.json
+
+        oddsharvester worker --queue jobs.db -o worker-1.json
     """
     # Configure logging based on verbosity
     if quiet:
@@ -48,6 +50,7 @@ cli.add_command(upcoming)
 cli.add_command(historic)
 cli.add_command(community)
 cli.add_command(live)
+cli.add_command(worker)
 
 
 def main():
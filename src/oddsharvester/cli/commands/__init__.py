@@ -4,5 +4,6 @@ from oddsharvester.cli.commands.community import community
 from oddsharvester.cli.commands.historic import historic
 from oddsharvester.cli.commands.live import live
 from oddsharvester.cli.commands.upcoming import upcoming
+from oddsharvester.cli.commands.worker import worker
 
-__all__ = ["community", "historic", "live", "upcoming"]
+__all__ = ["community", "historic", "live", "upcoming", "worker"]
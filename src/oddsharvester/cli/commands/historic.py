@@ -6,12 +6,16 @@ import sys
 
 import click
 
-from oddsharvester.cli.options import common_options, merged_match_links
+from oddsharvester.cli.commands.worker import enqueue_run
+from oddsharvester.cli.options import common_options, merged_match_links, sharding_options, validate_sharding
 from oddsharvester.cli.types import COMMA_LIST
 from oddsharvester.cli.validators import validate_max_pages, validate_seasons
 from oddsharvester.core.scrape_result import ErrorType
 from oddsharvester.core.scraper_app import run_scraper
-from oddsharvester.storage.storage_manager import store_data
+from oddsharvester.core.sharding import run_sharded
+from oddsharvester.storage.storage_manager import open_record_sink, store_data
+from oddsharvester.utils.constants import COMBO_CONCURRENCY
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 from oddsharvester.utils.sport_market_constants import Sport
 
 logger = logging.getLogger(__name__)
@@ -45,6 +49,7 @@ def _format_combo_summary(combo_stats: list[dict], links_only: bool) -> str:
 
 @click.command("historic")
 @common_options
+@sharding_options
 @click.option(
     "--season",
     "seasons",
@@ -77,37 +82,70 @@ def historic(ctx, **kwargs):
     if links_only and local_kickoff:
         raise click.UsageError("--links-only cannot be combined with --local-kickoff (no match pages are visited).")
 
-    try:
-        scraped_data = asyncio.run(
-            run_scraper(
-                command="scrape_historic",
-                match_links=match_links,
-                sport=sport_value,
-                date=None,
-                leagues=kwargs.get("leagues"),
-                seasons=seasons,
-                markets=kwargs.get("markets"),
-                max_pages=kwargs.get("max_pages"),
-                proxy_url=kwargs.get("proxy_url"),
-                proxy_user=kwargs.get("proxy_user"),
-                proxy_pass=kwargs.get("proxy_pass"),
-                browser_user_agent=kwargs.get("browser_user_agent"),
-                browser_locale_timezone=kwargs.get("browser_locale_timezone"),
-                browser_timezone_id=kwargs.get("browser_timezone_id"),
-                base_url=kwargs.get("base_url"),
-                target_bookmaker=kwargs.get("target_bookmaker"),
-                scrape_odds_history=kwargs.get("scrape_odds_history", False),
-                headless=kwargs.get("headless", False),
-                preview_submarkets_only=kwargs.get("preview_submarkets_only", False),
-                bookies_filter=bookies_filter.value if bookies_filter else "all",
-                period=kwargs.get("period"),
-                request_delay=kwargs.get("request_delay", 1.0),
-                concurrency_tasks=kwargs.get("concurrency_tasks", 3),
-                links_only=links_only,
-                local_kickoff=local_kickoff,
-            )
+    workers, shard = validate_sharding(kwargs, links_only)
+
+    run_kwargs = {
+        "command": "scrape_historic",
+        "match_links": match_links,
+        "sport": sport_value,
+        "date": None,
+        "leagues": kwargs.get("leagues"),
+        "seasons": seasons,
+        "markets": kwargs.get("markets"),
+        "max_pages": kwargs.get("max_pages"),
+        "proxy_url": kwargs.get("proxy_url"),
+        "proxy_user": kwargs.get("proxy_user"),
+        "proxy_pass": kwargs.get("proxy_pass"),
+        "browser_user_agent": kwargs.get("browser_user_agent"),
+        "browser_locale_timezone": kwargs.get("browser_locale_timezone"),
+        "browser_timezone_id": kwargs.get("browser_timezone_id"),
+        "base_url": kwargs.get("base_url"),
+        "target_bookmaker": kwargs.get("target_bookmaker"),
+        "scrape_odds_history": kwargs.get("scrape_odds_history", False),
+        "headless": kwargs.get("headless", False),
+        "block_resources": kwargs.get("block_resources", ResourceBlockProfile.OFF.value),
+        "preview_submarkets_only": kwargs.get("preview_submarkets_only", False),
+        "bookies_filter": bookies_filter.value if bookies_filter else "all",
+        "period": kwargs.get("period"),
+        "request_delay": kwargs.get("request_delay", 1.0),
+        "concurrency_tasks": kwargs.get("concurrency_tasks", 3),
+        "adaptive_concurrency": kwargs.get("adaptive_concurrency", False),
+        "combo_concurrency": kwargs.get("combo_concurrency", COMBO_CONCURRENCY),
+        "links_only": links_only,
+        "local_kickoff": local_kickoff,
+    }
+
+    if kwargs.get("enqueue_path"):
+        enqueue_run(kwargs["enqueue_path"], run_kwargs)
+        return
+
+    # Match records are written as they are scraped rather than held until the run ends.
+    # Links-only rows are tiny and come back in one piece, so they keep the buffered path.
+    record_sink = None
+    if not links_only:
+        record_sink = open_record_sink(
+            storage_type=storage.value if storage else "local",
+            storage_format=storage_format.value if storage_format else "json",
+            file_path=kwargs.get("file_path"),
+            append=kwargs.get("append", False),
         )
 
+    try:
+        try:
+            if workers > 1 or shard is not None:
+                scraped_data = run_sharded(
+                    workers=workers,
+                    run_kwargs=run_kwargs,
+                    shard=shard,
+                    record_sink=record_sink.write if record_sink else None,
+                )
+            else:
+                scraped_data = asyncio.run(
+                    run_scraper(**run_kwargs, record_sink=record_sink.write if record_sink else None)
+                )
+        finally:
+            streamed = record_sink.close() if record_sink else 0
+
         if scraped_data:
             if scraped_data.success:
                 store_data(
@@ -115,8 +153,9 @@ def historic(ctx, **kwargs):
                     data=scraped_data.success,
                     storage_format=storage_format.value if storage_format else "json",
                     file_path=kwargs.get("file_path"),
-                    append=kwargs.get("append", False),
+                    append=kwargs.get("append", False) or streamed > 0,
                 )
+            if scraped_data.success or streamed:
                 if links_only:
                     click.echo(
                         f"Collected {scraped_data.stats.successful} match links "
@@ -133,7 +172,7 @@ def historic(ctx, **kwargs):
             if scraped_data.failed:
                 click.echo(f"Failed URLs: {[f.url for f in scraped_data.failed]}", err=True)
 
-            if not scraped_data.success:
+            if not scraped_data.success and not streamed:
                 logger.error("Scraper did not return valid data.")
                 sys.exit(1)
 
@@ -9,6 +9,7 @@ import click
 from oddsharvester.cli.options import common_options, merged_match_links
 from oddsharvester.core.scraper_app import run_scraper
 from oddsharvester.storage.storage_manager import store_data
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 
 logger = logging.getLogger(__name__)
 
@@ -54,11 +55,13 @@ def live(ctx, **kwargs):
                 base_url=kwargs.get("base_url"),
                 target_bookmaker=kwargs.get("target_bookmaker"),
                 headless=kwargs.get("headless", False),
+                block_resources=kwargs.get("block_resources", ResourceBlockProfile.OFF.value),
                 preview_submarkets_only=kwargs.get("preview_submarkets_only", False),
                 local_kickoff=kwargs.get("local_kickoff", False),
                 bookies_filter=bookies_filter.value if bookies_filter else "all",
                 request_delay=kwargs.get("request_delay", 1.0),
                 concurrency_tasks=kwargs.get("concurrency_tasks", 3),
+                adaptive_concurrency=kwargs.get("adaptive_concurrency", False),
                 links_only=links_only,
             )
         )
@@ -6,16 +6,21 @@ import sys
 
 import click
 
-from oddsharvester.cli.options import common_options, merged_match_links
+from oddsharvester.cli.commands.worker import enqueue_run
+from oddsharvester.cli.options import common_options, merged_match_links, sharding_options, validate_sharding
 from oddsharvester.cli.validators import validate_date
 from oddsharvester.core.scraper_app import run_scraper
-from oddsharvester.storage.storage_manager import store_data
+from oddsharvester.core.sharding import run_sharded
+from oddsharvester.storage.storage_manager import open_record_sink, store_data
+from oddsharvester.utils.constants import COMBO_CONCURRENCY
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 
 logger = logging.getLogger(__name__)
 
 
 @click.command("upcoming")
 @common_options
+@sharding_options
 @click.option(
     "--date",
     "-d",
@@ -58,47 +63,81 @@ def upcoming(ctx, **kwargs):
     storage_format = kwargs["storage_format"]
     bookies_filter = kwargs.get("bookies_filter")
 
-    try:
-        scraped_data = asyncio.run(
-            run_scraper(
-                command="scrape_upcoming",
-                match_links=match_links,
-                sport=sport.value if sport else None,
-                date=kwargs.get("date"),
-                leagues=kwargs.get("leagues"),
-                seasons=None,
-                markets=kwargs.get("markets"),
-                max_pages=None,
-                proxy_url=kwargs.get("proxy_url"),
-                proxy_user=kwargs.get("proxy_user"),
-                proxy_pass=kwargs.get("proxy_pass"),
-                browser_user_agent=kwargs.get("browser_user_agent"),
-                browser_locale_timezone=kwargs.get("browser_locale_timezone"),
-                browser_timezone_id=kwargs.get("browser_timezone_id"),
-                base_url=kwargs.get("base_url"),
-                target_bookmaker=kwargs.get("target_bookmaker"),
-                scrape_odds_history=kwargs.get("scrape_odds_history", False),
-                headless=kwargs.get("headless", False),
-                preview_submarkets_only=kwargs.get("preview_submarkets_only", False),
-                bookies_filter=bookies_filter.value if bookies_filter else "all",
-                period=kwargs.get("period"),
-                request_delay=kwargs.get("request_delay", 1.0),
-                concurrency_tasks=kwargs.get("concurrency_tasks", 3),
-                include_started=kwargs.get("include_started", False),
-                kickoff_within_hours=kwargs.get("kickoff_within_hours"),
-                links_only=links_only,
-                local_kickoff=local_kickoff,
-            )
+    workers, shard = validate_sharding(kwargs, links_only)
+
+    run_kwargs = {
+        "command": "scrape_upcoming",
+        "match_links": match_links,
+        "sport": sport.value if sport else None,
+        "date": kwargs.get("date"),
+        "leagues": kwargs.get("leagues"),
+        "seasons": None,
+        "markets": kwargs.get("markets"),
+        "max_pages": None,
+        "proxy_url": kwargs.get("proxy_url"),
+        "proxy_user": kwargs.get("proxy_user"),
+        "proxy_pass": kwargs.get("proxy_pass"),
+        "browser_user_agent": kwargs.get("browser_user_agent"),
+        "browser_locale_timezone": kwargs.get("browser_locale_timezone"),
+        "browser_timezone_id": kwargs.get("browser_timezone_id"),
+        "base_url": kwargs.get("base_url"),
+        "target_bookmaker": kwargs.get("target_bookmaker"),
+        "scrape_odds_history": kwargs.get("scrape_odds_history", False),
+        "headless": kwargs.get("headless", False),
+        "block_resources": kwargs.get("block_resources", ResourceBlockProfile.OFF.value),
+        "preview_submarkets_only": kwargs.get("preview_submarkets_only", False),
+        "bookies_filter": bookies_filter.value if bookies_filter else "all",
+        "period": kwargs.get("period"),
+        "request_delay": kwargs.get("request_delay", 1.0),
+        "concurrency_tasks": kwargs.get("concurrency_tasks", 3),
+        "adaptive_concurrency": kwargs.get("adaptive_concurrency", False),
+        "combo_concurrency": kwargs.get("combo_concurrency", COMBO_CONCURRENCY),
+        "include_started": kwargs.get("include_started", False),
+        "kickoff_within_hours": kwargs.get("kickoff_within_hours"),
+        "links_only": links_only,
+        "local_kickoff": local_kickoff,
+    }
+
+    if kwargs.get("enqueue_path"):
+        enqueue_run(kwargs["enqueue_path"], run_kwargs)
+        return
+
+    # Match records are written as they are scraped rather than held until the run ends.
+    # Links-only rows are tiny and come back in one piece, so they keep the buffered path.
+    record_sink = None
+    if not links_only:
+        record_sink = open_record_sink(
+            storage_type=storage.value if storage else "local",
+            storage_format=storage_format.value if storage_format else "json",
+            file_path=kwargs.get("file_path"),
+            append=kwargs.get("append", False),
         )
 
-        if scraped_data and scraped_data.success:
-            store_data(
-                storage_type=storage.value if storage else "local",
-                data=scraped_data.success,
-                storage_format=storage_format.value if storage_format else "json",
-                file_path=kwargs.get("file_path"),
-                append=kwargs.get("append", False),
-            )
+    try:
+        try:
+            if workers > 1 or shard is not None:
+                scraped_data = run_sharded(
+                    workers=workers,
+                    run_kwargs=run_kwargs,
+                    shard=shard,
+                    record_sink=record_sink.write if record_sink else None,
+                )
+            else:
+                scraped_data = asyncio.run(
+                    run_scraper(**run_kwargs, record_sink=record_sink.write if record_sink else None)
+                )
+        finally:
+            streamed = record_sink.close() if record_sink else 0
+
+        if scraped_data and (scraped_data.success or streamed):
+            if scraped_data.success:
+                store_data(
+                    storage_type=storage.value if storage else "local",
+                    data=scraped_data.success,
+                    storage_format=storage_format.value if storage_format else "json",
+                    file_path=kwargs.get("file_path"),
+                    append=kwargs.get("append", False) or streamed > 0,
+                )
             if links_only:
                 click.echo(
                     f"Collected {scraped_data.stats.successful} match links "
@@ -0,0 +1,230 @@
+"""CLI command for scraping match links from a shared job queue."""
+
+import asyncio
+import logging
+import sys
+
+import click
+
+from oddsharvester.cli.types import STORAGE_FORMAT, STORAGE_TYPE
+from oddsharvester.cli.validators import validate_concurrency, validate_file_path, validate_proxy_url
+from oddsharvester.core.queue_worker import QueueWorker, queue_config
+from oddsharvester.core.scrape_result import ErrorType
+from oddsharvester.core.sharding import collect_match_links
+from oddsharvester.storage.job_queue import JobQueue
+from oddsharvester.storage.storage_manager import open_record_sink, store_data
+from oddsharvester.utils.constants import JOB_QUEUE_BATCH_SIZE, JOB_QUEUE_VISIBILITY_TIMEOUT_S
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_run(queue_path: str, run_kwargs: dict) -> None:
+    """Collect the match links of a historic/upcoming run into a job queue instead of scraping them."""
+    collection = collect_match_links(run_kwargs)
+    if collection is None:
+        logger.error("Scraper did not return valid data.")
+        sys.exit(1)
+
+    queue = JobQueue(queue_path)
+    try:
+        added = queue.enqueue(
+            collection.links,
+            queue_config(run_kwargs),
+            season_by_link=collection.season_by_link if collection.stamp_season else None,
+        )
+        counts = queue.counts()
+    finally:
+        queue.close()
+
+    click.echo(
+        f"Enqueued {added} new job(s) from {len(collection.links)} match links into {queue_path} "
+        f"({counts['pending']} pending, {counts['done']} done). Run 'oddsharvester worker --queue {queue_path}'."
+    )
+
+    listing_failures = [f for f in collection.failed if f.error_type is ErrorType.LISTING_PAGE]
+    if listing_failures:
+        click.echo(
+            f"Incomplete collection: {len(listing_failures)} listing page(s) failed, so an unknown "
+            f"number of matches were never enqueued: {[f.url for f in listing_failures]}",
+            err=True,
+        )
+        sys.exit(1)
+
+
+@click.command("worker")
+@click.option(
+    "--queue",
+    "queue_path",
+    required=True,
+    type=click.Path(dir_okay=False),
+    envvar="OH_QUEUE",
+    help="Job-queue file written by 'historic --enqueue' or 'upcoming --enqueue'.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=JOB_QUEUE_BATCH_SIZE,
+    envvar="OH_BATCH_SIZE",
+    help=f"Jobs claimed at a time (default: {JOB_QUEUE_BATCH_SIZE}).",
+)
+@click.option(
+    "--visibility-timeout",
+    "visibility_timeout_s",
+    type=click.FloatRange(min=1.0),
+    default=JOB_QUEUE_VISIBILITY_TIMEOUT_S,
+    envvar="OH_VISIBILITY_TIMEOUT",
+    help="Seconds a claimed job stays leased without renewal before other workers may reclaim it "
+    f"(default: {JOB_QUEUE_VISIBILITY_TIMEOUT_S:.0f}).",
+)
+@click.option("--max-jobs", type=click.IntRange(min=1), default=None, help="Stop after claiming this many jobs.")
+@click.option(
+    "--wait/--no-wait",
+    default=False,
+    envvar="OH_WAIT",
+    help="Keep polling for new jobs instead of exiting once the queue is drained.",
+)
+@click.option("--worker-id", default=None, help="Lease owner name (default: <hostname>-<pid>).")
+@click.option(
+    "--storage", type=STORAGE_TYPE, default="local", envvar="OH_STORAGE", help="Storage type: local or remote."
+)
+@click.option(
+    "--format",
+    "-f",
+    "storage_format",
+    type=STORAGE_FORMAT,
+    default="json",
+    envvar="OH_FORMAT",
+    help="Output format: json or csv.",
+)
+@click.option(
+    "--output",
+    "-o",
+    "file_path",
+    type=click.Path(),
+    callback=validate_file_path,
+    envvar="OH_FILE_PATH",
+    help="Output file path. Give each worker its own file.",
+)
+@click.option(
+    "--append/--no-append",
+    default=False,
+    envvar="OH_APPEND",
+    help="Append to the output file instead of overwriting it.",
+)
+@click.option("--headless/--no-headless", default=False, envvar="OH_HEADLESS", help="Run browser in headless mode.")
+@click.option(
+    "--block-resources",
+    "block_resources",
+    type=click.Choice([p.value for p in ResourceBlockProfile], case_sensitive=False),
+    default=ResourceBlockProfile.OFF.value,
+    envvar="OH_BLOCK_RESOURCES",
+    help="Requests the browser skips: minimal, balanced or off.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    "concurrency_tasks",
+    type=int,
+    default=3,
+    callback=validate_concurrency,
+    envvar="OH_CONCURRENCY",
+    help="Number of concurrent scraping tasks per proxy.",
+)
+@click.option(
+    "--adaptive-concurrency/--no-adaptive-concurrency",
+    "adaptive_concurrency",
+    default=False,
+    envvar="OH_ADAPTIVE_CONCURRENCY",
+    help="Treat --concurrency as a ceiling and adapt the live concurrency (AIMD).",
+)
+@click.option(
+    "--request-delay",
+    type=float,
+    default=1.0,
+    envvar="OH_REQUEST_DELAY",
+    help="Delay in seconds between match requests on each proxy (default: 1.0).",
+)
+@click.option(
+    "--proxy-url",
+    "proxy_url",
+    multiple=True,
+    callback=validate_proxy_url,
+    envvar="OH_PROXY_URL",
+    help="Proxy URL (repeatable).",
+)
+@click.option("--proxy-user", envvar="OH_PROXY_USER", help="Proxy username (optional).")
+@click.option("--proxy-pass", envvar="OH_PROXY_PASS", help="Proxy password (optional).")
+@click.pass_context
+def worker(ctx, **kwargs):
+    """Claim match links from a job queue, scrape them and ack them.
+
+    Start as many workers as you like on the same queue file; a crashed worker's jobs
+    are reclaimed by the others once their lease expires.
+
+    Example:
+
+        oddsharvester historic -s football -l england-premier-league --season 2024-2025 --enqueue jobs.db
+
+        oddsharvester worker --queue jobs.db -o worker-1.json --headless
+    """
+    storage = kwargs["storage"]
+    storage_format = kwargs["storage_format"]
+    node_settings = {
+        "proxy_url": kwargs.get("proxy_url"),
+        "proxy_user": kwargs.get("proxy_user"),
+        "proxy_pass": kwargs.get("proxy_pass"),
+        "headless": kwargs.get("headless", False),
+        "block_resources": kwargs.get("block_resources", ResourceBlockProfile.OFF.value),
+        "concurrency_tasks": kwargs.get("concurrency_tasks", 3),
+        "adaptive_concurrency": kwargs.get("adaptive_concurrency", False),
+        "request_delay": kwargs.get("request_delay", 1.0),
+    }
+
+    record_sink = open_record_sink(
+        storage_type=storage.value if storage else "local",
+        storage_format=storage_format.value if storage_format else "json",
+        file_path=kwargs.get("file_path"),
+        append=kwargs.get("append", False),
+    )
+    queue = JobQueue(kwargs["queue_path"])
+
+    try:
+        try:
+            queue_worker = QueueWorker(
+                queue,
+                node_settings=node_settings,
+                record_sink=record_sink.write if record_sink else None,
+                worker_id=kwargs.get("worker_id"),
+                batch_size=kwargs["batch_size"],
+                visibility_timeout_s=kwargs["visibility_timeout_s"],
+            )
+            scraped_data = asyncio.run(
+                queue_worker.run(wait=kwargs.get("wait", False), max_jobs=kwargs.get("max_jobs"))
+            )
+        finally:
+            streamed = record_sink.close() if record_sink else 0
+            counts = queue.counts()
+            queue.close()
+
+        if scraped_data.success:
+            store_data(
+                storage_type=storage.value if storage else "local",
+                data=scraped_data.success,
+                storage_format=storage_format.value if storage_format else "json",
+                file_path=kwargs.get("file_path"),
+                append=kwargs.get("append", False) or streamed > 0,
+            )
+
+        click.echo(
+            f"Worker scraped {scraped_data.stats.successful} matches and gave up on {scraped_data.stats.failed}. "
+            f"Queue: {counts['pending']} pending, {counts['leased']} leased, {counts['done']} done, "
+            f"{counts['failed']} failed."
+        )
+        if scraped_data.failed:
+            click.echo(f"Failed URLs: {[f.url for f in scraped_data.failed]}", err=True)
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Error while working the queue: {e}", exc_info=True)
+        sys.exit(1)
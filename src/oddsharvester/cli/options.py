@@ -15,8 +15,10 @@ from oddsharvester.cli.validators import (
     validate_match_links_file,
     validate_period,
     validate_proxy_url,
+    validate_workers,
 )
 from oddsharvester.utils.bookies_filter_enum import BookiesFilter
+from oddsharvester.utils.constants import COMBO_CONCURRENCY
 from oddsharvester.utils.odds_format_enum import OddsFormat
 from oddsharvester.utils.period_constants import (
     AmericanFootballPeriod,
@@ -31,6 +33,7 @@ from oddsharvester.utils.period_constants import (
     TennisPeriod,
     VolleyballPeriod,
 )
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 
 
 def _get_all_periods():
@@ -59,6 +62,68 @@ def merged_match_links(kwargs) -> list[str] | None:
     return merged or None
 
 
+def sharding_options(func):
+    """Decorator adding the scale-out options (historic and upcoming only): combos, sharding and job enqueueing."""
+
+    @click.option(
+        "--combo-concurrency",
+        "combo_concurrency",
+        type=click.IntRange(min=1),
+        default=COMBO_CONCURRENCY,
+        envvar="OH_COMBO_CONCURRENCY",
+        help="League/season combos scraped at once; above 1 they share the --concurrency budget "
+        f"(default: {COMBO_CONCURRENCY}, one after another).",
+    )
+    @click.option(
+        "--workers",
+        type=int,
+        default=1,
+        callback=validate_workers,
+        envvar="OH_WORKERS",
+        help="Split match links across N worker processes, each with its own browser (default: 1).",
+    )
+    @click.option(
+        "--shard",
+        type=int,
+        default=None,
+        envvar="OH_SHARD",
+        help="Run only this shard (0-based) of a --workers N split, e.g. to rerun one that failed.",
+    )
+    @click.option(
+        "--enqueue",
+        "enqueue_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        envvar="OH_ENQUEUE",
+        help="Collect match links into this job-queue file instead of scraping them; see 'oddsharvester worker'.",
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def validate_sharding(kwargs, links_only: bool) -> tuple[int, int | None]:
+    """Return (workers, shard) after checking they make sense together (and with --enqueue)."""
+    workers = kwargs.get("workers") or 1
+    shard = kwargs.get("shard")
+    if kwargs.get("enqueue_path"):
+        if links_only:
+            raise click.UsageError(
+                "--links-only cannot be combined with --enqueue (enqueueing already stops at links)."
+            )
+        if workers > 1 or shard is not None:
+            raise click.UsageError("--enqueue cannot be combined with --workers/--shard (workers pull from the queue).")
+    if shard is not None and not 0 <= shard < workers:
+        raise click.UsageError(f"--shard must be between 0 and {workers - 1} for --workers {workers}.")
+    if links_only and (workers > 1 or shard is not None):
+        raise click.UsageError(
+            "--links-only cannot be combined with --workers/--shard (only match scraping is sharded)."
+        )
+    return workers, shard
+
+
 def common_options(func):
     """Decorator that adds common options to both commands."""
 
@@ -140,6 +205,15 @@ def common_options(func):
         envvar="OH_HEADLESS",
         help="Run browser in headless mode.",
     )
+    @click.option(
+        "--block-resources",
+        "block_resources",
+        type=click.Choice([p.value for p in ResourceBlockProfile], case_sensitive=False),
+        default=ResourceBlockProfile.OFF.value,
+        envvar="OH_BLOCK_RESOURCES",
+        help="Requests the browser skips: 'balanced' drops images, fonts, media and ad/analytics hosts; "
+        "'minimal' keeps only first-party documents, scripts, stylesheets and XHR; 'off' loads everything.",
+    )
     @click.option(
         "--concurrency",
         "-c",
@@ -148,7 +222,15 @@ def common_options(func):
         default=3,
         callback=validate_concurrency,
         envvar="OH_CONCURRENCY",
-        help="Number of concurrent scraping tasks.",
+        help="Number of concurrent scraping tasks per proxy.",
+    )
+    @click.option(
+        "--adaptive-concurrency/--no-adaptive-concurrency",
+        "adaptive_concurrency",
+        default=False,
+        envvar="OH_ADAPTIVE_CONCURRENCY",
+        help="Treat --concurrency as a ceiling and adjust the live concurrency from success rate, "
+        "page latency and rate-limit/navigation errors (AIMD).",
     )
     @click.option(
         "--match-link",
@@ -253,7 +335,7 @@ def common_options(func):
         type=float,
         default=1.0,
         envvar="OH_REQUEST_DELAY",
-        help="Delay in seconds between match requests (default: 1.0).",
+        help="Delay in seconds between match requests on each proxy (default: 1.0).",
     )
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -201,6 +201,13 @@ def validate_concurrency(ctx, param, value):
     return value
 
 
+def validate_workers(ctx, param, value):
+    """Validate the worker process count is a positive integer."""
+    if value is not None and value <= 0:
+        raise click.BadParameter("Workers must be a positive integer.")
+    return value
+
+
 def validate_max_pages(ctx, param, value):
     """Validate max_pages is a positive integer."""
     if value is not None and value <= 0:
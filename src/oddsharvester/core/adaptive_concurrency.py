@@ -0,0 +1,99 @@
+"""
+Adaptive (AIMD) concurrency control for match scraping.
+
+The right concurrency swings with time of day, proxy quality and OddsPortal's
+anti-bot mood (docs/agentic-gotchas.md §6), so a fixed `--concurrency` is either
+too timid or trips throttling. The controller grows the limit by one while a
+window of outcomes looks healthy and halves it when throttling errors spike.
+"""
+
+import logging
+import math
+
+from oddsharvester.core.phase_timing import percentile
+from oddsharvester.core.retry import is_proxy_attributable_error
+from oddsharvester.core.scrape_result import ErrorType
+from oddsharvester.utils.constants import (
+    ADAPTIVE_CONCURRENCY_BACKOFF_ERROR_RATE,
+    ADAPTIVE_CONCURRENCY_DECREASE_FACTOR,
+    ADAPTIVE_CONCURRENCY_HEALTHY_SUCCESS_RATE,
+    ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE,
+    ADAPTIVE_CONCURRENCY_WINDOW,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AimdConcurrencyController:
+    """
+    Additive-increase / multiplicative-decrease controller for the number of concurrent pages.
+
+    Outcomes are judged in windows of `window` pages:
+    - throttling (`ErrorType.NAVIGATION` / `RATE_LIMITED`, the proxy-attributable errors from
+      `core/retry.py`) at or above `ADAPTIVE_CONCURRENCY_BACKOFF_ERROR_RATE` cuts the limit;
+    - otherwise, a healthy success rate with p95 latency within tolerance of the best p95
+      seen so far raises it by one;
+    - anything else holds it.
+    """
+
+    def __init__(self, ceiling: int, floor: int = 1, initial: int | None = None, window: int | None = None):
+        """
+        Args:
+            ceiling (int): Upper bound for the limit (the worker pool size).
+            floor (int): Lower bound for the limit.
+            initial (int, optional): Starting limit. Defaults to half the ceiling.
+            window (int, optional): Outcomes per evaluation. Defaults to `ADAPTIVE_CONCURRENCY_WINDOW`.
+        """
+        self.ceiling = max(ceiling, 1)
+        self.floor = min(max(floor, 1), self.ceiling)
+        start = initial if initial is not None else math.ceil(self.ceiling / 2)
+        self.limit = min(max(start, self.floor), self.ceiling)
+        self.window = window or ADAPTIVE_CONCURRENCY_WINDOW
+        self.baseline_p95: float | None = None
+        self._latencies: list[float] = []
+        self._failures = 0
+        self._throttled = 0
+
+    def record(self, latency_s: float, error_type: ErrorType | None) -> int:
+        """
+        Record one page outcome and return the (possibly updated) limit.
+
+        Args:
+            latency_s (float): Time spent scraping the page.
+            error_type (ErrorType | None): None for a success, else the failure's classification.
+        """
+        self._latencies.append(latency_s)
+        if error_type is not None:
+            self._failures += 1
+            if is_proxy_attributable_error(error_type):
+                self._throttled += 1
+
+        if len(self._latencies) >= self.window:
+            self._evaluate()
+        return self.limit
+
+    def _evaluate(self) -> None:
+        total = len(self._latencies)
+        success_rate = (total - self._failures) / total
+        throttle_rate = self._throttled / total
+        p95 = percentile(self._latencies, 95)
+        summary = f"success {success_rate:.0%}, p95 {p95:.1f}s, throttled {self._throttled}/{total}"
+
+        if throttle_rate >= ADAPTIVE_CONCURRENCY_BACKOFF_ERROR_RATE:
+            self._set_limit(math.floor(self.limit * ADAPTIVE_CONCURRENCY_DECREASE_FACTOR), f"backing off ({summary})")
+        else:
+            if self.baseline_p95 is None or p95 < self.baseline_p95:
+                self.baseline_p95 = p95
+            latency_ok = p95 <= self.baseline_p95 * ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE
+            if success_rate >= ADAPTIVE_CONCURRENCY_HEALTHY_SUCCESS_RATE and latency_ok:
+                self._set_limit(self.limit + 1, f"healthy ({summary})")
+
+        self._latencies = []
+        self._failures = 0
+        self._throttled = 0
+
+    def _set_limit(self, new_limit: int, reason: str) -> None:
+        new_limit = min(max(new_limit, self.floor), self.ceiling)
+        if new_limit != self.limit:
+            logger.info(f"Adaptive concurrency {self.limit} -> {new_limit}: {reason}")
+            self.limit = new_limit
@@ -1,10 +1,12 @@
 import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from contextlib import aclosing
 from datetime import UTC, date, datetime, time, timedelta
 from enum import Enum
 import json
 import logging
-import random
 import re
+from time import perf_counter
 from typing import Any
 from urllib.parse import urlsplit
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -12,16 +14,24 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from bs4 import BeautifulSoup
 from playwright.async_api import Page, TimeoutError
 
+from oddsharvester.core import lxml_tree
+from oddsharvester.core.adaptive_concurrency import AimdConcurrencyController
 from oddsharvester.core.browser.cookies import CookieDismisser
+from oddsharvester.core.browser.dom_snapshot import EVENT_HEADER_REGION, LIVE_INFO_REGION, DomSnapshots
 from oddsharvester.core.browser.pagination import PaginationWalker
+from oddsharvester.core.browser.readiness import PageReadiness
 from oddsharvester.core.browser.scrolling import PageScroller
 from oddsharvester.core.browser.selection import (
     BOOKIES_FILTER_STRATEGY,
     SelectionManager,
 )
 from oddsharvester.core.exceptions import H2HFragmentResolutionError
+from oddsharvester.core.match_budget import MatchBudget
 from oddsharvester.core.odds_portal_market_extractor import OddsPortalMarketExtractor
 from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+from oddsharvester.core.parser_backend import BS4_BACKEND, LXML_BACKEND, parser_backend_from_env
+from oddsharvester.core.parsing_executor import ParsingExecutor
+from oddsharvester.core.phase_timing import MatchTimings, bind_timings, timed_phase, unbind_timings
 from oddsharvester.core.playwright_manager import PlaywrightManager
 from oddsharvester.core.retry import (
     RetryConfig,
@@ -30,8 +40,9 @@ from oddsharvester.core.retry import (
     is_retryable_error,
     retry_with_backoff,
 )
-from oddsharvester.core.scrape_result import FailedUrl, ScrapeResult, ScrapeStats
+from oddsharvester.core.scrape_result import FailedUrl, MatchOutcome, ScrapeResult
 from oddsharvester.core.url_builder import URLBuilder
+from oddsharvester.core.worker_pool import WorkerPool
 from oddsharvester.utils.bookies_filter_enum import BookiesFilter
 from oddsharvester.utils.constants import (
     DEFAULT_REQUEST_DELAY_S,
@@ -44,7 +55,6 @@ from oddsharvester.utils.constants import (
     ODDS_FORMAT_SELECTOR_TIMEOUT_MS,
     ODDS_FORMAT_WAIT_MS,
     ODDSPORTAL_BASE_URL,
-    REQUEST_DELAY_JITTER_FACTOR,
     SELECTOR_TIMEOUT_MS,
 )
 from oddsharvester.utils.datetime_format import format_utc
@@ -52,6 +62,8 @@ from oddsharvester.utils.local_kickoff import compute_local_kickoff
 from oddsharvester.utils.odds_format_enum import OddsFormat
 from oddsharvester.utils.utils import clean_html_text
 
+logger = logging.getLogger(__name__)
+
 _MONTH_ABBREV_TO_NUM = {
     "jan": 1,
     "feb": 2,
@@ -216,6 +228,89 @@ def _row_kickoff_datetime(row, row_date: date | None, tz) -> datetime | None:
     return datetime.combine(row_date, kickoff_time, tzinfo=tz)
 
 
+def _parse_match_rows(
+    html_content: str,
+    base_url: str,
+    date_filter: date | None,
+    skip_started: bool,
+    track_headers: bool,
+    tz_name: str | None,
+    ref_tz,
+    need_kickoff: bool,
+    collect_kickoff: bool,
+    window_cutoff: datetime | None,
+) -> dict[str, Any]:
+    """Parse a listing page's event rows (the CPU half of `BaseScraper.extract_match_rows`).
+
+    Module-level and free of scraper state so `ParsingExecutor` can run it in a
+    worker process. Returns the rows plus the counters the caller logs.
+    """
+    soup = BeautifulSoup(html_content, "lxml")
+    event_rows = soup.find_all(class_=re.compile(OddsPortalSelectors.EVENT_ROW_CLASS_PATTERN))
+
+    seen: set[str] = set()
+    rows_out: list[dict[str, Any]] = []
+    current_row_date: date | None = None
+    seen_header_dates: set[date] = set()
+    unparseable_headers: list[str] = []
+    filtered_out_count = 0
+    offscreen_skipped_count = 0
+    started_filtered_out_count = 0
+    window_filtered_out_count = 0
+
+    for row in event_rows:
+        if _is_offscreen_row(row):
+            offscreen_skipped_count += 1
+            continue
+
+        if track_headers:
+            header_el = row.find(attrs={"data-testid": "date-header"})
+            if header_el is not None:
+                header_text = header_el.get_text(" ", strip=True)
+                parsed = _parse_date_header(header_text, tz_name=tz_name)
+                if parsed is None:
+                    unparseable_headers.append(header_text)
+                else:
+                    seen_header_dates.add(parsed)
+                current_row_date = parsed
+
+        if date_filter is not None and current_row_date is not None and current_row_date != date_filter:
+            filtered_out_count += 1
+            continue
+
+        if skip_started and _row_has_started(row):
+            started_filtered_out_count += 1
+            continue
+
+        kickoff_dt = _row_kickoff_datetime(row, current_row_date, ref_tz) if need_kickoff else None
+
+        if window_cutoff is not None and kickoff_dt is not None and kickoff_dt > window_cutoff:
+            window_filtered_out_count += 1
+            continue
+
+        kickoff_utc = format_utc(kickoff_dt) if collect_kickoff and kickoff_dt is not None else None
+
+        for link in row.find_all("a", href=True):
+            href = link["href"]
+            if len(href.strip("/").split("/")) <= 3:
+                continue
+            full_url = f"{base_url}{href}"
+            if full_url not in seen:
+                seen.add(full_url)
+                rows_out.append({"match_link": full_url, "kickoff_utc": kickoff_utc})
+
+    return {
+        "rows": rows_out,
+        "event_rows": len(event_rows),
+        "seen_header_dates": sorted(seen_header_dates),
+        "unparseable_headers": unparseable_headers,
+        "filtered_out": filtered_out_count,
+        "offscreen_skipped": offscreen_skipped_count,
+        "started_filtered_out": started_filtered_out_count,
+        "window_filtered_out": window_filtered_out_count,
+    }
+
+
 # Separator is a colon on the live header, but OddsPortal renders scores with an
 # en-dash (U+2013) elsewhere; accept both rather than silently dropping the score.
 _LIVE_MAIN_SCORE_RE = re.compile(r"^(\d+)\s*[:\u2013-]\s*(\d+)$")
@@ -288,6 +383,11 @@ def _parse_live_info(soup: BeautifulSoup) -> dict[str, Any] | None:
     }
 
 
+def _parse_live_info_html(html_content: str) -> dict[str, Any] | None:
+    """`_parse_live_info` on raw page HTML (picklable entry point for `ParsingExecutor`)."""
+    return _parse_live_info(BeautifulSoup(html_content, "lxml"))
+
+
 def _extract_fragment_match_id(match_link: str) -> str | None:
     """
     Extract the URL fragment as a match id from a match link.
@@ -323,6 +423,217 @@ def _join_static_info(static_info: Any) -> str | None:
     return ", ".join(names) or None
 
 
+def _match_date_from_dom(soup: BeautifulSoup, tz) -> str | None:
+    """
+    Extract the match date from <div data-testid="game-time-item"> and
+    return it formatted as "YYYY-MM-DD HH:MM:SS UTC".
+
+    Returns None if the div or its child paragraphs are missing, or if
+    the text doesn't match the expected "DD MMM YYYY" + "HH:MM" shape.
+    """
+    try:
+        game_time_div = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_TIME_TESTID})
+        if not game_time_div:
+            return None
+
+        paragraphs = game_time_div.find_all("p")
+        if len(paragraphs) < 3:
+            return None
+
+        date_part = paragraphs[1].get_text(strip=True).rstrip(",")
+        time_part = paragraphs[2].get_text(strip=True)
+        local_dt = datetime.strptime(f"{date_part} {time_part}", "%d %b %Y %H:%M")
+        local_dt = local_dt.replace(tzinfo=tz)
+        return format_utc(local_dt)
+    except Exception as e:
+        logger.warning(f"DOM parse failed for match_date: {e}")
+        return None
+
+
+def _teams_from_dom(soup: BeautifulSoup) -> tuple[str | None, str | None]:
+    """
+    Extract (home_team, away_team) from <div data-testid="game-host">
+    and <div data-testid="game-guest">. Returns (None, None) if either
+    side is missing - caller falls back to JSON for both fields.
+    """
+    try:
+        host = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_HOST_TESTID})
+        guest = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_GUEST_TESTID})
+        host_p = host.find("p") if host else None
+        guest_p = guest.find("p") if guest else None
+        if not host_p or not guest_p:
+            return None, None
+        return host_p.get_text(strip=True), guest_p.get_text(strip=True)
+    except Exception as e:
+        logger.warning(f"DOM parse failed for teams: {e}")
+        return None, None
+
+
+_SEASON_SUFFIX_RE = re.compile(r"\s+\d{4}/\d{4}$")
+
+
+def _league_from_dom(soup: BeautifulSoup) -> str | None:
+    """
+    Extract the league name from the breadcrumb navigation, stripping
+    the trailing season suffix when present (e.g. "Premier League 2024/2025"
+    -> "Premier League"). Returns None if the breadcrumb or league link is
+    missing.
+    """
+    try:
+        breadcrumbs = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_BREADCRUMBS_TESTID})
+        if not breadcrumbs:
+            return None
+        league_link = breadcrumbs.find(
+            "a", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_BREADCRUMB_LEAGUE_TESTID}
+        )
+        if not league_link:
+            return None
+        raw = league_link.get_text(strip=True)
+        return _SEASON_SUFFIX_RE.sub("", raw) or None
+    except Exception as e:
+        logger.warning(f"DOM parse failed for league_name: {e}")
+        return None
+
+
+_RESULT_TEXT_RE = re.compile(r"(\d+)\s*:\s*(\d+)(?:\s*\(([\d:,\s ]+)\))?")
+
+
+def _results_from_dom(soup: BeautifulSoup) -> tuple[str | None, str | None, str | None]:
+    """
+    Extract (home_score, away_score, partial_results) from the page DOM.
+
+    Scoped to descendants of <div data-testid="game-time-item">'s parent
+    to avoid false positives elsewhere in the page. Returns (None, None,
+    None) if the score pattern isn't found.
+    """
+    try:
+        game_time_div = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_TIME_TESTID})
+        if not game_time_div:
+            return None, None, None
+        scope = game_time_div.find_parent() or soup
+        excluded = {id(game_time_div), *(id(d) for d in game_time_div.find_all("div"))}
+        for div in scope.find_all("div"):
+            if id(div) in excluded:
+                continue
+            text = div.get_text(separator=" ", strip=True)
+            m = _RESULT_TEXT_RE.search(text)
+            if m:
+                home, away, partial = m.group(1), m.group(2), m.group(3)
+                formatted_partial = (
+                    f"({re.sub(r' +', ' ', partial.replace(chr(0xA0), ' ')).strip()})" if partial else None
+                )
+                return home, away, formatted_partial
+        return None, None, None
+    except Exception as e:
+        logger.warning(f"DOM parse failed for results: {e}")
+        return None, None, None
+
+
+def _dom_header_fields(soup: BeautifulSoup, tz) -> dict[str, Any]:
+    """Every match-header field the DOM provides (None where it does not)."""
+    home_team, away_team = _teams_from_dom(soup)
+    home_score, away_score, partial_results = _results_from_dom(soup)
+    return {
+        "match_date": _match_date_from_dom(soup, tz),
+        "home_team": home_team,
+        "away_team": away_team,
+        "league_name": _league_from_dom(soup),
+        "home_score": home_score,
+        "away_score": away_score,
+        "partial_results": partial_results,
+    }
+
+
+def _dom_header_fields_lxml(root, tz) -> dict[str, Any]:
+    """`_dom_header_fields` on an lxml tree (same lookups, see `core.lxml_tree`)."""
+    game_time_div = lxml_tree.find(
+        root, "div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_TIME_TESTID}
+    )
+    fields: dict[str, Any] = {"match_date": None, "home_team": None, "away_team": None, "league_name": None}
+
+    try:
+        paragraphs = lxml_tree.find_all(game_time_div, "p") if game_time_div is not None else []
+        if len(paragraphs) >= 3:
+            date_part = lxml_tree.get_text(paragraphs[1]).rstrip(",")
+            time_part = lxml_tree.get_text(paragraphs[2])
+            local_dt = datetime.strptime(f"{date_part} {time_part}", "%d %b %Y %H:%M")
+            fields["match_date"] = format_utc(local_dt.replace(tzinfo=tz))
+    except Exception as e:
+        logger.warning(f"DOM parse failed for match_date: {e}")
+
+    host = lxml_tree.find(root, "div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_HOST_TESTID})
+    guest = lxml_tree.find(root, "div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_GUEST_TESTID})
+    host_p = lxml_tree.find(host, "p") if host is not None else None
+    guest_p = lxml_tree.find(guest, "p") if guest is not None else None
+    if host_p is not None and guest_p is not None:
+        fields["home_team"], fields["away_team"] = lxml_tree.get_text(host_p), lxml_tree.get_text(guest_p)
+
+    breadcrumbs = lxml_tree.find(
+        root, "div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_BREADCRUMBS_TESTID}
+    )
+    league_link = (
+        lxml_tree.find(
+            breadcrumbs, "a", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_BREADCRUMB_LEAGUE_TESTID}
+        )
+        if breadcrumbs is not None
+        else None
+    )
+    if league_link is not None:
+        fields["league_name"] = _SEASON_SUFFIX_RE.sub("", lxml_tree.get_text(league_link)) or None
+
+    fields.update(home_score=None, away_score=None, partial_results=None)
+    if game_time_div is not None:
+        scope = game_time_div.getparent() if game_time_div.getparent() is not None else root
+        excluded = {game_time_div, *lxml_tree.find_all(game_time_div, "div")}
+        for div in lxml_tree.find_all(scope, "div"):
+            if div in excluded:
+                continue
+            m = _RESULT_TEXT_RE.search(lxml_tree.get_text(div, separator=" "))
+            if m:
+                partial = m.group(3)
+                fields["home_score"], fields["away_score"] = m.group(1), m.group(2)
+                fields["partial_results"] = (
+                    f"({re.sub(r' +', ' ', partial.replace(chr(0xA0), ' ')).strip()})" if partial else None
+                )
+                break
+    return fields
+
+
+def _parse_event_header_html(html_content: str, tz, parser_backend: str = BS4_BACKEND) -> dict[str, Any]:
+    """Parse a match page's React event header JSON and DOM header fields.
+
+    Picklable entry point for `ParsingExecutor`. Returns {"json_data", "dom"}, or
+    {"error"} naming what is missing: "no_header", "no_data", or the JSON error.
+    `parser_backend` picks the tree the page is read with (`bs4` or `lxml`).
+    """
+    if parser_backend == LXML_BACKEND:
+        root = lxml_tree.parse_html(html_content)
+        event_header_div = lxml_tree.find(root, "div", attrs={"id": "react-event-header"}) if root is not None else None
+    else:
+        root = BeautifulSoup(html_content, "html.parser")
+        event_header_div = root.find("div", id="react-event-header")
+    if event_header_div is None:
+        return {"error": "no_header"}
+    data_attribute = event_header_div.get("data")
+    if not data_attribute:
+        return {"error": "no_data"}
+    try:
+        json_data = json.loads(data_attribute)
+    except (TypeError, json.JSONDecodeError) as e:
+        return {"error": f"Failed to parse JSON data from react event header: {e}"}
+    if parser_backend == LXML_BACKEND:
+        return {"json_data": json_data, "dom": _dom_header_fields_lxml(root, tz)}
+    return {"json_data": json_data, "dom": _dom_header_fields(root, tz)}
+
+
+async def _aenumerate(items: AsyncIterable[Any]) -> AsyncIterator[tuple[int, Any]]:
+    """`enumerate` for an async iterable."""
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
+
+
 class BaseScraper:
     """
     Base class for scraping match data from OddsPortal.
@@ -338,6 +649,9 @@ class BaseScraper:
         preview_submarkets_only: bool = False,
         local_kickoff: bool = False,
         base_url: str | None = None,
+        record_sink: Callable[[dict[str, Any]], None] | None = None,
+        adaptive_concurrency: bool = False,
+        parsing_executor: ParsingExecutor | None = None,
     ):
         """
         Args:
@@ -352,6 +666,12 @@ class BaseScraper:
             the venue's local time) to each record. match_date stays UTC.
             base_url (str | None): Regional OddsPortal domain override (scheme+host). When None, the canonical
             https://www.oddsportal.com is used.
+            record_sink (Callable | None): If set, `extract_match_odds` hands each successful match record to it
+            as soon as the match is scraped instead of buffering it in `ScrapeResult.success`.
+            adaptive_concurrency (bool): If True, `concurrent_scraping_task` is a ceiling and an AIMD controller
+            adjusts the live concurrency from success rate, p95 latency and throttling errors.
+            parsing_executor (ParsingExecutor | None): Where listing and match-header HTML is parsed; defaults to
+            the shared executor.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.playwright_manager = playwright_manager
@@ -362,8 +682,29 @@ class BaseScraper:
         self.preview_submarkets_only = preview_submarkets_only
         self.local_kickoff = local_kickoff
         self.base_url = base_url
+        self.record_sink = record_sink
+        self.adaptive_concurrency = adaptive_concurrency
+        self.parsing_executor = parsing_executor or ParsingExecutor.shared()
+        self.worker_pool: WorkerPool | None = None
+        # Set while several combos run at once (see `share_match_budget`); caps their pages together.
+        self.match_budget: MatchBudget | None = None
+        # `playwright_manager.page` is a single tab: combos running at once take turns on it.
+        self.main_page_lock = asyncio.Lock()
         self._warmed_proxy_keys: set[str] = set()
         self.pagination_walker = PaginationWalker()
+        self.readiness = PageReadiness()
+        self.dom_snapshots = DomSnapshots()
+        self.parser_backend = parser_backend_from_env()
+
+    def share_match_budget(self, concurrent_scraping_task: int) -> MatchBudget:
+        """
+        Make every match scrape draw from one budget, for combos that run concurrently.
+
+        The budget holds as many pages as a single run would open (`concurrent_scraping_task`
+        per proxy lane), so running combos side by side does not multiply the load.
+        """
+        self.match_budget = MatchBudget(capacity=concurrent_scraping_task * self.playwright_manager.lane_count())
+        return self.match_budget
 
     async def set_odds_format(self, page: Page, odds_format: OddsFormat = OddsFormat.DECIMAL_ODDS):
         """
@@ -394,8 +735,10 @@ class BaseScraper:
                 return
 
             await dropdown_button.click()
-            await page.wait_for_timeout(ODDS_FORMAT_WAIT_MS)
             format_option_selector = "div.group > div.dropdown-content > ul > li > a"
+            await self.readiness.wait_until(
+                page, ODDS_FORMAT_WAIT_MS, row_selector=format_option_selector, network_idle=False
+            )
             format_options = await page.query_selector_all(format_option_selector)
 
             for option in format_options:
@@ -404,7 +747,8 @@ class BaseScraper:
                 if odds_format.value.lower() in option_text.lower():
                     self.logger.info(f"Selecting odds format: {option_text}")
                     await option.click()
-                    await page.wait_for_timeout(ODDS_FORMAT_WAIT_MS)
+                    # The odds re-render in the new format once its request completes.
+                    await self.readiness.settled(page, timeout_ms=ODDS_FORMAT_WAIT_MS)
                     self.logger.info(f"Odds format changed to '{odds_format.value}'.")
                     return
 
@@ -456,9 +800,6 @@ class BaseScraper:
         """
         try:
             html_content = await page.content()
-            soup = BeautifulSoup(html_content, "lxml")
-            event_rows = soup.find_all(class_=re.compile(OddsPortalSelectors.EVENT_ROW_CLASS_PATTERN))
-            self.logger.info(f"Found {len(event_rows)} event rows.")
 
             need_kickoff = kickoff_within_hours is not None or collect_kickoff
             track_headers = date_filter is not None or need_kickoff
@@ -469,59 +810,30 @@ class BaseScraper:
             if kickoff_within_hours is not None:
                 window_cutoff = datetime.now(ref_tz) + timedelta(hours=kickoff_within_hours)
 
-            seen: set[str] = set()
-            rows_out: list[dict[str, Any]] = []
-            current_row_date: date | None = None
-            seen_header_dates: set[date] = set()
-            filtered_out_count = 0
-            unparseable_header_count = 0
-            offscreen_skipped_count = 0
-            started_filtered_out_count = 0
-            window_filtered_out_count = 0
-
-            for row in event_rows:
-                if _is_offscreen_row(row):
-                    offscreen_skipped_count += 1
-                    continue
-
-                if track_headers:
-                    header_el = row.find(attrs={"data-testid": "date-header"})
-                    if header_el is not None:
-                        header_text = header_el.get_text(" ", strip=True)
-                        parsed = _parse_date_header(header_text, tz_name=tz_name)
-                        if parsed is None:
-                            unparseable_header_count += 1
-                            self.logger.warning(
-                                f"Could not parse date-header '{header_text}'; rows under it will not be filtered."
-                            )
-                        else:
-                            seen_header_dates.add(parsed)
-                        current_row_date = parsed
-
-                if date_filter is not None and current_row_date is not None and current_row_date != date_filter:
-                    filtered_out_count += 1
-                    continue
-
-                if skip_started and _row_has_started(row):
-                    started_filtered_out_count += 1
-                    continue
-
-                kickoff_dt = _row_kickoff_datetime(row, current_row_date, ref_tz) if need_kickoff else None
-
-                if window_cutoff is not None and kickoff_dt is not None and kickoff_dt > window_cutoff:
-                    window_filtered_out_count += 1
-                    continue
-
-                kickoff_utc = format_utc(kickoff_dt) if collect_kickoff and kickoff_dt is not None else None
-
-                for link in row.find_all("a", href=True):
-                    href = link["href"]
-                    if len(href.strip("/").split("/")) <= 3:
-                        continue
-                    full_url = f"{self.base_url or ODDSPORTAL_BASE_URL}{href}"
-                    if full_url not in seen:
-                        seen.add(full_url)
-                        rows_out.append({"match_link": full_url, "kickoff_utc": kickoff_utc})
+            parsed = await self.parsing_executor.run(
+                _parse_match_rows,
+                html_content,
+                base_url=self.base_url or ODDSPORTAL_BASE_URL,
+                date_filter=date_filter,
+                skip_started=skip_started,
+                track_headers=track_headers,
+                tz_name=tz_name,
+                ref_tz=ref_tz,
+                need_kickoff=need_kickoff,
+                collect_kickoff=collect_kickoff,
+                window_cutoff=window_cutoff,
+            )
+            self.logger.info(f"Found {parsed['event_rows']} event rows.")
+            for header_text in parsed["unparseable_headers"]:
+                self.logger.warning(f"Could not parse date-header '{header_text}'; rows under it will not be filtered.")
+
+            rows_out = parsed["rows"]
+            seen_header_dates = set(parsed["seen_header_dates"])
+            filtered_out_count = parsed["filtered_out"]
+            unparseable_header_count = len(parsed["unparseable_headers"])
+            offscreen_skipped_count = parsed["offscreen_skipped"]
+            started_filtered_out_count = parsed["started_filtered_out"]
+            window_filtered_out_count = parsed["window_filtered_out"]
 
             started_suffix = f", {started_filtered_out_count} started/finished rows skipped" if skip_started else ""
             window_suffix = (
@@ -683,10 +995,10 @@ class BaseScraper:
                 if page:
                     await page.close()
 
-    async def extract_match_odds(
+    async def iter_match_odds(
         self,
         sport: str,
-        match_links: list[str],
+        match_links: list[str] | AsyncIterable[str],
         markets: list[str] | None = None,
         scrape_odds_history: bool = False,
         target_bookmaker: str | None = None,
@@ -697,32 +1009,47 @@ class BaseScraper:
         retry_config: RetryConfig | None = None,
         request_delay: float = DEFAULT_REQUEST_DELAY_S,
         live_mode: bool = False,
-    ) -> ScrapeResult:
+        season: str | None = None,
+    ) -> AsyncIterator[MatchOutcome]:
         """
-        Extract odds for a list of match links concurrently.
+        Scrape a list of match links concurrently, yielding each outcome as soon as it finishes.
+
+        Links are fed through a bounded `WorkerPool` with `concurrent_scraping_task` workers per
+        healthy proxy lane (see `ProxyManager.configure_lanes`), and nothing is accumulated
+        here, so a consumer that writes each record out keeps memory flat however long the
+        link list is. The running pool is exposed as `self.worker_pool`
+        for its queue depth, in-flight count and per-worker utilisation. Outcomes arrive in
+        completion order, not link order; `MatchOutcome.index` carries the link's position.
+        Closing the generator early cancels the matches still in flight.
+
+        `match_links` may be an async iterable that is still producing (see `scrape_historic`):
+        scraping starts with the first link instead of waiting for the whole list.
 
         Args:
             sport (str): The sport to scrape odds for.
-            match_links (List[str]): A list of match links to scrape odds for.
+            match_links (List[str] | AsyncIterable[str]): The match links to scrape odds for.
             markets (Optional[List[str]]: The list of markets to scrape.
             scrape_odds_history (bool): Whether to scrape and attach odds history.
             target_bookmaker (str): If set, only scrape odds for this bookmaker.
-            concurrent_scraping_task (int): Controls how many pages are processed simultaneously.
+            concurrent_scraping_task (int): How many pages each proxy processes simultaneously.
             preview_submarkets_only (bool): If True, only scrape the collapsed submarket odds (best/highest shown
             per line, not per-bookmaker) from visible submarkets without loading individual bookmaker details.
             bookies_filter (BookiesFilter): The bookmaker filter to apply.
             period: The period to scrape odds for.
             retry_config: Configuration for per-match retry behavior.
+            request_delay (float): Per-proxy pacing: each proxy starts at most `concurrent_scraping_task`
+            requests per `request_delay` seconds.
+            season (Optional[str]): If set, stamped on each record before it is yielded, so records
+            streamed straight to storage carry it too.
 
-        Returns:
-            ScrapeResult: Contains successful results, failed URLs with error details, and statistics.
+        Yields:
+            MatchOutcome: One per match link, holding either the record or the failure.
         """
         await self._warm_proxy_contexts()
 
-        self.logger.info(f"Starting to scrape odds for {len(match_links)} match links...")
-
-        result = ScrapeResult(stats=ScrapeStats(total_urls=len(match_links)))
-        semaphore = asyncio.Semaphore(concurrent_scraping_task)
+        streaming = isinstance(match_links, AsyncIterable)
+        total = "streamed" if streaming else str(len(match_links))
+        self.logger.info(f"Starting to scrape odds for {total} match links...")
 
         if retry_config is None:
             retry_config = RetryConfig(
@@ -746,89 +1073,214 @@ class BaseScraper:
                 live_mode=live_mode,
             )
 
-        request_counter = {"count": 0}
+        # Rate limiting lives in the proxy lanes: each proxy paces its own requests, so a
+        # worker waiting for a token holds no page and a throttled proxy stalls only itself.
+        self.playwright_manager.configure_lanes(
+            per_proxy_concurrency=concurrent_scraping_task, request_delay=request_delay
+        )
 
-        async def scrape_with_semaphore(link: str) -> tuple[str, dict[str, Any] | None, FailedUrl | None]:
-            async with semaphore:
-                # Apply rate limiting delay (skip for the first request)
-                current_count = request_counter["count"]
-                request_counter["count"] += 1
-                if current_count > 0 and request_delay > 0:
-                    jitter = request_delay * REQUEST_DELAY_JITTER_FACTOR * random.random()  # noqa: S311
-                    total_delay = request_delay + jitter
-                    self.logger.debug(f"Rate limiting: waiting {total_delay:.2f}s before request")
-                    await asyncio.sleep(total_delay)
+        async def scrape_one(item: tuple[int, str]) -> MatchOutcome:
+            index, link = item
+            tab = None
+            proxy_key = None
+            page_opened_at = None
+            budget = None
+            # Phases are timed into the match's own timings, across its retries.
+            timings = MatchTimings()
+            timings_token = bind_timings(timings)
 
-                tab = None
-                proxy_key = None
+            try:
+                if self.match_budget is not None:
+                    await self.match_budget.acquire()
+                    budget = self.match_budget
+                tab, proxy_key = await self.playwright_manager.new_rotated_page()
+                page_opened_at = perf_counter()
+
+                # Use retry with backoff for each match
+                retry_result = await retry_with_backoff(
+                    scrape_single_match,
+                    tab,
+                    link,
+                    config=retry_config,
+                )
 
-                try:
-                    tab, proxy_key = await self.playwright_manager.new_rotated_page()
-
-                    # Use retry with backoff for each match
-                    retry_result = await retry_with_backoff(
-                        scrape_single_match,
-                        tab,
-                        link,
-                        config=retry_config,
+                if retry_result.success and retry_result.result is not None:
+                    self.logger.info(f"Successfully scraped match link: {link} (attempts: {retry_result.attempts})")
+                    self.playwright_manager.report_page_result(proxy_key, is_proxy_failure=False)
+                    data = retry_result.result
+                    if season is not None:
+                        data["season"] = season
+                    return MatchOutcome(
+                        index=index,
+                        link=link,
+                        data=data,
+                        duration_s=perf_counter() - page_opened_at,
+                        timings=timings,
                     )
-
-                    if retry_result.success and retry_result.result is not None:
-                        self.logger.info(f"Successfully scraped match link: {link} (attempts: {retry_result.attempts})")
-                        self.playwright_manager.report_page_result(proxy_key, is_proxy_failure=False)
-                        return (link, retry_result.result, None)
-                    else:
-                        # Scraping failed after retries
-                        error_type = retry_result.error_type or classify_error(retry_result.last_error)
-                        failed_url = FailedUrl(
-                            url=link,
-                            error_type=error_type,
-                            error_message=retry_result.last_error or "Unknown error",
-                            attempts=retry_result.attempts,
-                            is_retryable=retry_result.is_retryable,
-                        )
-                        self.logger.warning(
-                            f"Failed to scrape {link} after {retry_result.attempts} attempts: {retry_result.last_error}"
-                        )
-                        self.playwright_manager.report_page_result(
-                            proxy_key, is_proxy_failure=is_proxy_attributable_error(error_type)
-                        )
-                        return (link, None, failed_url)
-
-                except Exception as e:
-                    # Unexpected error outside of retry mechanism
-                    error_message = str(e)
+                else:
+                    # Scraping failed after retries
+                    error_type = retry_result.error_type or classify_error(retry_result.last_error)
                     failed_url = FailedUrl(
                         url=link,
-                        error_type=classify_error(error_message),
-                        error_message=error_message,
-                        attempts=1,
-                        is_retryable=is_retryable_error(error_message),
+                        error_type=error_type,
+                        error_message=retry_result.last_error or "Unknown error",
+                        attempts=retry_result.attempts,
+                        is_retryable=retry_result.is_retryable,
                     )
-                    self.logger.error(f"Unexpected error scraping {link}: {e}")
-                    if proxy_key is not None:
-                        self.playwright_manager.report_page_result(
-                            proxy_key,
-                            is_proxy_failure=is_proxy_attributable_error(classify_error(error_message)),
-                        )
-                    return (link, None, failed_url)
+                    self.logger.warning(
+                        f"Failed to scrape {link} after {retry_result.attempts} attempts: {retry_result.last_error}"
+                    )
+                    self.playwright_manager.report_page_result(
+                        proxy_key, is_proxy_failure=is_proxy_attributable_error(error_type)
+                    )
+                    return MatchOutcome(
+                        index=index,
+                        link=link,
+                        failed=failed_url,
+                        duration_s=perf_counter() - page_opened_at,
+                        timings=timings,
+                    )
+
+            except Exception as e:
+                # Unexpected error outside of retry mechanism
+                error_message = str(e)
+                failed_url = FailedUrl(
+                    url=link,
+                    error_type=classify_error(error_message),
+                    error_message=error_message,
+                    attempts=1,
+                    is_retryable=is_retryable_error(error_message),
+                )
+                self.logger.error(f"Unexpected error scraping {link}: {e}")
+                if proxy_key is not None:
+                    self.playwright_manager.report_page_result(
+                        proxy_key,
+                        is_proxy_failure=is_proxy_attributable_error(classify_error(error_message)),
+                    )
+                duration = perf_counter() - page_opened_at if page_opened_at is not None else 0.0
+                return MatchOutcome(index=index, link=link, failed=failed_url, duration_s=duration, timings=timings)
+
+            finally:
+                unbind_timings(timings_token)
+                if tab:
+                    await self.playwright_manager.return_page(tab, proxy_key)
+                if proxy_key is not None:
+                    self.playwright_manager.release_page(proxy_key)
+                if budget is not None:
+                    budget.release()
+
+        lanes = self.playwright_manager.lane_count()
+        await self.playwright_manager.warm_page_pools(
+            concurrent_scraping_task if streaming else min(concurrent_scraping_task, len(match_links))
+        )
+        pool = WorkerPool(scrape_one, workers=concurrent_scraping_task * lanes)
+        self.worker_pool = pool
+        controller = None
+        if self.adaptive_concurrency:
+            # --concurrency becomes the ceiling; the controller moves the live limit below it.
+            controller = AimdConcurrencyController(ceiling=pool.workers, floor=lanes)
+            pool.set_limit(controller.limit)
+            self.logger.info(f"Adaptive concurrency: starting at {controller.limit}, ceiling {pool.workers}")
+        try:
+            items = _aenumerate(match_links) if streaming else enumerate(match_links)
+            async with aclosing(pool.run(items)) as outcomes:
+                async for outcome in outcomes:
+                    if controller is not None:
+                        error_type = outcome.failed.error_type if outcome.failed is not None else None
+                        pool.set_limit(controller.record(outcome.duration_s, error_type))
+                    self.logger.debug(
+                        f"Progress: {pool.processed}/{total} done, "
+                        f"{pool.in_flight} in flight, {pool.queue_depth} queued"
+                    )
+                    yield outcome
+        finally:
+            stats = pool.stats()
+            utilisation = ", ".join(f"{u:.0%}" for u in stats.utilisation)
+            self.logger.info(
+                f"Worker pool: {stats.workers} workers processed {stats.processed} links in "
+                f"{stats.elapsed_s:.1f}s (utilisation per worker: {utilisation})"
+            )
+            self.logger.info(f"Page pool: {self.playwright_manager.page_pool_stats().to_dict()}")
+
+    async def extract_match_odds(
+        self,
+        sport: str,
+        match_links: list[str] | AsyncIterable[str],
+        markets: list[str] | None = None,
+        scrape_odds_history: bool = False,
+        target_bookmaker: str | None = None,
+        concurrent_scraping_task: int = 3,
+        preview_submarkets_only: bool = False,
+        bookies_filter: BookiesFilter = BookiesFilter.ALL,
+        period: Enum | None = None,
+        retry_config: RetryConfig | None = None,
+        request_delay: float = DEFAULT_REQUEST_DELAY_S,
+        live_mode: bool = False,
+        season: str | None = None,
+    ) -> ScrapeResult:
+        """
+        Extract odds for a list of match links concurrently.
 
-                finally:
-                    if tab:
-                        await tab.close()
+        Collects `iter_match_odds`. With a `record_sink` configured, each successful record is
+        handed to the sink as soon as it is scraped and only counted in the result; failures
+        are always kept. Otherwise records are buffered and returned in link order.
 
-        # Execute all scraping tasks concurrently
-        tasks = [scrape_with_semaphore(link) for link in match_links]
-        results = await asyncio.gather(*tasks)
+        Each match's phase breakdown is logged at debug level; `result.latency` keeps the
+        per-phase histograms and the breakdowns of the slowest matches.
 
-        # Process results
-        for _link, data, failed_url in results:
-            if data is not None:
-                result.success.append(data)
+        Args:
+            sport (str): The sport to scrape odds for.
+            match_links (List[str] | AsyncIterable[str]): The match links to scrape odds for.
+            markets (Optional[List[str]]: The list of markets to scrape.
+            scrape_odds_history (bool): Whether to scrape and attach odds history.
+            target_bookmaker (str): If set, only scrape odds for this bookmaker.
+            concurrent_scraping_task (int): Controls how many pages are processed simultaneously.
+            preview_submarkets_only (bool): If True, only scrape the collapsed submarket odds (best/highest shown
+            per line, not per-bookmaker) from visible submarkets without loading individual bookmaker details.
+            bookies_filter (BookiesFilter): The bookmaker filter to apply.
+            period: The period to scrape odds for.
+            retry_config: Configuration for per-match retry behavior.
+            season (Optional[str]): If set, stamped on each record.
+
+        Returns:
+            ScrapeResult: Contains successful results, failed URLs with error details, and statistics.
+        """
+        result = ScrapeResult()
+        buffered: list[MatchOutcome] = []
+
+        async for outcome in self.iter_match_odds(
+            sport=sport,
+            match_links=match_links,
+            markets=markets,
+            scrape_odds_history=scrape_odds_history,
+            target_bookmaker=target_bookmaker,
+            concurrent_scraping_task=concurrent_scraping_task,
+            preview_submarkets_only=preview_submarkets_only,
+            bookies_filter=bookies_filter,
+            period=period,
+            retry_config=retry_config,
+            request_delay=request_delay,
+            live_mode=live_mode,
+            season=season,
+        ):
+            result.stats.total_urls += 1
+            breakdown = result.latency.record(outcome.link, outcome.timings, outcome.duration_s)
+            self.logger.debug(f"Latency of {outcome.link}: {breakdown}")
+            if outcome.data is not None:
                 result.stats.successful += 1
-            elif failed_url is not None:
-                result.failed.append(failed_url)
+                # Live rows are still filtered by the caller (`_live_ended`), so they stay buffered.
+                if self.record_sink is not None and not live_mode:
+                    self.record_sink(outcome.data)
+                    continue
+            elif outcome.failed is not None:
                 result.stats.failed += 1
+            buffered.append(outcome)
+
+        for outcome in sorted(buffered, key=lambda o: o.index):
+            if outcome.data is not None:
+                result.success.append(outcome.data)
+            elif outcome.failed is not None:
+                result.failed.append(outcome.failed)
 
         # Log summary
         self.logger.info(
@@ -887,21 +1339,28 @@ class BaseScraper:
         # Errors after a successful load are content/DOM issues and must not
         # blacklist a proxy, so they are swallowed to None below except
         # H2HFragmentResolutionError, which is deliberately re-raised.
-        await page.goto(match_link, timeout=NAVIGATION_TIMEOUT_MS, wait_until="domcontentloaded")
+        with timed_phase("navigation"):
+            await page.goto(match_link, timeout=NAVIGATION_TIMEOUT_MS, wait_until="domcontentloaded")
 
         try:
-            # Wait a bit for dynamic content to load
-            await page.wait_for_timeout(DYNAMIC_CONTENT_WAIT_MS)
+            # Wait for the odds table to render, at most `DYNAMIC_CONTENT_WAIT_MS`
+            with timed_phase("render_wait"):
+                await self.readiness.odds_rendered(page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
 
             # Apply bookmaker filter before extracting odds
-            await self.selection_manager.ensure_selected(
-                page=page,
-                target_value=bookies_filter.value,
-                display_label=BookiesFilter.get_display_label(bookies_filter),
-                strategy=BOOKIES_FILTER_STRATEGY,
-            )
+            with timed_phase("bookies_filter"):
+                await self.selection_manager.ensure_selected(
+                    page=page,
+                    target_value=bookies_filter.value,
+                    display_label=BookiesFilter.get_display_label(bookies_filter),
+                    strategy=BOOKIES_FILTER_STRATEGY,
+                )
+                # Odds format and bookies filter are now set on this context; saved once so new
+                # contexts and later runs open match pages already configured.
+                await self.playwright_manager.save_storage_state(page.context)
 
-            match_details = await self._extract_match_details_event_header(page, match_link)
+            with timed_phase("match_header"):
+                match_details = await self._extract_match_details_event_header(page, match_link)
 
             if not match_details:
                 self.logger.warning(
@@ -910,7 +1369,9 @@ class BaseScraper:
                 return None
 
             if live_mode:
-                live_info = _parse_live_info(BeautifulSoup(await page.content(), "lxml"))
+                live_info = await self.parsing_executor.run(
+                    _parse_live_info_html, await self.dom_snapshots.content(page, LIVE_INFO_REGION)
+                )
                 if live_info is None:
                     # No live-info header: the match ended (or lost live coverage)
                     # between listing and visit. Not a scraping failure.
@@ -925,15 +1386,16 @@ class BaseScraper:
                     # Convert period enum to internal value for market extractor
                     # If period is None, get_internal_value will return None and market extractor will use default
                     period_internal = period.get_internal_value(period) if period else None
-                    market_data = await self.market_extractor.scrape_markets(
-                        page=page,
-                        sport=sport,
-                        markets=markets,
-                        period=period_internal,
-                        scrape_odds_history=scrape_odds_history,
-                        target_bookmaker=target_bookmaker,
-                        preview_submarkets_only=preview_submarkets_only,
-                    )
+                    with timed_phase("markets"):
+                        market_data = await self.market_extractor.scrape_markets(
+                            page=page,
+                            sport=sport,
+                            markets=markets,
+                            period=period_internal,
+                            scrape_odds_history=scrape_odds_history,
+                            target_bookmaker=target_bookmaker,
+                            preview_submarkets_only=preview_submarkets_only,
+                        )
                     if market_data:
                         match_details.update(market_data)
                     else:
@@ -965,110 +1427,26 @@ class BaseScraper:
             return UTC
 
     def _parse_match_date_from_dom(self, soup: BeautifulSoup) -> str | None:
-        """
-        Extract the match date from <div data-testid="game-time-item"> and
-        return it formatted as "YYYY-MM-DD HH:MM:SS UTC".
-
-        Returns None if the div or its child paragraphs are missing, or if
-        the text doesn't match the expected "DD MMM YYYY" + "HH:MM" shape.
-        """
-        try:
-            game_time_div = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_TIME_TESTID})
-            if not game_time_div:
-                return None
-
-            paragraphs = game_time_div.find_all("p")
-            if len(paragraphs) < 3:
-                return None
-
-            date_part = paragraphs[1].get_text(strip=True).rstrip(",")
-            time_part = paragraphs[2].get_text(strip=True)
-            local_dt = datetime.strptime(f"{date_part} {time_part}", "%d %b %Y %H:%M")
-            local_dt = local_dt.replace(tzinfo=self._resolved_browser_timezone())
-            return format_utc(local_dt)
-        except Exception as e:
-            self.logger.warning(f"DOM parse failed for match_date: {e}")
-            return None
+        """Match date from the DOM in the browser timezone, as UTC (see `_match_date_from_dom`)."""
+        return _match_date_from_dom(soup, self._resolved_browser_timezone())
 
     def _parse_teams_from_dom(self, soup: BeautifulSoup) -> tuple[str | None, str | None]:
-        """
-        Extract (home_team, away_team) from <div data-testid="game-host">
-        and <div data-testid="game-guest">. Returns (None, None) if either
-        side is missing - caller falls back to JSON for both fields.
-        """
-        try:
-            host = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_HOST_TESTID})
-            guest = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_GUEST_TESTID})
-            host_p = host.find("p") if host else None
-            guest_p = guest.find("p") if guest else None
-            if not host_p or not guest_p:
-                return None, None
-            return host_p.get_text(strip=True), guest_p.get_text(strip=True)
-        except Exception as e:
-            self.logger.warning(f"DOM parse failed for teams: {e}")
-            return None, None
-
-    _SEASON_SUFFIX_RE = re.compile(r"\s+\d{4}/\d{4}$")
+        """(home_team, away_team) from the DOM (see `_teams_from_dom`)."""
+        return _teams_from_dom(soup)
 
     def _parse_league_from_dom(self, soup: BeautifulSoup) -> str | None:
-        """
-        Extract the league name from the breadcrumb navigation, stripping
-        the trailing season suffix when present (e.g. "Premier League 2024/2025"
-        -> "Premier League"). Returns None if the breadcrumb or league link is
-        missing.
-        """
-        try:
-            breadcrumbs = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_BREADCRUMBS_TESTID})
-            if not breadcrumbs:
-                return None
-            league_link = breadcrumbs.find(
-                "a", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_BREADCRUMB_LEAGUE_TESTID}
-            )
-            if not league_link:
-                return None
-            raw = league_link.get_text(strip=True)
-            return self._SEASON_SUFFIX_RE.sub("", raw) or None
-        except Exception as e:
-            self.logger.warning(f"DOM parse failed for league_name: {e}")
-            return None
-
-    _RESULT_TEXT_RE = re.compile(r"(\d+)\s*:\s*(\d+)(?:\s*\(([\d:,\s ]+)\))?")
+        """League name from the breadcrumb (see `_league_from_dom`)."""
+        return _league_from_dom(soup)
 
     def _parse_results_from_dom(self, soup: BeautifulSoup) -> tuple[str | None, str | None, str | None]:
-        """
-        Extract (home_score, away_score, partial_results) from the page DOM.
-
-        Scoped to descendants of <div data-testid="game-time-item">'s parent
-        to avoid false positives elsewhere in the page. Returns (None, None,
-        None) if the score pattern isn't found.
-        """
-        try:
-            game_time_div = soup.find("div", attrs={"data-testid": OddsPortalSelectors.MATCH_DETAILS_GAME_TIME_TESTID})
-            if not game_time_div:
-                return None, None, None
-            scope = game_time_div.find_parent() or soup
-            excluded = {id(game_time_div), *(id(d) for d in game_time_div.find_all("div"))}
-            for div in scope.find_all("div"):
-                if id(div) in excluded:
-                    continue
-                text = div.get_text(separator=" ", strip=True)
-                m = self._RESULT_TEXT_RE.search(text)
-                if m:
-                    home, away, partial = m.group(1), m.group(2), m.group(3)
-                    formatted_partial = (
-                        f"({re.sub(r' +', ' ', partial.replace(chr(0xA0), ' ')).strip()})" if partial else None
-                    )
-                    return home, away, formatted_partial
-            return None, None, None
-        except Exception as e:
-            self.logger.warning(f"DOM parse failed for results: {e}")
-            return None, None, None
+        """(home_score, away_score, partial_results) from the DOM (see `_results_from_dom`)."""
+        return _results_from_dom(soup)
 
     async def _resolve_h2h_fragment_mismatch(
         self,
         page: Page,
         fragment: str,
-    ) -> tuple[BeautifulSoup, dict[str, Any]] | None:
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
         """
         Force the OddsPortal React SPA to swap to the fragment-targeted match
         and re-read the page payload.
@@ -1081,7 +1459,7 @@ class BaseScraper:
         to nudge it, then wait until `react-event-header`'s `eventData.id`
         matches the requested fragment.
 
-        Returns the updated (soup, json_data) on success, or None if the page
+        Returns the updated (DOM header fields, json_data) on success, or None if the page
         payload is unreadable afterwards. Raises H2HFragmentResolutionError if
         the SPA never swaps to the requested match.
         """
@@ -1123,19 +1501,11 @@ class BaseScraper:
             self.logger.error(f"H2H fragment resolution raised unexpected error for fragment={fragment}: {e}")
             return None
 
-        html_content = await page.content()
-        soup = BeautifulSoup(html_content, "html.parser")
-        header_div = soup.find("div", id="react-event-header")
-        if not header_div:
-            return None
-        data_attribute = header_div.get("data")
-        if not data_attribute:
+        html_content = await self.dom_snapshots.content(page, EVENT_HEADER_REGION)
+        parsed = _parse_event_header_html(html_content, self._resolved_browser_timezone(), self.parser_backend)
+        if "error" in parsed:
             return None
-        try:
-            json_data = json.loads(data_attribute)
-        except (TypeError, json.JSONDecodeError):
-            return None
-        return soup, json_data
+        return parsed["dom"], parsed["json_data"]
 
     async def _extract_match_details_event_header(self, page: Page, match_link: str) -> dict[str, Any] | None:
         """
@@ -1156,25 +1526,24 @@ class BaseScraper:
             except Exception:
                 self.logger.warning("React event header selector not found, attempting to parse existing content")
 
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-            event_header_div = soup.find("div", id="react-event-header")
+            html_content = await self.dom_snapshots.content(page, EVENT_HEADER_REGION)
+            browser_tz = self._resolved_browser_timezone()
+            parsed = await self.parsing_executor.run(
+                _parse_event_header_html, html_content, browser_tz, self.parser_backend
+            )
 
-            if not event_header_div:
+            if parsed.get("error") == "no_header":
                 self.logger.warning("React event header div not found in page content")
                 return None
-
-            data_attribute = event_header_div.get("data")
-            if not data_attribute:
+            if parsed.get("error") == "no_data":
                 self.logger.warning("React event header div found but 'data' attribute is missing")
                 return None
-
-            try:
-                json_data = json.loads(data_attribute)
-            except (TypeError, json.JSONDecodeError) as e:
-                self.logger.error(f"Failed to parse JSON data from react event header: {e}")
+            if "error" in parsed:
+                self.logger.error(parsed["error"])
                 return None
 
+            json_data = parsed["json_data"]
+            dom = parsed["dom"]
             event_body = json_data.get("eventBody", {})
             event_data = json_data.get("eventData", {})
 
@@ -1205,7 +1574,7 @@ class BaseScraper:
                     if event_body.get("startDate")
                     else None
                 )
-                ssr_dom_date = self._parse_match_date_from_dom(soup)
+                ssr_dom_date = dom["match_date"]
                 dom_resolved_independently = ssr_dom_date is not None and ssr_dom_date != ssr_json_date
                 if dom_resolved_independently:
                     self.logger.info(
@@ -1220,7 +1589,7 @@ class BaseScraper:
                     resolved = await self._resolve_h2h_fragment_mismatch(page=page, fragment=fragment)
                     if resolved is None:
                         return None
-                    soup, json_data = resolved
+                    dom, json_data = resolved
                     event_body = json_data.get("eventBody", {})
                     event_data = json_data.get("eventData", {})
 
@@ -1231,10 +1600,10 @@ class BaseScraper:
             )
 
             # DOM extraction (each helper returns None on failure)
-            dom_match_date = self._parse_match_date_from_dom(soup)
-            dom_home, dom_away = self._parse_teams_from_dom(soup)
-            dom_league = self._parse_league_from_dom(soup)
-            dom_home_score, dom_away_score, dom_partial = self._parse_results_from_dom(soup)
+            dom_match_date = dom["match_date"]
+            dom_home, dom_away = dom["home_team"], dom["away_team"]
+            dom_league = dom["league_name"]
+            dom_home_score, dom_away_score, dom_partial = dom["home_score"], dom["away_score"], dom["partial_results"]
 
             # Per-field fallback: DOM wins when present, else JSON
             match_date = dom_match_date if dom_match_date is not None else json_match_date
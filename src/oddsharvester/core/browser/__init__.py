@@ -4,6 +4,12 @@ Each helper is independent and focused on one responsibility:
 - CookieDismisser: dismiss the cookie consent banner
 - SelectionManager: ensure a navigation control (filter, period) is set to a target value
 - MarketTabNavigator: navigate to a market tab, including those hidden under "More"
-- PageScroller: incremental scrolling and scroll-to-element-and-click
+- MarketLabelCache: per-mirror localized tab label for each market code, persisted across runs
+- PageScroller: in-page scroll-to-load (MutationObserver) and single-call locate-scroll-and-click
 - PaginationWalker: decide how far a listing walk goes when the pagination widget is unreliable
+- PageReadiness: wait for rendered, stable rows, the active market and a quiet network instead of fixed sleeps
+- StorageStateStore: persist a configured context's cookies/localStorage so new contexts start configured
+- json_file: the env-configured JSON files under the user cache behind MarketLabelCache and StorageStateStore
+- ResourceBlocker: abort the requests a scrape does not need (images, fonts, trackers) per a blocking profile
+- DomSnapshots: outer HTML of named page regions (event header, bookmaker table, ...) instead of the full page
 """
@@ -0,0 +1,186 @@
+"""See module docstring in core/browser/__init__.py."""
+
+from dataclasses import dataclass
+import logging
+from weakref import WeakKeyDictionary
+
+from playwright.async_api import Page
+
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+
+
+@dataclass(frozen=True)
+class RegionPart:
+    """Elements of a region: the first match of `selector` (every match with `every`), `ancestor` levels up."""
+
+    selector: str
+    ancestor: int = 0
+    every: bool = False
+
+
+@dataclass(frozen=True)
+class DomRegion:
+    """
+    A named part of the page whose outer HTML is all a parser needs.
+
+    The fragment is the outer HTML of the elements the parts select, outermost first and in
+    document order, so a parser that searches it finds the same elements it would find in the
+    full document. `required` names an element without which the region cannot stand in for
+    the document (the snapshot is then None and callers read `page.content()`).
+    """
+
+    name: str
+    parts: tuple[RegionPart, ...]
+    required: str | None = None
+
+
+def _testid(testid: str) -> str:
+    return f'div[data-testid="{testid}"]'
+
+
+# The React header mount plus the DOM fields read alongside its JSON (PR #54): kickoff,
+# teams, breadcrumbs, and the game-time item's parent, which scopes the final score.
+EVENT_HEADER_REGION = DomRegion(
+    name="event_header",
+    parts=(
+        RegionPart("div#react-event-header"),
+        RegionPart(_testid(OddsPortalSelectors.MATCH_DETAILS_GAME_TIME_TESTID), ancestor=1),
+        RegionPart(_testid(OddsPortalSelectors.MATCH_DETAILS_GAME_HOST_TESTID)),
+        RegionPart(_testid(OddsPortalSelectors.MATCH_DETAILS_GAME_GUEST_TESTID)),
+        RegionPart(_testid(OddsPortalSelectors.MATCH_DETAILS_BREADCRUMBS_TESTID)),
+    ),
+    required="div#react-event-header",
+)
+
+# Absent on a match that is not in play, which is an answer in itself: an empty fragment.
+LIVE_INFO_REGION = DomRegion(
+    name="live_info",
+    parts=(RegionPart(f'[data-testid="{OddsPortalSelectors.LIVE_INFO_TESTID}"]'),),
+)
+
+# `OddsParser` only looks under the table header's parent; without a header it searches the
+# whole document, so the region is unavailable then.
+BOOKMAKER_TABLE_REGION = DomRegion(
+    name="bookmaker_table",
+    parts=(RegionPart(_testid(OddsPortalSelectors.BOOKMAKER_TABLE_HEADER_TESTID), ancestor=1),),
+    required=_testid(OddsPortalSelectors.BOOKMAKER_TABLE_HEADER_TESTID),
+)
+
+# Every row `SubmarketExtractor` matches (class containing the row class, as its regex does).
+SUBMARKET_LIST_REGION = DomRegion(
+    name="submarket_list",
+    parts=(RegionPart(f'div[class*="{OddsPortalSelectors.BOOKMAKER_ROW_CLASS}"]', every=True),),
+)
+
+# The page side keeps an epoch, a per-document token plus a counter bumped by every click
+# and every same-document navigation (hash change, history entry). A fragment read under the
+# current epoch is still what the page shows, so it is not sent again.
+_SNAPSHOT_JS = """
+(args) => {
+  let state = window.__ohDomSnapshot;
+  if (!state) {
+    state = {token: Math.random().toString(36).slice(2), version: 0};
+    const bump = () => { state.version += 1; };
+    document.addEventListener("click", bump, true);
+    window.addEventListener("hashchange", bump);
+    window.addEventListener("popstate", bump);
+    for (const method of ["pushState", "replaceState"]) {
+      const original = history[method];
+      history[method] = function (...rest) { bump(); return original.apply(this, rest); };
+    }
+    window.__ohDomSnapshot = state;
+  }
+  const epoch = `${state.token}:${state.version}`;
+  const regions = {};
+  for (const region of args.regions) {
+    if (epoch === args.epoch && args.cached.includes(region.name)) continue;
+    if (region.required && !document.querySelector(region.required)) {
+      regions[region.name] = null;
+      continue;
+    }
+    const picked = [];
+    for (const part of region.parts) {
+      const matches = part.every
+        ? Array.from(document.querySelectorAll(part.selector))
+        : [document.querySelector(part.selector)];
+      for (let element of matches) {
+        for (let level = 0; element && level < part.ancestor; level++) element = element.parentElement;
+        if (element && !picked.includes(element)) picked.push(element);
+      }
+    }
+    const outermost = picked.filter((element) => !picked.some((other) => other !== element && other.contains(element)));
+    outermost.sort((a, b) => (a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1));
+    regions[region.name] = outermost.map((element) => element.outerHTML).join("");
+  }
+  return {epoch, regions};
+}
+"""
+
+
+class DomSnapshots:
+    """
+    Outer HTML of named page regions, cached until the next navigation or click.
+
+    `page.content()` serialises the whole match page (several MB) over CDP, and the parser
+    then rebuilds all of it to read one container. A region snapshot sends only that
+    container, and parsers run on the fragment unchanged. Asking again for a region already
+    read costs one small round trip that returns nothing while the page has not navigated or
+    been clicked since.
+
+    `content` falls back to `page.content()` whenever the region cannot be read, so callers
+    always get HTML their parser understands.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # Per page: the epoch the fragments were read under, and the fragments by region name.
+        self._cache: WeakKeyDictionary[Page, tuple[str, dict[str, str]]] = WeakKeyDictionary()
+
+    async def snapshot(self, page: Page, *regions: DomRegion) -> dict[str, str | None]:
+        """
+        Read several regions in one round trip.
+
+        Returns:
+            dict[str, str | None]: Fragment per region name; None where the region is unavailable.
+        """
+        epoch, cached = self._cache.get(page, (None, {}))
+        try:
+            result = await page.evaluate(
+                _SNAPSHOT_JS,
+                {
+                    "epoch": epoch,
+                    "cached": list(cached),
+                    "regions": [
+                        {
+                            "name": region.name,
+                            "required": region.required,
+                            "parts": [
+                                {"selector": part.selector, "ancestor": part.ancestor, "every": part.every}
+                                for part in region.parts
+                            ],
+                        }
+                        for region in regions
+                    ],
+                },
+            )
+        except Exception as e:
+            self.logger.debug(f"DOM snapshot failed: {e}")
+            return {region.name: None for region in regions}
+        if not isinstance(result, dict) or not isinstance(result.get("regions"), dict):
+            return {region.name: None for region in regions}
+
+        fragments = dict(cached) if result.get("epoch") == epoch else {}
+        fragments.update({name: html for name, html in result["regions"].items() if isinstance(html, str)})
+        self._cache[page] = (result.get("epoch"), fragments)
+        return {region.name: fragments.get(region.name) for region in regions}
+
+    async def content(self, page: Page, region: DomRegion) -> str:
+        """The region's fragment, or the full `page.content()` when the region cannot be read."""
+        html = (await self.snapshot(page, region))[region.name]
+        if html is None:
+            html = await page.content()
+        return html if isinstance(html, str) else ""
+
+    def invalidate(self, page: Page) -> None:
+        """Forget the fragments of `page` (for DOM changes that are neither a click nor a navigation)."""
+        self._cache.pop(page, None)
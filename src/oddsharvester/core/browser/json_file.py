@@ -0,0 +1,58 @@
+"""See module docstring in core/browser/__init__.py."""
+
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+CACHE_DIR = Path.home() / ".cache" / "oddsharvester"
+
+
+def path_from_env(env_var: str, default: Path) -> Path | None:
+    """The file named by `env_var`: `default` when unset, None (no persistence) when set to an empty string."""
+    configured = os.environ.get(env_var)
+    if configured is None:
+        return default
+    return Path(configured).expanduser() if configured.strip() else None
+
+
+def read_json(path: Path | None, logger: logging.Logger, description: str) -> Any | None:
+    """The parsed content of `path`; None when there is no file or it cannot be read (logged as `description`)."""
+    if path is None or not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {description} {path}: {e}")
+        return None
+
+
+def write_json_atomically(path: Path, data: Any, **dump_kwargs: Any) -> None:
+    """
+    Replace `path` with `data` as JSON, so readers see the old or the new file, never a partial one.
+
+    Each call writes its own temporary file next to `path`: shard and queue-worker processes
+    share the cache files, and a shared temporary name would let one process move another's
+    half-written file into place. Concurrent writers each replace the whole file; the last wins.
+
+    Raises:
+        OSError: If the file could not be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+        try:
+            json.dump(data, tmp_file, indent=4, ensure_ascii=False, **dump_kwargs)
+        except BaseException:
+            tmp_file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,90 @@
+"""See module docstring in core/browser/__init__.py."""
+
+import logging
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from oddsharvester.core.browser.json_file import CACHE_DIR, path_from_env, read_json, write_json_atomically
+
+MARKET_LABEL_CACHE_ENV_VAR = "OH_MARKET_LABEL_CACHE"
+DEFAULT_MARKET_LABEL_CACHE_PATH = CACHE_DIR / "market_tab_labels.json"
+
+
+class MarketLabelCache:
+    """
+    Localized market tab label per market code, per mirror, persisted as JSON.
+
+    On a regional mirror the tab labels are translated, so `MarketTabNavigator` finds a market
+    by clicking tabs until the URL fragment shows its code (gotchas §7). The label that produced
+    a code does not change between matches of a mirror, so it is kept here, keyed by the page's
+    scheme and host, and clicked first next time. A label that stops producing its code is
+    forgotten.
+
+    The file is read on first use and rewritten (atomically) whenever a mapping is learned or
+    forgotten. Set `OH_MARKET_LABEL_CACHE` to another path, or to an empty string to keep the
+    cache in memory only.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Args:
+            path (Path | None): JSON file the mappings are read from and saved to; None keeps them in memory.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self._labels: dict[str, dict[str, str]] | None = None
+
+    @classmethod
+    def from_env(cls) -> "MarketLabelCache":
+        """Cache at `OH_MARKET_LABEL_CACHE`, or at the default path when unset."""
+        return cls(path_from_env(MARKET_LABEL_CACHE_ENV_VAR, DEFAULT_MARKET_LABEL_CACHE_PATH))
+
+    def label_for(self, page_url: str, market_code: str) -> str | None:
+        """The label that last opened `market_code` on the mirror serving `page_url`, if known."""
+        return self._mirror(page_url).get(market_code)
+
+    def learn(self, page_url: str, label: str, market_code: str) -> None:
+        """Record that clicking `label` on the mirror serving `page_url` opens `market_code`."""
+        mirror = self._mirror(page_url)
+        if mirror.get(market_code) == label:
+            return
+        mirror[market_code] = label
+        self._save()
+
+    def forget(self, page_url: str, market_code: str) -> None:
+        """Drop the label of `market_code` on the mirror serving `page_url` (it no longer opens that market)."""
+        if self._mirror(page_url).pop(market_code, None) is not None:
+            self.logger.info(f"Cached label for market code '{market_code}' is stale; forgetting it.")
+            self._save()
+
+    def _mirror(self, page_url: str) -> dict[str, str]:
+        if self._labels is None:
+            self._labels = self._load()
+        return self._labels.setdefault(mirror_origin(page_url), {})
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        data = read_json(self.path, self.logger, "market label cache")
+        if not isinstance(data, dict):
+            return {}
+        return {
+            origin: {code: label for code, label in labels.items() if isinstance(label, str)}
+            for origin, labels in data.items()
+            if isinstance(labels, dict)
+        }
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        labels = {origin: mapping for origin, mapping in (self._labels or {}).items() if mapping}
+        try:
+            write_json_atomically(self.path, labels, sort_keys=True)
+        except OSError as e:
+            self.logger.warning(f"Could not save market label cache {self.path}: {e}")
+
+
+def mirror_origin(page_url: str) -> str:
+    """The mirror serving a page: scheme and host of its URL, e.g. https://www.oddsportal.com."""
+    if not isinstance(page_url, str):
+        return ""
+    parts = urlsplit(page_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
@@ -1,32 +1,103 @@
 """See module docstring in core/browser/__init__.py."""
 
 import logging
+from urllib.parse import urlsplit
 
 from playwright.async_api import Page
 
+from oddsharvester.core.browser.market_label_cache import MarketLabelCache, mirror_origin
 from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
 from oddsharvester.utils.constants import (
     DEFAULT_MARKET_TIMEOUT_MS,
     DROPDOWN_WAIT_MS,
+    FRAGMENT_NAVIGATION_MAX_MISSES,
+    FRAGMENT_NAVIGATION_TIMEOUT_MS,
     MARKET_TAB_TIMEOUT_MS,
     TAB_SWITCH_WAIT_MS,
 )
 
+# One awaited call for `_navigate_by_fragment`: writes `#<match id>:<market code>;<scope>` into
+# the URL and waits, per animation frame, for the content to follow: the active tab changed
+# (when the market does), the first bookmaker rows re-rendered and no fetch/XHR in flight. The
+# URL alone proves nothing (gotchas §1), so if the content does not switch within `timeoutMs`
+# the previous URL is put back and the caller clicks the tab instead.
+_FRAGMENT_ROUTE_JS = """
+async (args) => {
+  const started = performance.now();
+  const frame = () => new Promise((resolve) => {
+    const timer = setTimeout(resolve, 50);
+    requestAnimationFrame(() => { clearTimeout(timer); resolve(); });
+  });
+  const activeTab = () => {
+    const tab = document.querySelector(args.activeTabSelector);
+    return tab ? (tab.textContent || "").trim() : null;
+  };
+  const rows = () => {
+    const found = Array.from(document.querySelectorAll(args.rowSelector));
+    return found.length + "|" + found.slice(0, 5).map((row) => row.textContent).join("|");
+  };
+  const previousUrl = location.href;
+  const tabBefore = activeTab();
+  const rowsBefore = rows();
+  const target = "#" + args.fragment;
+  location.hash = args.fragment;
+  window.dispatchEvent(new PopStateEvent("popstate", {state: history.state}));
+  while (performance.now() - started < args.timeoutMs) {
+    await frame();
+    const tab = activeTab();
+    const switched = location.hash === target
+      && (!args.marketChanges || (tab !== null && tab !== tabBefore))
+      && rows() !== rowsBefore
+      && !window.__ohPendingRequests;
+    if (switched) {
+      return {switched: true, tab, elapsedMs: performance.now() - started};
+    }
+  }
+  history.replaceState(history.state, "", previousUrl);
+  return {switched: false, tab: activeTab(), elapsedMs: performance.now() - started};
+}
+"""
+
 
 class MarketTabNavigator:
     """Navigate to a market tab on the odds page, with fallback to the 'More' dropdown."""
 
-    def __init__(self):
+    def __init__(self, label_cache: MarketLabelCache | None = None):
+        """
+        Args:
+            label_cache (MarketLabelCache | None): Localized tab labels learned by the market-code
+                fallback; an in-memory cache when None.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
-
-    async def navigate_to_tab(self, page: Page, market_tab_name: str, timeout: int = MARKET_TAB_TIMEOUT_MS) -> bool:
+        self.label_cache = label_cache or MarketLabelCache()
+        # Per mirror: consecutive fragment navigations the content did not follow.
+        self._fragment_misses: dict[str, int] = {}
+
+    async def navigate_to_tab(
+        self,
+        page: Page,
+        market_tab_name: str,
+        timeout: int = MARKET_TAB_TIMEOUT_MS,
+        period_scope: int | None = None,
+    ) -> bool:
         """Navigate to a specific market tab by its name.
 
-        First tries visible tabs, then the "More" dropdown. Verifies the tab becomes active.
+        First tries writing the market code (and `period_scope`, when given) into the URL fragment,
+        then the label this mirror is known to use for the market (see `MarketLabelCache`), then
+        visible tabs, then the "More" dropdown. Verifies the tab becomes active.
         Returns True on success, False otherwise.
         """
         self.logger.info(f"Attempting to navigate to market tab: {market_tab_name}")
 
+        target_code = OddsPortalSelectors.MARKET_TAB_CODES.get(market_tab_name)
+        if target_code and await self._navigate_by_fragment(page, target_code, period_scope):
+            self.logger.info(f"Successfully navigated to {market_tab_name} tab (via URL fragment).")
+            return True
+
+        if target_code and await self._navigate_by_cached_label(page, target_code):
+            self.logger.info(f"Successfully navigated to {market_tab_name} tab (via cached mirror label).")
+            return True
+
         market_found = False
         for selector in OddsPortalSelectors.MARKET_TAB_SELECTORS:
             if await self._wait_and_click(page=page, selector=selector, text=market_tab_name, timeout=timeout):
@@ -49,7 +120,6 @@ class MarketTabNavigator:
                 self.logger.warning(f"Tab {market_tab_name} was clicked but is not active.")
 
         # Localized-mirror fallback: match the URL-fragment market code (gotchas §7).
-        target_code = OddsPortalSelectors.MARKET_TAB_CODES.get(market_tab_name)
         if target_code and await self._navigate_by_code(page, target_code):
             self.logger.info(f"Successfully navigated to {market_tab_name} tab (via market-code fallback).")
             return True
@@ -60,8 +130,85 @@ class MarketTabNavigator:
         )
         return False
 
+    async def _navigate_by_fragment(self, page: Page, target_code: str, period_scope: int | None) -> bool:
+        """Switch market (and period) by writing `#<match id>:<code>;<scope>`; True once the content followed.
+
+        The SPA may ignore a written fragment for market switching (gotchas §7). A single miss can
+        also be a slow render on a loaded page, so fragment routing is only given up on a mirror,
+        for the rest of the run, after `FRAGMENT_NAVIGATION_MAX_MISSES` misses in a row.
+        """
+        url = page.url
+        if not isinstance(url, str):
+            return False
+        mirror = mirror_origin(url)
+        if self._fragment_misses.get(mirror, 0) >= FRAGMENT_NAVIGATION_MAX_MISSES:
+            return False
+
+        current_code = OddsPortalSelectors.market_code_from_url(url)
+        current_scope = OddsPortalSelectors.period_scope_from_url(url)
+        scope = period_scope if period_scope is not None else current_scope
+        if current_code == target_code and (scope is None or scope == current_scope):
+            return True
+        match_id = _match_id_from_url(url)
+        if not match_id or scope is None:
+            return False
+
+        args = {
+            "fragment": f"{match_id}:{target_code};{scope}",
+            "marketChanges": current_code != target_code,
+            "activeTabSelector": OddsPortalSelectors.ACTIVE_MARKET_TAB_SELECTOR,
+            "rowSelector": OddsPortalSelectors.BOOKMAKER_ROW_CSS,
+            "timeoutMs": FRAGMENT_NAVIGATION_TIMEOUT_MS,
+        }
+        try:
+            outcome = await page.evaluate(_FRAGMENT_ROUTE_JS, args)
+        except Exception as e:
+            self.logger.debug(f"Fragment navigation to '{target_code}' failed: {e}")
+            return False
+        if not isinstance(outcome, dict):
+            return False
+
+        if outcome.get("switched"):
+            self._fragment_misses[mirror] = 0
+            return True
+        misses = self._fragment_misses.get(mirror, 0) + 1
+        self._fragment_misses[mirror] = misses
+        if misses < FRAGMENT_NAVIGATION_MAX_MISSES:
+            self.logger.debug(
+                f"Content did not follow the URL fragment to '{target_code}' on {mirror} "
+                f"({misses}/{FRAGMENT_NAVIGATION_MAX_MISSES} misses); clicking the tab."
+            )
+        else:
+            self.logger.info(
+                f"Writing the URL fragment does not switch markets on {mirror}; clicking tabs for the rest of the run."
+            )
+        return False
+
+    async def _navigate_by_cached_label(self, page: Page, target_code: str) -> bool:
+        """Click the tab label cached for `target_code` on this mirror; forget it if it opens another market."""
+        label = self.label_cache.label_for(page.url, target_code)
+        if not label:
+            return False
+        try:
+            await self._open_more_dropdown(page)
+            if await self._click_by_text(page, OddsPortalSelectors.MARKET_TAB_ITEM_SELECTOR, label):
+                await page.wait_for_timeout(TAB_SWITCH_WAIT_MS)
+                code = OddsPortalSelectors.market_code_from_url(page.url)
+                if code:
+                    self.label_cache.learn(page.url, label, code)
+                if code == target_code:
+                    return True
+        except Exception as e:
+            self.logger.debug(f"Cached label '{label}' for code '{target_code}' could not be clicked: {e}")
+        self.label_cache.forget(page.url, target_code)
+        return False
+
     async def _navigate_by_code(self, page: Page, target_code: str) -> bool:
-        """Click each tab and match the URL-fragment market code (localized mirrors)."""
+        """Click each tab and match the URL-fragment market code (localized mirrors).
+
+        Every label clicked on the way is cached with the code it opened, so later matches on
+        this mirror click the right tab first time, for this market and the others scanned.
+        """
         try:
             await self._open_more_dropdown(page)
             elements = await page.query_selector_all(OddsPortalSelectors.MARKET_TAB_ITEM_SELECTOR)
@@ -80,7 +227,10 @@ class MarketTabNavigator:
                 if not await self._click_by_text(page, OddsPortalSelectors.MARKET_TAB_ITEM_SELECTOR, label):
                     continue
                 await page.wait_for_timeout(TAB_SWITCH_WAIT_MS)
-                if OddsPortalSelectors.market_code_from_url(page.url) == target_code:
+                code = OddsPortalSelectors.market_code_from_url(page.url)
+                if code:
+                    self.label_cache.learn(page.url, label, code)
+                if code == target_code:
                     self.logger.info(f"Market-code fallback matched tab '{label}' -> code '{target_code}'.")
                     return True
 
@@ -221,3 +371,13 @@ class MarketTabNavigator:
         except Exception as e:
             self.logger.error(f"Error verifying tab is active: {e}")
             return False
+
+
+def _match_id_from_url(url: str) -> str | None:
+    """Match id of a match page URL: the fragment's leading id, else the id suffix of the last path segment."""
+    parts = urlsplit(url)
+    fragment_id = parts.fragment.split(":", 1)[0].split(";", 1)[0]
+    if fragment_id:
+        return fragment_id
+    slug = parts.path.rstrip("/").rsplit("/", 1)[-1]
+    return slug.rsplit("-", 1)[-1] if "-" in slug else None
@@ -0,0 +1,182 @@
+"""See module docstring in core/browser/__init__.py."""
+
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from playwright.async_api import Page
+
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+
+# Installed on every browser context (see `PlaywrightManager._create_context`): counts the
+# fetch/XHR requests the page has in flight, so readiness can wait for the network to go quiet.
+PENDING_REQUESTS_SCRIPT = """
+(() => {
+  if (window.__ohPendingRequests !== undefined) return;
+  window.__ohPendingRequests = 0;
+  const done = () => { window.__ohPendingRequests = Math.max(window.__ohPendingRequests - 1, 0); };
+  const fetch = window.fetch;
+  if (fetch) {
+    window.fetch = function (...args) {
+      window.__ohPendingRequests += 1;
+      return fetch.apply(this, args).finally(done);
+    };
+  }
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    window.__ohPendingRequests += 1;
+    this.addEventListener("loadend", done, {once: true});
+    return send.apply(this, args);
+  };
+})();
+"""
+
+# One round trip: polls once per animation frame (or every 50 ms when frames are throttled,
+# e.g. a background tab) until every requested condition holds or `timeoutMs` runs out.
+_WAIT_READY_JS = """
+async (args) => {
+  const started = performance.now();
+  const frame = () => new Promise((resolve) => {
+    const timer = setTimeout(resolve, 50);
+    requestAnimationFrame(() => { clearTimeout(timer); resolve(); });
+  });
+  const marketCode = () => {
+    const hash = location.hash || "";
+    const colon = hash.indexOf(":");
+    return colon === -1 ? null : hash.slice(colon + 1).split(";")[0];
+  };
+  const activeTab = () => {
+    const tab = document.querySelector(args.activeTabSelector);
+    return tab ? (tab.textContent || "").toLowerCase() : "";
+  };
+  let lastCount = -1;
+  let stableFrames = 0;
+  let state = {};
+  while (true) {
+    await frame();
+    const count = args.rowSelector ? document.querySelectorAll(args.rowSelector).length : 0;
+    stableFrames = count === lastCount ? stableFrames + 1 : 0;
+    lastCount = count;
+    state = {
+      rows: count,
+      rowsReady: !args.rowSelector || count >= args.minRows,
+      stable: !args.rowSelector || stableFrames >= 2,
+      market: !args.marketCode && !args.marketName
+        || (args.marketCode !== null && marketCode() === args.marketCode)
+        || (args.marketName !== null && activeTab().includes(args.marketName)),
+      text: !args.textSelector
+        || ((document.querySelector(args.textSelector) || {}).textContent || "").includes(args.text),
+      idle: !args.networkIdle || !window.__ohPendingRequests,
+    };
+    const ready = state.rowsReady && state.stable && state.market && state.text && state.idle;
+    const waitedMs = performance.now() - started;
+    if (ready || waitedMs >= args.timeoutMs) {
+      return {...state, ready, waitedMs};
+    }
+  }
+}
+"""
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of one readiness wait."""
+
+    ready: bool
+    waited_ms: float = 0.0
+    rows: int = 0
+    unmet: tuple[str, ...] = ()
+
+
+class PageReadiness:
+    """
+    Waits for concrete page conditions instead of sleeping a fixed time.
+
+    Each wait returns as soon as its conditions hold: bookmaker rows rendered, the row
+    count unchanged across two animation frames, the URL market code (or the active tab)
+    matching, a control showing the expected text, no fetch/XHR in flight. Its timeout is
+    the fixed wait it replaces, so a page that never gets there costs what it did before.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def wait_until(
+        self,
+        page: Page,
+        timeout_ms: float,
+        row_selector: str | None = None,
+        min_rows: int = 1,
+        market_name: str | None = None,
+        text_selector: str | None = None,
+        text: str | None = None,
+        network_idle: bool = True,
+    ) -> ReadinessResult:
+        """
+        Wait until every given condition holds, or `timeout_ms` elapses.
+
+        Args:
+            page (Page): The Playwright page instance.
+            timeout_ms (float): Upper bound on the wait.
+            row_selector (str, optional): Rows that must number at least `min_rows` and stop changing.
+            min_rows (int): Rows `row_selector` must match.
+            market_name (str, optional): Market that must be active, by URL code (language-independent,
+                gotchas §7) or, without a known code, by the text of the active market tab.
+            text_selector (str, optional): Element whose text must contain `text`.
+            text (str, optional): Text `text_selector` must show.
+            network_idle (bool): Also require no fetch/XHR in flight.
+
+        Returns:
+            ReadinessResult: Whether the conditions held, how long it took and which did not.
+        """
+        market_code = OddsPortalSelectors.MARKET_TAB_CODES.get(market_name) if market_name else None
+        args = {
+            "timeoutMs": timeout_ms,
+            "rowSelector": row_selector,
+            "minRows": min_rows,
+            "marketCode": market_code,
+            "marketName": market_name.lower() if market_name and not market_code else None,
+            "activeTabSelector": OddsPortalSelectors.ACTIVE_MARKET_TAB_SELECTOR,
+            "textSelector": text_selector,
+            "text": text or "",
+            "networkIdle": network_idle,
+        }
+        try:
+            state = await page.evaluate(_WAIT_READY_JS, args)
+        except Exception as e:
+            # E.g. a navigation destroyed the context mid-wait. Nothing can be observed, so
+            # fall back to the fixed wait this replaces rather than hurry the caller along.
+            self.logger.debug(f"Readiness wait interrupted, sleeping {timeout_ms:.0f} ms instead: {e}")
+            state = None
+        if not isinstance(state, dict):
+            await page.wait_for_timeout(timeout_ms)
+            return ReadinessResult(ready=False, waited_ms=float(timeout_ms), unmet=("evaluate",))
+
+        result = ReadinessResult(
+            ready=bool(state.get("ready")),
+            waited_ms=float(state.get("waitedMs") or 0.0),
+            rows=int(state.get("rows") or 0),
+            unmet=_unmet(state),
+        )
+        if not result.ready:
+            self.logger.debug(f"Readiness not reached after {timeout_ms:.0f} ms; unmet: {', '.join(result.unmet)}")
+        return result
+
+    async def odds_rendered(self, page: Page, timeout_ms: float) -> ReadinessResult:
+        """Bookmaker rows rendered, stable, and no request in flight."""
+        return await self.wait_until(page, timeout_ms, row_selector=OddsPortalSelectors.BOOKMAKER_ROW_CSS)
+
+    async def market_active(self, page: Page, market_name: str, timeout_ms: float) -> ReadinessResult:
+        """`market_name` active, its bookmaker rows stable, and no request in flight."""
+        return await self.wait_until(
+            page, timeout_ms, row_selector=OddsPortalSelectors.BOOKMAKER_ROW_CSS, min_rows=0, market_name=market_name
+        )
+
+    async def settled(self, page: Page, timeout_ms: float) -> ReadinessResult:
+        """Bookmaker row count stable and no request in flight; an empty table counts as settled."""
+        return await self.wait_until(page, timeout_ms, row_selector=OddsPortalSelectors.BOOKMAKER_ROW_CSS, min_rows=0)
+
+
+def _unmet(state: dict[str, Any]) -> tuple[str, ...]:
+    checks = ("rowsReady", "stable", "market", "text", "idle")
+    return tuple(check for check in checks if not state.get(check, True))
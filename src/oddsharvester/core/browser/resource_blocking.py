@@ -0,0 +1,104 @@
+"""See module docstring in core/browser/__init__.py."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+from urllib.parse import urlsplit
+
+from oddsharvester.utils.constants import (
+    BALANCED_BLOCKED_RESOURCE_TYPES,
+    BLOCKED_RESOURCE_SIZE_ESTIMATE_BYTES,
+    BLOCKED_TRACKER_HOSTS,
+    MINIMAL_ALLOWED_RESOURCE_TYPES,
+)
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
+
+FIRST_PARTY_SITE = "oddsportal.com"
+
+
+@dataclass
+class ResourceBlockStats:
+    """Requests a `ResourceBlocker` let through or aborted, with the bytes the aborted ones would have cost."""
+
+    allowed: int = 0
+    blocked_by_type: Counter = field(default_factory=Counter)
+    estimated_bytes_saved: int = 0
+
+    @property
+    def blocked(self) -> int:
+        return sum(self.blocked_by_type.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests_allowed": self.allowed,
+            "requests_blocked": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+        }
+
+
+class ResourceBlocker:
+    """
+    Aborts the requests a scrape does not need, per a `ResourceBlockProfile`.
+
+    - `off`: nothing is intercepted.
+    - `balanced`: images, media, fonts and known ad/analytics hosts are aborted.
+    - `minimal`: only documents, scripts, stylesheets and XHR/fetch are let through,
+      and only from first-party sites.
+
+    First-party means oddsportal.com, the host of any page navigated to (without its `www.`),
+    and their subdomains, so a regional mirror set with --base-url keeps its own assets while
+    other sites under the same country suffix (`.com.br`, `.co.uk`) stay third-party. Requests
+    let through fall back to the routes registered before this one (e.g. HAR replay).
+    """
+
+    def __init__(self, profile: ResourceBlockProfile = ResourceBlockProfile.OFF):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.profile = profile
+        self.stats = ResourceBlockStats()
+        self._first_party_sites = {FIRST_PARTY_SITE}
+
+    async def attach(self, context) -> None:
+        """Intercept every request of `context` (a Playwright `BrowserContext`)."""
+        if self.profile is ResourceBlockProfile.OFF:
+            return
+        await context.route("**/*", self._handle)
+
+    def should_block(self, resource_type: str, url: str, main_frame: bool = True) -> bool:
+        """Whether a request of `resource_type` for `url` is aborted under the profile."""
+        if self.profile is ResourceBlockProfile.OFF:
+            return False
+        host = (urlsplit(url).hostname or "").lower()
+        if resource_type == "document" and main_frame:
+            # Pages are never blocked; the hosts they are served from become first-party.
+            # Iframe documents (ad slots, widgets) are judged like any other request.
+            self._first_party_sites.add(host.removeprefix("www."))
+            return False
+        if self.profile is ResourceBlockProfile.BALANCED:
+            return resource_type in BALANCED_BLOCKED_RESOURCE_TYPES or _on_any_site(host, BLOCKED_TRACKER_HOSTS)
+        return resource_type not in MINIMAL_ALLOWED_RESOURCE_TYPES or not _on_any_site(host, self._first_party_sites)
+
+    async def _handle(self, route) -> None:
+        request = route.request
+        try:
+            main_frame = request.frame.parent_frame is None
+        except Exception:
+            # Service worker requests have no frame.
+            main_frame = False
+        if not self.should_block(request.resource_type, request.url, main_frame=main_frame):
+            self.stats.allowed += 1
+            await route.fallback()
+            return
+        self.stats.blocked_by_type[request.resource_type] += 1
+        self.stats.estimated_bytes_saved += BLOCKED_RESOURCE_SIZE_ESTIMATE_BYTES.get(request.resource_type, 0)
+        try:
+            await route.abort("blockedbyclient")
+        except Exception as e:
+            # The page may have closed or navigated away while the request was pending.
+            self.logger.debug(f"Could not abort {request.url}: {e}")
+
+
+def _on_any_site(host: str, sites) -> bool:
+    """Whether `host` is one of `sites` or a subdomain of one (cdn.x.oddsportal.com is on oddsportal.com)."""
+    return any(host == site or host.endswith(f".{site}") for site in sites)
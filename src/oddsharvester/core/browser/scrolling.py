@@ -15,6 +15,88 @@ from oddsharvester.utils.constants import (
 
 _SCROLL_STEP_PX = 500
 
+# One awaited call: scrolls a step every tick until the bottom is reached, tracks the row
+# count (or page height) with a MutationObserver, and resolves once the bottom has been
+# reached and nothing has changed for `quietMs` with no fetch/XHR in flight (the counter
+# is installed by `PENDING_REQUESTS_SCRIPT`; without it the network is not checked).
+_SCROLL_TO_LOAD_JS = """
+async (args) => {
+  const started = performance.now();
+  const measure = () => ({
+    count: args.selector ? document.querySelectorAll(args.selector).length : -1,
+    height: document.body.scrollHeight,
+  });
+  let last = measure();
+  const initialCount = last.count;
+  let lastChange = performance.now();
+  const observer = new MutationObserver(() => {
+    const now = measure();
+    if (now.count !== last.count || now.height !== last.height) {
+      last = now;
+      lastChange = performance.now();
+    }
+  });
+  observer.observe(document.body, {childList: true, subtree: true});
+  try {
+    while (true) {
+      await new Promise((resolve) => setTimeout(resolve, args.tickMs));
+      const elapsed = performance.now() - started;
+      if (elapsed >= args.timeoutMs) {
+        return {stable: false, count: last.count, initialCount, height: last.height, elapsedMs: elapsed};
+      }
+      const atBottom = window.scrollY + window.innerHeight >= document.body.scrollHeight - 1;
+      if (!atBottom) {
+        window.scrollBy(0, args.stepPx);
+        continue;
+      }
+      const quiet = performance.now() - lastChange >= args.quietMs;
+      if (quiet && !window.__ohPendingRequests) {
+        return {stable: true, count: last.count, initialCount, height: last.height, elapsedMs: elapsed};
+      }
+    }
+  } finally {
+    observer.disconnect();
+  }
+}
+"""
+_SCROLL_TICK_MS = 100
+
+# One awaited call for `scroll_until_visible_and_click_parent`: every tick, looks for the
+# first rendered element matching the selector whose text contains `text` (the same substring
+# rule as `text_content()`), scrolls it into view and clicks its parent; otherwise scrolls a
+# step so lazily rendered rows (e.g. 40+ Asian Handicap lines) get a chance to appear.
+_LOCATE_AND_CLICK_JS = """
+async (args) => {
+  const started = performance.now();
+  let scrolls = 0;
+  while (true) {
+    let elements;
+    try {
+      elements = document.querySelectorAll(args.selector);
+    } catch (e) {
+      return {clicked: false, invalidSelector: true, scrolls, elapsedMs: performance.now() - started};
+    }
+    const target = Array.from(elements).find((element) =>
+      (args.text === null || (element.textContent || "").includes(args.text))
+      && element.getClientRects().length > 0
+      && element.parentElement
+    );
+    if (target) {
+      target.scrollIntoView({block: "center"});
+      target.parentElement.click();
+      return {clicked: true, matches: elements.length, scrolls, elapsedMs: performance.now() - started};
+    }
+    const elapsed = performance.now() - started;
+    if (elapsed >= args.timeoutMs) {
+      return {clicked: false, matches: elements.length, scrolls, elapsedMs: elapsed};
+    }
+    window.scrollBy(0, args.stepPx);
+    scrolls += 1;
+    await new Promise((resolve) => setTimeout(resolve, args.tickMs));
+  }
+}
+"""
+
 
 class PageScroller:
     """Incremental page scrolling and scroll-to-element-and-click."""
@@ -32,10 +114,55 @@ class PageScroller:
     ) -> bool:
         """Scroll the page until no new content loads or timeout is reached.
 
+        The scrolling runs in the page (`_SCROLL_TO_LOAD_JS`): content counts as loaded once
+        the bottom is reached and the element count (or page height) has not changed for
+        `max_scroll_attempts` pauses of `scroll_pause_time`, the same quiet period as
+        `max_scroll_attempts` unchanged checks in a row. If the script cannot run, the page is
+        scrolled step by step from here instead, checking after every pause.
+
         Returns True if the page stabilized (height or element count), False on timeout.
         """
         self.logger.info("Will scroll to the bottom of the page to load all content.")
         end_time = time.time() + timeout
+        args = {
+            "selector": content_check_selector,
+            "stepPx": _SCROLL_STEP_PX,
+            "tickMs": _SCROLL_TICK_MS,
+            # As long as `max_scroll_attempts` unchanged checks: a slow lazy load must not pass for the end.
+            "quietMs": scroll_pause_time * max(max_scroll_attempts, 1) * 1000,
+            "timeoutMs": timeout * 1000,
+        }
+        try:
+            outcome = await page.evaluate(_SCROLL_TO_LOAD_JS, args)
+        except Exception as e:
+            self.logger.debug(f"In-page scrolling failed, scrolling step by step: {e}")
+            outcome = None
+
+        if isinstance(outcome, dict):
+            if not outcome.get("stable"):
+                self.logger.info("Reached scrolling timeout. Stopping scroll.")
+                return False
+            if content_check_selector:
+                self.logger.info(
+                    f"Content stabilized at {outcome.get('count')} elements "
+                    f"(from {outcome.get('initialCount')}) in {outcome.get('elapsedMs', 0):.0f} ms. Scrolling complete."
+                )
+            else:
+                self.logger.info(f"Page height stabilized at {outcome.get('height')}. Scrolling complete.")
+            return True
+
+        return await self._scroll_step_by_step(
+            page, end_time, scroll_pause_time, max_scroll_attempts, content_check_selector
+        )
+
+    async def _scroll_step_by_step(
+        self,
+        page: Page,
+        end_time: float,
+        scroll_pause_time: int,
+        max_scroll_attempts: int,
+        content_check_selector: str | None,
+    ) -> bool:
         last_height = await page.evaluate("document.body.scrollHeight")
         last_element_count = 0
         stable_count_attempts = 0
@@ -97,7 +224,48 @@ class PageScroller:
         timeout: int = SCROLL_UNTIL_CLICK_TIMEOUT_S,
         scroll_pause_time: int = SCROLL_UNTIL_CLICK_PAUSE_S,
     ) -> bool:
-        """Scroll until an element matching selector (and optional text) is visible, then click its parent."""
+        """Scroll until an element matching selector (and optional text) is visible, then click its parent.
+
+        Locating, scrolling and clicking run in the page in one call (`_LOCATE_AND_CLICK_JS`),
+        checking again every `_SCROLL_TICK_MS` rather than every `scroll_pause_time`. If the
+        script cannot run, elements are checked one by one from here instead.
+        """
+        args = {
+            "selector": selector,
+            "text": text or None,
+            "stepPx": _SCROLL_STEP_PX,
+            "tickMs": _SCROLL_TICK_MS,
+            "timeoutMs": timeout * 1000,
+        }
+        try:
+            outcome = await page.evaluate(_LOCATE_AND_CLICK_JS, args)
+        except Exception as e:
+            self.logger.debug(f"In-page locate-and-click failed, checking elements one by one: {e}")
+            outcome = None
+
+        if isinstance(outcome, dict):
+            if outcome.get("clicked"):
+                self.logger.info(
+                    f"Element matching '{text or selector}' is visible. Clicked its parent "
+                    f"after {outcome.get('scrolls', 0)} scrolls ({outcome.get('elapsedMs', 0):.0f} ms)."
+                )
+                return True
+            self.logger.warning(
+                f"Failed to find and click parent of element matching selector '{selector}' with text '{text}' "
+                f"within timeout."
+            )
+            return False
+
+        return await self._click_parent_step_by_step(page, selector, text, timeout, scroll_pause_time)
+
+    async def _click_parent_step_by_step(
+        self,
+        page: Page,
+        selector: str,
+        text: str | None,
+        timeout: float,
+        scroll_pause_time: float,
+    ) -> bool:
         end_time = time.time() + timeout
 
         while time.time() < end_time:
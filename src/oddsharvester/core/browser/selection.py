@@ -65,9 +65,21 @@ class SelectionManager:
 
         Returns True on success, False on container missing, target missing, or verify failure.
         """
+        predicate_arg = {
+            "containerSelector": strategy.container_selector,
+            "activeClass": strategy.active_class,
+            "targetValue": target_value,
+            "matchMode": strategy.match_mode,
+            "attributeName": strategy.attribute_name,
+        }
         try:
             self.logger.info(f"Ensuring {strategy.name} is set to: {display_label}")
 
+            # Usually already set (restored storage state, earlier page): one round trip to verify.
+            if await page.evaluate(_SELECTION_WAIT_PREDICATE, predicate_arg) is True:
+                self.logger.info(f"{strategy.name} already set to '{target_value}'. No action needed.")
+                return True
+
             container = await page.query_selector(strategy.container_selector)
             if not container:
                 self.logger.warning(f"{strategy.name} navigation not found on page. Skipping selection.")
@@ -91,13 +103,7 @@ class SelectionManager:
             try:
                 await page.wait_for_function(
                     _SELECTION_WAIT_PREDICATE,
-                    arg={
-                        "containerSelector": strategy.container_selector,
-                        "activeClass": strategy.active_class,
-                        "targetValue": target_value,
-                        "matchMode": strategy.match_mode,
-                        "attributeName": strategy.attribute_name,
-                    },
+                    arg=predicate_arg,
                     timeout=strategy.timeout_ms,
                 )
                 self.logger.info(f"Successfully set {strategy.name} to: {display_label}")
@@ -0,0 +1,69 @@
+"""See module docstring in core/browser/__init__.py."""
+
+import logging
+from pathlib import Path
+
+from oddsharvester.core.browser.json_file import CACHE_DIR, path_from_env, read_json, write_json_atomically
+
+STORAGE_STATE_ENV_VAR = "OH_STORAGE_STATE"
+DEFAULT_STORAGE_STATE_PATH = CACHE_DIR / "storage_state.json"
+
+# Bot-management cookies are bound to the client that earned them (user agent, IP), which
+# changes between runs and proxies; replaying them only invites a fresh challenge.
+_CLIENT_BOUND_COOKIE_PREFIXES = ("__cf", "cf_")
+
+
+class StorageStateStore:
+    """
+    Cookies and localStorage of a configured browser context, persisted as Playwright storage state.
+
+    OddsPortal keeps the odds format, cookie consent and bookmaker filter client-side, per
+    `BrowserContext` (gotchas §11). Once a context has been configured its storage state is
+    saved here, and every context created afterwards (this run's proxy contexts, the next
+    run's) starts from it, so `set_odds_format` and the per-match bookies filter find the
+    right value already selected and only verify it.
+
+    Set `OH_STORAGE_STATE` to another path, or to an empty string to start every context fresh.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Args:
+            path (Path | None): JSON file the state is read from and saved to; None disables persistence.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+
+    @classmethod
+    def from_env(cls) -> "StorageStateStore":
+        """Store at `OH_STORAGE_STATE`, or at the default path when unset."""
+        return cls(path_from_env(STORAGE_STATE_ENV_VAR, DEFAULT_STORAGE_STATE_PATH))
+
+    def load(self) -> dict | None:
+        """The saved storage state, ready for `new_context(storage_state=...)`; None when there is none."""
+        state = read_json(self.path, self.logger, "storage state")
+        if not isinstance(state, dict):
+            return None
+        return {"cookies": state.get("cookies") or [], "origins": state.get("origins") or []}
+
+    def save(self, state: dict) -> bool:
+        """
+        Persist a context's storage state (as returned by `BrowserContext.storage_state()`).
+
+        Returns:
+            bool: True if the state was written.
+        """
+        if self.path is None or not isinstance(state, dict):
+            return False
+        cookies = [
+            cookie
+            for cookie in state.get("cookies") or []
+            if not str(cookie.get("name", "")).startswith(_CLIENT_BOUND_COOKIE_PREFIXES)
+        ]
+        state = {"cookies": cookies, "origins": state.get("origins") or []}
+        try:
+            write_json_atomically(self.path, state)
+        except OSError as e:
+            self.logger.warning(f"Could not save storage state {self.path}: {e}")
+            return False
+        return True
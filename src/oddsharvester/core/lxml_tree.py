@@ -0,0 +1,99 @@
+"""
+BeautifulSoup lookups on an lxml tree, for the `lxml` parser backend (see `core.parser_backend`).
+
+Each helper behaves like the BeautifulSoup call the parsers make on an `html.parser` tree:
+descendants in document order, `class_=` matching per class token or on the whole class
+string, and `get_text(strip=True)` leaving out script, style and template text.
+"""
+
+from collections.abc import Callable, Iterator
+import re
+
+from lxml import etree
+import lxml.html
+
+# Strings BeautifulSoup's HTML builders keep out of `get_text` (`DEFAULT_STRING_CONTAINERS`).
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+ClassMatcher = str | re.Pattern
+
+
+def parse_html(html_content: str) -> etree._Element | None:
+    """The lxml tree of a document or fragment; None when there is nothing to parse."""
+    if not isinstance(html_content, str) or not html_content.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def class_matches(element: etree._Element, matcher: ClassMatcher) -> bool:
+    """BeautifulSoup's `class_=` test: a string equals, a pattern searches, one class token or all of them."""
+    tokens = (element.get("class") or "").split()
+    if not tokens:
+        return False
+    candidates = [*tokens, " ".join(tokens)]
+    if isinstance(matcher, re.Pattern):
+        return any(matcher.search(candidate) for candidate in candidates)
+    return matcher in candidates
+
+
+def find_all(
+    element: etree._Element,
+    tag: str,
+    class_: ClassMatcher | None = None,
+    attrs: dict[str, str | re.Pattern | bool] | None = None,
+) -> list[etree._Element]:
+    """Descendants of `element` (not itself) named `tag` that match, like `Tag.find_all`."""
+    return list(_matching(element, tag, class_, attrs))
+
+
+def find(
+    element: etree._Element,
+    tag: str,
+    class_: ClassMatcher | None = None,
+    attrs: dict[str, str | re.Pattern | bool] | None = None,
+) -> etree._Element | None:
+    """First descendant of `element` named `tag` that matches, like `Tag.find`."""
+    return next(_matching(element, tag, class_, attrs), None)
+
+
+def get_text(element: etree._Element, separator: str = "") -> str:
+    """`Tag.get_text(separator, strip=True)`: stripped, non-empty strings joined by `separator`."""
+    return separator.join(stripped for string in _strings(element) if (stripped := string.strip()))
+
+
+def _matching(
+    element: etree._Element,
+    tag: str,
+    class_: ClassMatcher | None,
+    attrs: dict[str, str | re.Pattern | bool] | None,
+) -> Iterator[etree._Element]:
+    checks: list[Callable[[etree._Element], bool]] = []
+    if class_ is not None:
+        checks.append(lambda candidate: class_matches(candidate, class_))
+    for name, expected in (attrs or {}).items():
+        checks.append(_attribute_check(name, expected))
+    for candidate in element.iterdescendants(tag):
+        if all(check(candidate) for check in checks):
+            yield candidate
+
+
+def _attribute_check(name: str, expected: str | re.Pattern | bool) -> Callable[[etree._Element], bool]:
+    if expected is True:
+        return lambda candidate: candidate.get(name) is not None
+    if isinstance(expected, re.Pattern):
+        return lambda candidate: candidate.get(name) is not None and expected.search(candidate.get(name)) is not None
+    return lambda candidate: candidate.get(name) == expected
+
+
+def _strings(element: etree._Element) -> Iterator[str]:
+    if element.text:
+        yield element.text
+    for child in element:
+        # Comments and processing instructions have a non-string tag; only their tail is page text.
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
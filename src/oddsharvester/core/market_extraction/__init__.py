@@ -1,13 +1,19 @@
+from .bookmaker_table_extractor import BookmakerTableExtractor
 from .market_grouping import MarketGrouping
+from .market_planner import MarketNavigationPlanner, MarketPlan, TabVisit
 from .navigation_manager import NavigationManager
 from .odds_history_extractor import OddsHistoryExtractor
 from .odds_parser import OddsParser
 from .submarket_extractor import SubmarketExtractor
 
 __all__ = [
+    "BookmakerTableExtractor",
     "MarketGrouping",
+    "MarketNavigationPlanner",
+    "MarketPlan",
     "NavigationManager",
     "OddsHistoryExtractor",
     "OddsParser",
     "SubmarketExtractor",
+    "TabVisit",
 ]
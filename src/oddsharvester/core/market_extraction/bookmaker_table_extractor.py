@@ -0,0 +1,160 @@
+import logging
+import os
+from typing import Any
+
+from playwright.async_api import Page
+
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+
+from .odds_parser import OddsParser
+
+ODDS_EXTRACTION_ENV_VAR = "OH_ODDS_EXTRACTION"
+
+# Walks the bookmaker table the way `OddsParser.parse_market_odds` walks the serialised page:
+# rows are the divs under the table header's parent (the whole document without a header) whose
+# class matches the row pattern, or the fallback pattern when none does; a class pattern matches
+# one class token or the full class string, as BeautifulSoup's `class_=re.compile(...)` does.
+# Each row yields its bookmaker name (same fallback chain as `_extract_bookmaker_name`), the
+# stripped text of every odds cell and whether the cell is struck through.
+_BOOKMAKER_TABLE_JS = """
+(args) => {
+  const classMatches = (element, pattern) => {
+    const tokens = Array.from(element.classList);
+    return tokens.some((token) => pattern.test(token)) || pattern.test(tokens.join(" "));
+  };
+  const divsMatching = (root, pattern) =>
+    Array.from(root.querySelectorAll("div")).filter((div) => classMatches(div, pattern));
+  const text = (element) => {
+    const parts = [];
+    const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+      if (node.parentElement && node.parentElement.closest("script, style")) continue;
+      const part = node.nodeValue.trim();
+      if (part) parts.push(part);
+    }
+    return parts.join("");
+  };
+  const bookmakerName = (row) => {
+    const logo = Array.from(row.getElementsByTagName("img")).find((img) => img.classList.contains(args.logoClass));
+    if (logo && logo.getAttribute("title")) return logo.getAttribute("title");
+    const link = row.querySelector("a[title]");
+    if (link && link.getAttribute("title")) {
+      let name = link.getAttribute("title");
+      if (name.toLowerCase().startsWith("go to ") && name.endsWith("!")) {
+        name = name.slice("go to ".length, -1).trim();
+        if (name.toLowerCase().endsWith(" website")) name = name.slice(0, -" website".length).trim();
+      }
+      return name;
+    }
+    for (const img of row.getElementsByTagName("img")) {
+      const alt = img.getAttribute("alt") || "";
+      if (alt && alt.toLowerCase() !== "logo") return alt;
+    }
+    return null;
+  };
+
+  const header = document.querySelector(`div[data-testid="${args.headerTestId}"]`);
+  const root = header && header.parentElement ? header.parentElement : document;
+  let blocks = divsMatching(root, new RegExp(args.rowPattern));
+  if (!blocks.length) blocks = divsMatching(root, new RegExp(args.rowFallbackPattern));
+
+  const cellPattern = new RegExp(args.cellPattern);
+  const target = args.targetBookmaker ? args.targetBookmaker.toLowerCase() : null;
+  const rows = [];
+  for (const block of blocks) {
+    const name = bookmakerName(block);
+    if (!name || (target && name.toLowerCase() !== target)) continue;
+    const cells = divsMatching(block, cellPattern);
+    rows.push({
+      bookmaker_name: name,
+      odds: cells.map(text),
+      blocked: cells.map((cell) => cell.querySelector(args.blockedSelector) !== null),
+    });
+  }
+  return {rows, blocks: blocks.length, scoped: root !== document};
+}
+"""
+
+
+class BookmakerTableExtractor:
+    """
+    Reads a market's bookmaker odds table inside the page, with one `page.evaluate`.
+
+    The HTML path serialises the whole document (several MB) over CDP with `page.content()`
+    and re-parses all of it for a few dozen rows. Here the rows are read where they render
+    and only the odds come back, as compact JSON, then go through the same
+    `OddsParser.build_market_odds` as parsed HTML does.
+
+    `extract_market_odds` returns None whenever the caller should use the HTML parser instead:
+    the script failed, returned something unexpected, or found no bookmaker rows at all.
+    Set `OH_ODDS_EXTRACTION=html` to always use the HTML parser.
+    """
+
+    def __init__(self, odds_parser: OddsParser | None = None, enabled: bool = True):
+        """
+        Args:
+            odds_parser (OddsParser | None): Turns the raw rows into odds entries.
+            enabled (bool): If False, `extract_market_odds` always defers to the HTML parser.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.odds_parser = odds_parser or OddsParser()
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls, odds_parser: OddsParser | None = None) -> "BookmakerTableExtractor":
+        """Enabled unless `OH_ODDS_EXTRACTION` is set to `html`."""
+        mode = os.environ.get(ODDS_EXTRACTION_ENV_VAR, "").strip().lower()
+        return cls(odds_parser=odds_parser, enabled=mode != "html")
+
+    async def read_rows(self, page: Page, target_bookmaker: str | None = None) -> dict[str, Any] | None:
+        """
+        Run the table walk in the page.
+
+        Returns:
+            dict | None: {"rows", "blocks", "scoped"} as returned by the script, or None if it failed.
+        """
+        try:
+            result = await page.evaluate(
+                _BOOKMAKER_TABLE_JS,
+                {
+                    "headerTestId": OddsPortalSelectors.BOOKMAKER_TABLE_HEADER_TESTID,
+                    "rowPattern": OddsPortalSelectors.BOOKMAKER_ROW_CLASS,
+                    "rowFallbackPattern": OddsPortalSelectors.BOOKMAKER_ROW_FALLBACK_CLASS,
+                    "cellPattern": OddsPortalSelectors.ODDS_BLOCK_CLASS_PATTERN,
+                    "logoClass": OddsPortalSelectors.BOOKMAKER_LOGO_CLASS,
+                    "blockedSelector": OddsPortalSelectors.ODDS_BLOCKED_SELECTOR,
+                    "targetBookmaker": target_bookmaker,
+                },
+            )
+        except Exception as e:
+            self.logger.debug(f"In-page bookmaker table extraction failed: {e}")
+            return None
+        if not isinstance(result, dict) or not isinstance(result.get("rows"), list):
+            return None
+        return result
+
+    async def extract_market_odds(
+        self, page: Page, period: str, odds_labels: list, target_bookmaker: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Extract the odds of the market currently shown, like `OddsParser.parse_market_odds` on `page.content()`.
+
+        Args:
+            page (Page): The Playwright page instance.
+            period (str): The match period (e.g., "FullTime").
+            odds_labels (list): Labels of the expected odds columns.
+            target_bookmaker (str, optional): If set, only extract odds for this bookmaker.
+
+        Returns:
+            list[dict] | None: The bookmaker odds, or None to fall back to the HTML parser.
+        """
+        if not self.enabled:
+            return None
+        result = await self.read_rows(page, target_bookmaker)
+        if result is None:
+            return None
+        if not result.get("blocks"):
+            self.logger.info("No bookmaker rows found in page; falling back to the HTML parser.")
+            return None
+        self.logger.info(f"Read {len(result['rows'])} bookmaker rows in page.")
+        return self.odds_parser.build_market_odds(result["rows"], period, odds_labels, target_bookmaker)
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+import logging
+
+from .market_grouping import MarketGrouping
+
+
+@dataclass
+class TabVisit:
+    """Markets scraped during one visit to a main-market tab (`main_market` None: tab unknown)."""
+
+    main_market: str | None
+    markets: list[str] = field(default_factory=list)
+
+
+@dataclass
+class MarketPlan:
+    """Order in which a match's markets are scraped, one visit per main-market tab."""
+
+    visits: list[TabVisit] = field(default_factory=list)
+
+    @property
+    def markets(self) -> list[str]:
+        return [market for visit in self.visits for market in visit.markets]
+
+    @property
+    def naive_navigations(self) -> int:
+        """Tab navigations when every market navigates to its own tab, in requested order."""
+        return len(self.markets)
+
+    @property
+    def planned_navigations(self) -> int:
+        return len(self.visits)
+
+
+class MarketNavigationPlanner:
+    """Orders requested markets so each main-market tab is visited once per match."""
+
+    def __init__(self, market_grouping: MarketGrouping | None = None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.market_grouping = market_grouping or MarketGrouping()
+
+    def plan(self, markets: list[str], market_methods: dict, active_tab: str | None = None) -> MarketPlan:
+        """
+        Group `markets` by the main-market tab of their registry method (`main_market`).
+
+        Tabs keep the order of their first requested market, except `active_tab` (the tab the
+        page is on already, e.g. after line discovery), which goes first. Markets whose tab
+        cannot be read from their method each get a visit of their own, in requested order.
+
+        Args:
+            markets (list[str]): Requested markets supported for the sport.
+            market_methods (dict): Market methods from SportMarketRegistry.
+            active_tab (str | None): Main market currently shown on the page.
+
+        Returns:
+            MarketPlan: The visits, each listing its markets in requested order.
+        """
+        plan = MarketPlan()
+        visits_by_tab: dict[str, TabVisit] = {}
+
+        for market in markets:
+            main_market_info = self.market_grouping.get_main_market_info(market_methods[market])
+            main_market = main_market_info["main_market"] if main_market_info else None
+            if main_market is None:
+                plan.visits.append(TabVisit(main_market=None, markets=[market]))
+                continue
+            if main_market not in visits_by_tab:
+                visits_by_tab[main_market] = TabVisit(main_market=main_market)
+                plan.visits.append(visits_by_tab[main_market])
+            visits_by_tab[main_market].markets.append(market)
+
+        if active_tab in visits_by_tab:
+            plan.visits.remove(visits_by_tab[active_tab])
+            plan.visits.insert(0, visits_by_tab[active_tab])
+
+        self.logger.info(
+            f"Market plan: {len(plan.markets)} markets on {plan.planned_navigations} tab visits "
+            f"(naive order: {plan.naive_navigations} tab navigations)."
+        )
+        return plan
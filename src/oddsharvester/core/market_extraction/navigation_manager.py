@@ -3,6 +3,7 @@ import logging
 from playwright.async_api import Page
 
 from oddsharvester.core.browser.market_navigation import MarketTabNavigator
+from oddsharvester.core.browser.readiness import PageReadiness
 from oddsharvester.core.browser.scrolling import PageScroller
 from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
 from oddsharvester.utils.constants import DEFAULT_MARKET_TIMEOUT_MS, MARKET_SWITCH_WAIT_TIME_MS, SCROLL_PAUSE_TIME_MS
@@ -11,16 +12,19 @@ from oddsharvester.utils.constants import DEFAULT_MARKET_TIMEOUT_MS, MARKET_SWIT
 class NavigationManager:
     """Handles browser navigation for market extraction."""
 
-    def __init__(self, tab_navigator: MarketTabNavigator, scroller: PageScroller):
+    def __init__(
+        self, tab_navigator: MarketTabNavigator, scroller: PageScroller, readiness: PageReadiness | None = None
+    ):
         """Initialize NavigationManager."""
         self.logger = logging.getLogger(self.__class__.__name__)
         self.tab_navigator = tab_navigator
         self.scroller = scroller
+        self.readiness = readiness or PageReadiness()
 
-    async def navigate_to_market_tab(self, page: Page, market_tab_name: str) -> bool:
-        """Navigate to a specific market tab."""
+    async def navigate_to_market_tab(self, page: Page, market_tab_name: str, period_scope: int | None = None) -> bool:
+        """Navigate to a specific market tab, landing on `period_scope` when the URL fragment route is taken."""
         return await self.tab_navigator.navigate_to_tab(
-            page=page, market_tab_name=market_tab_name, timeout=DEFAULT_MARKET_TIMEOUT_MS
+            page=page, market_tab_name=market_tab_name, timeout=DEFAULT_MARKET_TIMEOUT_MS, period_scope=period_scope
         )
 
     async def wait_for_market_switch(self, page: Page, market_name: str, max_attempts: int = 3) -> bool:
@@ -42,8 +46,9 @@ class NavigationManager:
 
         for attempt in range(max_attempts):
             try:
-                # Wait for the market switch animation to complete
-                await page.wait_for_timeout(MARKET_SWITCH_WAIT_TIME_MS)
+                # Returns once the market is active and its rows have settled; the old fixed
+                # wait is only the bound.
+                await self.readiness.market_active(page, market_name, timeout_ms=MARKET_SWITCH_WAIT_TIME_MS)
 
                 if target_code and OddsPortalSelectors.market_code_from_url(page.url) == target_code:
                     self.logger.info(f"Market switch confirmed via URL code: {market_name} is active")
@@ -86,5 +91,5 @@ class NavigationManager:
         )
 
     async def wait_for_page_load(self, page: Page) -> None:
-        """Wait for page content to load."""
-        await page.wait_for_timeout(SCROLL_PAUSE_TIME_MS)
+        """Wait for page content to load: rows stable and no request in flight, at most `SCROLL_PAUSE_TIME_MS`."""
+        await self.readiness.settled(page, timeout_ms=SCROLL_PAUSE_TIME_MS)
@@ -9,6 +9,84 @@ from oddsharvester.utils.constants import (
     ODDS_MOVEMENT_SELECTOR_TIMEOUT_MS,
 )
 
+# One awaited call for `extract_odds_history_for_bookmakers`: for every odds cell of every
+# matching bookmaker row, dispatches the hover events, waits (per animation frame, at most
+# `timeoutMs`) for a new odds movement modal, copies its HTML and dispatches the leave events.
+# A modal counts as new when its header node or its HTML differs from the previous one; a
+# modal already open before the first hover (left by an earlier one) is the first "previous".
+_HARVEST_ODDS_HISTORY_JS = """
+async (args) => {
+  const started = performance.now();
+  const frame = () => new Promise((resolve) => {
+    const timer = setTimeout(resolve, 50);
+    requestAnimationFrame(() => { clearTimeout(timer); resolve(); });
+  });
+  const fire = (element, types) => {
+    const box = element.getBoundingClientRect();
+    for (const type of types) {
+      const init = {
+        bubbles: !type.endsWith("enter") && !type.endsWith("leave"),
+        cancelable: true,
+        view: window,
+        clientX: box.left + box.width / 2,
+        clientY: box.top + box.height / 2,
+      };
+      element.dispatchEvent(type.startsWith("pointer") ? new PointerEvent(type, init) : new MouseEvent(type, init));
+    }
+  };
+  const enter = ["pointerover", "pointerenter", "mouseover", "mouseenter", "mousemove"];
+  const leave = ["pointerout", "pointerleave", "mouseout", "mouseleave"];
+  const names = args.bookmakers.map((name) => name.toLowerCase());
+  const modals = Object.fromEntries(args.bookmakers.map((name) => [name, []]));
+  const missing = {};
+  const openModal = () => {
+    const header = document.querySelector(args.headerSelector);
+    const wrapper = header && header.parentElement;
+    return wrapper ? {node: header, html: wrapper.innerHTML} : null;
+  };
+  let previous = openModal() || {node: null, html: null};
+  let cells = 0;
+
+  const harvest = async (cell) => {
+    cell.scrollIntoView({block: "center"});
+    fire(cell, enter);
+    const deadline = performance.now() + args.timeoutMs;
+    try {
+      while (performance.now() < deadline) {
+        await frame();
+        const modal = openModal();
+        if (modal && (modal.node !== previous.node || modal.html !== previous.html)) {
+          previous = modal;
+          return previous.html;
+        }
+      }
+      return null;
+    } finally {
+      fire(cell, leave);
+    }
+  };
+
+  for (const row of document.querySelectorAll(args.rowSelector)) {
+    const logo = row.querySelector(args.logoSelector);
+    const title = ((logo && logo.getAttribute("title")) || "").toLowerCase();
+    const matched = title ? args.bookmakers.filter((_, i) => title.includes(names[i])) : [];
+    if (!matched.length) continue;
+    for (const cell of row.querySelectorAll(args.cellSelector)) {
+      cells += 1;
+      const html = await harvest(cell);
+      for (const name of matched) {
+        if (html === null) {
+          missing[name] = (missing[name] || 0) + 1;
+        } else {
+          modals[name].push(html);
+        }
+      }
+    }
+  }
+  return {modals, missing, cells, elapsedMs: performance.now() - started};
+}
+"""
+
 
 class OddsHistoryExtractor:
     """Handles extraction of odds history data by hovering over bookmaker odds."""
@@ -16,6 +94,59 @@ class OddsHistoryExtractor:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    async def extract_odds_history_for_bookmakers(self, page: Page, bookmaker_names: list[str]) -> dict[str, list[str]]:
+        """
+        Capture the odds history modals of several bookmakers in one call.
+
+        Hover events are dispatched and each modal harvested in the page (`_HARVEST_ODDS_HISTORY_JS`),
+        waiting for the modal itself instead of `ODDS_HISTORY_HOVER_WAIT_MS` per cell. Bookmakers
+        with a modal that did not show up in time, or all of them if the script cannot run, are
+        captured again with real hovers through `extract_odds_history_for_bookmaker`.
+
+        Args:
+            page (Page): Playwright page instance.
+            bookmaker_names (list[str]): Names of the bookmakers to match, as for `extract_odds_history_for_bookmaker`.
+
+        Returns:
+            dict[str, list[str]]: Raw modal HTML per requested bookmaker name, in odds cell order.
+        """
+        bookmaker_names = list(dict.fromkeys(bookmaker_names))
+        if not bookmaker_names:
+            return {}
+
+        self.logger.info(f"Extracting odds history for {len(bookmaker_names)} bookmakers in one pass.")
+        args = {
+            "bookmakers": bookmaker_names,
+            "rowSelector": OddsPortalSelectors.BOOKMAKER_ROW_CSS,
+            "logoSelector": OddsPortalSelectors.BOOKMAKER_LOGO_CSS,
+            "cellSelector": OddsPortalSelectors.ODDS_BLOCK_CSS,
+            "headerSelector": OddsPortalSelectors.ODDS_MOVEMENT_HEADER,
+            "timeoutMs": ODDS_MOVEMENT_SELECTOR_TIMEOUT_MS,
+        }
+        try:
+            outcome = await page.evaluate(_HARVEST_ODDS_HISTORY_JS, args)
+        except Exception as e:
+            self.logger.debug(f"In-page odds history capture failed, hovering bookmaker by bookmaker: {e}")
+            outcome = None
+
+        if not isinstance(outcome, dict):
+            return {name: await self.extract_odds_history_for_bookmaker(page, name) for name in bookmaker_names}
+
+        harvested = outcome.get("modals") or {}
+        missing = outcome.get("missing") or {}
+        self.logger.info(
+            f"Captured {sum(len(modals) for modals in harvested.values())} odds history modals "
+            f"from {outcome.get('cells', 0)} odds cells in {outcome.get('elapsedMs', 0):.0f} ms."
+        )
+        modals_by_bookmaker = {}
+        for name in bookmaker_names:
+            if missing.get(name):
+                self.logger.warning(f"{missing[name]} odds history modals missing for {name}, hovering one by one.")
+                modals_by_bookmaker[name] = await self.extract_odds_history_for_bookmaker(page, name)
+            else:
+                modals_by_bookmaker[name] = list(harvested.get(name) or [])
+        return modals_by_bookmaker
+
     async def extract_odds_history_for_bookmaker(self, page: Page, bookmaker_name: str) -> list[str]:
         """
         Hover on odds for a specific bookmaker to trigger and capture the odds history modal.
@@ -5,7 +5,9 @@ from typing import Any
 
 from bs4 import BeautifulSoup, Tag
 
+from oddsharvester.core import lxml_tree
 from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+from oddsharvester.core.parser_backend import LXML_BACKEND, parser_backend_from_env
 
 _FRACTIONAL_RE = re.compile(r"^(\d+)/(\d+)$")
 _logger = logging.getLogger(__name__)
@@ -27,8 +29,14 @@ def parse_odds_value(text: str) -> float:
 class OddsParser:
     """Handles parsing of odds data from HTML content."""
 
-    def __init__(self):
+    def __init__(self, parser_backend: str | None = None):
+        """
+        Args:
+            parser_backend (str | None): Tree backend of `parse_bookmaker_rows` (`bs4` or `lxml`);
+                defaults to `OH_PARSER_BACKEND`.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.parser_backend = parser_backend or parser_backend_from_env()
 
     def parse_market_odds(
         self, html_content: str, period: str, odds_labels: list, target_bookmaker: str | None = None
@@ -46,6 +54,25 @@ class OddsParser:
             list[dict]: A list of dictionaries containing bookmaker odds.
         """
         self.logger.info("Parsing odds from HTML content.")
+        rows = self.parse_bookmaker_rows(html_content, target_bookmaker)
+        if not rows:
+            return []
+        return self.build_market_odds(rows, period, odds_labels, target_bookmaker)
+
+    def parse_bookmaker_rows(self, html_content: str, target_bookmaker: str | None = None) -> list[dict[str, Any]]:
+        """
+        Reads the raw bookmaker rows of the odds table, before any label mapping.
+
+        Args:
+            html_content (str): The HTML content of the page.
+            target_bookmaker (str, optional): If set, only keep the row of this bookmaker.
+
+        Returns:
+            list[dict]: One {"bookmaker_name", "odds", "blocked"} dict per bookmaker row (see `build_market_odds`).
+        """
+        if self.parser_backend == LXML_BACKEND:
+            return self._parse_bookmaker_rows_lxml(html_content, target_bookmaker)
+
         soup = BeautifulSoup(html_content, "html.parser")
 
         # Scope to the bookmaker table container if present — its parent holds only
@@ -67,7 +94,7 @@ class OddsParser:
             self.logger.warning("No bookmaker blocks found.")
             return []
 
-        odds_data = []
+        rows = []
         for block in bookmaker_blocks:
             try:
                 bookmaker_name = self._extract_bookmaker_name(block)
@@ -76,32 +103,122 @@ class OddsParser:
                     continue
 
                 odds_blocks = block.find_all("div", class_=re.compile(OddsPortalSelectors.ODDS_BLOCK_CLASS_PATTERN))
+                rows.append(
+                    {
+                        "bookmaker_name": bookmaker_name,
+                        "odds": [odds_block.get_text(strip=True) for odds_block in odds_blocks],
+                        "blocked": [
+                            odds_block.select_one(OddsPortalSelectors.ODDS_BLOCKED_SELECTOR) is not None
+                            for odds_block in odds_blocks
+                        ],
+                    }
+                )
 
-                if len(odds_blocks) < len(odds_labels):
-                    self.logger.warning(f"Incomplete odds data for bookmaker: {bookmaker_name}. Skipping...")
-                    continue
+            except Exception as e:
+                self.logger.error(f"Error parsing odds: {e}")
+                continue
+
+        return rows
+
+    def _parse_bookmaker_rows_lxml(self, html_content: str, target_bookmaker: str | None) -> list[dict[str, Any]]:
+        """`parse_bookmaker_rows` on an lxml tree (same lookups, see `core.lxml_tree`)."""
+        root = lxml_tree.parse_html(html_content)
+        header = (
+            lxml_tree.find(root, "div", attrs={"data-testid": OddsPortalSelectors.BOOKMAKER_TABLE_HEADER_TESTID})
+            if root is not None
+            else None
+        )
+        search_root = header.getparent() if header is not None and header.getparent() is not None else root
+
+        bookmaker_blocks = []
+        if search_root is not None:
+            bookmaker_blocks = lxml_tree.find_all(
+                search_root, "div", class_=re.compile(OddsPortalSelectors.BOOKMAKER_ROW_CLASS)
+            )
+            if not bookmaker_blocks:
+                bookmaker_blocks = lxml_tree.find_all(
+                    search_root, "div", class_=re.compile(OddsPortalSelectors.BOOKMAKER_ROW_FALLBACK_CLASS)
+                )
 
-                extracted_odds = {label: odds_blocks[i].get_text(strip=True) for i, label in enumerate(odds_labels)}
+        if not bookmaker_blocks:
+            self.logger.warning("No bookmaker blocks found.")
+            return []
 
-                for key, value in extracted_odds.items():
-                    extracted_odds[key] = re.sub(r"(\d+\.\d+)\1", r"\1", value)
+        odds_block_class = re.compile(OddsPortalSelectors.ODDS_BLOCK_CLASS_PATTERN)
+        blocked_class = OddsPortalSelectors.ODDS_BLOCKED_SELECTOR.removeprefix(".")
+        rows = []
+        for block in bookmaker_blocks:
+            try:
+                bookmaker_name = self._extract_bookmaker_name_lxml(block)
 
-                blocked_outcomes = [
-                    label
-                    for i, label in enumerate(odds_labels)
-                    if odds_blocks[i].select_one(OddsPortalSelectors.ODDS_BLOCKED_SELECTOR)
-                ]
+                if not bookmaker_name or (target_bookmaker and bookmaker_name.lower() != target_bookmaker.lower()):
+                    continue
 
-                extracted_odds["bookmaker_name"] = bookmaker_name
-                extracted_odds["period"] = period
-                if blocked_outcomes:
-                    extracted_odds["blocked_outcomes"] = blocked_outcomes
-                odds_data.append(extracted_odds)
+                odds_blocks = lxml_tree.find_all(block, "div", class_=odds_block_class)
+                rows.append(
+                    {
+                        "bookmaker_name": bookmaker_name,
+                        "odds": [lxml_tree.get_text(odds_block) for odds_block in odds_blocks],
+                        "blocked": [
+                            any(
+                                blocked_class in (element.get("class") or "").split()
+                                for element in odds_block.iterdescendants()
+                                if isinstance(element.tag, str)
+                            )
+                            for odds_block in odds_blocks
+                        ],
+                    }
+                )
 
             except Exception as e:
                 self.logger.error(f"Error parsing odds: {e}")
                 continue
 
+        return rows
+
+    def build_market_odds(
+        self, rows: list[dict[str, Any]], period: str, odds_labels: list, target_bookmaker: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Turns raw bookmaker rows into market odds entries.
+
+        Shared by the HTML parser above and the in-page extraction (`BookmakerTableExtractor`),
+        so both apply the same filtering and clean-up.
+
+        Args:
+            rows (list[dict]): One {"bookmaker_name", "odds", "blocked"} dict per bookmaker row, in page order;
+                `odds` holds the text of each odds cell and `blocked` whether that cell is struck through.
+            period (str): The match period (e.g., "FullTime").
+            odds_labels (list): Labels of the expected odds columns.
+            target_bookmaker (str, optional): If set, only keep odds for this bookmaker.
+
+        Returns:
+            list[dict]: A list of dictionaries containing bookmaker odds.
+        """
+        odds_data = []
+        for row in rows:
+            bookmaker_name = row.get("bookmaker_name")
+            if not bookmaker_name or (target_bookmaker and bookmaker_name.lower() != target_bookmaker.lower()):
+                continue
+
+            odds_texts = row.get("odds") or []
+            if len(odds_texts) < len(odds_labels):
+                self.logger.warning(f"Incomplete odds data for bookmaker: {bookmaker_name}. Skipping...")
+                continue
+
+            extracted_odds = {
+                label: re.sub(r"(\d+\.\d+)\1", r"\1", odds_texts[i]) for i, label in enumerate(odds_labels)
+            }
+
+            blocked = row.get("blocked") or []
+            blocked_outcomes = [label for i, label in enumerate(odds_labels) if i < len(blocked) and blocked[i]]
+
+            extracted_odds["bookmaker_name"] = bookmaker_name
+            extracted_odds["period"] = period
+            if blocked_outcomes:
+                extracted_odds["blocked_outcomes"] = blocked_outcomes
+            odds_data.append(extracted_odds)
+
         self.logger.info(f"Successfully parsed odds for {len(odds_data)} bookmakers.")
         return odds_data
 
@@ -191,3 +308,28 @@ class OddsParser:
 
         self.logger.debug("Could not resolve bookmaker name from block")
         return None
+
+    def _extract_bookmaker_name_lxml(self, block) -> str | None:
+        """`_extract_bookmaker_name` on an lxml element."""
+        img_tag = lxml_tree.find(block, "img", class_=OddsPortalSelectors.BOOKMAKER_LOGO_CLASS)
+        if img_tag is not None and img_tag.get("title"):
+            return img_tag.get("title")
+
+        a_tag = lxml_tree.find(block, "a", attrs={"title": True})
+        if a_tag is not None and a_tag.get("title"):
+            name = a_tag.get("title")
+            if name.lower().startswith("go to ") and name.endswith("!"):
+                name = name[len("go to ") : -1].strip()
+                if name.lower().endswith(" website"):
+                    name = name[: -len(" website")].strip()
+            self.logger.debug(f"Resolved bookmaker name via <a title>: {name}")
+            return name
+
+        for img in lxml_tree.find_all(block, "img"):
+            alt = img.get("alt", "")
+            if alt and alt.lower() not in ("", "logo"):
+                self.logger.debug(f"Resolved bookmaker name via <img alt>: {alt}")
+                return alt
+
+        self.logger.debug("Could not resolve bookmaker name from block")
+        return None
@@ -5,15 +5,33 @@ from typing import Any
 from bs4 import BeautifulSoup
 from playwright.async_api import Page
 
+from oddsharvester.core import lxml_tree
+from oddsharvester.core.browser.dom_snapshot import SUBMARKET_LIST_REGION, DomSnapshots
+from oddsharvester.core.browser.readiness import PageReadiness
 from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+from oddsharvester.core.parser_backend import BS4_BACKEND, LXML_BACKEND, parser_backend_from_env
+from oddsharvester.core.parsing_executor import ParsingExecutor
 from oddsharvester.utils.constants import SCROLL_PAUSE_TIME_MS
 
+_logger = logging.getLogger(__name__)
+
+_ODDS_CONTAINER_TESTID = "odd-container-default"
+
 
 class SubmarketExtractor:
     """Handles extraction of visible submarkets in passive mode."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        readiness: PageReadiness | None = None,
+        parsing_executor: ParsingExecutor | None = None,
+        dom_snapshots: DomSnapshots | None = None,
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.readiness = readiness or PageReadiness()
+        self.parsing_executor = parsing_executor or ParsingExecutor.shared()
+        self.dom_snapshots = dom_snapshots or DomSnapshots()
+        self.parser_backend = parser_backend_from_env()
 
     async def is_preview_compatible_market(self, page: Page, main_market: str) -> bool:
         """
@@ -30,10 +48,8 @@ class SubmarketExtractor:
             bool: True if the market supports preview mode, False otherwise.
         """
         try:
-            # Get current page HTML
-            html_content = await page.content()
-            if not isinstance(html_content, str):
-                html_content = ""
+            # Get the submarket rows' HTML
+            html_content = await self.dom_snapshots.content(page, SUBMARKET_LIST_REGION)
             soup = BeautifulSoup(html_content, "html.parser")
 
             # Look for submarket containers
@@ -46,7 +62,7 @@ class SubmarketExtractor:
                 # Check if any of these submarkets have visible odds
                 submarkets_with_odds = 0
                 for container in submarket_containers[:5]:  # Check first 5 submarkets
-                    odds_containers = container.find_all("p", attrs={"data-testid": "odd-container-default"})
+                    odds_containers = container.find_all("p", attrs={"data-testid": _ODDS_CONTAINER_TESTID})
                     if len(odds_containers) >= 2:  # Need at least 2 odds to be useful
                         submarkets_with_odds += 1
 
@@ -92,141 +108,232 @@ class SubmarketExtractor:
         self.logger.info(f"Extracting visible submarkets for {main_market} in passive mode")
 
         try:
-            await page.wait_for_timeout(SCROLL_PAUSE_TIME_MS)
-            html_content = await page.content()
-            if not isinstance(html_content, str):
-                html_content = ""
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Find all submarket rows (these contain the handicap names and odds)
-            submarket_rows = soup.find_all("div", class_=re.compile(OddsPortalSelectors.BOOKMAKER_ROW_CLASS))
-
-            if not submarket_rows:
-                self.logger.warning("No submarket rows found in passive mode")
-                return []
-
-            submarkets_data = []
-
-            for row in submarket_rows:
-                try:
-                    # Extract submarket name - improved parsing for different market types
-                    submarket_name = self._extract_submarket_name(row, main_market)
-
-                    if not submarket_name:
-                        continue
-
-                    # Log the extracted submarket name for debugging
-                    self.logger.debug(f"Extracted submarket name: '{submarket_name}'")
-
-                    # Find all odds containers in this row
-                    odds_containers = row.find_all("p", attrs={"data-testid": "odd-container-default"})
-
-                    # Use provided odds_labels or determine based on market type
-                    if odds_labels is None:
-                        # Default to Over/Under labels, but adjust for single-odds markets
-                        if "correct score" in main_market.lower():
-                            odds_labels = ["correct_score"]
-                            min_odds_required = 1
-                        else:
-                            odds_labels = ["odds_over", "odds_under"]
-                            min_odds_required = 2
-                    else:
-                        min_odds_required = len(odds_labels)
-
-                    if len(odds_containers) < min_odds_required:
-                        self.logger.debug(
-                            f"Skipping row with {len(odds_containers)} odds, need at least {min_odds_required} "
-                            f"for {main_market}"
-                        )
-                        continue
-
-                    # Extract odds values
-                    odds_values = []
-                    for container in odds_containers:
-                        odds_text = container.get_text(strip=True)
-                        if odds_text:
-                            odds_values.append(odds_text)
-
-                    if len(odds_values) >= min_odds_required:
-                        submarket_data = {
-                            "submarket_name": submarket_name,
-                            "period": period,
-                            "market_type": main_market,
-                            "extraction_mode": "passive",
-                        }
-
-                        # Add odds with appropriate labels
-                        for i, label in enumerate(odds_labels):
-                            if i < len(odds_values):
-                                submarket_data[label] = odds_values[i]
-
-                        # Add any additional odds beyond the expected labels
-                        if len(odds_values) > len(odds_labels):
-                            for i, odds_value in enumerate(odds_values[len(odds_labels) :], start=len(odds_labels)):
-                                submarket_data[f"odds_option_{i + 1}"] = odds_value
-
-                        submarkets_data.append(submarket_data)
-
-                except Exception as e:
-                    self.logger.warning(f"Error processing submarket row: {e}")
-                    continue
-
-            self.logger.info(f"Successfully extracted {len(submarkets_data)} visible submarkets in passive mode")
-            return submarkets_data
+            await self.readiness.settled(page, timeout_ms=SCROLL_PAUSE_TIME_MS)
+            html_content = await self.dom_snapshots.content(page, SUBMARKET_LIST_REGION)
+            return await self.parsing_executor.run(
+                parse_visible_submarkets, html_content, main_market, period, odds_labels, self.parser_backend
+            )
 
         except Exception as e:
             self.logger.error(f"Error in passive submarket extraction: {e}")
             return []
 
     def _extract_submarket_name(self, row, main_market: str) -> str | None:
-        """Extract submarket name from a row using multiple strategies."""
-        # First, try to find the div with data-testid pattern (for Over/Under markets)
-        market_key = main_market.lower().replace("/", "-").replace(" ", "-")
-        data_testid_pattern = f"{market_key}-collapsed-option-box"
-        submarket_name_element = row.find("div", attrs={"data-testid": re.compile(data_testid_pattern)})
-
-        if submarket_name_element:
-            # For markets like Over/Under, look for the clean name in max-sm:!hidden class
-            clean_name_p = submarket_name_element.find("p", class_=OddsPortalSelectors.SUBMARKET_CLEAN_NAME_CLASS)
-            if clean_name_p:
-                return clean_name_p.get_text(strip=True)
-            else:
-                # Fallback to any <p> in the div
-                first_p = submarket_name_element.find("p")
-                if first_p:
-                    return first_p.get_text(strip=True)
-
-        # If not found, try to find any div with the flex classes (for other markets)
-        flex_div = row.find("div", class_=re.compile(r"flex.*items-center.*justify-start"))
-        if flex_div:
-            # Look for the clean name in max-sm:!hidden class first
-            clean_name_p = flex_div.find("p", class_=OddsPortalSelectors.SUBMARKET_CLEAN_NAME_CLASS)
-            if clean_name_p:
-                return clean_name_p.get_text(strip=True)
+        """Extract submarket name from a row using multiple strategies (see `extract_submarket_name`)."""
+        return extract_submarket_name(row, main_market)
+
+
+def parse_visible_submarkets(
+    html_content: str,
+    main_market: str,
+    period: str,
+    odds_labels: list | None = None,
+    parser_backend: str = BS4_BACKEND,
+) -> list[dict[str, Any]]:
+    """
+    Parse the collapsed submarket rows of a market page (the parsing half of passive mode).
+
+    Module-level so `ParsingExecutor` can run it in a worker process.
+
+    Args:
+        html_content (str): The HTML content of the page.
+        main_market (str): The main market name (e.g., "Over/Under", "European Handicap").
+        period (str): The match period (e.g., "FullTime").
+        odds_labels (list, optional): Labels corresponding to odds values. If None, defaults to
+        ["odds_over", "odds_under"].
+        parser_backend (str): Tree backend the rows are read with (`bs4` or `lxml`).
+
+    Returns:
+        list[dict]: A list of dictionaries containing submarket data with odds.
+    """
+    # (submarket name, odds texts) of every submarket row (these contain the handicap names and odds)
+    if parser_backend == LXML_BACKEND:
+        submarket_rows = _read_submarket_rows_lxml(html_content, main_market)
+    else:
+        submarket_rows = _read_submarket_rows(html_content, main_market)
+
+    if not submarket_rows:
+        _logger.warning("No submarket rows found in passive mode")
+        return []
+
+    submarkets_data = []
+
+    for submarket_name, odds_texts in submarket_rows:
+        try:
+            if not submarket_name:
+                continue
+
+            # Log the extracted submarket name for debugging
+            _logger.debug(f"Extracted submarket name: '{submarket_name}'")
+
+            # Use provided odds_labels or determine based on market type
+            if odds_labels is None:
+                # Default to Over/Under labels, but adjust for single-odds markets
+                if "correct score" in main_market.lower():
+                    odds_labels = ["correct_score"]
+                    min_odds_required = 1
+                else:
+                    odds_labels = ["odds_over", "odds_under"]
+                    min_odds_required = 2
             else:
-                # Fallback to any <p> in the div
-                first_p = flex_div.find("p")
-                if first_p:
-                    return first_p.get_text(strip=True)
-
-        # If still not found, try to find any <p> with font-bold class
-        bold_p = row.find("p", class_=re.compile(r"font-bold"))
-        if bold_p:
-            return bold_p.get_text(strip=True)
-
-        # If still not found, try to find any <p> that looks like a submarket name
-        all_p_tags = row.find_all("p")
-        for p_tag in all_p_tags:
-            text = p_tag.get_text(strip=True)
-            # Skip percentage values, odds values, and other non-submarket text
-            if (
-                text
-                and not text.endswith("%")
-                and not text.replace(".", "").isdigit()  # Skip pure numbers like "2.80"
-                and len(text) > 1
-                and not text.startswith("data-testid")  # Skip any data attributes
-                and ":" in text
-            ):  # Correct Score submarkets contain ":"
-                return text
-
-        return None
+                min_odds_required = len(odds_labels)
+
+            if len(odds_texts) < min_odds_required:
+                _logger.debug(
+                    f"Skipping row with {len(odds_texts)} odds, need at least {min_odds_required} for {main_market}"
+                )
+                continue
+
+            # Extract odds values
+            odds_values = [odds_text for odds_text in odds_texts if odds_text]
+
+            if len(odds_values) >= min_odds_required:
+                submarket_data = {
+                    "submarket_name": submarket_name,
+                    "period": period,
+                    "market_type": main_market,
+                    "extraction_mode": "passive",
+                }
+
+                # Add odds with appropriate labels
+                for i, label in enumerate(odds_labels):
+                    if i < len(odds_values):
+                        submarket_data[label] = odds_values[i]
+
+                # Add any additional odds beyond the expected labels
+                if len(odds_values) > len(odds_labels):
+                    for i, odds_value in enumerate(odds_values[len(odds_labels) :], start=len(odds_labels)):
+                        submarket_data[f"odds_option_{i + 1}"] = odds_value
+
+                submarkets_data.append(submarket_data)
+
+        except Exception as e:
+            _logger.warning(f"Error processing submarket row: {e}")
+            continue
+
+    _logger.info(f"Successfully extracted {len(submarkets_data)} visible submarkets in passive mode")
+    return submarkets_data
+
+
+def _read_submarket_rows(html_content: str, main_market: str) -> list[tuple[str | None, list[str]]]:
+    """(name, odds texts) of each submarket row, read with BeautifulSoup."""
+    soup = BeautifulSoup(html_content, "html.parser")
+    return [
+        (
+            extract_submarket_name(row, main_market),
+            [
+                container.get_text(strip=True)
+                for container in row.find_all("p", attrs={"data-testid": _ODDS_CONTAINER_TESTID})
+            ],
+        )
+        for row in soup.find_all("div", class_=re.compile(OddsPortalSelectors.BOOKMAKER_ROW_CLASS))
+    ]
+
+
+def _read_submarket_rows_lxml(html_content: str, main_market: str) -> list[tuple[str | None, list[str]]]:
+    """`_read_submarket_rows` on an lxml tree (same lookups, see `core.lxml_tree`)."""
+    root = lxml_tree.parse_html(html_content)
+    if root is None:
+        return []
+    return [
+        (
+            _extract_submarket_name_lxml(row, main_market),
+            [
+                lxml_tree.get_text(container)
+                for container in lxml_tree.find_all(row, "p", attrs={"data-testid": _ODDS_CONTAINER_TESTID})
+            ],
+        )
+        for row in lxml_tree.find_all(root, "div", class_=re.compile(OddsPortalSelectors.BOOKMAKER_ROW_CLASS))
+    ]
+
+
+def extract_submarket_name(row, main_market: str) -> str | None:
+    """Extract submarket name from a row using multiple strategies."""
+    # First, try to find the div with data-testid pattern (for Over/Under markets)
+    market_key = main_market.lower().replace("/", "-").replace(" ", "-")
+    data_testid_pattern = f"{market_key}-collapsed-option-box"
+    submarket_name_element = row.find("div", attrs={"data-testid": re.compile(data_testid_pattern)})
+
+    if submarket_name_element:
+        # For markets like Over/Under, look for the clean name in max-sm:!hidden class
+        clean_name_p = submarket_name_element.find("p", class_=OddsPortalSelectors.SUBMARKET_CLEAN_NAME_CLASS)
+        if clean_name_p:
+            return clean_name_p.get_text(strip=True)
+        else:
+            # Fallback to any <p> in the div
+            first_p = submarket_name_element.find("p")
+            if first_p:
+                return first_p.get_text(strip=True)
+
+    # If not found, try to find any div with the flex classes (for other markets)
+    flex_div = row.find("div", class_=re.compile(r"flex.*items-center.*justify-start"))
+    if flex_div:
+        # Look for the clean name in max-sm:!hidden class first
+        clean_name_p = flex_div.find("p", class_=OddsPortalSelectors.SUBMARKET_CLEAN_NAME_CLASS)
+        if clean_name_p:
+            return clean_name_p.get_text(strip=True)
+        else:
+            # Fallback to any <p> in the div
+            first_p = flex_div.find("p")
+            if first_p:
+                return first_p.get_text(strip=True)
+
+    # If still not found, try to find any <p> with font-bold class
+    bold_p = row.find("p", class_=re.compile(r"font-bold"))
+    if bold_p:
+        return bold_p.get_text(strip=True)
+
+    # If still not found, try to find any <p> that looks like a submarket name
+    all_p_tags = row.find_all("p")
+    for p_tag in all_p_tags:
+        text = p_tag.get_text(strip=True)
+        # Skip percentage values, odds values, and other non-submarket text
+        if (
+            text
+            and not text.endswith("%")
+            and not text.replace(".", "").isdigit()  # Skip pure numbers like "2.80"
+            and len(text) > 1
+            and not text.startswith("data-testid")  # Skip any data attributes
+            and ":" in text
+        ):  # Correct Score submarkets contain ":"
+            return text
+
+    return None
+
+
+def _extract_submarket_name_lxml(row, main_market: str) -> str | None:
+    """`extract_submarket_name` on an lxml element."""
+    market_key = main_market.lower().replace("/", "-").replace(" ", "-")
+    data_testid_pattern = f"{market_key}-collapsed-option-box"
+    submarket_name_element = lxml_tree.find(row, "div", attrs={"data-testid": re.compile(data_testid_pattern)})
+
+    for name_container in (
+        submarket_name_element,
+        lxml_tree.find(row, "div", class_=re.compile(r"flex.*items-center.*justify-start")),
+    ):
+        if name_container is None:
+            continue
+        clean_name_p = lxml_tree.find(name_container, "p", class_=OddsPortalSelectors.SUBMARKET_CLEAN_NAME_CLASS)
+        if clean_name_p is not None:
+            return lxml_tree.get_text(clean_name_p)
+        first_p = lxml_tree.find(name_container, "p")
+        if first_p is not None:
+            return lxml_tree.get_text(first_p)
+
+    bold_p = lxml_tree.find(row, "p", class_=re.compile(r"font-bold"))
+    if bold_p is not None:
+        return lxml_tree.get_text(bold_p)
+
+    for p_tag in lxml_tree.find_all(row, "p"):
+        text = lxml_tree.get_text(p_tag)
+        if (
+            text
+            and not text.endswith("%")
+            and not text.replace(".", "").isdigit()
+            and len(text) > 1
+            and not text.startswith("data-testid")
+            and ":" in text
+        ):
+            return text
+
+    return None
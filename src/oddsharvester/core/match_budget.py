@@ -0,0 +1,98 @@
+"""
+Shared match-concurrency budget for concurrent league/season combos.
+
+Each combo runs its own `WorkerPool`, so combos scraped side by side would each open
+`--concurrency` pages per proxy. A `MatchBudget` caps the pages open across all of
+them, and hands freed slots to the waiting combos in turn, so a league with thousands
+of matches cannot hold every slot while a small one waits behind it.
+
+The combo a task works for is bound with `bind_share`; tasks created afterwards
+(the combo's match workers) inherit it through their context.
+"""
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Hashable
+from contextvars import ContextVar
+
+_share: ContextVar[Hashable] = ContextVar("match_budget_share", default=None)
+
+
+def bind_share(share: Hashable) -> None:
+    """Charge the budget slots taken by the current task, and the tasks it starts, to `share`."""
+    _share.set(share)
+
+
+class MatchBudget:
+    """
+    A counting semaphore that serves its waiters round-robin by share.
+
+    While slots are free, `acquire` returns at once. Once they are all taken, waiters queue
+    per share, and each freed slot goes to the next share in turn, which then moves to the
+    back of the line.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity (int): Slots (open match pages) shared by every combo.
+        """
+        self.capacity = max(capacity, 1)
+        self.in_use = 0
+        self.granted: Counter = Counter()
+        self._waiters: dict[Hashable, deque[asyncio.Future]] = {}
+        self._turns: deque[Hashable] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self) -> None:
+        """Take a slot for the current task's share, waiting for its turn when none is free."""
+        share = _share.get()
+        if self.in_use < self.capacity and not self._turns:
+            self._take(share)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._waiters.setdefault(share, deque())
+        if not queue:
+            self._turns.append(share)
+        queue.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the task was cancelled: give it back.
+                self.release()
+            else:
+                self._drop_waiter(share, waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next share waiting for one."""
+        self.in_use -= 1
+        while self.in_use < self.capacity and self._turns:
+            share = self._turns.popleft()
+            queue = self._waiters[share]
+            waiter = queue.popleft()
+            if queue:
+                self._turns.append(share)
+            else:
+                del self._waiters[share]
+            if not waiter.done():
+                self._take(share)
+                waiter.set_result(None)
+
+    def _take(self, share: Hashable) -> None:
+        self.in_use += 1
+        self.granted[share] += 1
+
+    def _drop_waiter(self, share: Hashable, waiter: asyncio.Future) -> None:
+        queue = self._waiters.get(share)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del self._waiters[share]
+            self._turns.remove(share)
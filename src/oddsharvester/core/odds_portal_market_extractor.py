@@ -1,8 +1,11 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
 import logging
 from typing import Any
 
 from playwright.async_api import Page
 
+from oddsharvester.core.browser.dom_snapshot import BOOKMAKER_TABLE_REGION, DomSnapshots
 from oddsharvester.core.browser.market_navigation import MarketTabNavigator
 from oddsharvester.core.browser.scrolling import PageScroller
 from oddsharvester.core.browser.selection import (
@@ -11,18 +14,37 @@ from oddsharvester.core.browser.selection import (
     SelectionManager,
 )
 from oddsharvester.core.market_extraction import (
+    BookmakerTableExtractor,
     MarketGrouping,
+    MarketNavigationPlanner,
     NavigationManager,
     OddsHistoryExtractor,
     OddsParser,
     SubmarketExtractor,
 )
 from oddsharvester.core.market_extraction.line_tokens import line_name_to_token
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+from oddsharvester.core.parsing_executor import ParsingExecutor
+from oddsharvester.core.phase_timing import timed_market, timed_phase
 from oddsharvester.core.sport_market_registry import SportMarketRegistry
 from oddsharvester.core.sport_period_registry import SportPeriodRegistry
 from oddsharvester.utils.sport_market_constants import FOOTBALL_UMBRELLA_MARKETS, Sport
 
 
+@dataclass
+class _ActiveTab:
+    """Main-market tab a page is on, and the period confirmed on it (None: not selected yet)."""
+
+    page: Page
+    main_market: str
+    period: str | None = None
+
+
+# Tab the current match's page is on, so markets sharing it skip navigation and period
+# selection. Set per scrape_markets call; each match task sees only its own.
+_active_tab: ContextVar[_ActiveTab | None] = ContextVar("active_market_tab", default=None)
+
+
 class OddsPortalMarketExtractor:
     """
     Extracts betting odds data from OddsPortal using Playwright.
@@ -31,7 +53,13 @@ class OddsPortalMarketExtractor:
     for specific match periods and bookmaker odds.
     """
 
-    def __init__(self, scroller: PageScroller, tab_navigator: MarketTabNavigator, selection_manager: SelectionManager):
+    def __init__(
+        self,
+        scroller: PageScroller,
+        tab_navigator: MarketTabNavigator,
+        selection_manager: SelectionManager,
+        parsing_executor: ParsingExecutor | None = None,
+    ):
         """
         Initialize OddsPortalMarketExtractor.
 
@@ -39,19 +67,26 @@ class OddsPortalMarketExtractor:
             scroller (PageScroller): Handles incremental page scrolling.
             tab_navigator (MarketTabNavigator): Handles market tab navigation.
             selection_manager (SelectionManager): Manages period selection.
+            parsing_executor (ParsingExecutor | None): Where market HTML is parsed; defaults to the shared executor.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.scroller = scroller
         self.tab_navigator = tab_navigator
         self.selection_manager = selection_manager
         self.period_selector = PeriodSelector()
+        self.parsing_executor = parsing_executor or ParsingExecutor.shared()
 
         # Initialize component classes
         self.navigation_manager = NavigationManager(tab_navigator=tab_navigator, scroller=scroller)
         self.odds_parser = OddsParser()
-        self.submarket_extractor = SubmarketExtractor()
+        self.bookmaker_table_extractor = BookmakerTableExtractor.from_env(self.odds_parser)
+        self.dom_snapshots = DomSnapshots()
+        self.submarket_extractor = SubmarketExtractor(
+            parsing_executor=self.parsing_executor, dom_snapshots=self.dom_snapshots
+        )
         self.odds_history_extractor = OddsHistoryExtractor()
         self.market_grouping = MarketGrouping()
+        self.market_planner = MarketNavigationPlanner(self.market_grouping)
 
     async def scrape_markets(
         self,
@@ -79,6 +114,24 @@ class OddsPortalMarketExtractor:
         Returns:
             Dict[str, Any]: A dictionary containing market data.
         """
+        token = _active_tab.set(None)
+        try:
+            return await self._scrape_markets(
+                page, sport, markets, period, scrape_odds_history, target_bookmaker, preview_submarkets_only
+            )
+        finally:
+            _active_tab.reset(token)
+
+    async def _scrape_markets(
+        self,
+        page: Page,
+        sport: str,
+        markets: list[str],
+        period: str,
+        scrape_odds_history: bool,
+        target_bookmaker: str | None,
+        preview_submarkets_only: bool,
+    ) -> dict[str, Any]:
         market_data = {}
         market_methods = SportMarketRegistry.get_market_mapping(sport)
 
@@ -94,9 +147,10 @@ class OddsPortalMarketExtractor:
                 continue
 
             try:
-                line_names = await self._discover_line_names(
-                    page=page, main_market=umbrella_main_market, sport=sport, period=period
-                )
+                with timed_phase("line_discovery"):
+                    line_names = await self._discover_line_names(
+                        page=page, main_market=umbrella_main_market, sport=sport, period=period
+                    )
                 line_tokens: list[str] = []
                 for line_name in line_names:
                     token = line_name_to_token(umbrella_main_market, line_name)
@@ -116,33 +170,54 @@ class OddsPortalMarketExtractor:
 
         markets = expanded_markets
 
+        supported_markets = []
+        for market in markets:
+            if market in market_methods:
+                supported_markets.append(market)
+            else:
+                self.logger.warning(f"Market '{market}' is not supported for sport '{sport}'.")
+
         # Group markets by their main market type for optimization in preview mode
         market_groups = {}
 
-        for market in markets:
-            try:
-                if market in market_methods:
-                    # For preview mode, group markets by their main market type
-                    if preview_submarkets_only:
-                        # Get the main market info from the existing market method
-                        main_market_info = self.market_grouping.get_main_market_info(market_methods[market])
-                        if main_market_info:
-                            main_market_name = main_market_info["main_market"]
-                            if main_market_name not in market_groups:
-                                market_groups[main_market_name] = []
-                            market_groups[main_market_name].append(market)
-                    else:
-                        # Normal mode: scrape each market individually
-                        self.logger.info(f"Scraping market: {market} (Period: {period})")
+        if preview_submarkets_only:
+            for market in supported_markets:
+                # Get the main market info from the existing market method
+                main_market_info = self.market_grouping.get_main_market_info(market_methods[market])
+                if main_market_info:
+                    main_market_name = main_market_info["main_market"]
+                    if main_market_name not in market_groups:
+                        market_groups[main_market_name] = []
+                    market_groups[main_market_name].append(market)
+        else:
+            # Normal mode: scrape each market individually, visiting each main-market tab once
+            # (markets sharing the tab the page is already on skip navigation, see extract_market_odds).
+            active_tab = _active_tab.get()
+            plan = self.market_planner.plan(
+                supported_markets,
+                market_methods,
+                active_tab=active_tab.main_market if active_tab and active_tab.page is page else None,
+            )
+            for market in plan.markets:
+                try:
+                    self.logger.info(f"Scraping market: {market} (Period: {period})")
+                    with timed_market(market):
                         market_data[f"{market}_market"] = await market_methods[market](
-                            self, page, period, scrape_odds_history, target_bookmaker, preview_submarkets_only, sport
+                            self,
+                            page,
+                            period,
+                            scrape_odds_history,
+                            target_bookmaker,
+                            preview_submarkets_only,
+                            sport,
                         )
-                else:
-                    self.logger.warning(f"Market '{market}' is not supported for sport '{sport}'.")
+                except Exception as e:
+                    self.logger.error(f"Error scraping market '{market}': {e}")
+                    market_data[f"{market}_market"] = None
+                    _active_tab.set(None)
 
-            except Exception as e:
-                self.logger.error(f"Error scraping market '{market}': {e}")
-                market_data[f"{market}_market"] = None
+            # Report markets in the order they were requested, not the order they were scraped.
+            market_data = {f"{market}_market": market_data[f"{market}_market"] for market in supported_markets}
 
         # Handle grouped markets in preview mode
         if preview_submarkets_only and market_groups:
@@ -159,17 +234,18 @@ class OddsPortalMarketExtractor:
                         odds_labels = main_market_info["odds_labels"] if main_market_info else None
 
                         # Scrape the main market once
-                        main_market_data = await self.extract_market_odds(
-                            page=page,
-                            main_market=main_market_name,
-                            specific_market=None,  # No specific market, scrape all submarkets
-                            period=period,
-                            odds_labels=odds_labels,
-                            scrape_odds_history=scrape_odds_history,
-                            target_bookmaker=target_bookmaker,
-                            preview_submarkets_only=preview_submarkets_only,
-                            sport=sport,
-                        )
+                        with timed_market(main_market_name):
+                            main_market_data = await self.extract_market_odds(
+                                page=page,
+                                main_market=main_market_name,
+                                specific_market=None,  # No specific market, scrape all submarkets
+                                period=period,
+                                odds_labels=odds_labels,
+                                scrape_odds_history=scrape_odds_history,
+                                target_bookmaker=target_bookmaker,
+                                preview_submarkets_only=preview_submarkets_only,
+                                sport=sport,
+                            )
 
                         # Distribute the results to each specific market
                         for specific_market in grouped_markets:
@@ -197,9 +273,11 @@ class OddsPortalMarketExtractor:
         """
         if not await self.navigation_manager.navigate_to_market_tab(page=page, market_tab_name=main_market):
             self.logger.warning(f"Failed to find or click {main_market} tab while discovering lines")
+            _active_tab.set(None)
             return []
 
         await self.navigation_manager.wait_for_market_switch(page, main_market)
+        _active_tab.set(_ActiveTab(page=page, main_market=main_market))
 
         submarkets = await self.submarket_extractor.extract_visible_submarkets_passive(
             page=page, main_market=main_market, period=period
@@ -242,18 +320,30 @@ class OddsPortalMarketExtractor:
         )
 
         try:
-            # Navigate to the main market tab
-            if not await self.navigation_manager.navigate_to_market_tab(page=page, market_tab_name=main_market):
-                self.logger.error(f"Failed to find or click {main_market} tab")
-                return []
+            active_tab = _active_tab.get()
+            if active_tab and active_tab.page is page and active_tab.main_market == main_market:
+                self.logger.info(f"Already on the {main_market} tab, skipping navigation.")
+            else:
+                # Navigate to the main market tab
+                _active_tab.set(None)
+                period_scope = OddsPortalSelectors.period_scope_code(sport, period) if sport else None
+                if not await self.navigation_manager.navigate_to_market_tab(
+                    page=page, market_tab_name=main_market, period_scope=period_scope
+                ):
+                    self.logger.error(f"Failed to find or click {main_market} tab")
+                    return []
 
-            # Wait for market switch to complete
-            await self.navigation_manager.wait_for_market_switch(page, main_market)
+                # Wait for market switch to complete
+                await self.navigation_manager.wait_for_market_switch(page, main_market)
+                active_tab = _ActiveTab(page=page, main_market=main_market)
+                _active_tab.set(active_tab)
 
             # Ensure correct period is selected after market switch. Prefer the
             # language-independent scope code (works on localized mirrors, §7);
             # fall back to localized-label matching when no scope is verified.
-            if sport:
+            if sport and active_tab.period == period:
+                self.logger.debug(f"Period {period} already selected on the {main_market} tab.")
+            elif sport:
                 period_enum = SportPeriodRegistry.from_internal_value(period, sport)
                 if period_enum:
                     scope_selected = await self.period_selector.select_by_scope(
@@ -261,12 +351,14 @@ class OddsPortalMarketExtractor:
                     )
                     if scope_selected is None:
                         display_label = period_enum.get_display_label(period_enum)
-                        await self.selection_manager.ensure_selected(
+                        scope_selected = await self.selection_manager.ensure_selected(
                             page=page,
                             target_value=display_label,
                             display_label=display_label,
                             strategy=PERIOD_STRATEGY,
                         )
+                    if scope_selected is True:
+                        active_tab.period = period
                 else:
                     self.logger.debug(f"Period selection skipped for sport: {sport}")
 
@@ -288,14 +380,7 @@ class OddsPortalMarketExtractor:
                         return []
 
                     await self.navigation_manager.wait_for_page_load(page)
-                    html_content = await page.content()
-
-                    odds_data = self.odds_parser.parse_market_odds(
-                        html_content=html_content,
-                        period=period,
-                        odds_labels=odds_labels,
-                        target_bookmaker=target_bookmaker,
-                    )
+                    odds_data = await self._read_market_odds(page, period, odds_labels, target_bookmaker)
             else:
                 # Active mode: click on specific submarket if provided
                 if specific_market and not await self.navigation_manager.select_specific_market(
@@ -305,11 +390,7 @@ class OddsPortalMarketExtractor:
                     return []
 
                 await self.navigation_manager.wait_for_page_load(page)
-                html_content = await page.content()
-
-                odds_data = self.odds_parser.parse_market_odds(
-                    html_content=html_content, period=period, odds_labels=odds_labels, target_bookmaker=target_bookmaker
-                )
+                odds_data = await self._read_market_odds(page, period, odds_labels, target_bookmaker)
 
             # Stamp the market onto each dict (issue #78): the line for a submarket, the
             # market label itself otherwise, so every cell is self-describing. Passive rows
@@ -320,13 +401,19 @@ class OddsPortalMarketExtractor:
             if scrape_odds_history:
                 self.logger.info("Fetching odds history for all parsed bookmakers.")
 
-                for odds_entry in odds_data:
-                    bookmaker_name = odds_entry.get("bookmaker_name")
-
-                    if not bookmaker_name or (target_bookmaker and bookmaker_name.lower() != target_bookmaker.lower()):
-                        continue
+                bookmaker_names = [
+                    odds_entry["bookmaker_name"]
+                    for odds_entry in odds_data
+                    if odds_entry.get("bookmaker_name")
+                    and (not target_bookmaker or odds_entry["bookmaker_name"].lower() == target_bookmaker.lower())
+                ]
+                with timed_phase("odds_history"):
+                    modals_by_bookmaker = await self.odds_history_extractor.extract_odds_history_for_bookmakers(
+                        page, bookmaker_names
+                    )
 
-                    modals = await self.odds_history_extractor.extract_odds_history_for_bookmaker(page, bookmaker_name)
+                for odds_entry in odds_data:
+                    modals = modals_by_bookmaker.get(odds_entry.get("bookmaker_name"))
 
                     if modals:
                         all_histories = []
@@ -345,4 +432,24 @@ class OddsPortalMarketExtractor:
 
         except Exception as e:
             self.logger.error(f"Error extracting odds for {main_market} {specific_market}: {e}")
+            _active_tab.set(None)
             return []
+
+    async def _read_market_odds(
+        self, page: Page, period: str, odds_labels: list, target_bookmaker: str | None
+    ) -> list[dict[str, Any]]:
+        """Bookmaker odds of the market on screen: read in the page, or parsed from the table's HTML as a fallback."""
+        odds_data = await self.bookmaker_table_extractor.extract_market_odds(
+            page, period=period, odds_labels=odds_labels, target_bookmaker=target_bookmaker
+        )
+        if odds_data is not None:
+            return odds_data
+
+        html_content = await self.dom_snapshots.content(page, BOOKMAKER_TABLE_REGION)
+        return await self.parsing_executor.run(
+            self.odds_parser.parse_market_odds,
+            html_content,
+            period=period,
+            odds_labels=odds_labels,
+            target_bookmaker=target_bookmaker,
+        )
@@ -1,8 +1,10 @@
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import random
+from typing import Any
 
 from playwright.async_api import Page
 
@@ -16,6 +18,7 @@ from oddsharvester.utils.constants import (
     DEFAULT_REQUEST_DELAY_S,
     GOTO_TIMEOUT_LONG_MS,
     GOTO_TIMEOUT_MS,
+    LISTING_PAGE_CONCURRENCY,
     LISTING_PAGE_RETRY_ATTEMPTS,
     LISTING_PAGE_RETRY_DELAY_S,
     MAX_PAGINATION_PAGES,
@@ -24,6 +27,21 @@ from oddsharvester.utils.constants import (
     PAGE_COLLECTION_DELAY_MIN_MS,
     RESULTS_PAGE_SIZE,
 )
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
+
+
+@dataclass
+class _ListingFrontier:
+    """How far a listing walk knows pages exist, shared by the pages fetched in parallel."""
+
+    frontier: int
+    observed_max: int | None = None
+
+    def observe(self, widget_pages: list[int]) -> None:
+        """Raise the frontier to the highest page a pagination widget shows; it never shrinks."""
+        if widget_pages:
+            self.observed_max = max(self.observed_max or 0, max(widget_pages))
+            self.frontier = max(self.frontier, self.observed_max)
 
 
 @dataclass
@@ -51,6 +69,7 @@ class OddsPortalScraper(BaseScraper):
         browser_locale_timezone: str | None = None,
         browser_timezone_id: str | None = None,
         proxy_manager=None,
+        block_profile: ResourceBlockProfile = ResourceBlockProfile.OFF,
     ):
         """Initializes Playwright using PlaywrightManager."""
         await self.playwright_manager.initialize(
@@ -59,11 +78,13 @@ class OddsPortalScraper(BaseScraper):
             locale=browser_locale_timezone,
             timezone_id=browser_timezone_id,
             proxy_manager=proxy_manager,
+            block_profile=block_profile,
         )
 
     async def stop_playwright(self):
         """Stops Playwright and cleans up resources."""
         await self.playwright_manager.cleanup()
+        self.parsing_executor.shutdown()
 
     async def scrape_historic(
         self,
@@ -107,28 +128,26 @@ class OddsPortalScraper(BaseScraper):
         self.logger.info(f"Base URL: {base_url}")
         self.logger.info(f"Max pages parameter: {max_pages}")
 
-        # Navigate to the base URL
-        self.logger.info("Navigating to base URL...")
-        await current_page.goto(base_url)
-        await self._prepare_page_for_scraping(page=current_page)
+        async with self.main_page_lock:
+            # Navigate to the base URL
+            self.logger.info("Navigating to base URL...")
+            await current_page.goto(base_url)
+            await self._prepare_page_for_scraping(page=current_page)
 
-        # Analyze pagination and determine pages to scrape
-        self.logger.info("Step 1: Analyzing pagination information...")
-        pages_to_scrape = await self._get_pagination_info(page=current_page, max_pages=max_pages)
-
-        # Collect match links from all pages
-        self.logger.info("Step 2: Collecting match links from all pages...")
-        link_result = await self._collect_match_links(
-            base_url=base_url,
-            pages_to_scrape=pages_to_scrape,
-            page_limit=self._effective_page_limit(max_pages),
-            max_pages=max_pages,
-        )
+            # Analyze pagination and determine pages to scrape
+            self.logger.info("Step 1: Analyzing pagination information...")
+            pages_to_scrape = await self._get_pagination_info(page=current_page, max_pages=max_pages)
 
-        if link_result.failed_pages:
-            self.logger.warning(f"Failed to collect links from pages: {link_result.failed_pages}")
+        collect_kwargs = {
+            "base_url": base_url,
+            "pages_to_scrape": pages_to_scrape,
+            "page_limit": self._effective_page_limit(max_pages),
+            "max_pages": max_pages,
+        }
 
         if links_only:
+            self.logger.info("Step 2: Collecting match links from all pages...")
+            link_result = await self._collect_match_links(**collect_kwargs)
             self.logger.info(f"Links-only mode: returning {len(link_result.links)} match links without odds.")
             return self._links_only_result(
                 rows=[{"match_link": link} for link in link_result.links],
@@ -136,13 +155,12 @@ class OddsPortalScraper(BaseScraper):
                 failed_page_urls=[f"{base_url}#/page/{p}" for p in link_result.failed_pages],
             )
 
-        # Extract odds from all collected links
-        self.logger.info("Step 3: Extracting odds from collected match links...")
-        self.logger.info(f"Total unique matches to process: {len(link_result.links)}")
-
-        result = await self.extract_match_odds(
+        # The listing walk spends 6-8 s per page, so odds extraction starts on the first
+        # page's links instead of waiting for the whole walk.
+        self.logger.info("Step 2: Collecting match links and extracting odds as they are discovered...")
+        link_result, result = await self._collect_and_extract(
+            collect_kwargs=collect_kwargs,
             sport=sport,
-            match_links=link_result.links,
             markets=markets,
             scrape_odds_history=scrape_odds_history,
             target_bookmaker=target_bookmaker,
@@ -151,7 +169,9 @@ class OddsPortalScraper(BaseScraper):
             bookies_filter=bookies_filter,
             period=period,
             request_delay=request_delay,
+            season=season,
         )
+        self.logger.info(f"Total unique matches processed: {len(link_result.links)}")
 
         for row in result.success:
             row["season"] = season
@@ -167,6 +187,49 @@ class OddsPortalScraper(BaseScraper):
 
         return result
 
+    async def _collect_and_extract(
+        self, collect_kwargs: dict[str, Any], **extract_kwargs: Any
+    ) -> tuple[LinkCollectionResult, ScrapeResult]:
+        """
+        Walk the listing pages and extract odds concurrently.
+
+        `_collect_match_links` publishes each page's new links as soon as the page is kept, and
+        `extract_match_odds` consumes them as a stream, so the match workers start with the
+        first page. The walk itself is unchanged: same verdicts, same retries, same failed pages.
+
+        Args:
+            collect_kwargs (dict): Keyword arguments for `_collect_match_links`.
+            **extract_kwargs: Keyword arguments for `extract_match_odds`, except `match_links`.
+
+        Returns:
+            tuple[LinkCollectionResult, ScrapeResult]: The walk's result and the odds extraction result.
+        """
+        discovered: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def publish(links: list[str]) -> None:
+            for link in links:
+                discovered.put_nowait(link)
+
+        async def collect() -> LinkCollectionResult:
+            try:
+                return await self._collect_match_links(**collect_kwargs, on_links=publish)
+            finally:
+                # Ends the stream whether the walk finished or raised.
+                discovered.put_nowait(None)
+
+        async def stream() -> AsyncIterator[str]:
+            while (link := await discovered.get()) is not None:
+                yield link
+
+        collector = asyncio.create_task(collect())
+        try:
+            result = await self.extract_match_odds(match_links=stream(), **extract_kwargs)
+        except BaseException:
+            collector.cancel()
+            await asyncio.wait([collector])
+            raise
+        return await collector, result
+
     async def scrape_upcoming(
         self,
         sport: str,
@@ -211,36 +274,37 @@ class OddsPortalScraper(BaseScraper):
         url = URLBuilder.get_upcoming_matches_url(sport=sport, date=date, league=league, base_url=self.base_url)
         self.logger.info(f"Fetching upcoming odds from {url}")
 
-        await current_page.goto(url, timeout=GOTO_TIMEOUT_MS, wait_until="domcontentloaded")
-        await self._prepare_page_for_scraping(page=current_page)
+        async with self.main_page_lock:
+            await current_page.goto(url, timeout=GOTO_TIMEOUT_MS, wait_until="domcontentloaded")
+            await self._prepare_page_for_scraping(page=current_page)
 
-        # Scroll to load all matches due to lazy loading
-        self.logger.info("Scrolling page to load all upcoming matches...")
-        await self.scroller.scroll_until_loaded(
-            page=current_page,
-            timeout=30,
-            scroll_pause_time=2,
-            max_scroll_attempts=3,
-            content_check_selector="div[class*='eventRow']",
-        )
+            # Scroll to load all matches due to lazy loading
+            self.logger.info("Scrolling page to load all upcoming matches...")
+            await self.scroller.scroll_until_loaded(
+                page=current_page,
+                timeout=30,
+                scroll_pause_time=2,
+                max_scroll_attempts=3,
+                content_check_selector="div[class*='eventRow']",
+            )
 
-        # League page shows all upcoming dates; when a specific date is requested,
-        # post-filter links by the date-header rendered above each row group.
-        date_filter = None
-        if league and date:
-            try:
-                date_filter = datetime.strptime(date, "%Y%m%d").date()
-                self.logger.info(f"Applying date filter for league page: {date_filter.isoformat()}")
-            except ValueError:
-                self.logger.warning(f"Could not parse date '{date}' for filtering; returning all league matches.")
-
-        rows = await self.extract_match_rows(
-            page=current_page,
-            date_filter=date_filter,
-            skip_started=not include_started,
-            kickoff_within_hours=kickoff_within_hours,
-            collect_kickoff=links_only,
-        )
+            # League page shows all upcoming dates; when a specific date is requested,
+            # post-filter links by the date-header rendered above each row group.
+            date_filter = None
+            if league and date:
+                try:
+                    date_filter = datetime.strptime(date, "%Y%m%d").date()
+                    self.logger.info(f"Applying date filter for league page: {date_filter.isoformat()}")
+                except ValueError:
+                    self.logger.warning(f"Could not parse date '{date}' for filtering; returning all league matches.")
+
+            rows = await self.extract_match_rows(
+                page=current_page,
+                date_filter=date_filter,
+                skip_started=not include_started,
+                kickoff_within_hours=kickoff_within_hours,
+                collect_kickoff=links_only,
+            )
 
         if not rows:
             self.logger.warning("No match links found for upcoming matches.")
@@ -463,6 +527,18 @@ class OddsPortalScraper(BaseScraper):
             ),
         )
 
+    @staticmethod
+    async def _publish_links(
+        links: list[str], seen: set[str], on_links: Callable[[list[str]], Awaitable[None]] | None
+    ) -> None:
+        """Hand the links not published yet to `on_links`, keeping page order."""
+        if on_links is None:
+            return
+        new_links = [link for link in dict.fromkeys(links) if link not in seen]
+        seen.update(new_links)
+        if new_links:
+            await on_links(new_links)
+
     async def _get_pagination_info(self, page: Page, max_pages: int | None) -> list[int]:
         """
         Extracts pagination details from the page.
@@ -537,6 +613,7 @@ class OddsPortalScraper(BaseScraper):
         pages_to_scrape: list[int],
         page_limit: int = MAX_PAGINATION_PAGES,
         max_pages: int | None = None,
+        on_links: Callable[[list[str]], Awaitable[None]] | None = None,
     ) -> LinkCollectionResult:
         """
         Walks listing pages, collecting match links.
@@ -551,6 +628,9 @@ class OddsPortalScraper(BaseScraper):
             page_limit (int): Hard bound on how many pages the walk may visit.
             max_pages (Optional[int]): The user-supplied --max-pages, if any; distinguishes
                 an intentional limit from the default safety cap in the truncation warning.
+            on_links (Callable, optional): Awaited with the links a page adds that were not seen
+                before, as soon as the page is kept, so they can be scraped while the walk goes on.
+                A page the walk re-fetches publishes nothing until its final attempt.
 
         Returns:
             LinkCollectionResult: Contains links found and tracking of successful/failed pages.
@@ -560,52 +640,48 @@ class OddsPortalScraper(BaseScraper):
 
         result = LinkCollectionResult()
         all_links = []
-        frontier = planned_max
-        observed_max: int | None = None
+        seen: set[str] = set()
+        walk = _ListingFrontier(frontier=planned_max)
         page_number = 1
         attempt = 1
 
         while page_number <= page_limit:
-            self.logger.info(f"Processing page {page_number} (frontier: {frontier}, limit: {page_limit})")
-            tab = None
-            past_frontier = page_number >= frontier
-
-            try:
-                tab = await self.playwright_manager.context.new_page()
-
-                page_url = f"{base_url}#/page/{page_number}"
-                self.logger.info(f"Navigating to: {page_url}")
-                await tab.goto(page_url, timeout=GOTO_TIMEOUT_MS, wait_until="domcontentloaded")
-                delay = random.randint(PAGE_COLLECTION_DELAY_MIN_MS, PAGE_COLLECTION_DELAY_MAX_MS)  # noqa: S311
-                await tab.wait_for_timeout(delay)
-
-                self.logger.info(f"Scrolling page {page_number} to load all matches...")
-                scroll_success = await self.scroller.scroll_until_loaded(
-                    page=tab,
-                    timeout=30,
-                    scroll_pause_time=2,
-                    max_scroll_attempts=3,
-                    content_check_selector="div[class*='eventRow']",
+            if attempt == 1 and page_number < walk.frontier:
+                # Every page below the frontier exists and is judged on fullness alone, so
+                # they are fetched in parallel; only the pages past it are explored one by one.
+                known = await self._collect_known_pages(
+                    base_url=base_url,
+                    first_page=page_number,
+                    page_limit=page_limit,
+                    walk=walk,
+                    seen=seen,
+                    on_links=on_links,
                 )
-                if not scroll_success:
-                    self.logger.warning(f"Scrolling may not have completed for page {page_number}")
+                for number in sorted(known):
+                    kept, links = known[number]
+                    all_links.extend(links)
+                    if kept:
+                        result.successful_pages += 1
+                    else:
+                        result.failed_pages.append(number)
+                page_number = max(known) + 1
+                continue
 
-                links = await self.extract_match_links(page=tab)
+            self.logger.info(f"Processing page {page_number} (frontier: {walk.frontier}, limit: {page_limit})")
+            past_frontier = page_number >= walk.frontier
 
-                # Read on every page, not just empty ones: the tab is already loaded, so
-                # this costs no request, and a widget missing from page 1 is often present
-                # on page 2. That is how the true count is recovered (issue #79).
-                widget_pages = await self.pagination_walker.read_widget(page=tab)
-                if widget_pages:
-                    observed_max = max(observed_max or 0, max(widget_pages))
-                    frontier = max(frontier, observed_max)
-                past_frontier = page_number >= frontier
+            try:
+                links, widget_pages, scroll_success = await self._load_listing_page(
+                    context=self.playwright_manager.context, base_url=base_url, page_number=page_number
+                )
+                walk.observe(widget_pages)
+                past_frontier = page_number >= walk.frontier
 
                 verdict = self.pagination_walker.decide(
                     requested_page=page_number,
                     link_count=len(links),
-                    frontier=frontier,
-                    observed_max=observed_max,
+                    frontier=walk.frontier,
+                    observed_max=walk.observed_max,
                     scroll_ok=scroll_success,
                 )
 
@@ -629,6 +705,7 @@ class OddsPortalScraper(BaseScraper):
                     # already non-zero, so dropping real rows only costs a re-scrape of links
                     # the user is holding. They dedupe on match_link, which is unique.
                     all_links.extend(links)
+                    await self._publish_links(links, seen, on_links)
                     if past_frontier:
                         break
                     attempt = 1
@@ -636,6 +713,7 @@ class OddsPortalScraper(BaseScraper):
                     continue
 
                 all_links.extend(links)
+                await self._publish_links(links, seen, on_links)
                 # A zero-link STOP_COMPLETE past the planned floor is the widget-corroboration
                 # page confirming the season already ended; it rendered nothing, so it was not
                 # collected and must not inflate successful_pages (that count feeds the
@@ -656,10 +734,6 @@ class OddsPortalScraper(BaseScraper):
                 if past_frontier:
                     break
 
-            finally:
-                if tab:
-                    await tab.close()
-
             attempt = 1
             page_number += 1
 
@@ -694,3 +768,133 @@ class OddsPortalScraper(BaseScraper):
             self.logger.warning(f"Failed to collect links from pages: {result.failed_pages}")
 
         return result
+
+    async def _collect_known_pages(
+        self,
+        base_url: str,
+        first_page: int,
+        page_limit: int,
+        walk: "_ListingFrontier",
+        seen: set[str],
+        on_links: Callable[[list[str]], Awaitable[None]] | None,
+    ) -> dict[int, tuple[bool, list[str]]]:
+        """
+        Fetch the pages from `first_page` up to the frontier concurrently.
+
+        Tabs are spread over the contexts still in rotation, `LISTING_PAGE_CONCURRENCY` at a
+        time per context. A widget read that moves the frontier while pages are in flight
+        adds the newly known pages to the same batch. Each page keeps the sequential walk's
+        rules: a page short of a full listing is re-fetched `LISTING_PAGE_RETRY_ATTEMPTS`
+        times, an error fails the page without a re-fetch, and a failed page keeps the links
+        it did render.
+
+        Returns:
+            dict[int, tuple[bool, list[str]]]: For each page fetched, whether it was collected and its links.
+        """
+        contexts = self.playwright_manager.listing_contexts()
+        slots = asyncio.Semaphore(LISTING_PAGE_CONCURRENCY * len(contexts))
+        outcomes: dict[int, tuple[bool, list[str]]] = {}
+
+        async def fetch(page_number: int) -> None:
+            context = contexts[page_number % len(contexts)]
+            try:
+                for attempt in range(1, LISTING_PAGE_RETRY_ATTEMPTS + 2):
+                    self.logger.info(f"Processing page {page_number} (frontier: {walk.frontier}, limit: {page_limit})")
+                    try:
+                        links, widget_pages, scroll_success = await self._load_listing_page(
+                            context=context, base_url=base_url, page_number=page_number
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Error processing page {page_number}: {e}")
+                        outcomes[page_number] = (False, [])
+                        return
+
+                    walk.observe(widget_pages)
+                    verdict = self.pagination_walker.decide(
+                        requested_page=page_number,
+                        link_count=len(links),
+                        frontier=walk.frontier,
+                        observed_max=walk.observed_max,
+                        scroll_ok=scroll_success,
+                    )
+                    if verdict is not WalkVerdict.PAGE_FAILED:
+                        self.logger.info(f"Extracted {len(links)} links from page {page_number}")
+                        break
+                    if attempt <= LISTING_PAGE_RETRY_ATTEMPTS:
+                        self.logger.warning(
+                            f"Page {page_number} returned {len(links)} of {RESULTS_PAGE_SIZE} links; re-fetching it."
+                        )
+                        await asyncio.sleep(LISTING_PAGE_RETRY_DELAY_S)
+                        continue
+                    self.logger.warning(
+                        f"Page {page_number} returned {len(links)} of {RESULTS_PAGE_SIZE} links after "
+                        f"{attempt} attempts; treating it as failed."
+                    )
+
+                outcomes[page_number] = (verdict is not WalkVerdict.PAGE_FAILED, links)
+                await self._publish_links(links, seen, on_links)
+            finally:
+                slots.release()
+
+        tasks: list[asyncio.Task] = []
+        next_page = first_page
+        try:
+            while True:
+                while next_page < min(walk.frontier, page_limit + 1):
+                    await slots.acquire()
+                    tasks.append(asyncio.create_task(fetch(next_page)))
+                    next_page += 1
+                pending = [task for task in tasks if not task.done()]
+                if not pending:
+                    break
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+
+        for task in tasks:
+            # Re-raise anything that escaped a page's own error handling, e.g. from on_links.
+            task.result()
+        return outcomes
+
+    async def _load_listing_page(self, context, base_url: str, page_number: int) -> tuple[list[str], list[int], bool]:
+        """
+        Open one listing page in a new tab of `context` and read it.
+
+        Returns:
+            tuple[list[str], list[int], bool]: The page's match links, the page numbers its
+                pagination widget shows, and whether its scroll completed.
+        """
+        tab = None
+        try:
+            tab = await context.new_page()
+
+            page_url = f"{base_url}#/page/{page_number}"
+            self.logger.info(f"Navigating to: {page_url}")
+            await tab.goto(page_url, timeout=GOTO_TIMEOUT_MS, wait_until="domcontentloaded")
+            delay = random.randint(PAGE_COLLECTION_DELAY_MIN_MS, PAGE_COLLECTION_DELAY_MAX_MS)  # noqa: S311
+            await tab.wait_for_timeout(delay)
+
+            self.logger.info(f"Scrolling page {page_number} to load all matches...")
+            scroll_success = await self.scroller.scroll_until_loaded(
+                page=tab,
+                timeout=30,
+                scroll_pause_time=2,
+                max_scroll_attempts=3,
+                content_check_selector="div[class*='eventRow']",
+            )
+            if not scroll_success:
+                self.logger.warning(f"Scrolling may not have completed for page {page_number}")
+
+            links = await self.extract_match_links(page=tab)
+
+            # Read on every page, not just empty ones: the tab is already loaded, so
+            # this costs no request, and a widget missing from page 1 is often present
+            # on page 2. That is how the true count is recovered (issue #79).
+            widget_pages = await self.pagination_walker.read_widget(page=tab)
+            return links, widget_pages, scroll_success
+        finally:
+            if tab:
+                await tab.close()
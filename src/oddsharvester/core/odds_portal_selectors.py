@@ -23,6 +23,7 @@ class OddsPortalSelectors:
 
     # Every market tab (visible + 'More' overflow) carries the `odds-item` class.
     MARKET_TAB_ITEM_SELECTOR = "li.odds-item"
+    ACTIVE_MARKET_TAB_SELECTOR = f"{MARKET_TAB_ITEM_SELECTOR}[class*='active']"
 
     # `data-testid='more-button'` is language-independent (text is localized).
     MORE_BUTTON_SELECTORS: ClassVar[list[str]] = [
@@ -0,0 +1,157 @@
+"""
+Warm page pool for match scraping.
+
+Opening a tab per match pays the renderer spin-up and the `STEALTH_SCRIPT` init-script
+injection every time. A `PagePool` keeps finished tabs of one browser context, resets
+them to about:blank and hands them out again, closing each one after a bounded
+number of uses so a long run cannot grow a tab's memory without limit. Cookie
+consent and the odds format are context state, so a reused tab keeps them.
+"""
+
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any
+
+from oddsharvester.core.phase_timing import percentile
+from oddsharvester.utils.constants import PAGE_POOL_MAX_USES, PAGE_POOL_RESET_TIMEOUT_MS
+
+BLANK_URL = "about:blank"
+
+
+@dataclass
+class PagePoolStats:
+    """Counters of one page pool (or several, summed with `merge`)."""
+
+    hits: int = 0
+    misses: int = 0
+    recycled: int = 0
+    discarded: int = 0
+    creation_ms: list[float] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def merge(self, other: "PagePoolStats") -> "PagePoolStats":
+        self.hits += other.hits
+        self.misses += other.misses
+        self.recycled += other.recycled
+        self.discarded += other.discarded
+        self.creation_ms.extend(other.creation_ms)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "recycled": self.recycled,
+            "discarded": self.discarded,
+            "pages_created": len(self.creation_ms),
+            "creation_ms_p50": round(percentile(self.creation_ms, 50), 1),
+            "creation_ms_p95": round(percentile(self.creation_ms, 95), 1),
+        }
+
+
+class PagePool:
+    """
+    Reusable tabs of one browser context.
+
+    `acquire` returns an idle tab (a hit) or opens a new one (a miss). `release` counts a use,
+    then either closes the tab (recycled after `max_uses`, or discarded when it is closed or
+    fails the reset) or resets it to about:blank and makes it idle again.
+    """
+
+    def __init__(self, context, max_uses: int = PAGE_POOL_MAX_USES):
+        """
+        Args:
+            context: The Playwright `BrowserContext` tabs are opened in.
+            max_uses (int): Matches a tab serves before it is closed and replaced.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.context = context
+        self.max_uses = max(max_uses, 1)
+        self.stats = PagePoolStats()
+        self._idle: list = []
+        self._uses: dict[Any, int] = {}
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def _create(self):
+        started = time.perf_counter()
+        page = await self.context.new_page()
+        self.stats.creation_ms.append((time.perf_counter() - started) * 1000)
+        self._uses[page] = 0
+        return page
+
+    async def warm(self, count: int) -> None:
+        """Open tabs until `count` are idle, so the first matches do not pay for creation."""
+        while len(self._idle) < count:
+            self._idle.append(await self._create())
+
+    async def acquire(self):
+        """Return an idle tab, or a new one when none is left."""
+        while self._idle:
+            page = self._idle.pop()
+            if page.is_closed():
+                self._forget(page)
+                self.stats.discarded += 1
+                continue
+            self.stats.hits += 1
+            return page
+
+        self.stats.misses += 1
+        return await self._create()
+
+    async def release(self, page, reusable: bool = True) -> None:
+        """
+        Hand a tab back after a match.
+
+        Args:
+            page: A tab obtained from `acquire`.
+            reusable (bool): False to close the tab instead of pooling it (e.g. its context is out of rotation).
+        """
+        uses = self._uses.get(page, 0) + 1
+        self._uses[page] = uses
+        if page.is_closed():
+            self._forget(page)
+            self.stats.discarded += 1
+            return
+        if not reusable or uses >= self.max_uses:
+            self.stats.recycled += 1
+            await self._close(page)
+            return
+
+        try:
+            # Unloading the match page frees its DOM and JS heap; the URL check catches a
+            # tab stuck on a beforeunload prompt or a navigation that did not take.
+            await page.goto(BLANK_URL, timeout=PAGE_POOL_RESET_TIMEOUT_MS)
+            clean = page.url == BLANK_URL
+        except Exception as e:
+            self.logger.debug(f"Page reset failed, discarding it: {e}")
+            clean = False
+
+        if clean:
+            self._idle.append(page)
+        else:
+            self.stats.discarded += 1
+            await self._close(page)
+
+    async def close(self) -> None:
+        """Close every idle tab."""
+        while self._idle:
+            await self._close(self._idle.pop())
+
+    async def _close(self, page) -> None:
+        self._forget(page)
+        try:
+            await page.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing pooled page: {e}")
+
+    def _forget(self, page) -> None:
+        self._uses.pop(page, None)
@@ -0,0 +1,31 @@
+"""
+Tree backend of the hot HTML parsers.
+
+`OddsParser.parse_bookmaker_rows`, the passive submarket parser and the match event header
+parser run once per market or match page. By default they walk a BeautifulSoup tree built
+with `html.parser` (pure Python). With the `lxml` backend they walk an lxml tree instead
+(libxml2, in C) through `core.lxml_tree`, which reproduces the BeautifulSoup lookups they
+use. Both backends return the same data; each parser keeps its two variants side by side.
+
+Settings:
+- `OH_PARSER_BACKEND`: `bs4` (default) or `lxml`.
+"""
+
+import logging
+import os
+
+PARSER_BACKEND_ENV_VAR = "OH_PARSER_BACKEND"
+BS4_BACKEND = "bs4"
+LXML_BACKEND = "lxml"
+PARSER_BACKENDS = (BS4_BACKEND, LXML_BACKEND)
+
+_logger = logging.getLogger(__name__)
+
+
+def parser_backend_from_env() -> str:
+    """The backend named by `OH_PARSER_BACKEND` (`bs4` when unset or unknown)."""
+    backend = os.environ.get(PARSER_BACKEND_ENV_VAR, "").strip().lower() or BS4_BACKEND
+    if backend not in PARSER_BACKENDS:
+        _logger.warning(f"Unknown {PARSER_BACKEND_ENV_VAR}={backend!r}; using {BS4_BACKEND}.")
+        return BS4_BACKEND
+    return backend
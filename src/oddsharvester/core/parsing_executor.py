@@ -0,0 +1,103 @@
+"""
+Process pool for the HTML parsing done between page visits.
+
+Building a BeautifulSoup tree of a match or listing page takes tens of milliseconds of pure
+CPU. On the asyncio loop that time is stolen from every other tab the scraper drives, so
+their Playwright traffic stalls while one page is parsed. `ParsingExecutor` hands the raw
+HTML to a worker process instead, and awaits the plain data (dicts, lists, strings) the
+parse function returns.
+
+Small documents (odds history modals, test fixtures) are cheaper to parse than to ship to a
+worker, so anything under `inline_max_bytes` is parsed on the loop as before.
+
+Settings:
+- `OH_PARSE_WORKERS`: worker processes (default: one per core, split between the processes of a
+  sharded run; 0 parses everything inline).
+- `OH_INLINE_PARSE_MAX_BYTES`: documents up to this size are parsed inline (default 256 KB).
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+import logging
+import multiprocessing
+import os
+import pickle
+from typing import Any
+
+PARSE_WORKERS_ENV_VAR = "OH_PARSE_WORKERS"
+INLINE_PARSE_MAX_BYTES_ENV_VAR = "OH_INLINE_PARSE_MAX_BYTES"
+DEFAULT_INLINE_PARSE_MAX_BYTES = 256 * 1024
+
+
+class ParsingExecutor:
+    """Runs parse functions on raw HTML in a process pool, or inline for small documents."""
+
+    _shared: "ParsingExecutor | None" = None
+
+    def __init__(self, max_workers: int | None = None, inline_max_bytes: int = DEFAULT_INLINE_PARSE_MAX_BYTES):
+        """
+        Args:
+            max_workers (int | None): Worker processes; None sizes the pool to the CPU count, 0 disables it.
+            inline_max_bytes (int): Documents up to this many characters are parsed on the event loop.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max(max_workers, 0)
+        self.inline_max_bytes = inline_max_bytes
+        self._pool: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def from_env(cls) -> "ParsingExecutor":
+        """Executor configured from `OH_PARSE_WORKERS` and `OH_INLINE_PARSE_MAX_BYTES`."""
+        workers = os.environ.get(PARSE_WORKERS_ENV_VAR, "").strip()
+        inline_max = os.environ.get(INLINE_PARSE_MAX_BYTES_ENV_VAR, "").strip()
+        return cls(
+            max_workers=int(workers) if workers else None,
+            inline_max_bytes=int(inline_max) if inline_max else DEFAULT_INLINE_PARSE_MAX_BYTES,
+        )
+
+    @classmethod
+    def shared(cls) -> "ParsingExecutor":
+        """The process-wide executor (created from the environment on first use)."""
+        if cls._shared is None:
+            cls._shared = cls.from_env()
+        return cls._shared
+
+    async def run(self, parse: Callable[..., Any], html: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call `parse(html, *args, **kwargs)` in a worker process and return its result.
+
+        `parse` must be picklable (a module-level function, or a method of a picklable
+        object) and return plain data. It is called inline when the pool is disabled, the
+        document is small, or the pool cannot take the job.
+        """
+        call = partial(parse, html, *args, **kwargs)
+        if self.max_workers == 0 or not isinstance(html, str) or len(html) <= self.inline_max_bytes:
+            return call()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), call)
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Parsing pool broke ({e}); parsing inline from now on.")
+            self.shutdown()
+            self.max_workers = 0
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            # Raised while shipping `call` to a worker; a parse function's own errors are handled inside it.
+            self.logger.debug(f"Could not hand {getattr(parse, '__qualname__', parse)!r} to the pool: {e}")
+        return call()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a later `run` starts a new pool)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # "spawn": forking a process that runs Playwright's driver threads is unsafe.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self.logger.info(f"Started parsing pool with {self.max_workers} worker processes.")
+        return self._pool
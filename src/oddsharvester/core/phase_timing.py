@@ -0,0 +1,177 @@
+"""
+Per-phase latency of match scrapes.
+
+Each match scrape gets a `MatchTimings`, bound to its task with `bind_timings`. Code on the
+scrape path wraps its steps in `timed_phase` / `timed_market`, which add the elapsed time
+to whatever timings are bound, and do nothing when none are (e.g. a direct call in a
+test). Phases can nest: "markets" covers every market, "odds_history" included.
+
+`LatencyStats` folds each match's breakdown into per-phase and per-market histograms and
+reports p50/p95/p99 for them, along with the breakdowns of the slowest matches.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+import heapq
+import math
+import random
+from time import perf_counter
+from typing import Any
+
+from oddsharvester.utils.constants import LATENCY_RESERVOIR_SIZE, LATENCY_SLOWEST_MATCHES
+
+_timings: ContextVar["MatchTimings | None"] = ContextVar("match_timings", default=None)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class MatchTimings:
+    """Milliseconds spent per phase and per market on one match, retries included."""
+
+    phases: dict[str, float] = field(default_factory=dict)
+    markets: dict[str, float] = field(default_factory=dict)
+
+
+def bind_timings(timings: MatchTimings | None) -> Token:
+    """Record the phases timed by the current task (and the tasks it starts) into `timings`."""
+    return _timings.set(timings)
+
+
+def unbind_timings(token: Token) -> None:
+    _timings.reset(token)
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """Add the time spent in the block to phase `name` of the bound timings."""
+    with _timed("phases", name):
+        yield
+
+
+@contextmanager
+def timed_market(name: str) -> Iterator[None]:
+    """Add the time spent in the block to market `name` of the bound timings."""
+    with _timed("markets", name):
+        yield
+
+
+@contextmanager
+def _timed(bucket: str, name: str) -> Iterator[None]:
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        totals = getattr(timings, bucket)
+        totals[name] = totals.get(name, 0.0) + (perf_counter() - started) * 1000
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Streaming latency of one phase or market.
+
+    Count and max are exact; percentiles come from a uniform sample of at most
+    `LATENCY_RESERVOIR_SIZE` timings (reservoir sampling), so memory stays bounded.
+    """
+
+    count: int = 0
+    max_ms: float = 0.0
+    samples: list[float] = field(default_factory=list)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.max_ms = max(self.max_ms, ms)
+        if len(self.samples) < LATENCY_RESERVOIR_SIZE:
+            self.samples.append(ms)
+            return
+        slot = random.randrange(self.count)  # noqa: S311
+        if slot < LATENCY_RESERVOIR_SIZE:
+            self.samples[slot] = ms
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        total = self.count + other.count
+        if len(self.samples) + len(other.samples) <= LATENCY_RESERVOIR_SIZE:
+            self.samples = self.samples + other.samples
+        else:
+            # Each side keeps a share of the sample proportional to the timings it has seen.
+            kept = min(round(LATENCY_RESERVOIR_SIZE * self.count / total), len(self.samples))
+            taken = min(LATENCY_RESERVOIR_SIZE - kept, len(other.samples))
+            self.samples = random.sample(self.samples, kept) + random.sample(other.samples, taken)
+        self.count = total
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "p50_ms": round(percentile(self.samples, 50), 1),
+            "p95_ms": round(percentile(self.samples, 95), 1),
+            "p99_ms": round(percentile(self.samples, 99), 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+@dataclass
+class LatencyStats:
+    """
+    Per-phase and per-market latency histograms of a run (or several, combined with `merge`).
+
+    Only the `LATENCY_SLOWEST_MATCHES` slowest matches keep their per-match breakdown.
+    """
+
+    phases: dict[str, LatencyHistogram] = field(default_factory=dict)
+    markets: dict[str, LatencyHistogram] = field(default_factory=dict)
+    slowest: list[dict[str, Any]] = field(default_factory=list)
+
+    def record(self, url: str, timings: MatchTimings | None, duration_s: float) -> dict[str, Any]:
+        """
+        Add one match: its total time on the page and, when it was timed, its breakdown.
+
+        Returns:
+            dict: The match's breakdown (`url`, `total_ms`, `phases`, `markets`).
+        """
+        timings = timings or MatchTimings()
+        breakdown = {
+            "url": url,
+            "total_ms": round(duration_s * 1000, 1),
+            "phases": {name: round(ms, 1) for name, ms in timings.phases.items()},
+            "markets": {name: round(ms, 1) for name, ms in timings.markets.items()},
+        }
+        self.phases.setdefault("total", LatencyHistogram()).add(breakdown["total_ms"])
+        for name, ms in breakdown["phases"].items():
+            self.phases.setdefault(name, LatencyHistogram()).add(ms)
+        for name, ms in breakdown["markets"].items():
+            self.markets.setdefault(name, LatencyHistogram()).add(ms)
+        self._keep_slowest([breakdown])
+        return breakdown
+
+    def merge(self, other: "LatencyStats") -> "LatencyStats":
+        for mine, theirs in ((self.phases, other.phases), (self.markets, other.markets)):
+            for name, histogram in theirs.items():
+                mine.setdefault(name, LatencyHistogram()).merge(histogram)
+        self._keep_slowest(other.slowest)
+        return self
+
+    def _keep_slowest(self, matches: list[dict[str, Any]]) -> None:
+        self.slowest = heapq.nlargest(LATENCY_SLOWEST_MATCHES, self.slowest + matches, key=lambda m: m["total_ms"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phases": {name: histogram.to_dict() for name, histogram in self.phases.items()},
+            "markets": {name: histogram.to_dict() for name, histogram in self.markets.items()},
+            "slowest_matches": self.slowest,
+        }
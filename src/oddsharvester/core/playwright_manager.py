@@ -5,8 +5,13 @@ import random
 
 from playwright.async_api import async_playwright
 
+from oddsharvester.core.browser.readiness import PENDING_REQUESTS_SCRIPT
+from oddsharvester.core.browser.resource_blocking import ResourceBlocker, ResourceBlockStats
+from oddsharvester.core.browser.storage_state import StorageStateStore
 from oddsharvester.core.exceptions import AllProxiesExhaustedError
+from oddsharvester.core.page_pool import PagePool, PagePoolStats
 from oddsharvester.utils.constants import PLAYWRIGHT_BROWSER_ARGS, PLAYWRIGHT_BROWSER_ARGS_DOCKER
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 from oddsharvester.utils.utils import is_running_in_docker
 
 HAR_REPLAY_ENV_VAR = "ODDSHARVESTER_HAR_REPLAY"
@@ -44,6 +49,11 @@ class PlaywrightManager:
         self.contexts: dict = {}
         self._default_key: str | None = None
         self._proxy_manager = None
+        self.page_pools: dict[str, PagePool] = {}
+        self.resource_blocker = ResourceBlocker()
+        self.storage_state_store = StorageStateStore()
+        self._storage_state: dict | None = None
+        self._storage_state_saved: set[int] = set()
 
     async def initialize(
         self,
@@ -52,6 +62,7 @@ class PlaywrightManager:
         locale: str | None = None,
         timezone_id: str | None = None,
         proxy_manager=None,
+        block_profile: ResourceBlockProfile = ResourceBlockProfile.OFF,
     ):
         """
         Initialize and start Playwright with a browser and page.
@@ -60,11 +71,21 @@ class PlaywrightManager:
             is_webdriver_headless (bool): Whether to start the browser in headless mode.
             proxy_manager: Optional ProxyManager providing the launch proxy and, in multi-proxy
                 mode, one context per proxy.
+            block_profile (ResourceBlockProfile): Which requests every context aborts (see `ResourceBlocker`).
         """
         try:
             self.logger.info("Starting Playwright...")
             self.timezone_id = timezone_id
             self._proxy_manager = proxy_manager
+            self.resource_blocker = ResourceBlocker(block_profile)
+            # HAR record/replay runs start fresh so fixtures do not depend on the host's saved state.
+            if os.environ.get(HAR_RECORD_ENV_VAR) or os.environ.get(HAR_REPLAY_ENV_VAR):
+                self.storage_state_store = StorageStateStore()
+            else:
+                self.storage_state_store = StorageStateStore.from_env()
+            self._storage_state = self.storage_state_store.load()
+            if self._storage_state is not None:
+                self.logger.info(f"Restoring browser storage state from {self.storage_state_store.path}")
             self.playwright = await async_playwright().start()
 
             browser_args = PLAYWRIGHT_BROWSER_ARGS_DOCKER if is_running_in_docker() else PLAYWRIGHT_BROWSER_ARGS
@@ -130,16 +151,18 @@ class PlaywrightManager:
         }
         if proxy is not None:
             context_kwargs["proxy"] = proxy
-        if enable_har:
-            har_record_path = os.environ.get(HAR_RECORD_ENV_VAR)
-            if har_record_path:
-                self.logger.info(f"HAR recording mode active: {har_record_path}")
-                context_kwargs["record_har_path"] = Path(har_record_path)
-                context_kwargs["record_har_mode"] = "full"
-                context_kwargs["record_har_url_filter"] = HAR_REPLAY_URL_PATTERN
+        if self._storage_state is not None:
+            context_kwargs["storage_state"] = self._storage_state
+        har_record_path = os.environ.get(HAR_RECORD_ENV_VAR) if enable_har else None
+        if har_record_path:
+            self.logger.info(f"HAR recording mode active: {har_record_path}")
+            context_kwargs["record_har_path"] = Path(har_record_path)
+            context_kwargs["record_har_mode"] = "full"
+            context_kwargs["record_har_url_filter"] = HAR_REPLAY_URL_PATTERN
 
         context = await self.browser.new_context(**context_kwargs)
         await context.add_init_script(STEALTH_SCRIPT)
+        await context.add_init_script(PENDING_REQUESTS_SCRIPT)
 
         if enable_har:
             har_replay_path = os.environ.get(HAR_REPLAY_ENV_VAR)
@@ -150,6 +173,12 @@ class PlaywrightManager:
                     url=HAR_REPLAY_URL_PATTERN,
                     not_found="abort",
                 )
+        # Registered last so it sees each request first; what it lets through falls back to
+        # the HAR routes. A recording keeps every request, so a fixture serves any profile.
+        if har_record_path:
+            self.logger.info("HAR recording: resource blocking disabled for the recorded context.")
+        else:
+            await self.resource_blocker.attach(context)
         return context
 
     def non_default_context_keys(self) -> list[str]:
@@ -160,19 +189,76 @@ class PlaywrightManager:
         """Open a new page in the context bound to a specific proxy key."""
         return await self.contexts[key].new_page()
 
+    def listing_contexts(self) -> list:
+        """Browser contexts listing pages can be spread over: every proxy context still in rotation."""
+        if self._proxy_manager is None:
+            return [self.context]
+        return [context for key, context in self.contexts.items() if self._is_in_rotation(key)] or [self.context]
+
+    def configure_lanes(self, per_proxy_concurrency: int, request_delay: float) -> None:
+        """Set per-proxy concurrency and pacing for `new_rotated_page` (no-op without a proxy manager)."""
+        if self._proxy_manager is not None:
+            self._proxy_manager.configure_lanes(per_proxy_concurrency, request_delay)
+
+    def lane_count(self) -> int:
+        """Number of proxy lanes pages can currently be routed to (1 without a proxy manager)."""
+        if self._proxy_manager is None:
+            return 1
+        return max(self._proxy_manager.healthy_lane_count(), 1)
+
+    def _page_pool(self, key: str) -> PagePool:
+        if key not in self.page_pools:
+            self.page_pools[key] = PagePool(self.contexts.get(key, self.context))
+        return self.page_pools[key]
+
+    def _is_in_rotation(self, key: str) -> bool:
+        if self._proxy_manager is None:
+            return True
+        return any(e.key == key and not e.blacklisted for e in self._proxy_manager.entries)
+
+    async def warm_page_pools(self, pages_per_context: int) -> None:
+        """Open `pages_per_context` tabs up front in every context still in rotation."""
+        keys = [self._default_key] if self._proxy_manager is None else list(self.contexts)
+        for key in keys:
+            if self._is_in_rotation(key):
+                await self._page_pool(key).warm(pages_per_context)
+
     async def new_rotated_page(self):
-        """Open a page on the next round-robin proxy. Returns (page, proxy_key).
+        """Take a pooled page on the next proxy lane with capacity. Returns (page, proxy_key).
+
+        Waits while every lane is full or out of tokens. The caller must hand the page
+        back through `return_page` and the key through `release_page` once done.
 
         Raises AllProxiesExhaustedError if every proxy is blacklisted.
         """
         if self._proxy_manager is None:
-            return await self.context.new_page(), self._default_key
-        entry = self._proxy_manager.next_proxy()
+            return await self._page_pool(self._default_key).acquire(), self._default_key
+        entry = await self._proxy_manager.acquire_lane()
         if entry is None:
             raise AllProxiesExhaustedError("All proxies are blacklisted; cannot open a new page.")
-        page = await self.contexts[entry.key].new_page()
+        try:
+            page = await self._page_pool(entry.key).acquire()
+        except Exception:
+            self._proxy_manager.release_lane(entry.key)
+            raise
         return page, entry.key
 
+    async def return_page(self, page, key: str) -> None:
+        """Give a page from `new_rotated_page` back to its pool (closed if its proxy left rotation)."""
+        await self._page_pool(key).release(page, reusable=self._is_in_rotation(key))
+
+    def release_page(self, key: str) -> None:
+        """Free the lane slot taken by `new_rotated_page` (no-op without a proxy manager)."""
+        if self._proxy_manager is not None:
+            self._proxy_manager.release_lane(key)
+
+    def page_pool_stats(self) -> PagePoolStats:
+        """Page pool counters summed over every context."""
+        total = PagePoolStats()
+        for pool in self.page_pools.values():
+            total.merge(pool.stats)
+        return total
+
     def report_page_result(self, key: str, is_proxy_failure: bool) -> None:
         """Forward a per-page outcome to the proxy pool (no-op without a proxy manager)."""
         if self._proxy_manager is not None:
@@ -183,11 +269,52 @@ class PlaywrightManager:
         if self._proxy_manager is not None:
             self._proxy_manager.blacklist_proxy(key)
 
+    async def save_storage_state(self, context=None, force: bool = False) -> None:
+        """
+        Persist the storage state of a configured context (default: the default context).
+
+        Contexts created afterwards, in this run or the next, start from the saved state (see
+        `StorageStateStore`). Each context is saved once unless `force` is set; failures are
+        logged, never raised.
+        """
+        context = context or self.context
+        if context is None or self.storage_state_store.path is None:
+            return
+        if id(context) in self._storage_state_saved and not force:
+            return
+        self._storage_state_saved.add(id(context))
+        try:
+            state = await context.storage_state()
+        except Exception as e:
+            self.logger.warning(f"Could not read browser storage state: {e}")
+            return
+        if self.storage_state_store.save(state):
+            self._storage_state = self.storage_state_store.load()
+            self.logger.debug(f"Saved browser storage state to {self.storage_state_store.path}")
+
+    def resource_block_stats(self) -> ResourceBlockStats:
+        """Requests let through and blocked across every context so far."""
+        return self.resource_blocker.stats
+
     async def cleanup(self):
         """Properly closes Playwright instances."""
         self.logger.info("Cleaning up Playwright resources...")
+        if self.resource_blocker.profile is not ResourceBlockProfile.OFF:
+            stats = self.resource_blocker.stats
+            self.logger.info(
+                f"Resource blocking ({self.resource_blocker.profile.value}): {stats.blocked} of "
+                f"{stats.blocked + stats.allowed} requests blocked, "
+                f"~{stats.estimated_bytes_saved / 1_000_000:.1f} MB saved ({dict(stats.blocked_by_type)})"
+            )
+        # Once configured (odds format, bookies filter), the default context has seen every preference
+        # the run set since. A context that never got that far (challenge page, early error) would
+        # overwrite a good saved state with an unconfigured one, so it is not saved.
+        if self.context is not None and id(self.context) in self._storage_state_saved:
+            await self.save_storage_state(force=True)
         if self.page:
             await self.page.close()
+        for pool in self.page_pools.values():
+            await pool.close()
         for context in self.contexts.values():
             await context.close()
         if self.browser:
@@ -0,0 +1,205 @@
+"""
+Queue-driven match scraping.
+
+`--enqueue` turns a historic/upcoming run into jobs in a `JobQueue`; any number of
+`oddsharvester worker` processes then claim, scrape and ack them. Each worker scrapes
+its batches in one `ScraperSession`, so it has its own browser and proxy lanes, launched
+once and relaunched only after a batch crashes, and renews its leases while a batch runs:
+only a worker that dies or stalls lets them expire.
+"""
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import logging
+import os
+import socket
+from typing import Any
+
+from oddsharvester.core.scrape_result import ErrorType, FailedUrl, ScrapeResult
+from oddsharvester.core.scraper_app import ScraperSession
+from oddsharvester.storage.job_queue import Job, JobQueue
+from oddsharvester.utils.constants import (
+    JOB_QUEUE_BATCH_SIZE,
+    JOB_QUEUE_POLL_INTERVAL_S,
+    JOB_QUEUE_VISIBILITY_TIMEOUT_S,
+)
+
+# Per-node settings: taken from the worker's own options, never stored in the queue
+# (proxy credentials do not belong in a shared file).
+NODE_SETTINGS = (
+    "proxy_url",
+    "proxy_user",
+    "proxy_pass",
+    "headless",
+    "block_resources",
+    "concurrency_tasks",
+    "adaptive_concurrency",
+    "combo_concurrency",
+    "request_delay",
+)
+
+
+def queue_config(run_kwargs: dict[str, Any]) -> dict[str, Any]:
+    """The part of a CLI run's `run_scraper` kwargs that describes what to scrape, for the queue."""
+    dropped = {"match_links", "links_only", "record_sink", *NODE_SETTINGS}
+    return {k: v for k, v in run_kwargs.items() if k not in dropped}
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class QueueWorker:
+    """Claims jobs from a `JobQueue`, scrapes them and acks or fails each one."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        node_settings: dict[str, Any] | None = None,
+        record_sink: Callable[[dict[str, Any]], None] | None = None,
+        worker_id: str | None = None,
+        batch_size: int = JOB_QUEUE_BATCH_SIZE,
+        visibility_timeout_s: float = JOB_QUEUE_VISIBILITY_TIMEOUT_S,
+        poll_interval_s: float = JOB_QUEUE_POLL_INTERVAL_S,
+    ):
+        """
+        Args:
+            queue (JobQueue): The queue to work on.
+            node_settings (dict, optional): `run_scraper` kwargs of this node (see `NODE_SETTINGS`).
+            record_sink (Callable, optional): Receives each scraped record; otherwise records are
+                kept in the returned `ScrapeResult.success`.
+            worker_id (str, optional): Lease owner name. Defaults to `<hostname>-<pid>`.
+            batch_size (int): Jobs claimed at a time.
+            visibility_timeout_s (float): Lease duration; leases are renewed at a third of it.
+            poll_interval_s (float): Wait between claims when nothing is claimable.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.queue = queue
+        self.node_settings = node_settings or {}
+        self.record_sink = record_sink
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.visibility_timeout_s = visibility_timeout_s
+        self.poll_interval_s = poll_interval_s
+        self._session: ScraperSession | None = None
+
+    async def run(self, wait: bool = False, max_jobs: int | None = None) -> ScrapeResult:
+        """
+        Work until the queue is drained.
+
+        Without `wait`, the worker stops once no job is pending or leased; it keeps polling while
+        other workers hold leases, since those leases may expire and need reclaiming. With `wait`
+        it never stops on its own and picks up jobs enqueued later.
+
+        Args:
+            wait (bool): Keep polling for new jobs instead of stopping when the queue is drained.
+            max_jobs (int, optional): Stop after claiming this many jobs.
+
+        Returns:
+            ScrapeResult: Records scraped by this worker (unless sent to the sink) and the jobs it gave up on.
+        """
+        result = ScrapeResult()
+        claimed = 0
+        self.logger.info(f"Worker {self.worker_id} started on {self.queue.path}")
+
+        try:
+            while max_jobs is None or claimed < max_jobs:
+                limit = self.batch_size if max_jobs is None else min(self.batch_size, max_jobs - claimed)
+                jobs = self.queue.claim(self.worker_id, limit, self.visibility_timeout_s)
+                if not jobs:
+                    if not wait and not self.queue.has_unfinished():
+                        break
+                    await asyncio.sleep(self.poll_interval_s)
+                    continue
+
+                claimed += len(jobs)
+                for group in self._group(jobs):
+                    result.merge(await self._process(group))
+        finally:
+            await self._close_session()
+
+        counts = self.queue.counts()
+        self.logger.info(
+            f"Worker {self.worker_id} finished: {result.stats.successful} scraped, {result.stats.failed} given up. "
+            f"Queue: {counts}"
+        )
+        return result
+
+    @staticmethod
+    def _group(jobs: list[Job]) -> list[list[Job]]:
+        """Jobs scraped in one batch share a configuration and a season."""
+        groups: dict[tuple[str, str | None], list[Job]] = {}
+        for job in jobs:
+            groups.setdefault((job.config_key, job.season), []).append(job)
+        return list(groups.values())
+
+    async def _process(self, jobs: list[Job]) -> ScrapeResult:
+        job_ids = [job.id for job in jobs]
+        heartbeat = asyncio.ensure_future(self._renew_leases(job_ids))
+        error = "scraper returned no result"
+        try:
+            scraped = await self._scrape({**jobs[0].config, **self.node_settings}, [job.link for job in jobs])
+        except Exception as e:
+            self.logger.error(f"Batch of {len(jobs)} job(s) crashed: {e}", exc_info=True)
+            scraped, error = None, str(e)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+        if scraped is None:
+            # The browser may be what failed: the next batch starts a new one.
+            await self._close_session()
+            scraped = ScrapeResult(failed=[self._failure(job, error) for job in jobs])
+        failures = {f.url: f for f in scraped.failed}
+
+        outcome = ScrapeResult()
+        for row in scraped.success:
+            if jobs[0].season is not None:
+                # A match page does not say which season listing it came from.
+                row["season"] = jobs[0].season
+            if self.record_sink is not None:
+                self.record_sink(row)
+            else:
+                outcome.success.append(row)
+        outcome.stats.successful = scraped.stats.successful
+
+        self.queue.ack(self.worker_id, [job.id for job in jobs if job.link not in failures])
+        for job in jobs:
+            failed = failures.get(job.link)
+            if failed is None:
+                continue
+            # Back to pending while attempts remain; only a job given up on is reported.
+            if self.queue.fail(self.worker_id, job, failed.error_message, failed.is_retryable) == "failed":
+                outcome.failed.append(failed)
+
+        outcome.stats.failed = len(outcome.failed)
+        outcome.stats.total_urls = outcome.stats.successful + outcome.stats.failed
+        return outcome
+
+    async def _scrape(self, run_kwargs: dict[str, Any], match_links: list[str]) -> ScrapeResult | None:
+        """Scrape a batch in the open session, opening one if there is none or its browser settings differ."""
+        if self._session is not None and not self._session.accepts(run_kwargs):
+            await self._close_session()
+        if self._session is None:
+            self._session = ScraperSession(run_kwargs)
+        return await self._session.scrape_matches(match_links=match_links, **run_kwargs)
+
+    async def _close_session(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            try:
+                await session.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close the scraper session: {e}")
+
+    async def _renew_leases(self, job_ids: list[int]) -> None:
+        while True:
+            await asyncio.sleep(self.visibility_timeout_s / 3)
+            self.queue.renew(self.worker_id, job_ids, self.visibility_timeout_s)
+
+    @staticmethod
+    def _failure(job: Job, message: str) -> FailedUrl:
+        """A job that produced no outcome at all (the batch crashed): worth another attempt."""
+        return FailedUrl(url=job.link, error_type=ErrorType.UNKNOWN, error_message=message, attempts=job.attempts)
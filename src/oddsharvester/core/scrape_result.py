@@ -11,6 +11,8 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+from oddsharvester.core.phase_timing import LatencyStats, MatchTimings
+
 
 class ErrorType(Enum):
     """Classification of scraping errors."""
@@ -51,6 +53,23 @@ class FailedUrl:
         }
 
 
+@dataclass
+class MatchOutcome:
+    """Outcome of scraping one match link, as streamed by `BaseScraper.iter_match_odds`.
+
+    Exactly one of `data` and `failed` is set. `index` is the link's position in the
+    input list, so a consumer that needs input order back can restore it. `duration_s`
+    is the time spent on the page, retries included, and `timings` splits it by phase.
+    """
+
+    index: int
+    link: str
+    data: dict[str, Any] | None = None
+    failed: FailedUrl | None = None
+    duration_s: float = 0.0
+    timings: MatchTimings | None = None
+
+
 @dataclass
 class PartialResult:
     """Represents a match with partial data (e.g., missing markets)."""
@@ -103,7 +122,7 @@ class ScrapeResult:
     Complete result of a scraping operation.
 
     Contains successful results, failed URLs with error details,
-    partial results, and overall statistics.
+    partial results, overall statistics and per-phase latency.
     """
 
     success: list[dict[str, Any]] = field(default_factory=list)
@@ -111,6 +130,7 @@ class ScrapeResult:
     partial: list[PartialResult] = field(default_factory=list)
     stats: ScrapeStats = field(default_factory=ScrapeStats)
     combo_stats: list[dict[str, Any]] = field(default_factory=list)
+    latency: LatencyStats = field(default_factory=LatencyStats)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -120,6 +140,7 @@ class ScrapeResult:
             "partial": [p.to_dict() for p in self.partial],
             "stats": self.stats.to_dict(),
             "combo_stats": self.combo_stats,
+            "latency": self.latency.to_dict(),
         }
 
     def merge(self, other: "ScrapeResult") -> "ScrapeResult":
@@ -139,6 +160,7 @@ class ScrapeResult:
         self.stats.successful += other.stats.successful
         self.stats.failed += other.stats.failed
         self.stats.partial += other.stats.partial
+        self.latency.merge(other.latency)
         return self
 
     def get_retryable_urls(self) -> list[str]:
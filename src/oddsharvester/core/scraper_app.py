@@ -1,25 +1,32 @@
+from collections.abc import Callable
 import logging
+from typing import Any
 from urllib.parse import urlsplit
 
 from oddsharvester.core.browser.cookies import CookieDismisser
+from oddsharvester.core.browser.market_label_cache import MarketLabelCache
 from oddsharvester.core.browser.market_navigation import MarketTabNavigator
 from oddsharvester.core.browser.scrolling import PageScroller
 from oddsharvester.core.browser.selection import SelectionManager
+from oddsharvester.core.match_budget import bind_share
 from oddsharvester.core.odds_portal_market_extractor import OddsPortalMarketExtractor
 from oddsharvester.core.odds_portal_scraper import OddsPortalScraper
 from oddsharvester.core.playwright_manager import PlaywrightManager
 from oddsharvester.core.retry import RetryConfig, is_retryable_error, retry_with_backoff
 from oddsharvester.core.scrape_result import ScrapeResult
 from oddsharvester.core.sport_market_registry import SportMarketRegistrar
+from oddsharvester.core.worker_pool import WorkerPool
 from oddsharvester.utils.bookies_filter_enum import BookiesFilter
 from oddsharvester.utils.command_enum import CommandEnum
 from oddsharvester.utils.constants import (
+    COMBO_CONCURRENCY,
     DEFAULT_REQUEST_DELAY_S,
     OPERATION_RETRY_BASE_DELAY,
     OPERATION_RETRY_MAX_ATTEMPTS,
     OPERATION_RETRY_MAX_DELAY,
 )
 from oddsharvester.utils.proxy_manager import ProxyManager
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 from oddsharvester.utils.utils import validate_and_convert_period
 
 logger = logging.getLogger("ScraperApp")
@@ -44,6 +51,7 @@ async def run_scraper(
     target_bookmaker: str | None = None,
     scrape_odds_history: bool = False,
     headless: bool = True,
+    block_resources: str = ResourceBlockProfile.OFF.value,
     preview_submarkets_only: bool = False,
     bookies_filter: str = BookiesFilter.ALL.value,
     period: str | None = None,
@@ -53,10 +61,16 @@ async def run_scraper(
     kickoff_within_hours: float | None = None,
     links_only: bool = False,
     local_kickoff: bool = False,
+    record_sink: Callable[[dict[str, Any]], None] | None = None,
+    adaptive_concurrency: bool = False,
+    combo_concurrency: int = COMBO_CONCURRENCY,
 ) -> ScrapeResult | None:
     """
     Runs the scraping process and handles execution.
 
+    When `record_sink` is given, each scraped match record is passed to it as soon as it is
+    scraped and is not kept in `ScrapeResult.success`; `stats.successful` still counts it.
+
     Returns:
         ScrapeResult containing successful matches, failed URLs, and statistics.
         Returns None if a fatal error occurs during initialization.
@@ -71,8 +85,10 @@ async def run_scraper(
         f"max_pages={max_pages}, proxy_url={proxy_url}, browser_user_agent={browser_user_agent}, "
         f"browser_locale_timezone={browser_locale_timezone}, browser_timezone_id={browser_timezone_id}, "
         f"scrape_odds_history={scrape_odds_history}, target_bookmaker={target_bookmaker}, "
-        f"headless={headless}, preview_submarkets_only={preview_submarkets_only}, "
-        f"bookies_filter={bookies_filter}, period={period}, base_url={base_url}, local_kickoff={local_kickoff}"
+        f"headless={headless}, block_resources={block_resources}, preview_submarkets_only={preview_submarkets_only}, "
+        f"bookies_filter={bookies_filter}, period={period}, base_url={base_url}, local_kickoff={local_kickoff}, "
+        f"concurrency_tasks={concurrency_tasks}, adaptive_concurrency={adaptive_concurrency}, "
+        f"combo_concurrency={combo_concurrency}"
     )
 
     if base_url:
@@ -90,41 +106,25 @@ async def run_scraper(
                 base_url,
             )
 
-    if isinstance(proxy_url, list | tuple):
-        proxy_manager = ProxyManager(proxy_urls=list(proxy_url), proxy_user=proxy_user, proxy_pass=proxy_pass)
-    else:
-        proxy_manager = ProxyManager(proxy_url=proxy_url, proxy_user=proxy_user, proxy_pass=proxy_pass)
-    SportMarketRegistrar.register_all_markets()
-    playwright_manager = PlaywrightManager()
-    cookie_dismisser = CookieDismisser()
-    selection_manager = SelectionManager()
-    tab_navigator = MarketTabNavigator()
-    scroller = PageScroller()
-
-    market_extractor = OddsPortalMarketExtractor(
-        scroller=scroller,
-        tab_navigator=tab_navigator,
-        selection_manager=selection_manager,
-    )
-
-    scraper = OddsPortalScraper(
-        playwright_manager=playwright_manager,
-        market_extractor=market_extractor,
-        scroller=scroller,
-        cookie_dismisser=cookie_dismisser,
-        selection_manager=selection_manager,
+    scraper = build_scraper(
         preview_submarkets_only=preview_submarkets_only,
         local_kickoff=local_kickoff,
         base_url=base_url,
+        record_sink=record_sink,
+        adaptive_concurrency=adaptive_concurrency,
     )
 
     try:
-        await scraper.start_playwright(
+        await start_scraper(
+            scraper,
+            proxy_url=proxy_url,
+            proxy_user=proxy_user,
+            proxy_pass=proxy_pass,
             headless=headless,
             browser_user_agent=browser_user_agent,
             browser_locale_timezone=browser_locale_timezone,
             browser_timezone_id=browser_timezone_id,
-            proxy_manager=proxy_manager,
+            block_resources=block_resources,
         )
 
         # Checked before the generic match_links branch: live scraping needs its own
@@ -212,6 +212,7 @@ async def run_scraper(
                     period=period_enum,
                     request_delay=request_delay,
                     concurrent_scraping_task=concurrency_tasks,
+                    combo_concurrency=combo_concurrency,
                     links_only=links_only,
                 )
 
@@ -258,6 +259,7 @@ async def run_scraper(
                         concurrent_scraping_task=concurrency_tasks,
                         include_started=include_started,
                         kickoff_within_hours=kickoff_within_hours,
+                        combo_concurrency=combo_concurrency,
                         links_only=links_only,
                     )
             else:
@@ -302,10 +304,16 @@ async def _scrape_league_season_combos(
     leagues: list[str],
     sport: str,
     seasons: list[str] | None = None,
+    combo_concurrency: int = COMBO_CONCURRENCY,
     **kwargs,
 ) -> ScrapeResult:
     """
-    Scrape every (league, season) combination sequentially, league outer.
+    Scrape every (league, season) combination, league outer, `combo_concurrency` at a time.
+
+    Combos that run together share one match budget (`BaseScraper.share_match_budget`):
+    their match pages never exceed what a single run would open, and freed pages go to
+    the combos in turn, so a large league cannot starve the others. Results are merged and
+    `combo_stats` recorded in combo order, whatever order the combos finish in.
 
     `seasons=None` degenerates to one pass per league with no `season` kwarg,
     which is the upcoming-matches behaviour (`scrape_upcoming` has no such parameter).
@@ -316,43 +324,32 @@ async def _scrape_league_season_combos(
         leagues: Leagues to scrape
         sport: The sport being scraped
         seasons: Seasons to scrape per league, or None for a seasonless run
+        combo_concurrency: How many combos run at once (1 runs them one after another)
         **kwargs: Additional arguments forwarded to the scrape function
 
     Returns:
         ScrapeResult: Merged results, with a per-combo breakdown in `combo_stats`.
     """
-    combined_result = ScrapeResult()
     pass_season = seasons is not None
     combos = [(league, season) for league in leagues for season in (seasons or [None])]
+    concurrent = max(min(combo_concurrency, len(combos)), 1)
 
-    logger.info(f"Starting scraping for {len(combos)} league/season combo(s)")
+    logger.info(f"Starting scraping for {len(combos)} league/season combo(s), {concurrent} at a time")
 
-    for i, (league, season) in enumerate(combos, 1):
+    async def scrape_combo(item: tuple[int, tuple[str, str | None]]) -> tuple[int, ScrapeResult | None, bool]:
+        i, (league, season) = item
         label = f"{league} {season}" if season is not None else league
         combo_kwargs = {**kwargs, "season": season} if pass_season else kwargs
+        bind_share((league, season))
 
         try:
-            logger.info(f"[{i}/{len(combos)}] Processing: {label}")
+            logger.info(f"[{i + 1}/{len(combos)}] Processing: {label}")
 
             combo_result = await retry_scrape(scrape_func, sport=sport, league=league, **combo_kwargs)
 
             if combo_result is None:
                 logger.warning(f"No data returned for {label}")
-                combined_result.combo_stats.append(
-                    {"league": league, "season": season, "successful": 0, "failed": 0, "errored": True}
-                )
-                continue
-
-            combined_result.merge(combo_result)
-            combined_result.combo_stats.append(
-                {
-                    "league": league,
-                    "season": season,
-                    "successful": combo_result.stats.successful,
-                    "failed": combo_result.stats.failed,
-                    "errored": False,
-                }
-            )
+                return i, None, True
 
             if combo_result.success:
                 logger.info(
@@ -361,13 +358,36 @@ async def _scrape_league_season_combos(
                 )
             else:
                 logger.warning(f"No successful matches for {label} ({combo_result.stats.failed} failed)")
+            return i, combo_result, False
 
         except Exception as e:
             logger.error(f"Failed to scrape {label}: {e}")
-            combined_result.combo_stats.append(
-                {"league": league, "season": season, "successful": 0, "failed": 0, "errored": True}
-            )
-            continue
+            return i, None, True
+
+    outcomes: dict[int, tuple[ScrapeResult | None, bool]] = {}
+    if concurrent > 1:
+        scraper.share_match_budget(kwargs.get("concurrent_scraping_task", 3))
+    try:
+        async for i, combo_result, errored in WorkerPool(scrape_combo, workers=concurrent).run(enumerate(combos)):
+            outcomes[i] = (combo_result, errored)
+    finally:
+        if concurrent > 1:
+            scraper.match_budget = None
+
+    combined_result = ScrapeResult()
+    for i, (league, season) in enumerate(combos):
+        combo_result, errored = outcomes[i]
+        if combo_result is not None:
+            combined_result.merge(combo_result)
+        combined_result.combo_stats.append(
+            {
+                "league": league,
+                "season": season,
+                "successful": combo_result.stats.successful if combo_result is not None else 0,
+                "failed": combo_result.stats.failed if combo_result is not None else 0,
+                "errored": errored,
+            }
+        )
 
     errored = [c for c in combined_result.combo_stats if c["errored"]]
     if errored:
@@ -418,3 +438,153 @@ async def retry_scrape(scrape_func, *args, **kwargs) -> ScrapeResult | None:
 
     logger.error(f"Max retries exceeded after {retry_result.attempts} attempts.")
     return None
+
+
+def build_scraper(
+    preview_submarkets_only: bool = False,
+    local_kickoff: bool = False,
+    base_url: str | None = None,
+    record_sink: Callable[[dict[str, Any]], None] | None = None,
+    adaptive_concurrency: bool = False,
+) -> OddsPortalScraper:
+    """Build an `OddsPortalScraper` with its browser helpers; `start_scraper` launches its browser."""
+    SportMarketRegistrar.register_all_markets()
+    selection_manager = SelectionManager()
+    scroller = PageScroller()
+
+    market_extractor = OddsPortalMarketExtractor(
+        scroller=scroller,
+        tab_navigator=MarketTabNavigator(label_cache=MarketLabelCache.from_env()),
+        selection_manager=selection_manager,
+    )
+
+    return OddsPortalScraper(
+        playwright_manager=PlaywrightManager(),
+        market_extractor=market_extractor,
+        scroller=scroller,
+        cookie_dismisser=CookieDismisser(),
+        selection_manager=selection_manager,
+        preview_submarkets_only=preview_submarkets_only,
+        local_kickoff=local_kickoff,
+        base_url=base_url,
+        record_sink=record_sink,
+        adaptive_concurrency=adaptive_concurrency,
+    )
+
+
+async def start_scraper(
+    scraper: OddsPortalScraper,
+    proxy_url: str | list[str] | None = None,
+    proxy_user: str | None = None,
+    proxy_pass: str | None = None,
+    headless: bool = True,
+    browser_user_agent: str | None = None,
+    browser_locale_timezone: str | None = None,
+    browser_timezone_id: str | None = None,
+    block_resources: str = ResourceBlockProfile.OFF.value,
+) -> None:
+    """Launch the scraper's browser behind the given proxies."""
+    if isinstance(proxy_url, list | tuple):
+        proxy_manager = ProxyManager(proxy_urls=list(proxy_url), proxy_user=proxy_user, proxy_pass=proxy_pass)
+    else:
+        proxy_manager = ProxyManager(proxy_url=proxy_url, proxy_user=proxy_user, proxy_pass=proxy_pass)
+
+    await scraper.start_playwright(
+        headless=headless,
+        browser_user_agent=browser_user_agent,
+        browser_locale_timezone=browser_locale_timezone,
+        browser_timezone_id=browser_timezone_id,
+        proxy_manager=proxy_manager,
+        block_profile=ResourceBlockProfile(block_resources),
+    )
+
+
+# `run_scraper` kwargs taken by `build_scraper` and `start_scraper`: a `ScraperSession` only
+# serves batches whose values for these match the ones it was opened with.
+SCRAPER_SETTINGS = ("preview_submarkets_only", "local_kickoff", "base_url", "adaptive_concurrency")
+BROWSER_SETTINGS = (
+    "proxy_url",
+    "proxy_user",
+    "proxy_pass",
+    "headless",
+    "browser_user_agent",
+    "browser_locale_timezone",
+    "browser_timezone_id",
+    "block_resources",
+)
+
+
+class ScraperSession:
+    """
+    A started scraper kept open across batches of match links.
+
+    `run_scraper` launches and closes a browser per call; a session launches it on the first
+    batch and keeps it (with its proxy lanes, cookies and page pool) until `close`.
+    """
+
+    def __init__(self, run_kwargs: dict[str, Any]):
+        """
+        Args:
+            run_kwargs (dict): `run_scraper` kwargs; only `SCRAPER_SETTINGS` and `BROWSER_SETTINGS` are kept.
+        """
+        self.settings = self.settings_of(run_kwargs)
+        self.scraper: OddsPortalScraper | None = None
+
+    @staticmethod
+    def settings_of(run_kwargs: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in run_kwargs.items() if k in SCRAPER_SETTINGS or k in BROWSER_SETTINGS}
+
+    def accepts(self, run_kwargs: dict[str, Any]) -> bool:
+        """Whether a batch with these `run_scraper` kwargs can be scraped by this session's browser."""
+        return self.settings_of(run_kwargs) == self.settings
+
+    async def scrape_matches(
+        self,
+        match_links: list[str],
+        sport: str,
+        markets: list | None = None,
+        scrape_odds_history: bool = False,
+        target_bookmaker: str | None = None,
+        bookies_filter: str = BookiesFilter.ALL.value,
+        period: str | None = None,
+        request_delay: float = DEFAULT_REQUEST_DELAY_S,
+        concurrency_tasks: int = 3,
+        **_run_kwargs,
+    ) -> ScrapeResult | None:
+        """
+        Scrape match links like `run_scraper(match_links=...)`, starting the browser on first use.
+
+        Other `run_scraper` kwargs (the listing to walk, the session settings) do not apply to
+        a batch of match links and are ignored. Errors are raised, not logged away: the caller
+        decides whether to `close` the session and start over.
+
+        Returns:
+            ScrapeResult | None: The batch's result, or None if retries were exhausted.
+        """
+        if self.scraper is None:
+            scraper = build_scraper(**{k: v for k, v in self.settings.items() if k in SCRAPER_SETTINGS})
+            try:
+                await start_scraper(scraper, **{k: v for k, v in self.settings.items() if k in BROWSER_SETTINGS})
+            except Exception:
+                await scraper.stop_playwright()
+                raise
+            self.scraper = scraper
+
+        return await retry_scrape(
+            self.scraper.scrape_matches,
+            match_links=match_links,
+            sport=sport,
+            markets=markets,
+            scrape_odds_history=scrape_odds_history,
+            target_bookmaker=target_bookmaker,
+            bookies_filter=BookiesFilter(bookies_filter),
+            period=validate_and_convert_period(period, sport),
+            request_delay=request_delay,
+            concurrent_scraping_task=concurrency_tasks,
+        )
+
+    async def close(self) -> None:
+        """Stop the browser, if started; the next `scrape_matches` starts a new one."""
+        scraper, self.scraper = self.scraper, None
+        if scraper is not None:
+            await scraper.stop_playwright()
@@ -0,0 +1,302 @@
+"""
+Multi-process sharded scraping.
+
+One process drives one Chromium and one event loop, which leaves most cores of a
+scrape box idle. In sharded mode a coordinator resolves the full link set, splits
+it into N shards and runs each shard in its own process with its own
+`PlaywrightManager`/`OddsPortalScraper` (via `run_scraper`), then merges the
+`ScrapeResult`s. With a record sink, each shard streams its records to the
+coordinator through a bounded queue as they are scraped, and the coordinator writes
+them to the sink right away: a shard that crashes late keeps what it already scraped.
+
+Shard assignment hashes the match link itself, so it depends only on the link and
+N: the same link always lands in the same shard, whatever else is in the run.
+That makes `--shard K` a faithful rerun of one shard.
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import multiprocessing
+import os
+import queue
+from typing import Any
+
+from oddsharvester.core.parsing_executor import PARSE_WORKERS_ENV_VAR
+from oddsharvester.core.scrape_result import ErrorType, FailedUrl, ScrapeResult, ScrapeStats
+from oddsharvester.core.scraper_app import run_scraper
+from oddsharvester.utils.command_enum import CommandEnum
+from oddsharvester.utils.constants import SHARD_RECORD_POLL_INTERVAL_S, SHARD_RECORD_QUEUE_SIZE
+from oddsharvester.utils.setup_logging import setup_logger
+
+logger = logging.getLogger("Sharding")
+
+
+def shard_for(link: str, shards: int) -> int:
+    """Deterministic shard index for a match link (stable across processes and runs)."""
+    digest = hashlib.sha1(link.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def split_into_shards(links: list[str], shards: int) -> list[list[str]]:
+    """Partition links into `shards` lists, preserving input order within each shard."""
+    buckets: list[list[str]] = [[] for _ in range(shards)]
+    for link in links:
+        buckets[shard_for(link, shards)].append(link)
+    return buckets
+
+
+@dataclass
+class LinkCollection:
+    """Match links resolved up front, before their scraping is split across workers."""
+
+    links: list[str]
+    season_by_link: dict[str, str | None] = field(default_factory=dict)
+    stamp_season: bool = False
+    failed: list[FailedUrl] = field(default_factory=list)
+
+
+def collect_match_links(run_kwargs: dict[str, Any]) -> LinkCollection | None:
+    """
+    Resolve the match links of a historic/upcoming run without scraping them.
+
+    Explicit `match_links` are used as given (deduplicated). Otherwise a links-only run
+    collects them in-process; its listing-page failures are kept, and for historic runs
+    the season each link was listed under is remembered so it can be stamped on the record.
+
+    Returns:
+        LinkCollection | None: The links, or None if link collection failed fatally.
+    """
+    links = run_kwargs.get("match_links")
+    if links:
+        return LinkCollection(links=list(dict.fromkeys(links)))
+
+    logger.info("Collecting match links before handing them to workers...")
+    collected = asyncio.run(run_scraper(**{**run_kwargs, "links_only": True, "record_sink": None}))
+    if collected is None:
+        return None
+    return LinkCollection(
+        links=list(dict.fromkeys(row["match_link"] for row in collected.success)),
+        season_by_link={row["match_link"]: row.get("season") for row in collected.success},
+        stamp_season=run_kwargs.get("command") == CommandEnum.HISTORIC,
+        failed=list(collected.failed),
+    )
+
+
+def _group_by_season(links: list[str], season_by_link: dict[str, str | None]) -> list[tuple[str | None, list[str]]]:
+    groups: dict[str | None, list[str]] = {}
+    for link in links:
+        groups.setdefault(season_by_link.get(link), []).append(link)
+    return list(groups.items())
+
+
+def _season_stamper(
+    record_sink: Callable[[dict[str, Any]], None], season: str | None
+) -> Callable[[dict[str, Any]], None]:
+    def write(row: dict[str, Any]) -> None:
+        row["season"] = season
+        record_sink(row)
+
+    return write
+
+
+async def _scrape_shard(
+    groups: list[tuple[str | None, list[str]]],
+    run_kwargs: dict[str, Any],
+    stamp_season: bool,
+    record_sink: Callable[[dict[str, Any]], None] | None = None,
+) -> ScrapeResult | None:
+    """Scrape one shard's links, one `run_scraper` call per season group, streaming records to `record_sink`."""
+    shard_result = ScrapeResult()
+    for season, links in groups:
+        sink = _season_stamper(record_sink, season) if record_sink is not None and stamp_season else record_sink
+        result = await run_scraper(**{**run_kwargs, "match_links": links, "record_sink": sink})
+        if result is None:
+            return None
+        if stamp_season:
+            # Matches were discovered on a season listing; a match page does not say
+            # which season it was listed under, so carry it over like scrape_historic does.
+            for row in result.success:
+                row["season"] = season
+        shard_result.merge(result)
+    return shard_result
+
+
+def shard_parse_workers(workers: int) -> int | None:
+    """
+    Parsing pool size for each of `workers` shard processes.
+
+    Every shard process would otherwise size its own `ParsingExecutor` pool to the CPU count,
+    so N shards would start N pools of one worker per core. The cores are split between the
+    shards instead. None when `OH_PARSE_WORKERS` is set: the shards inherit it as given.
+    """
+    if os.environ.get(PARSE_WORKERS_ENV_VAR, "").strip():
+        return None
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _run_shard_process(
+    shard_index: int,
+    groups: list[tuple[str | None, list[str]]],
+    run_kwargs: dict[str, Any],
+    stamp_season: bool,
+    log_level: int,
+    parse_workers: int | None = None,
+    records: Any = None,
+) -> tuple[int, ScrapeResult | None]:
+    """Entry point of a shard worker process; scraped records go to the `records` queue when given."""
+    setup_logger(log_level=log_level, save_to_file=False)
+    if parse_workers is not None:
+        # Read by ParsingExecutor.shared() when the scraper first parses a page.
+        os.environ[PARSE_WORKERS_ENV_VAR] = str(parse_workers)
+    logging.getLogger("Sharding").info(f"Shard {shard_index}: scraping {sum(len(g[1]) for g in groups)} links")
+    record_sink = records.put if records is not None else None
+    return shard_index, asyncio.run(_scrape_shard(groups, run_kwargs, stamp_season, record_sink))
+
+
+def _shard_failure(links: list[str], shard_index: int, reason: str, streamed: set[str]) -> ScrapeResult:
+    """
+    Record every link of a shard that produced no result, so the shard can be rerun.
+
+    Links whose records already reached the sink before the shard failed count as scraped.
+    """
+    failed = [
+        FailedUrl(
+            url=link,
+            error_type=ErrorType.UNKNOWN,
+            error_message=f"Shard {shard_index} failed: {reason}",
+            is_retryable=True,
+        )
+        for link in links
+        if link not in streamed
+    ]
+    return ScrapeResult(
+        failed=failed,
+        stats=ScrapeStats(total_urls=len(links), successful=len(links) - len(failed), failed=len(failed)),
+    )
+
+
+def run_sharded(
+    workers: int,
+    run_kwargs: dict[str, Any],
+    shard: int | None = None,
+    record_sink: Callable[[dict[str, Any]], None] | None = None,
+) -> ScrapeResult | None:
+    """
+    Run a historic/upcoming scrape split across `workers` processes.
+
+    Without explicit match links, the coordinator first collects the links in-process
+    (a links-only run) and keeps its listing-page failures. Each shard then runs in its own
+    spawned process. With `record_sink`, shards send each record to the coordinator through
+    a bounded queue as soon as it is scraped, and the coordinator hands it to the sink while
+    the shards run, so neither side holds a shard's records.
+
+    Args:
+        workers (int): Number of shards (and worker processes).
+        run_kwargs (dict): Keyword arguments for `run_scraper`, exactly as the CLI builds them.
+        shard (int, optional): Run only this shard (0-based), in-process.
+        record_sink (Callable, optional): Receives each scraped record.
+
+    Returns:
+        ScrapeResult | None: Merged results, or None if link collection failed fatally.
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    if shard is not None and not 0 <= shard < workers:
+        raise ValueError(f"shard must be between 0 and {workers - 1}.")
+
+    run_kwargs = {k: v for k, v in run_kwargs.items() if k != "record_sink"}
+    collection = collect_match_links(run_kwargs)
+    if collection is None:
+        return None
+    links = collection.links
+    season_by_link = collection.season_by_link
+    stamp_season = collection.stamp_season
+    # Listing pages that could not be collected hide matches no shard will see.
+    combined = ScrapeResult(
+        failed=list(collection.failed),
+        stats=ScrapeStats(total_urls=len(collection.failed), failed=len(collection.failed)),
+    )
+
+    shards = split_into_shards(links, workers)
+    selected = [shard] if shard is not None else [i for i, s in enumerate(shards) if s]
+    logger.info(
+        f"Sharded mode: {len(links)} links across {workers} shard(s) "
+        f"(sizes: {[len(s) for s in shards]}); running shard(s) {selected}"
+    )
+
+    # Links whose records reached the sink: a shard that fails later does not report them.
+    streamed: set[str] = set()
+
+    def write(row: dict[str, Any]) -> None:
+        streamed.add(row.get("match_link"))
+        record_sink(row)
+
+    def absorb(shard_index: int, result: ScrapeResult | None) -> None:
+        if result is None:
+            result = _shard_failure(shards[shard_index], shard_index, "scraper returned no result", streamed)
+        combined.merge(result)
+        logger.info(
+            f"Shard {shard_index} done: {result.stats.successful} scraped, {result.stats.failed} failed "
+            f"(rerun with --workers {workers} --shard {shard_index})"
+        )
+
+    if shard is not None:
+        groups = _group_by_season(shards[shard], season_by_link)
+        sink = write if record_sink is not None else None
+        absorb(shard, asyncio.run(_scrape_shard(groups, run_kwargs, stamp_season, sink)))
+        return combined
+
+    if not selected:
+        logger.info("No match links to shard.")
+        return combined
+
+    log_level = logging.getLogger().getEffectiveLevel()
+    parse_workers = shard_parse_workers(len(selected))
+    # Spawn, not fork: the coordinator may already have run an event loop and a browser.
+    context = multiprocessing.get_context("spawn")
+    with (
+        context.Manager() as manager,
+        ProcessPoolExecutor(max_workers=len(selected), mp_context=context) as executor,
+    ):
+        records = manager.Queue(SHARD_RECORD_QUEUE_SIZE) if record_sink is not None else None
+
+        def drain() -> None:
+            while records is not None:
+                try:
+                    row = records.get_nowait()
+                except queue.Empty:
+                    return
+                write(row)
+
+        futures = {
+            executor.submit(
+                _run_shard_process,
+                i,
+                _group_by_season(shards[i], season_by_link),
+                run_kwargs,
+                stamp_season,
+                log_level,
+                parse_workers,
+                records,
+            ): i
+            for i in selected
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=SHARD_RECORD_POLL_INTERVAL_S, return_when=FIRST_COMPLETED)
+            # A shard's records are all queued by the time it returns: write them before its result.
+            drain()
+            for future in done:
+                shard_index = futures[future]
+                try:
+                    _, result = future.result()
+                except Exception as e:
+                    logger.error(f"Shard {shard_index} crashed: {e}")
+                    result = _shard_failure(shards[shard_index], shard_index, str(e), streamed)
+                absorb(shard_index, result)
+
+    return combined
@@ -0,0 +1,192 @@
+"""
+Bounded worker pool for concurrent scraping.
+
+A fixed number of long-lived workers pull items from a bounded `asyncio.Queue`.
+The producer blocks once the queue is full, so only `queue_size` items are ever
+materialised ahead of the workers, however long the input is.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from oddsharvester.utils.constants import WORKER_QUEUE_SIZE_FACTOR
+
+# Put on the result channel once every item has been handled.
+_DONE = object()
+
+
+@dataclass
+class _WorkerError:
+    error: BaseException
+
+
+@dataclass
+class WorkerPoolStats:
+    """Point-in-time view of a worker pool, for sizing concurrency from data."""
+
+    workers: int
+    limit: int
+    queue_depth: int
+    in_flight: int
+    processed: int
+    elapsed_s: float
+    busy_s: list[float] = field(default_factory=list)
+
+    @property
+    def utilisation(self) -> list[float]:
+        """Fraction of the elapsed time each worker spent running the handler."""
+        if self.elapsed_s <= 0:
+            return [0.0] * len(self.busy_s)
+        return [min(busy / self.elapsed_s, 1.0) for busy in self.busy_s]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "workers": self.workers,
+            "limit": self.limit,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "processed": self.processed,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "utilisation": [round(u, 3) for u in self.utilisation],
+        }
+
+
+class WorkerPool:
+    """
+    Run an async handler over an iterable with a fixed number of workers.
+
+    Results are yielded in completion order. The result channel is bounded as
+    well, so a slow consumer stalls the workers instead of piling results up.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        workers: int,
+        queue_size: int | None = None,
+    ):
+        """
+        Args:
+            handler: Coroutine function called once per item.
+            workers (int): Number of concurrent workers.
+            queue_size (int, optional): Items buffered ahead of the workers. Defaults to
+                `workers * WORKER_QUEUE_SIZE_FACTOR`.
+
+        Raises:
+            ValueError: If `workers` is less than 1.
+        """
+        if workers < 1:
+            raise ValueError(f"Worker pool needs at least one worker, got {workers}.")
+
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size or workers * WORKER_QUEUE_SIZE_FACTOR
+        self.limit = workers
+        self.in_flight = 0
+        self.processed = 0
+        self._limit_raised = asyncio.Event()
+        self._queue: asyncio.Queue | None = None
+        self._busy_s = [0.0] * workers
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    def set_limit(self, limit: int) -> None:
+        """Cap how many workers may pick up new items, between 1 and `workers`.
+
+        Workers above the cap finish their current item and then park until it rises.
+        """
+        limit = min(max(limit, 1), self.workers)
+        if limit > self.limit:
+            self._limit_raised.set()
+        self.limit = limit
+
+    @property
+    def queue_depth(self) -> int:
+        """Items queued but not yet picked up by a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self) -> WorkerPoolStats:
+        """Snapshot the pool's current counters."""
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = (self._finished_at or time.monotonic()) - self._started_at
+        return WorkerPoolStats(
+            workers=self.workers,
+            limit=self.limit,
+            queue_depth=self.queue_depth,
+            in_flight=self.in_flight,
+            processed=self.processed,
+            elapsed_s=elapsed,
+            busy_s=list(self._busy_s),
+        )
+
+    async def run(self, items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+        """
+        Feed `items` to the workers and yield each handler result as it completes.
+
+        `items` may be an async iterable that is still being produced (e.g. links
+        discovered while a listing walk continues); workers start on the first item.
+
+        An exception raised by the handler stops the pool and is re-raised here.
+        Closing the generator early cancels the producer and all workers.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.workers)
+        self._queue = queue
+        self._started_at = time.monotonic()
+        self._finished_at = None
+
+        async def produce() -> None:
+            try:
+                if isinstance(items, AsyncIterable):
+                    async for item in items:
+                        await queue.put(item)
+                else:
+                    for item in items:
+                        await queue.put(item)
+            except Exception as e:
+                await results.put(_WorkerError(e))
+                return
+            await queue.join()
+            await results.put(_DONE)
+
+        async def work(worker_id: int) -> None:
+            while True:
+                while worker_id >= self.limit:
+                    self._limit_raised.clear()
+                    await self._limit_raised.wait()
+                item = await queue.get()
+                self.in_flight += 1
+                started = time.monotonic()
+                try:
+                    result = await self.handler(item)
+                except Exception as e:
+                    await results.put(_WorkerError(e))
+                    return
+                finally:
+                    self.in_flight -= 1
+                    self._busy_s[worker_id] += time.monotonic() - started
+
+                self.processed += 1
+                await results.put(result)
+                queue.task_done()
+
+        producer = asyncio.create_task(produce())
+        tasks = [producer] + [asyncio.create_task(work(worker_id)) for worker_id in range(self.workers)]
+
+        try:
+            while (result := await results.get()) is not _DONE:
+                if isinstance(result, _WorkerError):
+                    raise result.error
+                yield result
+        finally:
+            self._finished_at = time.monotonic()
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
@@ -0,0 +1,274 @@
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any
+
+from oddsharvester.utils.constants import JOB_QUEUE_MAX_ATTEMPTS, JOB_QUEUE_VISIBILITY_TIMEOUT_S
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    link TEXT NOT NULL,
+    config_key TEXT NOT NULL,
+    config TEXT NOT NULL,
+    season TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (link, config_key)
+);
+CREATE INDEX IF NOT EXISTS jobs_claimable ON jobs (status, lease_expires_at);
+"""
+
+JOB_STATUSES = ("pending", "leased", "done", "failed")
+LEASE_EXPIRED_ERROR = "lease expired"
+
+
+@dataclass
+class Job:
+    """One match link to scrape, with the `run_scraper` settings it was enqueued with."""
+
+    id: int
+    link: str
+    config: dict[str, Any]
+    config_key: str
+    season: str | None
+    attempts: int
+
+
+class JobQueue:
+    """
+    Durable queue of match-scraping jobs backed by a SQLite file.
+
+    Workers `claim` jobs under a lease that expires after a visibility timeout; an expired lease
+    makes the job claimable again, so the jobs of a worker that crashed are picked up by the
+    others, until the job has been claimed `max_attempts` times: a link that keeps killing or
+    stalling its worker is then given up. Delivery is at-least-once: a worker that stalls past
+    its lease can see its jobs scraped a second time elsewhere.
+
+    Every process opens its own connection to the file, so all workers must see the same file
+    through a local filesystem (one host, or containers sharing a volume on it). SQLite locking
+    is not reliable over network filesystems such as NFS.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = JOB_QUEUE_MAX_ATTEMPTS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path (str): Path of the SQLite file. Created, with its directory, if missing.
+            max_attempts (int): Claims after which a job failing with a retryable error, or whose lease
+                keeps expiring, is given up.
+            clock (Callable): Source of the current time in seconds (injectable for tests).
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self.max_attempts = max_attempts
+        self._clock = clock
+        # Autocommit mode: transactions are opened explicitly where several statements must be atomic.
+        self._conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def config_key(config: dict[str, Any]) -> str:
+        """Stable key of a scrape configuration, so the same link can be queued once per configuration."""
+        canonical = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha1(canonical.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def enqueue(
+        self,
+        links: Iterable[str],
+        config: dict[str, Any],
+        season_by_link: dict[str, str | None] | None = None,
+    ) -> int:
+        """
+        Queue match links to be scraped with `config`.
+
+        A link already queued with the same configuration is skipped, whatever its status, so
+        re-enqueueing a season only adds the matches that are new.
+
+        Args:
+            links (Iterable[str]): Match links.
+            config (dict): `run_scraper` keyword arguments (JSON-serialisable), without `match_links`.
+            season_by_link (dict, optional): Season each link was listed under, stamped on its record.
+
+        Returns:
+            int: Number of jobs added.
+        """
+        key = self.config_key(config)
+        payload = json.dumps(config, default=str)
+        season_by_link = season_by_link or {}
+        now = self._clock()
+        rows = [(link, key, payload, season_by_link.get(link), now, now) for link in dict.fromkeys(links)]
+
+        with self._transaction():
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (link, config_key, config, season, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = self._conn.total_changes - before
+
+        self.logger.info(f"Enqueued {added} job(s) ({len(rows) - added} already queued) in {self.path}")
+        return added
+
+    def claim(
+        self, worker_id: str, limit: int, visibility_timeout_s: float = JOB_QUEUE_VISIBILITY_TIMEOUT_S
+    ) -> list[Job]:
+        """
+        Lease up to `limit` claimable jobs: pending ones, and leased ones whose lease has expired.
+
+        A job whose lease expired after its last allowed attempt is marked failed instead.
+
+        Args:
+            worker_id (str): Owner recorded on the lease.
+            limit (int): Maximum number of jobs to claim.
+            visibility_timeout_s (float): Lease duration.
+
+        Returns:
+            list[Job]: The claimed jobs, oldest first.
+        """
+        now = self._clock()
+        with self._transaction():
+            expired = self._conn.execute(
+                "UPDATE jobs SET status = 'failed', lease_owner = NULL, lease_expires_at = NULL, "
+                "last_error = ?, updated_at = ? WHERE status = 'leased' AND lease_expires_at <= ? AND attempts >= ?",
+                (LEASE_EXPIRED_ERROR, now, now, self.max_attempts),
+            ).rowcount
+            rows = self._conn.execute(
+                "SELECT id, link, config, config_key, season, attempts, status FROM jobs "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires_at <= ?) "
+                "ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires_at = ?, updated_at = ? WHERE id = ?",
+                [(worker_id, now + visibility_timeout_s, now, row["id"]) for row in rows],
+            )
+
+        if expired:
+            self.logger.warning(
+                f"Gave up on {expired} job(s) whose lease expired after {self.max_attempts} attempt(s)."
+            )
+        reclaimed = sum(1 for row in rows if row["status"] == "leased")
+        if reclaimed:
+            self.logger.warning(f"{worker_id} reclaimed {reclaimed} job(s) whose lease expired.")
+
+        return [
+            Job(
+                id=row["id"],
+                link=row["link"],
+                config=json.loads(row["config"]),
+                config_key=row["config_key"],
+                season=row["season"],
+                attempts=row["attempts"] + 1,
+            )
+            for row in rows
+        ]
+
+    def renew(
+        self, worker_id: str, job_ids: list[int], visibility_timeout_s: float = JOB_QUEUE_VISIBILITY_TIMEOUT_S
+    ) -> int:
+        """Extend the leases `worker_id` still holds. Returns the number of leases renewed."""
+        now = self._clock()
+        return self._update_owned(
+            "SET lease_expires_at = ?, updated_at = ?", (now + visibility_timeout_s, now), worker_id, job_ids
+        )
+
+    def ack(self, worker_id: str, job_ids: list[int]) -> int:
+        """
+        Mark jobs done. A job whose lease was lost to another worker is left to that worker.
+
+        Returns:
+            int: Number of jobs marked done.
+        """
+        acked = self._update_owned(
+            "SET status = 'done', lease_owner = NULL, lease_expires_at = NULL, last_error = NULL, updated_at = ?",
+            (self._clock(),),
+            worker_id,
+            job_ids,
+        )
+        if acked < len(job_ids):
+            self.logger.warning(f"{worker_id} lost the lease on {len(job_ids) - acked} job(s) before acking them.")
+        return acked
+
+    def fail(self, worker_id: str, job: Job, error: str, retryable: bool) -> str:
+        """
+        Record a failed attempt. A retryable failure with attempts left goes back to pending.
+
+        Returns:
+            str: The job's new status ("pending" or "failed"), or "" if the lease was lost.
+        """
+        status = "pending" if retryable and job.attempts < self.max_attempts else "failed"
+        updated = self._update_owned(
+            "SET status = ?, lease_owner = NULL, lease_expires_at = NULL, last_error = ?, updated_at = ?",
+            (status, error, self._clock()),
+            worker_id,
+            [job.id],
+        )
+        return status if updated else ""
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per status."""
+        rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def has_unfinished(self) -> bool:
+        """True while any job is pending or leased (a lease may still expire and be reclaimed)."""
+        row = self._conn.execute("SELECT 1 FROM jobs WHERE status IN ('pending', 'leased') LIMIT 1").fetchone()
+        return row is not None
+
+    def failed_jobs(self) -> list[dict[str, Any]]:
+        """Jobs given up on, with their last error."""
+        rows = self._conn.execute(
+            "SELECT link, attempts, last_error FROM jobs WHERE status = 'failed' ORDER BY id"
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _update_owned(self, set_clause: str, params: tuple, worker_id: str, job_ids: list[int]) -> int:
+        if not job_ids:
+            return 0
+        placeholders = ", ".join("?" for _ in job_ids)
+        with self._transaction():
+            cursor = self._conn.execute(
+                f"UPDATE jobs {set_clause} WHERE status = 'leased' AND lease_owner = ? AND id IN ({placeholders})",
+                (*params, worker_id, *job_ids),
+            )
+        return cursor.rowcount
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers cannot claim the same job.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
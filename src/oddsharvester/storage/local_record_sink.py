@@ -0,0 +1,138 @@
+import csv
+from itertools import chain
+import json
+import logging
+import os
+
+from .storage_format import StorageFormat
+
+
+class LocalRecordSink:
+    """
+    Incrementally persist scraped records to a local CSV or JSON file.
+
+    Each record is appended to a JSON Lines spool (`<target>.partial.jsonl`) and flushed
+    as soon as it arrives, so memory stays flat and a crash loses nothing already scraped.
+    `close()` turns the spool into the requested format with the same layout
+    `LocalDataStorage.save_data` produces, then removes the spool. A spool left behind by a
+    crashed run is kept intact: it is valid JSON Lines, one record per line.
+    """
+
+    def __init__(
+        self,
+        file_path: str | None = None,
+        storage_format: str = StorageFormat.JSON.value,
+        append: bool = False,
+    ):
+        """
+        Args:
+            file_path (str, optional): Target file path. Defaults to `scraped_data`.
+            storage_format (str): "csv" or "json".
+            append (bool): When True, append to the existing target on close; when False, overwrite it.
+
+        Raises:
+            ValueError: If the storage format is not supported.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        format_to_use = storage_format.lower()
+        if format_to_use not in [f.value for f in StorageFormat]:
+            raise ValueError(
+                f"Invalid storage format. Supported formats are: {', '.join(f.value for f in StorageFormat)}."
+            )
+
+        target_file_path = file_path or "scraped_data"
+        if not target_file_path.endswith(f".{format_to_use}"):
+            target_file_path = f"{target_file_path}.{format_to_use}"
+
+        self.storage_format = format_to_use
+        self.file_path = target_file_path
+        self.spool_path = f"{target_file_path}.partial.jsonl"
+        self.append = append
+        self.count = 0
+        self._spool = None
+
+    def write(self, record: dict) -> None:
+        """Spool one record to disk. The spool file is only created on the first write."""
+        if not isinstance(record, dict):
+            raise ValueError("Record must be a dictionary.")
+
+        if self._spool is None:
+            directory = os.path.dirname(self.spool_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            if os.path.exists(self.spool_path):
+                self.logger.warning(
+                    f"Overwriting {self.spool_path} left behind by an interrupted run. "
+                    "Move it aside first to keep the records it holds."
+                )
+            self._spool = open(self.spool_path, "w", encoding="utf-8")  # noqa: SIM115
+            self.logger.info(f"Streaming records to {self.spool_path}")
+
+        self._spool.write(json.dumps(record) + "\n")
+        self._spool.flush()
+        self.count += 1
+
+    def close(self) -> int:
+        """
+        Finalize the target file from the spool.
+
+        A sink that never received a record leaves the target untouched, matching the
+        buffered path, which skips storage when there is nothing to store.
+
+        Returns:
+            int: Number of records written.
+        """
+        if self._spool is None:
+            return 0
+
+        self._spool.close()
+        self._spool = None
+
+        if self.storage_format == StorageFormat.CSV.value:
+            self._finalize_csv()
+        else:
+            self._finalize_json()
+
+        os.remove(self.spool_path)
+        self.logger.info(f"Successfully saved {self.count} record(s) to {self.file_path}")
+        return self.count
+
+    def _iter_spool(self):
+        with open(self.spool_path, encoding="utf-8") as spool:
+            for line in spool:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _finalize_csv(self):
+        """Two passes over the spool: line markets yield different columns per match, so the
+        header is the union of every row's keys in first-seen order (issue #78)."""
+        fieldnames = list(dict.fromkeys(key for row in self._iter_spool() for key in row))
+
+        mode = "a" if self.append else "w"
+        with open(self.file_path, mode=mode, newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            if not self.append or os.path.getsize(self.file_path) == 0:
+                writer.writeheader()
+            for row in self._iter_spool():
+                writer.writerow(row)
+
+    def _finalize_json(self):
+        """Stream the spool into a JSON array laid out like `json.dump(data, indent=4)`."""
+        existing_data = []
+        if self.append and os.path.exists(self.file_path):
+            with open(self.file_path, encoding="utf-8") as file:
+                try:
+                    existing_data = json.load(file)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"File {self.file_path} exists but is empty or invalid JSON.")
+
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write("[")
+            first = True
+            for row in chain(existing_data, self._iter_spool()):
+                file.write("\n" if first else ",\n")
+                file.write("\n".join(f"    {line}" for line in json.dumps(row, indent=4).splitlines()))
+                first = False
+            file.write("]" if first else "\n]")
+        os.replace(tmp_path, self.file_path)
@@ -1,5 +1,6 @@
 import logging
 
+from oddsharvester.storage.local_record_sink import LocalRecordSink
 from oddsharvester.storage.storage_format import StorageFormat
 from oddsharvester.storage.storage_type import StorageType
 
@@ -34,3 +35,19 @@ def store_data(
     except Exception as e:
         logger.error(f"Error during data storage: {e!s}")
         return False
+
+
+def open_record_sink(
+    storage_type: StorageType,
+    storage_format: StorageFormat,
+    file_path: str,
+    append: bool = False,
+) -> LocalRecordSink | None:
+    """Open a sink that writes records to local storage as they are scraped.
+
+    Returns None for remote storage, which uploads one object per run and so still
+    needs the full record list; callers fall back to `store_data` in that case.
+    """
+    if StorageType(storage_type) != StorageType.LOCAL:
+        return None
+    return LocalRecordSink(file_path=file_path, storage_format=storage_format, append=append)
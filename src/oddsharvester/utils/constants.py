@@ -7,6 +7,8 @@ ODDSPORTAL_BASE_URL = "https://www.oddsportal.com"
 # Navigation & page load timeouts (ms)
 NAVIGATION_TIMEOUT_MS = 15000
 GOTO_TIMEOUT_MS = 10000
+# Resetting a pooled tab to about:blank between matches
+PAGE_POOL_RESET_TIMEOUT_MS = 5000
 GOTO_TIMEOUT_LONG_MS = 20000
 SELECTOR_TIMEOUT_MS = 10000
 COOKIE_BANNER_TIMEOUT_MS = 10000
@@ -27,6 +29,9 @@ DROPDOWN_WAIT_MS = 1000
 TAB_SWITCH_WAIT_MS = 500
 FALLBACK_VERIFY_WAIT_MS = 1000
 H2H_FRAGMENT_RESOLVE_TIMEOUT_MS = 5000
+FRAGMENT_NAVIGATION_TIMEOUT_MS = 1500
+# Consecutive fragment navigations that time out before a mirror is deemed to ignore them.
+FRAGMENT_NAVIGATION_MAX_MISSES = 3
 
 # Odds history extraction timeouts (ms)
 ODDS_HISTORY_PRE_WAIT_MS = 2000
@@ -52,6 +57,9 @@ MAX_PAGINATION_PAGES = 50
 # Links a full results listing page yields. A page returning fewer is the last one,
 # unless the pagination widget promised a later page: then it was truncated (issue #78).
 RESULTS_PAGE_SIZE = 50
+# Listing pages fetched at once per browser context while the walk is below the pagination
+# frontier. Those pages are known to exist, so they need no sequential exploration.
+LISTING_PAGE_CONCURRENCY = 3
 
 # =============================================================================
 # RETRY CONSTANTS
@@ -80,6 +88,82 @@ LISTING_PAGE_RETRY_DELAY_S = 5.0
 DEFAULT_REQUEST_DELAY_S = 1.0
 REQUEST_DELAY_JITTER_FACTOR = 0.5
 
+# Match links queued ahead of the scraping workers, per worker. Keeps the producer
+# just far enough ahead that no worker waits, without materialising the whole list.
+WORKER_QUEUE_SIZE_FACTOR = 2
+
+# League/season combos scraped at once by a multi-league or multi-season run. By default
+# they run one after another; with --combo-concurrency above 1 they share one match
+# budget, which overlaps their listing walks without adding match pages.
+COMBO_CONCURRENCY = 1
+
+# Adaptive (AIMD) concurrency, enabled with --adaptive-concurrency. Outcomes are
+# judged in windows; a window with this share of NAVIGATION/RATE_LIMITED errors
+# multiplies the limit by the decrease factor. A window at or above the healthy
+# success rate whose p95 latency stays within tolerance of the best p95 seen
+# adds one.
+ADAPTIVE_CONCURRENCY_WINDOW = 10
+ADAPTIVE_CONCURRENCY_BACKOFF_ERROR_RATE = 0.2
+ADAPTIVE_CONCURRENCY_DECREASE_FACTOR = 0.5
+ADAPTIVE_CONCURRENCY_HEALTHY_SUCCESS_RATE = 0.9
+ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE = 1.5
+
+# Per-phase latency (`ScrapeResult.latency`) keeps a uniform sample of at most this many
+# timings per phase and per market for its percentiles, so it does not grow with the run.
+LATENCY_RESERVOIR_SIZE = 1024
+# ...and the per-match breakdown of only this many of its slowest matches.
+LATENCY_SLOWEST_MATCHES = 20
+
+# Records a `--workers` shard process may have queued for the coordinator's sink before
+# it blocks: bounds the coordinator's memory when the sink falls behind.
+SHARD_RECORD_QUEUE_SIZE = 1000
+SHARD_RECORD_POLL_INTERVAL_S = 0.1
+
+# Durable job queue (`--enqueue` / `oddsharvester worker`). A claimed job is leased
+# for the visibility timeout; a worker renews its leases while it scrapes, so only a
+# crashed or stalled worker lets them expire and be reclaimed. A job that keeps
+# failing with a retryable error is given up after the max attempts.
+JOB_QUEUE_VISIBILITY_TIMEOUT_S = 600.0
+JOB_QUEUE_MAX_ATTEMPTS = 3
+JOB_QUEUE_BATCH_SIZE = 10
+JOB_QUEUE_POLL_INTERVAL_S = 5.0
+
+# Warm page pool: a match tab is reset to about:blank and reused, then closed and
+# replaced after this many matches so one tab's memory cannot grow for a whole run.
+PAGE_POOL_MAX_USES = 25
+
+# Network resource blocking (--block-resources). The scraper reads the DOM and the
+# React payload; images, fonts and media are only downloaded to be drawn. `balanced`
+# aborts those and known ad/analytics hosts, `minimal` keeps only documents, scripts,
+# stylesheets (visibility checks need layout) and XHR/fetch from first-party hosts.
+BALANCED_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+MINIMAL_ALLOWED_RESOURCE_TYPES = frozenset({"document", "script", "stylesheet", "xhr", "fetch"})
+BLOCKED_TRACKER_HOSTS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googleadservices.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "hotjar.com",
+    "facebook.net",
+)
+# Average transfer size per resource type in the recorded HAR fixtures, used to estimate
+# the bytes a blocked request would have cost (its real size is never known).
+BLOCKED_RESOURCE_SIZE_ESTIMATE_BYTES = {
+    "image": 3_100,
+    "font": 60_000,
+    "stylesheet": 10_000,
+    "script": 55_000,
+}
+
 PLAYWRIGHT_BROWSER_ARGS = [
     "--disable-background-networking",
     "--disable-extensions",
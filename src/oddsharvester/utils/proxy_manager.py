@@ -1,7 +1,13 @@
-from dataclasses import dataclass
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
 import logging
+import random
+import time
 from urllib.parse import urlparse, urlunparse
 
+from oddsharvester.utils.constants import REQUEST_DELAY_JITTER_FACTOR
+
 # A proxy is dropped from rotation after this many CONSECUTIVE proxy-attributable
 # failures (navigation / rate-limit). The counter resets on any non-proxy outcome.
 PROXY_CONSECUTIVE_FAILURE_THRESHOLD = 3
@@ -11,14 +17,50 @@ _DIRECT_KEY = "direct"
 _PER_CONTEXT_SENTINEL = {"server": "per-context"}
 
 
+@dataclass
+class TokenBucket:
+    """Request pacing for one proxy lane: refills one token every `interval_s`, up to `capacity`."""
+
+    interval_s: float
+    capacity: float = 1.0
+    tokens: float = 1.0
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def _refill(self, now: float) -> None:
+        if self.interval_s > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) / self.interval_s)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        if self.interval_s <= 0 or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) * self.interval_s
+
+    def take(self, now: float, cost: float = 1.0) -> None:
+        """Spend `cost` tokens. A cost above 1 pushes the next token further out (jitter)."""
+        self._refill(now)
+        if self.interval_s > 0:
+            self.tokens -= cost
+
+
 @dataclass
 class ProxyEntry:
-    """A single proxy in the rotation pool."""
+    """A single proxy in the rotation pool.
+
+    `in_flight`, `max_in_flight` and `bucket` make up the proxy's lane: how many pages
+    it may have open at once and how fast it may start new ones. Unset until
+    `ProxyManager.configure_lanes` is called, which means unlimited.
+    """
 
     key: str
     config: dict[str, str] | None
     consecutive_failures: int = 0
     blacklisted: bool = False
+    in_flight: int = 0
+    max_in_flight: int | None = None
+    bucket: TokenBucket | None = None
 
 
 class ProxyManager:
@@ -65,6 +107,7 @@ class ProxyManager:
         self._failover_enabled = len(self._real) >= 2
         self._cursor = 0
         self._exhausted_logged = False
+        self._lane_released = asyncio.Event()
 
     @staticmethod
     def _normalize_urls(proxy_urls: list[str] | None, proxy_url: str | None) -> list[str]:
@@ -131,10 +174,83 @@ class ProxyManager:
             if not entry.blacklisted:
                 self._cursor = (idx + 1) % n
                 return entry
+        self._log_exhausted()
+        return None
+
+    def _log_exhausted(self) -> None:
         if not self._exhausted_logged:
             self.logger.error("All proxies are blacklisted; remaining matches will fail.")
             self._exhausted_logged = True
-        return None
+
+    def configure_lanes(self, per_proxy_concurrency: int, request_delay: float) -> None:
+        """Give every proxy its own concurrency lane and token bucket.
+
+        Each lane allows `per_proxy_concurrency` open pages and starts at most that many
+        requests per `request_delay` seconds, so total throughput scales with the number
+        of healthy proxies and a throttled proxy only slows its own lane.
+        """
+        for entry in self.entries:
+            entry.max_in_flight = per_proxy_concurrency
+            entry.bucket = (
+                TokenBucket(
+                    interval_s=request_delay / per_proxy_concurrency,
+                    capacity=per_proxy_concurrency,
+                    tokens=per_proxy_concurrency,
+                )
+                if request_delay > 0
+                else None
+            )
+
+    def healthy_lane_count(self) -> int:
+        """Number of proxies still in rotation."""
+        return sum(1 for e in self.entries if not e.blacklisted)
+
+    async def acquire_lane(self) -> ProxyEntry | None:
+        """Claim a slot on the next proxy lane with capacity, waiting if every lane is busy.
+
+        Lanes are scanned round-robin from the cursor; the first one with a free slot
+        and a token wins. If none is ready, waits until the soonest token refills or
+        another caller releases a slot. Returns None if every proxy is blacklisted.
+        """
+        while True:
+            n = len(self.entries)
+            now = time.monotonic()
+            waits: list[float] = []
+            healthy = False
+
+            for i in range(n):
+                idx = (self._cursor + i) % n
+                entry = self.entries[idx]
+                if entry.blacklisted:
+                    continue
+                healthy = True
+                if entry.max_in_flight is not None and entry.in_flight >= entry.max_in_flight:
+                    continue
+                wait = entry.bucket.wait_time(now) if entry.bucket is not None else 0.0
+                if wait > 0:
+                    waits.append(wait)
+                    continue
+
+                if entry.bucket is not None:
+                    entry.bucket.take(now, cost=1 + REQUEST_DELAY_JITTER_FACTOR * random.random())  # noqa: S311
+                entry.in_flight += 1
+                self._cursor = (idx + 1) % n
+                return entry
+
+            if not healthy:
+                self._log_exhausted()
+                return None
+
+            self._lane_released.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._lane_released.wait(), timeout=min(waits) if waits else None)
+
+    def release_lane(self, key: str) -> None:
+        """Free the slot claimed by `acquire_lane` on the proxy identified by `key`."""
+        entry = next((e for e in self.entries if e.key == key), None)
+        if entry is not None and entry.in_flight > 0:
+            entry.in_flight -= 1
+            self._lane_released.set()
 
     def blacklist_proxy(self, key: str) -> None:
         """Force a proxy out of rotation (e.g. its context could not be warmed)."""
@@ -142,6 +258,8 @@ class ProxyManager:
         if entry is not None and not entry.blacklisted:
             entry.blacklisted = True
             self.logger.warning(f"Proxy removed from rotation (context warm-up failed): {entry.key}")
+            # Wake lane waiters so they stop counting on this proxy.
+            self._lane_released.set()
 
     def report_result(self, key: str, is_proxy_failure: bool) -> None:
         """Record the outcome of a request that used the proxy identified by `key`.
@@ -162,6 +280,7 @@ class ProxyManager:
                 self.logger.warning(
                     f"Proxy blacklisted after {entry.consecutive_failures} consecutive failures: {entry.key}"
                 )
+                self._lane_released.set()
         else:
             entry.consecutive_failures = 0
 
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ResourceBlockProfile(Enum):
+    MINIMAL = "minimal"
+    BALANCED = "balanced"
+    OFF = "off"
@@ -8,6 +8,9 @@ import pytest
 from oddsharvester import __version__
 from oddsharvester.cli.cli import cli
 from oddsharvester.cli.commands.historic import _format_combo_summary
+from oddsharvester.core.scrape_result import ScrapeResult, ScrapeStats
+from oddsharvester.core.sharding import LinkCollection
+from oddsharvester.storage.job_queue import JobQueue
 
 # Use a far future date to avoid date validation issues
 FUTURE_DATE = "20991231"
@@ -208,6 +211,86 @@ class TestCommonOptions:
         assert mock_run_scraper["historic"].called
         assert mock_run_scraper["historic"].call_args.kwargs.get("concurrency_tasks") == 7
 
+    def test_adaptive_concurrency_flag_forwarded_to_run_scraper(self, runner, mock_run_scraper):
+        runner.invoke(
+            cli,
+            [
+                "historic",
+                "-s",
+                "football",
+                "-l",
+                "england-premier-league",
+                "--season",
+                "2024",
+                "--adaptive-concurrency",
+            ],
+        )
+        assert mock_run_scraper["historic"].call_args.kwargs.get("adaptive_concurrency") is True
+
+    def test_workers_routes_to_sharded_run(self, runner, mock_run_scraper):
+        with patch("oddsharvester.cli.commands.historic.run_sharded") as run_sharded:
+            run_sharded.return_value = None
+            runner.invoke(
+                cli,
+                ["historic", "-s", "football", "-l", "england-premier-league", "--season", "2024", "--workers", "4"],
+            )
+        assert not mock_run_scraper["historic"].called
+        assert run_sharded.call_args.kwargs["workers"] == 4
+        assert run_sharded.call_args.kwargs["shard"] is None
+        assert run_sharded.call_args.kwargs["run_kwargs"]["command"] == "scrape_historic"
+
+    def test_single_worker_keeps_in_process_run(self, runner, mock_run_scraper):
+        with patch("oddsharvester.cli.commands.upcoming.run_sharded") as run_sharded:
+            runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE])
+        assert mock_run_scraper["upcoming"].called
+        assert not run_sharded.called
+
+    def test_shard_out_of_range_rejected(self, runner, mock_run_scraper):
+        result = runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--workers", "2", "--shard", "2"])
+        assert result.exit_code != 0
+        assert "--shard must be between 0 and 1" in result.output
+
+    def test_workers_rejects_links_only(self, runner, mock_run_scraper):
+        result = runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--workers", "2", "--links-only"])
+        assert result.exit_code != 0
+        assert "--links-only cannot be combined with --workers" in result.output
+
+    def test_invalid_workers(self, runner, mock_run_scraper):
+        result = runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--workers", "0"])
+        assert result.exit_code != 0
+
+    def test_adaptive_concurrency_off_by_default(self, runner, mock_run_scraper):
+        runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE])
+        assert mock_run_scraper["upcoming"].call_args.kwargs.get("adaptive_concurrency") is False
+
+    def test_combo_concurrency_defaults_to_sequential(self, runner, mock_run_scraper):
+        leagues = "england-premier-league,italy-serie-a"
+        runner.invoke(cli, ["historic", "-s", "football", "-l", leagues, "--season", "2024"])
+        assert mock_run_scraper["historic"].call_args.kwargs.get("combo_concurrency") == 1
+
+    def test_combo_concurrency_forwarded_to_run_scraper(self, runner, mock_run_scraper):
+        leagues = "england-premier-league,italy-serie-a"
+        runner.invoke(
+            cli, ["historic", "-s", "football", "-l", leagues, "--season", "2024", "--combo-concurrency", "4"]
+        )
+        assert mock_run_scraper["historic"].call_args.kwargs.get("combo_concurrency") == 4
+
+    def test_block_resources_defaults_to_off(self, runner, mock_run_scraper):
+        runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE])
+        assert mock_run_scraper["upcoming"].call_args.kwargs.get("block_resources") == "off"
+
+    def test_block_resources_forwarded_to_run_scraper(self, runner, mock_run_scraper):
+        runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--block-resources", "minimal"])
+        assert mock_run_scraper["upcoming"].call_args.kwargs.get("block_resources") == "minimal"
+
+    def test_invalid_block_resources(self, runner, mock_run_scraper):
+        result = runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--block-resources", "all"])
+        assert result.exit_code != 0
+
+    def test_invalid_combo_concurrency(self, runner, mock_run_scraper):
+        result = runner.invoke(cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--combo-concurrency", "0"])
+        assert result.exit_code != 0
+
     def test_historic_single_season_forwarded_as_list(self, runner, mock_run_scraper):
         """Backward compatibility: a single --season value still works, now as a one-element list."""
         runner.invoke(cli, ["historic", "-s", "football", "-l", "england-premier-league", "--season", "2024"])
@@ -369,8 +452,6 @@ class TestLinksOnly:
         assert "--links-only cannot be combined with --match-link" in result.output
 
     def _links_result(self):
-        from oddsharvester.core.scrape_result import ScrapeResult, ScrapeStats
-
         return ScrapeResult(
             success=[
                 {
@@ -504,12 +585,97 @@ class TestMatchLinkBatching:
             assert "--links-only cannot be combined with --match-link" in result.output
 
 
+class TestJobQueue:
+    """Test --enqueue and the worker command."""
+
+    def test_enqueue_collects_instead_of_scraping(self, runner, mock_run_scraper):
+        with patch("oddsharvester.cli.commands.historic.enqueue_run") as enqueue_run:
+            result = runner.invoke(
+                cli,
+                ["historic", "-s", "football", "-l", "england-premier-league", "--season", "2024", "--enqueue", "q.db"],
+            )
+        assert result.exit_code == 0
+        assert not mock_run_scraper["historic"].called
+        queue_path, run_kwargs = enqueue_run.call_args.args
+        assert queue_path == "q.db"
+        assert run_kwargs["command"] == "scrape_historic"
+
+    def test_enqueue_rejects_links_only(self, runner, mock_run_scraper):
+        result = runner.invoke(
+            cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--enqueue", "q.db", "--links-only"]
+        )
+        assert result.exit_code != 0
+        assert "--links-only cannot be combined with --enqueue" in result.output
+
+    def test_enqueue_rejects_workers(self, runner, mock_run_scraper):
+        result = runner.invoke(
+            cli, ["upcoming", "-s", "football", "-d", FUTURE_DATE, "--enqueue", "q.db", "--workers", "2"]
+        )
+        assert result.exit_code != 0
+        assert "--enqueue cannot be combined with --workers" in result.output
+
+    def test_enqueue_run_stores_scrape_config_without_proxies(self, runner, tmp_path):
+        queue_path = str(tmp_path / "q.db")
+        links = ["https://www.oddsportal.com/football/a/", "https://www.oddsportal.com/football/b/"]
+        with patch(
+            "oddsharvester.cli.commands.worker.collect_match_links",
+            return_value=LinkCollection(links=links),
+        ):
+            result = runner.invoke(
+                cli,
+                [
+                    "upcoming",
+                    "-s",
+                    "football",
+                    "-d",
+                    FUTURE_DATE,
+                    "--enqueue",
+                    queue_path,
+                    "--proxy-url",
+                    "http://proxy:8080",
+                    "--proxy-pass",
+                    "secret",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "Enqueued 2 new job(s)" in result.output
+        queue = JobQueue(queue_path)
+        try:
+            jobs = queue.claim("test", limit=10)
+        finally:
+            queue.close()
+        assert [j.link for j in jobs] == links
+        assert jobs[0].config["sport"] == "football"
+        assert "proxy_url" not in jobs[0].config
+        assert "proxy_pass" not in jobs[0].config
+
+    def test_worker_command_runs_queue_worker(self, runner, tmp_path):
+        result_data = ScrapeResult(stats=ScrapeStats(total_urls=2, successful=2))
+        with patch("oddsharvester.cli.commands.worker.QueueWorker") as worker_cls:
+            worker_cls.return_value.run = AsyncMock(return_value=result_data)
+            result = runner.invoke(
+                cli,
+                ["worker", "--queue", str(tmp_path / "q.db"), "--batch-size", "5", "--headless", "-c", "2"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "Worker scraped 2 matches" in result.output
+        kwargs = worker_cls.call_args.kwargs
+        assert kwargs["batch_size"] == 5
+        assert kwargs["node_settings"]["headless"] is True
+        assert kwargs["node_settings"]["concurrency_tasks"] == 2
+
+    def test_worker_requires_queue(self, runner):
+        result = runner.invoke(cli, ["worker"])
+        assert result.exit_code != 0
+        assert "--queue" in result.output
+
+
 class TestComboSummaryRendering:
     """Tests for the per-combo summary table gate in `historic` (findings 2 and 4)."""
 
     def _combo_result(self, combo_stats, success=None):
-        from oddsharvester.core.scrape_result import ScrapeResult, ScrapeStats
-
         success = success if success is not None else []
         return ScrapeResult(
             success=success,
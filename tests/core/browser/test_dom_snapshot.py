@@ -0,0 +1,77 @@
+import pytest
+
+from oddsharvester.core.browser.dom_snapshot import (
+    BOOKMAKER_TABLE_REGION,
+    EVENT_HEADER_REGION,
+    LIVE_INFO_REGION,
+    DomSnapshots,
+)
+
+HEADER_HTML = '<div id="react-event-header" data="{}"></div>'
+LIVE_HTML = '<div data-testid="live-info">1st Half 1:0</div>'
+
+
+class TestDomSnapshots:
+    @pytest.mark.asyncio
+    async def test_content_returns_region_fragment(self, mock_page):
+        mock_page.evaluate.return_value = {"epoch": "a:0", "regions": {"event_header": HEADER_HTML}}
+
+        html = await DomSnapshots().content(mock_page, EVENT_HEADER_REGION)
+
+        assert html == HEADER_HTML
+        mock_page.content.assert_not_awaited()
+        args = mock_page.evaluate.await_args.args[1]
+        assert args["regions"][0]["name"] == "event_header"
+        assert args["regions"][0]["required"] == "div#react-event-header"
+
+    @pytest.mark.asyncio
+    async def test_content_falls_back_to_full_page(self, mock_page):
+        mock_page.content.return_value = "<html>full</html>"
+        mock_page.evaluate.return_value = {"epoch": "a:0", "regions": {"bookmaker_table": None}}
+        assert await DomSnapshots().content(mock_page, BOOKMAKER_TABLE_REGION) == "<html>full</html>"
+
+        mock_page.evaluate.side_effect = Exception("Execution context was destroyed")
+        assert await DomSnapshots().content(mock_page, BOOKMAKER_TABLE_REGION) == "<html>full</html>"
+
+    @pytest.mark.asyncio
+    async def test_fragment_reused_until_epoch_changes(self, mock_page):
+        snapshots = DomSnapshots()
+        mock_page.evaluate.return_value = {"epoch": "a:0", "regions": {"live_info": LIVE_HTML}}
+        await snapshots.content(mock_page, LIVE_INFO_REGION)
+
+        # Same epoch: the page sends nothing back for the cached region.
+        mock_page.evaluate.return_value = {"epoch": "a:0", "regions": {}}
+        assert await snapshots.content(mock_page, LIVE_INFO_REGION) == LIVE_HTML
+        args = mock_page.evaluate.await_args.args[1]
+        assert args["epoch"] == "a:0"
+        assert args["cached"] == ["live_info"]
+
+        # A click or navigation since: the page re-reads the region.
+        mock_page.evaluate.return_value = {"epoch": "a:1", "regions": {"live_info": ""}}
+        assert await snapshots.content(mock_page, LIVE_INFO_REGION) == ""
+
+    @pytest.mark.asyncio
+    async def test_unavailable_region_is_not_cached(self, mock_page):
+        snapshots = DomSnapshots()
+        mock_page.evaluate.return_value = {"epoch": "a:0", "regions": {"event_header": None, "live_info": LIVE_HTML}}
+
+        assert await snapshots.snapshot(mock_page, EVENT_HEADER_REGION, LIVE_INFO_REGION) == {
+            "event_header": None,
+            "live_info": LIVE_HTML,
+        }
+
+        await snapshots.snapshot(mock_page, EVENT_HEADER_REGION)
+        assert mock_page.evaluate.await_args.args[1]["cached"] == ["live_info"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forgets_page(self, mock_page):
+        snapshots = DomSnapshots()
+        mock_page.evaluate.return_value = {"epoch": "a:0", "regions": {"live_info": LIVE_HTML}}
+        await snapshots.content(mock_page, LIVE_INFO_REGION)
+
+        snapshots.invalidate(mock_page)
+        await snapshots.content(mock_page, LIVE_INFO_REGION)
+
+        args = mock_page.evaluate.await_args.args[1]
+        assert args["epoch"] is None
+        assert args["cached"] == []
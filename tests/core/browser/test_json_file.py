@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+
+import pytest
+
+from oddsharvester.core.browser.json_file import path_from_env, read_json, write_json_atomically
+
+ENV_VAR = "OH_TEST_JSON_FILE"
+
+
+def test_path_from_env(monkeypatch, tmp_path):
+    default = tmp_path / "default.json"
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    assert path_from_env(ENV_VAR, default) == default
+
+    monkeypatch.setenv(ENV_VAR, " ")
+    assert path_from_env(ENV_VAR, default) is None
+
+    monkeypatch.setenv(ENV_VAR, str(tmp_path / "other.json"))
+    assert path_from_env(ENV_VAR, default) == tmp_path / "other.json"
+
+
+def test_read_json_missing_or_unreadable(tmp_path, caplog):
+    logger = logging.getLogger("test")
+    path = tmp_path / "data.json"
+    assert read_json(None, logger, "data") is None
+    assert read_json(path, logger, "data") is None
+
+    path.write_text("{not json", encoding="utf-8")
+    assert read_json(path, logger, "test data") is None
+    assert "Ignoring unreadable test data" in caplog.text
+
+
+def test_write_json_atomically_round_trips(tmp_path):
+    path = tmp_path / "nested" / "data.json"
+    write_json_atomically(path, {"b": "é", "a": 1}, sort_keys=True)
+    write_json_atomically(path, {"b": "é", "a": 2}, sort_keys=True)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2, "b": "é"}
+    assert read_json(path, logging.getLogger("test"), "data") == {"a": 2, "b": "é"}
+    assert [p.name for p in path.parent.iterdir()] == ["data.json"]
+
+
+def test_concurrent_writers_never_share_a_temp_file(tmp_path):
+    """Shard and queue-worker processes write the same cache file; each write must land whole."""
+    path = tmp_path / "labels.json"
+    payloads = [{"writer": i, "labels": {f"code-{j}": f"label {i}" for j in range(200)}} for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda payload: write_json_atomically(path, payload), payloads))
+
+    assert json.loads(path.read_text(encoding="utf-8")) in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["labels.json"]
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "data.json"
+    write_json_atomically(path, {"a": 1})
+
+    with pytest.raises(TypeError):
+        write_json_atomically(path, {"a": object()})
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
@@ -0,0 +1,63 @@
+import json
+
+from oddsharvester.core.browser.market_label_cache import (
+    DEFAULT_MARKET_LABEL_CACHE_PATH,
+    MARKET_LABEL_CACHE_ENV_VAR,
+    MarketLabelCache,
+    mirror_origin,
+)
+
+ES_MATCH = "https://www.oddsportal.es/football/h2h/a/b/#abcd:1X2;2"
+ES_OTHER_MATCH = "https://www.oddsportal.es/football/spain/laliga/c-d/#efgh:ah;2"
+
+
+class TestMarketLabelCache:
+    def test_labels_are_keyed_by_mirror(self):
+        cache = MarketLabelCache()
+        cache.learn(ES_MATCH, "Más/Menos de", "over-under")
+
+        assert cache.label_for(ES_OTHER_MATCH, "over-under") == "Más/Menos de"
+        assert cache.label_for("https://www.oddsportal.com/football/h2h/a/b/", "over-under") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "labels.json"
+        MarketLabelCache(path).learn(ES_MATCH, "Más/Menos de", "over-under")
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "https://www.oddsportal.es": {"over-under": "Más/Menos de"}
+        }
+        assert MarketLabelCache(path).label_for(ES_OTHER_MATCH, "over-under") == "Más/Menos de"
+
+    def test_forget_removes_the_persisted_label(self, tmp_path):
+        path = tmp_path / "labels.json"
+        cache = MarketLabelCache(path)
+        cache.learn(ES_MATCH, "Más/Menos de", "over-under")
+        cache.learn(ES_MATCH, "Hándicap asiático", "ah")
+
+        cache.forget(ES_OTHER_MATCH, "over-under")
+
+        reloaded = MarketLabelCache(path)
+        assert reloaded.label_for(ES_MATCH, "over-under") is None
+        assert reloaded.label_for(ES_MATCH, "ah") == "Hándicap asiático"
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "labels.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert MarketLabelCache(path).label_for(ES_MATCH, "over-under") is None
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(MARKET_LABEL_CACHE_ENV_VAR, raising=False)
+        assert MarketLabelCache.from_env().path == DEFAULT_MARKET_LABEL_CACHE_PATH
+
+        monkeypatch.setenv(MARKET_LABEL_CACHE_ENV_VAR, str(tmp_path / "labels.json"))
+        assert MarketLabelCache.from_env().path == tmp_path / "labels.json"
+
+        monkeypatch.setenv(MARKET_LABEL_CACHE_ENV_VAR, "")
+        assert MarketLabelCache.from_env().path is None
+
+
+def test_mirror_origin():
+    assert mirror_origin(ES_MATCH) == "https://www.oddsportal.es"
+    assert mirror_origin("HTTPS://WWW.OddsPortal.com/football/") == "https://www.oddsportal.com"
+    assert mirror_origin(None) == ""
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from oddsharvester.core.browser.market_navigation import MarketTabNavigator
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+from oddsharvester.utils.constants import FRAGMENT_NAVIGATION_MAX_MISSES
 
 
 class TestMarketTabNavigator:
@@ -142,6 +144,51 @@ class TestMarketTabNavigator:
             result = await navigator._navigate_by_code(mock_page, "correct-score")
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_navigate_by_code_caches_every_scanned_label(self, navigator, mock_page):
+        """The scan caches each label with the code it opened, so the next match clicks the right tab first."""
+        labels = ["1X2", "Más/Menos de"]
+        elements = [AsyncMock(text_content=AsyncMock(return_value=t)) for t in labels]
+        mock_page.query_selector_all = AsyncMock(return_value=elements)
+        mapping = {"1X2": "1X2", "Más/Menos de": "over-under"}
+
+        async def fake_click(page, selector, text):
+            page.url = f"https://www.oddsportal.es/football/h2h/a/b/#abcd:{mapping[text]};2"
+            return True
+
+        with (
+            patch.object(navigator, "_open_more_dropdown", return_value=True),
+            patch.object(navigator, "_click_by_text", side_effect=fake_click) as click,
+        ):
+            assert await navigator._navigate_by_code(mock_page, "over-under") is True
+            assert navigator.label_cache.label_for(mock_page.url, "1X2") == "1X2"
+
+            mock_page.url = "https://www.oddsportal.es/football/h2h/c/d/#efgh:1X2;2"
+            click.reset_mock()
+            result = await navigator.navigate_to_tab(mock_page, "Over/Under")
+
+            assert result is True
+            click.assert_awaited_once_with(mock_page, OddsPortalSelectors.MARKET_TAB_ITEM_SELECTOR, "Más/Menos de")
+
+    @pytest.mark.asyncio
+    async def test_stale_cached_label_is_forgotten(self, navigator, mock_page):
+        """A cached label that opens another market is dropped and the usual search runs."""
+        mock_page.url = "https://www.oddsportal.es/football/h2h/a/b/#abcd:1X2;2"
+        navigator.label_cache.learn(mock_page.url, "Más/Menos de", "over-under")
+
+        with (
+            patch.object(navigator, "_open_more_dropdown", return_value=True),
+            patch.object(navigator, "_click_by_text", return_value=True),
+            patch.object(navigator, "_wait_and_click", return_value=False),
+            patch.object(navigator, "_click_more_if_market_hidden", return_value=False),
+            patch.object(navigator, "_navigate_by_code", return_value=True) as code_fallback,
+        ):
+            result = await navigator.navigate_to_tab(mock_page, "Over/Under")
+
+        assert result is True
+        code_fallback.assert_awaited_once_with(mock_page, "over-under")
+        assert navigator.label_cache.label_for(mock_page.url, "over-under") is None
+
     @pytest.mark.asyncio
     async def test_navigate_by_code_no_tabs(self, navigator, mock_page):
         """_navigate_by_code returns False when there are no market tabs."""
@@ -524,6 +571,62 @@ class TestMarketTabNavigator:
                 assert "Attempting to navigate to market tab: Draw No Bet" in caplog.text
                 assert "Successfully navigated to Draw No Bet tab" in caplog.text
 
+    # =============================================================================
+    # URL-FRAGMENT NAVIGATION TESTS
+    # =============================================================================
+
+    @pytest.mark.asyncio
+    async def test_navigate_by_fragment_switches_market_and_period(self, navigator, mock_page):
+        """The market code and period scope are written into the fragment; no tab is clicked."""
+        mock_page.url = "https://www.oddsportal.com/football/england/premier-league/leicester-brentford-xQ77QTN0/"
+        mock_page.evaluate = AsyncMock(return_value={"switched": True, "tab": "Over/Under", "elapsedMs": 240.0})
+
+        with patch.object(navigator, "_wait_and_click") as click:
+            result = await navigator.navigate_to_tab(mock_page, "Over/Under", period_scope=2)
+
+        assert result is True
+        click.assert_not_called()
+        args = mock_page.evaluate.call_args.args[1]
+        assert args["fragment"] == "xQ77QTN0:over-under;2"
+        assert args["marketChanges"] is True
+
+    @pytest.mark.asyncio
+    async def test_navigate_by_fragment_already_there(self, navigator, mock_page):
+        mock_page.url = "https://www.oddsportal.com/football/h2h/barcelona-SKbpVP5K/leganes-Mi0rXQg7/#hYV97ShC:bts;2"
+
+        assert await navigator._navigate_by_fragment(mock_page, "bts", 2) is True
+        mock_page.evaluate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fragment_route_ignored_falls_back_to_clicks(self, navigator, mock_page):
+        """When the content keeps ignoring the fragment, tabs are clicked, and the route is given up on the mirror."""
+        mock_page.url = "https://www.oddsportal.com/football/h2h/barcelona-SKbpVP5K/leganes-Mi0rXQg7/#hYV97ShC:1X2;2"
+        mock_page.evaluate = AsyncMock(return_value={"switched": False, "tab": "1X2", "elapsedMs": 1500.0})
+
+        with (
+            patch.object(navigator, "_wait_and_click", return_value=True),
+            patch.object(navigator, "_verify_tab_is_active", return_value=True),
+        ):
+            for _ in range(FRAGMENT_NAVIGATION_MAX_MISSES + 1):
+                assert await navigator.navigate_to_tab(mock_page, "Over/Under", period_scope=2) is True
+
+        assert mock_page.evaluate.await_count == FRAGMENT_NAVIGATION_MAX_MISSES
+        assert mock_page.evaluate.call_args.args[1]["fragment"] == "hYV97ShC:over-under;2"
+
+    @pytest.mark.asyncio
+    async def test_fragment_route_survives_an_isolated_miss(self, navigator, mock_page):
+        """A slow render that misses the timeout once does not turn fragment routing off."""
+        mock_page.url = "https://www.oddsportal.com/football/h2h/barcelona-SKbpVP5K/leganes-Mi0rXQg7/#hYV97ShC:1X2;2"
+        missed = {"switched": False, "tab": "1X2", "elapsedMs": 1500.0}
+        followed = {"switched": True, "tab": "Over/Under", "elapsedMs": 300.0}
+        outcomes = [missed] * (FRAGMENT_NAVIGATION_MAX_MISSES - 1) + [followed] + [missed] * 2 + [followed]
+        mock_page.evaluate = AsyncMock(side_effect=outcomes)
+
+        for _ in outcomes:
+            await navigator._navigate_by_fragment(mock_page, "over-under", 2)
+
+        assert mock_page.evaluate.await_count == len(outcomes)
+
     # =============================================================================
     # INTEGRATION TESTS
     # =============================================================================
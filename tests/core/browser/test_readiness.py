@@ -0,0 +1,89 @@
+import pytest
+
+from oddsharvester.core.browser.readiness import PageReadiness, ReadinessResult
+from oddsharvester.core.odds_portal_selectors import OddsPortalSelectors
+
+
+class TestPageReadiness:
+    @pytest.fixture
+    def readiness(self):
+        return PageReadiness()
+
+    @pytest.mark.asyncio
+    async def test_ready_returns_without_fixed_wait(self, readiness, mock_page):
+        """Conditions met in the page: no fallback sleep."""
+        mock_page.evaluate.return_value = {
+            "ready": True,
+            "waitedMs": 120.0,
+            "rows": 8,
+            "rowsReady": True,
+            "stable": True,
+            "market": True,
+            "text": True,
+            "idle": True,
+        }
+
+        result = await readiness.odds_rendered(mock_page, timeout_ms=2000)
+
+        assert result == ReadinessResult(ready=True, waited_ms=120.0, rows=8, unmet=())
+        mock_page.wait_for_timeout.assert_not_awaited()
+        args = mock_page.evaluate.call_args.args[1]
+        assert args["rowSelector"] == OddsPortalSelectors.BOOKMAKER_ROW_CSS
+        assert args["minRows"] == 1
+        assert args["timeoutMs"] == 2000
+        assert args["networkIdle"] is True
+
+    @pytest.mark.asyncio
+    async def test_timeout_reports_unmet_conditions(self, readiness, mock_page):
+        mock_page.evaluate.return_value = {
+            "ready": False,
+            "waitedMs": 3000.0,
+            "rows": 0,
+            "rowsReady": True,
+            "stable": True,
+            "market": False,
+            "text": True,
+            "idle": False,
+        }
+
+        result = await readiness.market_active(mock_page, "Over/Under", timeout_ms=3000)
+
+        assert not result.ready
+        assert result.unmet == ("market", "idle")
+        mock_page.wait_for_timeout.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_market_with_known_code_matches_on_url(self, readiness, mock_page):
+        """Markets with a tab code are matched on the URL hash, not the (localized) tab label."""
+        mock_page.evaluate.return_value = {"ready": True}
+        market = next(iter(OddsPortalSelectors.MARKET_TAB_CODES))
+
+        await readiness.market_active(mock_page, market, timeout_ms=3000)
+
+        args = mock_page.evaluate.call_args.args[1]
+        assert args["marketCode"] == OddsPortalSelectors.MARKET_TAB_CODES[market]
+        assert args["marketName"] is None
+        assert args["minRows"] == 0
+
+    @pytest.mark.asyncio
+    async def test_market_without_code_matches_on_tab_text(self, readiness, mock_page):
+        mock_page.evaluate.return_value = {"ready": True}
+
+        await readiness.market_active(mock_page, "Some Unknown Market", timeout_ms=3000)
+
+        args = mock_page.evaluate.call_args.args[1]
+        assert args["marketCode"] is None
+        assert args["marketName"] == "some unknown market"
+        # Only a market tab counts: pagination and nav items also carry an "active" class.
+        assert args["activeTabSelector"] == "li.odds-item[class*='active']"
+
+    @pytest.mark.asyncio
+    async def test_evaluate_failure_falls_back_to_fixed_wait(self, readiness, mock_page):
+        """A context destroyed mid-wait costs the old fixed wait, never less."""
+        mock_page.evaluate.side_effect = Exception("Execution context was destroyed")
+
+        result = await readiness.settled(mock_page, timeout_ms=2500)
+
+        assert not result.ready
+        assert result.unmet == ("evaluate",)
+        mock_page.wait_for_timeout.assert_awaited_once_with(2500)
@@ -0,0 +1,123 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from oddsharvester.core.browser.resource_blocking import ResourceBlocker
+from oddsharvester.utils.constants import BLOCKED_RESOURCE_SIZE_ESTIMATE_BYTES
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
+
+MATCH_URL = "https://www.oddsportal.com/football/england/premier-league/leicester-brentford-xQ77QTN0/"
+LOGO_URL = "https://cci2.oddsportal.com/bookmakers/logo.png"
+
+
+def _route(resource_type, url, main_frame=True):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.request.frame.parent_frame = None if main_frame else MagicMock()
+    route.fallback = AsyncMock()
+    route.abort = AsyncMock()
+    return route
+
+
+class TestShouldBlock:
+    @pytest.mark.parametrize(
+        ("resource_type", "url", "blocked"),
+        [
+            ("document", MATCH_URL, False),
+            ("script", "https://www.oddsportal.com/build/app.js", False),
+            ("xhr", "https://www.oddsportal.com/feed/match-event/1-1-xQ77QTN0.dat", False),
+            ("stylesheet", "https://www.oddsportal.com/build/app.css", False),
+            ("image", LOGO_URL, True),
+            ("font", "https://www.oddsportal.com/fonts/inter.woff2", True),
+            ("media", "https://www.oddsportal.com/clip.mp4", True),
+            ("script", "https://www.googletagmanager.com/gtm.js", True),
+            ("script", "https://cdn.cookielaw.org/otSDKStub.js", False),
+        ],
+    )
+    def test_balanced(self, resource_type, url, blocked):
+        assert ResourceBlocker(ResourceBlockProfile.BALANCED).should_block(resource_type, url) is blocked
+
+    @pytest.mark.parametrize(
+        ("resource_type", "url", "blocked"),
+        [
+            ("script", "https://www.oddsportal.com/build/app.js", False),
+            ("fetch", "https://www.oddsportal.com/ajax-user-data/", False),
+            ("stylesheet", "https://www.oddsportal.com/build/app.css", False),
+            ("image", LOGO_URL, True),
+            ("other", "https://www.oddsportal.com/manifest.json", True),
+            ("script", "https://cdn.cookielaw.org/otSDKStub.js", True),
+        ],
+    )
+    def test_minimal(self, resource_type, url, blocked):
+        assert ResourceBlocker(ResourceBlockProfile.MINIMAL).should_block(resource_type, url) is blocked
+
+    def test_off_blocks_nothing(self):
+        blocker = ResourceBlocker(ResourceBlockProfile.OFF)
+        assert not blocker.should_block("image", LOGO_URL)
+        assert not blocker.should_block("script", "https://www.googletagmanager.com/gtm.js")
+
+    def test_minimal_treats_navigated_mirror_as_first_party(self):
+        blocker = ResourceBlocker(ResourceBlockProfile.MINIMAL)
+        assert blocker.should_block("script", "https://static.oddsportal.es/app.js")
+
+        assert not blocker.should_block("document", "https://www.oddsportal.es/football/")
+        assert not blocker.should_block("script", "https://static.oddsportal.es/app.js")
+
+    def test_minimal_mirror_under_a_country_suffix_keeps_other_sites_third_party(self):
+        blocker = ResourceBlocker(ResourceBlockProfile.MINIMAL)
+        assert not blocker.should_block("document", "https://www.oddsportal.com.br/futebol/")
+
+        assert not blocker.should_block("script", "https://static.oddsportal.com.br/app.js")
+        assert blocker.should_block("script", "https://tracker.com.br/tag.js")
+        assert blocker.should_block("script", "https://www.anothersite.co.uk/app.js")
+
+    def test_minimal_blocks_third_party_iframes(self):
+        blocker = ResourceBlocker(ResourceBlockProfile.MINIMAL)
+        assert blocker.should_block("document", "https://ads.example.net/slot.html", main_frame=False)
+        assert blocker.should_block("script", "https://ads.example.net/slot.js")
+
+
+class TestRouting:
+    @pytest.mark.asyncio
+    async def test_handle_aborts_and_counts_blocked_requests(self):
+        blocker = ResourceBlocker(ResourceBlockProfile.BALANCED)
+        image = _route("image", LOGO_URL)
+        font = _route("font", "https://www.oddsportal.com/fonts/inter.woff2")
+        page = _route("document", MATCH_URL)
+
+        for route in (image, font, page):
+            await blocker._handle(route)
+
+        image.abort.assert_awaited_once_with("blockedbyclient")
+        page.fallback.assert_awaited_once()
+        page.abort.assert_not_awaited()
+        assert blocker.stats.to_dict() == {
+            "requests_allowed": 1,
+            "requests_blocked": 2,
+            "blocked_by_type": {"image": 1, "font": 1},
+            "estimated_bytes_saved": BLOCKED_RESOURCE_SIZE_ESTIMATE_BYTES["image"]
+            + BLOCKED_RESOURCE_SIZE_ESTIMATE_BYTES["font"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_abort_is_tolerated(self):
+        blocker = ResourceBlocker(ResourceBlockProfile.BALANCED)
+        route = _route("image", LOGO_URL)
+        route.abort.side_effect = Exception("Target page, context or browser has been closed")
+
+        await blocker._handle(route)
+
+        assert blocker.stats.blocked == 1
+
+    @pytest.mark.asyncio
+    async def test_attach_skipped_when_off(self):
+        context = MagicMock()
+        context.route = AsyncMock()
+
+        await ResourceBlocker(ResourceBlockProfile.OFF).attach(context)
+        context.route.assert_not_awaited()
+
+        blocker = ResourceBlocker(ResourceBlockProfile.BALANCED)
+        await blocker.attach(context)
+        context.route.assert_awaited_once_with("**/*", blocker._handle)
@@ -68,6 +68,46 @@ class TestPageScroller:
         )
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_scroll_until_loaded_in_page_engine_single_call(self, scroller, mock_page):
+        """The in-page engine settles the page in one evaluate, with no polling from Python."""
+        mock_page.evaluate.return_value = {"stable": True, "count": 50, "initialCount": 12, "elapsedMs": 900}
+
+        result = await scroller.scroll_until_loaded(
+            mock_page, timeout=30, scroll_pause_time=2, max_scroll_attempts=3, content_check_selector=".row"
+        )
+
+        assert result is True
+        mock_page.evaluate.assert_awaited_once()
+        args = mock_page.evaluate.call_args.args[1]
+        assert args["selector"] == ".row"
+        # Quiet for as long as 3 unchanged checks 2 s apart.
+        assert args["quietMs"] == 6000
+        assert args["timeoutMs"] == 30000
+        mock_page.wait_for_timeout.assert_not_awaited()
+        mock_page.query_selector_all.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_scroll_until_loaded_in_page_engine_timeout(self, scroller, mock_page):
+        """An engine timeout keeps the contract: False, so a short listing page is not taken as the last."""
+        mock_page.evaluate.return_value = {"stable": False, "count": 20, "initialCount": 12, "elapsedMs": 30000}
+
+        result = await scroller.scroll_until_loaded(mock_page, timeout=30, content_check_selector=".row")
+
+        assert result is False
+        mock_page.evaluate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scroll_until_loaded_falls_back_when_engine_fails(self, scroller, mock_page):
+        """A failed in-page run (e.g. the context was destroyed) falls back to step-by-step scrolling."""
+        mock_page.evaluate.side_effect = [Exception("Execution context was destroyed"), 1000, 1000, 1000, 1000, 1000]
+        mock_page.wait_for_timeout = AsyncMock()
+
+        result = await scroller.scroll_until_loaded(mock_page, timeout=1, scroll_pause_time=0.1, max_scroll_attempts=1)
+
+        assert result is True
+        mock_page.wait_for_timeout.assert_awaited()
+
     @pytest.mark.asyncio
     async def test_scroll_until_visible_and_click_parent_success_with_text(self, scroller, mock_page):
         """Test successful scroll and click with text matching."""
@@ -201,3 +241,48 @@ class TestPageScroller:
 
         result = await scroller.scroll_until_loaded(mock_page, timeout=1, scroll_pause_time=0.1, max_scroll_attempts=2)
         assert result is True
+
+    @pytest.mark.asyncio
+    async def test_scroll_until_visible_and_click_parent_in_page(self, scroller, mock_page):
+        """The element is located, scrolled to and its parent clicked in one evaluate."""
+        mock_page.evaluate.return_value = {"clicked": True, "matches": 42, "scrolls": 3, "elapsedMs": 310.0}
+
+        result = await scroller.scroll_until_visible_and_click_parent(
+            mock_page, "test-selector", "+2.5", timeout=20, scroll_pause_time=3
+        )
+
+        assert result is True
+        mock_page.evaluate.assert_awaited_once()
+        args = mock_page.evaluate.call_args.args[1]
+        assert args["selector"] == "test-selector"
+        assert args["text"] == "+2.5"
+        assert args["timeoutMs"] == 20000
+        mock_page.query_selector_all.assert_not_awaited()
+        mock_page.wait_for_timeout.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_scroll_until_visible_and_click_parent_in_page_not_found(self, scroller, mock_page):
+        """Not found in the page is final: no element-by-element pass afterwards."""
+        mock_page.evaluate.return_value = {"clicked": False, "matches": 40, "scrolls": 200, "elapsedMs": 20000.0}
+
+        result = await scroller.scroll_until_visible_and_click_parent(mock_page, "test-selector", "+9.5", timeout=20)
+
+        assert result is False
+        mock_page.query_selector_all.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_scroll_until_visible_and_click_parent_evaluate_failure_falls_back(self, scroller, mock_page):
+        mock_element = AsyncMock()
+        mock_element.text_content.return_value = "Asian Handicap +2.5"
+        mock_element.bounding_box.return_value = {"x": 0, "y": 0, "width": 100, "height": 50}
+        parent = AsyncMock()
+        mock_element.evaluate_handle.return_value = parent
+        mock_page.query_selector_all.return_value = [mock_element]
+        mock_page.evaluate.side_effect = Exception("Execution context was destroyed")
+
+        result = await scroller.scroll_until_visible_and_click_parent(
+            mock_page, "test-selector", "+2.5", timeout=1, scroll_pause_time=0.1
+        )
+
+        assert result is True
+        parent.click.assert_awaited_once()
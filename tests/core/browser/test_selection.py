@@ -54,6 +54,21 @@ class TestSelectionManager:
         assert result is True
         mock_page.click.assert_not_called()
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("strategy", "target_value", "display_label"), STRATEGIES)
+    async def test_already_selected_is_verified_in_one_evaluate(
+        self, manager, mock_page, strategy, target_value, display_label
+    ):
+        mock_page.evaluate = AsyncMock(return_value=True)
+        mock_page.query_selector = AsyncMock()
+
+        result = await manager.ensure_selected(mock_page, target_value, display_label, strategy)
+
+        assert result is True
+        mock_page.evaluate.assert_awaited_once()
+        assert mock_page.evaluate.await_args.args[1]["targetValue"] == target_value
+        mock_page.query_selector.assert_not_called()
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(("strategy", "target_value", "display_label"), STRATEGIES)
     async def test_returns_true_when_click_and_wait_succeed(
@@ -0,0 +1,53 @@
+import json
+
+from oddsharvester.core.browser.storage_state import (
+    DEFAULT_STORAGE_STATE_PATH,
+    STORAGE_STATE_ENV_VAR,
+    StorageStateStore,
+)
+
+ODDS_FORMAT_COOKIE = {"name": "op_user_odds_format", "value": "1", "domain": ".oddsportal.com", "path": "/"}
+
+
+class TestStorageStateStore:
+    def test_round_trips_cookies_and_local_storage(self, tmp_path):
+        store = StorageStateStore(tmp_path / "state.json")
+        origins = [{"origin": "https://www.oddsportal.com", "localStorage": [{"name": "bookies", "value": "all"}]}]
+
+        assert store.save({"cookies": [ODDS_FORMAT_COOKIE], "origins": origins}) is True
+        assert store.load() == {"cookies": [ODDS_FORMAT_COOKIE], "origins": origins}
+
+    def test_drops_client_bound_bot_management_cookies(self, tmp_path):
+        store = StorageStateStore(tmp_path / "state.json")
+        cookies = [ODDS_FORMAT_COOKIE, {"name": "cf_clearance", "value": "x"}, {"name": "__cf_bm", "value": "y"}]
+
+        store.save({"cookies": cookies, "origins": []})
+
+        assert store.load()["cookies"] == [ODDS_FORMAT_COOKIE]
+
+    def test_missing_or_unreadable_file_loads_nothing(self, tmp_path):
+        path = tmp_path / "state.json"
+        assert StorageStateStore(path).load() is None
+
+        path.write_text("{not json", encoding="utf-8")
+        assert StorageStateStore(path).load() is None
+
+    def test_disabled_store_saves_nothing(self):
+        assert StorageStateStore().save({"cookies": [ODDS_FORMAT_COOKIE], "origins": []}) is False
+        assert StorageStateStore().load() is None
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(STORAGE_STATE_ENV_VAR, raising=False)
+        assert StorageStateStore.from_env().path == DEFAULT_STORAGE_STATE_PATH
+
+        monkeypatch.setenv(STORAGE_STATE_ENV_VAR, "")
+        assert StorageStateStore.from_env().path is None
+
+        monkeypatch.setenv(STORAGE_STATE_ENV_VAR, str(tmp_path / "state.json"))
+        assert StorageStateStore.from_env().path == tmp_path / "state.json"
+
+    def test_saved_file_is_playwright_storage_state(self, tmp_path):
+        path = tmp_path / "nested" / "state.json"
+        StorageStateStore(path).save({"cookies": [ODDS_FORMAT_COOKIE], "origins": []})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"cookies": [ODDS_FORMAT_COOKIE], "origins": []}
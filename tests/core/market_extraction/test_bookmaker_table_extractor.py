@@ -0,0 +1,78 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from oddsharvester.core.market_extraction.bookmaker_table_extractor import (
+    ODDS_EXTRACTION_ENV_VAR,
+    BookmakerTableExtractor,
+)
+
+IN_PAGE_RESULT = {
+    "rows": [
+        {"bookmaker_name": "Bookmaker1", "odds": ["1.901.90", "3.50", "4.20"], "blocked": [False, True, False]},
+        {"bookmaker_name": "Bookmaker2", "odds": ["1.85", "3.60"], "blocked": [False, False]},
+    ],
+    "blocks": 2,
+    "scoped": True,
+}
+
+
+@pytest.fixture
+def page():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_rows_read_in_page_go_through_the_parser_rules(page):
+    page.evaluate = AsyncMock(return_value=IN_PAGE_RESULT)
+
+    odds = await BookmakerTableExtractor().extract_market_odds(page, "FullTime", ["1", "X", "2"])
+
+    # Duplicated value collapsed, blocked cell flagged, incomplete Bookmaker2 row skipped.
+    assert odds == [
+        {
+            "1": "1.90",
+            "X": "3.50",
+            "2": "4.20",
+            "bookmaker_name": "Bookmaker1",
+            "period": "FullTime",
+            "blocked_outcomes": ["X"],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_target_bookmaker_is_passed_to_the_script(page):
+    page.evaluate = AsyncMock(return_value={"rows": [], "blocks": 2})
+
+    odds = await BookmakerTableExtractor().extract_market_odds(page, "FullTime", ["1", "2"], target_bookmaker="Pinn")
+
+    assert odds == []
+    assert page.evaluate.await_args.args[1]["targetBookmaker"] == "Pinn"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "evaluate",
+    [
+        AsyncMock(side_effect=Exception("Execution context was destroyed")),
+        AsyncMock(return_value=None),
+        AsyncMock(return_value={"rows": [], "blocks": 0}),
+    ],
+    ids=["script-failed", "unexpected-result", "no-rows"],
+)
+async def test_defers_to_html_parser(page, evaluate):
+    page.evaluate = evaluate
+
+    assert await BookmakerTableExtractor().extract_market_odds(page, "FullTime", ["1", "2"]) is None
+
+
+@pytest.mark.asyncio
+async def test_html_mode_never_runs_the_script(page, monkeypatch):
+    monkeypatch.setenv(ODDS_EXTRACTION_ENV_VAR, "html")
+    page.evaluate = AsyncMock(return_value=IN_PAGE_RESULT)
+
+    extractor = BookmakerTableExtractor.from_env()
+
+    assert await extractor.extract_market_odds(page, "FullTime", ["1", "X", "2"]) is None
+    page.evaluate.assert_not_called()
@@ -0,0 +1,49 @@
+import logging
+
+from oddsharvester.core.market_extraction.market_planner import MarketNavigationPlanner, TabVisit
+
+
+def _method(main_market):
+    """A registry-style market method with `main_market` in its closure."""
+    odds_labels = None
+    return lambda self, page, period, hist, bk, preview, sport: (main_market, odds_labels)
+
+
+MARKET_METHODS = {
+    "1x2": _method("1X2"),
+    "over_under_2_5": _method("Over/Under"),
+    "btts": _method("Both Teams to Score"),
+    "over_under_3_5": _method("Over/Under"),
+    "unknown": object(),
+}
+
+
+class TestMarketNavigationPlanner:
+    def test_groups_markets_by_main_market_tab(self):
+        plan = MarketNavigationPlanner().plan(["1x2", "over_under_2_5", "btts", "over_under_3_5"], MARKET_METHODS)
+
+        assert plan.visits == [
+            TabVisit("1X2", ["1x2"]),
+            TabVisit("Over/Under", ["over_under_2_5", "over_under_3_5"]),
+            TabVisit("Both Teams to Score", ["btts"]),
+        ]
+        assert plan.markets == ["1x2", "over_under_2_5", "over_under_3_5", "btts"]
+        assert (plan.planned_navigations, plan.naive_navigations) == (3, 4)
+
+    def test_active_tab_is_visited_first(self):
+        plan = MarketNavigationPlanner().plan(
+            ["1x2", "over_under_2_5", "over_under_3_5"], MARKET_METHODS, active_tab="Over/Under"
+        )
+
+        assert plan.markets == ["over_under_2_5", "over_under_3_5", "1x2"]
+
+    def test_market_without_known_tab_keeps_its_own_visit(self):
+        plan = MarketNavigationPlanner().plan(["unknown", "1x2"], MARKET_METHODS)
+
+        assert plan.visits == [TabVisit(None, ["unknown"]), TabVisit("1X2", ["1x2"])]
+
+    def test_logs_planned_and_naive_navigations(self, caplog):
+        with caplog.at_level(logging.INFO):
+            MarketNavigationPlanner().plan(["over_under_2_5", "1x2", "over_under_3_5"], MARKET_METHODS)
+
+        assert "3 markets on 2 tab visits (naive order: 3 tab navigations)" in caplog.text
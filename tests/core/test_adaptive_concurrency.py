@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+
+from oddsharvester.core.adaptive_concurrency import AimdConcurrencyController, percentile
+from oddsharvester.core.scrape_result import ErrorType
+
+
+def _feed(controller, n, latency=1.0, error_type=None):
+    for _ in range(n):
+        limit = controller.record(latency, error_type)
+    return limit
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 95) == 0.0
+
+
+def test_starts_at_half_ceiling():
+    assert AimdConcurrencyController(ceiling=8).limit == 4
+    assert AimdConcurrencyController(ceiling=1).limit == 1
+    assert AimdConcurrencyController(ceiling=8, initial=2).limit == 2
+
+
+def test_floor_never_exceeds_ceiling():
+    controller = AimdConcurrencyController(ceiling=2, floor=5)
+    assert controller.floor == 2
+    assert controller.limit == 2
+
+
+def test_no_change_before_window_fills():
+    controller = AimdConcurrencyController(ceiling=10, initial=4, window=5)
+    assert _feed(controller, 4) == 4
+
+
+def test_additive_increase_when_healthy():
+    controller = AimdConcurrencyController(ceiling=10, initial=4, window=5)
+    assert _feed(controller, 5) == 5
+    assert _feed(controller, 5) == 6
+
+
+def test_increase_capped_at_ceiling():
+    controller = AimdConcurrencyController(ceiling=3, initial=3, window=2)
+    assert _feed(controller, 10) == 3
+
+
+def test_multiplicative_decrease_on_rate_limited():
+    controller = AimdConcurrencyController(ceiling=16, initial=8, window=5)
+    _feed(controller, 3)
+    assert _feed(controller, 2, error_type=ErrorType.RATE_LIMITED) == 4
+
+
+def test_navigation_errors_also_back_off():
+    controller = AimdConcurrencyController(ceiling=16, initial=8, window=5)
+    _feed(controller, 4)
+    assert _feed(controller, 1, error_type=ErrorType.NAVIGATION) == 4
+
+
+def test_decrease_stops_at_floor():
+    controller = AimdConcurrencyController(ceiling=16, floor=2, initial=3, window=2)
+    assert _feed(controller, 10, error_type=ErrorType.RATE_LIMITED) == 2
+
+
+def test_non_throttling_failures_hold():
+    """Parsing failures are a page problem, not a load problem: no cut, but no growth either."""
+    controller = AimdConcurrencyController(ceiling=16, initial=4, window=5)
+    _feed(controller, 3)
+    assert _feed(controller, 2, error_type=ErrorType.PARSING) == 4
+
+
+def test_latency_regression_holds():
+    controller = AimdConcurrencyController(ceiling=16, initial=4, window=5)
+    assert _feed(controller, 5, latency=2.0) == 5
+    assert _feed(controller, 5, latency=10.0) == 5
+    assert controller.baseline_p95 == 2.0
+
+
+def test_every_change_is_logged(caplog):
+    controller = AimdConcurrencyController(ceiling=16, initial=4, window=2)
+    with caplog.at_level(logging.INFO, logger="oddsharvester.core.adaptive_concurrency"):
+        _feed(controller, 2)
+        _feed(controller, 2, error_type=ErrorType.RATE_LIMITED)
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert any("4 -> 5" in m and "healthy" in m for m in messages)
+    assert any("5 -> 2" in m and "backing off" in m for m in messages)
+
+
+@pytest.mark.parametrize("limit", [0, -3])
+def test_limit_clamped_to_floor(limit):
+    controller = AimdConcurrencyController(ceiling=4, initial=limit)
+    assert controller.limit == 1
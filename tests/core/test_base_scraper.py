@@ -1,3 +1,4 @@
+import asyncio
 from datetime import UTC, date, datetime, timedelta
 import json as _json
 import logging
@@ -13,13 +14,19 @@ from oddsharvester.core.base_scraper import (
     _extract_fragment_match_id,
     _is_offscreen_row,
     _parse_date_header,
+    _parse_event_header_html,
     _parse_live_info,
     _row_has_started,
     _row_kickoff_datetime,
 )
+from oddsharvester.core.browser.dom_snapshot import _SNAPSHOT_JS
 from oddsharvester.core.odds_portal_market_extractor import OddsPortalMarketExtractor
 from oddsharvester.core.odds_portal_scraper import OddsPortalScraper
+from oddsharvester.core.page_pool import PagePoolStats
+from oddsharvester.core.parser_backend import BS4_BACKEND, LXML_BACKEND
+from oddsharvester.core.phase_timing import timed_market, timed_phase
 from oddsharvester.core.playwright_manager import PlaywrightManager
+from oddsharvester.core.retry import RetryConfig
 from oddsharvester.utils.constants import NAVIGATION_TIMEOUT_MS, ODDSPORTAL_BASE_URL
 from oddsharvester.utils.odds_format_enum import OddsFormat
 
@@ -51,6 +58,12 @@ def setup_base_scraper_mocks():
     playwright_manager_mock.non_default_context_keys = MagicMock(return_value=[])
     playwright_manager_mock.report_page_result = MagicMock()
     playwright_manager_mock.blacklist_proxy = MagicMock()
+    playwright_manager_mock.configure_lanes = MagicMock()
+    playwright_manager_mock.lane_count = MagicMock(return_value=1)
+    playwright_manager_mock.release_page = MagicMock()
+    playwright_manager_mock.return_page = AsyncMock()
+    playwright_manager_mock.warm_page_pools = AsyncMock()
+    playwright_manager_mock.page_pool_stats = MagicMock(return_value=PagePoolStats())
 
     selection_manager_mock = AsyncMock()
 
@@ -1160,6 +1173,142 @@ async def test_extract_match_odds_uses_rotated_page(setup_base_scraper_mocks):
     pm.report_page_result.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_iter_match_odds_yields_each_outcome(setup_base_scraper_mocks):
+    """Every link yields one outcome tagged with its input index, success or failure."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    scraper._scrape_match_data = AsyncMock(side_effect=[{"match": "data1"}, None])
+
+    links = ["https://oddsportal.com/match1", "https://oddsportal.com/match2"]
+    outcomes = [
+        o
+        async for o in scraper.iter_match_odds(
+            sport="football",
+            match_links=links,
+            markets=["1x2"],
+            retry_config=RetryConfig(max_attempts=1),
+            season="2023-2024",
+        )
+    ]
+
+    by_index = {o.index: o for o in outcomes}
+    assert sorted(by_index) == [0, 1]
+    assert by_index[0].link == links[0]
+    assert by_index[0].data == {"match": "data1", "season": "2023-2024"}
+    assert by_index[0].failed is None
+    assert by_index[1].data is None
+    assert by_index[1].failed.url == links[1]
+
+
+@pytest.mark.asyncio
+async def test_iter_match_odds_close_cancels_pending(setup_base_scraper_mocks):
+    """Stopping the consumer early must not leave match scrapes running in the background."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def scrape(**kwargs):
+        if kwargs["match_link"].endswith("slow"):
+            started.set()
+            await release.wait()
+        return {"match": kwargs["match_link"]}
+
+    scraper._scrape_match_data = AsyncMock(side_effect=scrape)
+
+    stream = scraper.iter_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/fast", "https://oddsportal.com/slow"],
+        concurrent_scraping_task=2,
+        request_delay=0,
+    )
+    first = await anext(stream)
+    await started.wait()
+    await stream.aclose()
+
+    assert first.data == {"match": "https://oddsportal.com/fast"}
+    # Both pages, including the cancelled one, go back to the pool.
+    assert mocks["playwright_manager_mock"].return_page.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_streams_to_record_sink(setup_base_scraper_mocks):
+    """With a record sink, successes go to the sink and are counted but not buffered; failures stay."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    sink = MagicMock()
+    scraper.record_sink = sink
+    scraper._scrape_match_data = AsyncMock(side_effect=[{"match": "data1"}, None])
+
+    result = await scraper.extract_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"],
+        markets=["1x2"],
+        concurrent_scraping_task=1,
+        retry_config=RetryConfig(max_attempts=1),
+        request_delay=0,
+    )
+
+    sink.assert_called_once_with({"match": "data1"})
+    assert result.success == []
+    assert result.stats.successful == 1
+    assert result.stats.failed == 1
+    assert [f.url for f in result.failed] == ["https://oddsportal.com/match2"]
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_keeps_link_order(setup_base_scraper_mocks):
+    """Buffered results come back in input order even when later links finish first."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    delays = {"https://oddsportal.com/a": 0.03, "https://oddsportal.com/b": 0.0, "https://oddsportal.com/c": 0.01}
+
+    async def scrape(**kwargs):
+        await asyncio.sleep(delays[kwargs["match_link"]])
+        return {"match": kwargs["match_link"]}
+
+    scraper._scrape_match_data = AsyncMock(side_effect=scrape)
+
+    result = await scraper.extract_match_odds(
+        sport="football", match_links=list(delays), concurrent_scraping_task=3, request_delay=0
+    )
+
+    assert [row["match"] for row in result.success] == list(delays)
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_reports_phase_latency(setup_base_scraper_mocks):
+    """Phases timed inside a match scrape land in that match's breakdown, and only there."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+
+    async def scrape(**kwargs):
+        with timed_phase("navigation"):
+            await asyncio.sleep(0)
+        if kwargs["match_link"].endswith("a"):
+            with timed_market("1x2"):
+                await asyncio.sleep(0)
+        return {"match": kwargs["match_link"]}
+
+    scraper._scrape_match_data = AsyncMock(side_effect=scrape)
+    links = ["https://oddsportal.com/a", "https://oddsportal.com/b"]
+
+    result = await scraper.extract_match_odds(
+        sport="football", match_links=links, concurrent_scraping_task=2, request_delay=0
+    )
+
+    latency = result.to_dict()["latency"]
+    by_url = {m["url"]: m for m in latency["slowest_matches"]}
+    assert set(by_url) == set(links)
+    assert set(by_url[links[0]]["markets"]) == {"1x2"}
+    assert by_url[links[1]]["markets"] == {}
+    # Timing data stays out of the match records.
+    assert all("latency" not in row for row in result.success)
+    assert latency["phases"]["navigation"]["count"] == 2
+    assert latency["markets"]["1x2"]["count"] == 1
+
+
 @pytest.mark.asyncio
 async def test_scrape_match_data(setup_base_scraper_mocks):
     """Test scraping data for a specific match."""
@@ -1533,13 +1682,12 @@ async def test_extract_match_details_invalid_json(setup_base_scraper_mocks):
 
 
 @pytest.mark.asyncio
-@patch("oddsharvester.core.base_scraper.asyncio.sleep", new_callable=AsyncMock)
-async def test_extract_match_odds_rate_limiting(mock_sleep, setup_base_scraper_mocks):
-    """Test that rate limiting delay is applied between match requests."""
+async def test_extract_match_odds_rate_limiting(setup_base_scraper_mocks):
+    """Pacing is delegated to the per-proxy lanes, and every lane slot taken is handed back."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
+    pm = mocks["playwright_manager_mock"]
 
-    # Mock _scrape_match_data to return data directly
     scraper._scrape_match_data = AsyncMock(side_effect=[{"match": "data1"}, {"match": "data2"}, {"match": "data3"}])
 
     match_links = [
@@ -1548,7 +1696,6 @@ async def test_extract_match_odds_rate_limiting(mock_sleep, setup_base_scraper_m
         "https://oddsportal.com/match3",
     ]
 
-    # Use concurrent_scraping_task=1 to force sequential execution for predictable test behavior
     result = await scraper.extract_match_odds(
         sport="football",
         match_links=match_links,
@@ -1557,18 +1704,17 @@ async def test_extract_match_odds_rate_limiting(mock_sleep, setup_base_scraper_m
         request_delay=2.0,
     )
 
-    # First request should not have a delay, subsequent ones should
-    # With concurrency=1, requests are sequential so we expect 2 sleep calls (for 2nd and 3rd requests)
-    assert mock_sleep.call_count == 2
+    pm.configure_lanes.assert_called_once_with(per_proxy_concurrency=1, request_delay=2.0)
+    assert pm.release_page.call_count == 3
     assert len(result.success) == 3
 
 
 @pytest.mark.asyncio
-@patch("oddsharvester.core.base_scraper.asyncio.sleep", new_callable=AsyncMock)
-async def test_extract_match_odds_no_delay_when_zero(mock_sleep, setup_base_scraper_mocks):
-    """Test that no delay is applied when request_delay is 0."""
+async def test_extract_match_odds_no_delay_when_zero(setup_base_scraper_mocks):
+    """Test that a zero request_delay is passed through to the lanes unchanged."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
+    pm = mocks["playwright_manager_mock"]
 
     scraper._scrape_match_data = AsyncMock(side_effect=[{"match": "data1"}, {"match": "data2"}])
 
@@ -1582,10 +1728,90 @@ async def test_extract_match_odds_no_delay_when_zero(mock_sleep, setup_base_scra
         request_delay=0,
     )
 
-    mock_sleep.assert_not_called()
+    pm.configure_lanes.assert_called_once_with(per_proxy_concurrency=1, request_delay=0)
     assert len(result.success) == 2
 
 
+@pytest.mark.asyncio
+async def test_extract_match_odds_sizes_pool_per_lane(setup_base_scraper_mocks):
+    """Each healthy proxy lane gets its own share of workers."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    mocks["playwright_manager_mock"].lane_count = MagicMock(return_value=3)
+
+    await scraper.extract_match_odds(sport="football", match_links=[], concurrent_scraping_task=2)
+
+    assert scraper.worker_pool.workers == 6
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_warms_page_pools_and_returns_pages(setup_base_scraper_mocks):
+    """Tabs are pre-opened per context and handed back to the pool instead of closed."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    pm = mocks["playwright_manager_mock"]
+    scraper._scrape_match_data = AsyncMock(return_value={"match": "data"})
+
+    await scraper.extract_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"],
+        concurrent_scraping_task=4,
+        request_delay=0,
+    )
+
+    pm.warm_page_pools.assert_awaited_once_with(2)
+    assert pm.return_page.await_count == 2
+    mocks["page_mock"].close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_draws_pages_from_the_shared_match_budget(setup_base_scraper_mocks):
+    """With a budget set (concurrent combos), each match holds a slot while its page is open."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    mocks["playwright_manager_mock"].lane_count = MagicMock(return_value=2)
+    budget = scraper.share_match_budget(concurrent_scraping_task=3)
+    in_use = []
+
+    async def scrape(**kwargs):
+        in_use.append(budget.in_use)
+        return {"match": "data"}
+
+    scraper._scrape_match_data = AsyncMock(side_effect=scrape)
+
+    await scraper.extract_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"],
+        concurrent_scraping_task=3,
+        request_delay=0,
+    )
+
+    assert budget.capacity == 6
+    assert all(n >= 1 for n in in_use)
+    assert budget.in_use == 0
+    assert sum(budget.granted.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_adaptive_concurrency_starts_below_ceiling(setup_base_scraper_mocks):
+    """In adaptive mode --concurrency is the ceiling; the pool starts at half of it."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    scraper.adaptive_concurrency = True
+    scraper._scrape_match_data = AsyncMock(return_value={"match": "data"})
+
+    result = await scraper.extract_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/match1"],
+        concurrent_scraping_task=6,
+        request_delay=0,
+    )
+
+    assert scraper.worker_pool.workers == 6
+    assert scraper.worker_pool.limit == 3
+    assert result.stats.successful == 1
+
+
 def test_resolved_browser_timezone_defaults_to_utc(setup_base_scraper_mocks):
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
@@ -2000,6 +2226,31 @@ def _make_react_event_header_html(event_id: str, start_date: int = 1681753200) -
     return f"<html><body><div id=\"react-event-header\" data='{_json.dumps(payload)}'></div></body></html>"
 
 
+@pytest.mark.parametrize(
+    "body",
+    [
+        _make_date_html() + _make_teams_html() + _make_league_html(),
+        _make_date_html(date_str="not a date,") + _make_teams_html(away=None) + _make_league_html(with_link=False),
+        '<section><div data-testid="game-time-item"><p>Tue</p><p>16 Jun 2020,</p><p>20:00</p></div>'
+        '<div><div class="flex">Final result&nbsp;2:0 (1:0,&nbsp;1:0)</div></div></section>',
+        "<div>nothing here</div>",
+    ],
+)
+@pytest.mark.parametrize("header_id", ["WbDmMwm1", None])
+def test_parse_event_header_html_lxml_matches_bs4(body, header_id):
+    html = body
+    if header_id:
+        html = _make_react_event_header_html(header_id).replace("</body>", f"{body}</body>")
+    tz = ZoneInfo("Europe/Brussels")
+
+    assert _parse_event_header_html(html, tz, LXML_BACKEND) == _parse_event_header_html(html, tz, BS4_BACKEND)
+
+
+def _h2h_trigger_awaits(page_mock):
+    """`page.evaluate` awaits other than the header's DOM snapshot reads (i.e. the hashchange trigger)."""
+    return [call for call in page_mock.evaluate.await_args_list if call.args[:1] != (_SNAPSHOT_JS,)]
+
+
 @pytest.mark.asyncio
 async def test_resolve_h2h_fragment_mismatch_success_returns_updated_payload(setup_base_scraper_mocks):
     """When wait_for_function succeeds, re-parsed soup + json reflect the requested match id."""
@@ -2019,7 +2270,7 @@ async def test_resolve_h2h_fragment_mismatch_success_returns_updated_payload(set
     assert result is not None
     _soup, json_data = result
     assert json_data["eventData"]["id"] == "WbDmMwm1"
-    page_mock.evaluate.assert_awaited_once()
+    assert len(_h2h_trigger_awaits(page_mock)) == 1
     page_mock.wait_for_function.assert_awaited_once()
 
 
@@ -2055,7 +2306,8 @@ async def test_resolve_h2h_fragment_mismatch_passes_fragment_to_evaluate(setup_b
 
     await scraper._resolve_h2h_fragment_mismatch(page=page_mock, fragment="abc")
 
-    args, kwargs = page_mock.evaluate.await_args
+    (trigger_await,) = _h2h_trigger_awaits(page_mock)
+    args, kwargs = trigger_await
     # The fragment is the second positional arg to page.evaluate(expression, arg)
     # Accept either positional or keyword form, but the value must equal "abc"
     if len(args) >= 2:
@@ -2064,6 +2316,26 @@ async def test_resolve_h2h_fragment_mismatch_passes_fragment_to_evaluate(setup_b
         assert kwargs.get("arg") == "abc"
 
 
+@pytest.mark.asyncio
+async def test_extract_match_details_reads_event_header_region(setup_base_scraper_mocks):
+    """The header is parsed from the event-header snapshot; the full page is not serialised."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    page_mock = mocks["page_mock"]
+
+    page_mock.evaluate = AsyncMock(
+        return_value={"epoch": "a:0", "regions": {"event_header": _make_react_event_header_html("WbDmMwm1")}}
+    )
+
+    result = await scraper._extract_match_details_event_header(
+        page=page_mock,
+        match_link="https://www.oddsportal.com/baseball/h2h/a/b/#WbDmMwm1",
+    )
+
+    assert result["home_team"] == "Royals"
+    page_mock.content.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_extract_match_details_h2h_fragment_match_skips_resync(setup_base_scraper_mocks):
     """When URL fragment equals eventData.id, no resync attempt is made."""
@@ -2081,7 +2353,7 @@ async def test_extract_match_details_h2h_fragment_match_skips_resync(setup_base_
     )
 
     assert result is not None
-    page_mock.evaluate.assert_not_awaited()
+    assert _h2h_trigger_awaits(page_mock) == []
     page_mock.wait_for_function.assert_not_awaited()
 
 
@@ -2111,7 +2383,7 @@ async def test_extract_match_details_h2h_fragment_mismatch_resolved(setup_base_s
     assert "2026-05-22" not in (result["match_date"] or "")
     # The corrected match's date should be present
     assert "2025-04-15" in (result["match_date"] or "")
-    page_mock.evaluate.assert_awaited_once()
+    assert len(_h2h_trigger_awaits(page_mock)) == 1
     page_mock.wait_for_function.assert_awaited_once()
 
 
@@ -2188,7 +2460,7 @@ async def test_extract_match_details_h2h_fragment_mismatch_dom_resolved_no_resyn
     assert result["away_team"] == "Leganes"
     assert result["home_score"] == "2"
     assert result["away_score"] == "0"
-    page_mock.evaluate.assert_not_awaited()
+    assert _h2h_trigger_awaits(page_mock) == []
     page_mock.wait_for_function.assert_not_awaited()
 
 
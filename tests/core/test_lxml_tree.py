@@ -0,0 +1,46 @@
+import re
+
+import pytest
+
+from oddsharvester.core import lxml_tree
+
+
+class TestLxmlTree:
+    HTML = """
+    <div id="row" class="border-black-borders flex h-9">
+        <p class="odds font-bold"> 1.90 <!-- stale --> </p>
+        <p>2<script>var x = 1;</script>.10<style>p {}</style></p>
+        <div data-testid="over-under-collapsed-option-box" title="">nested</div>
+    </div>
+    """
+
+    def test_find_all_searches_descendants_in_document_order(self):
+        root = lxml_tree.parse_html(self.HTML)
+        row = lxml_tree.find(root, "div", class_=re.compile("border-black-borders"))
+
+        assert row.get("id") == "row"
+        assert [lxml_tree.get_text(p) for p in lxml_tree.find_all(row, "p")] == ["1.90", "2.10"]
+        assert lxml_tree.find_all(row, "div", class_=re.compile("border-black-borders")) == []
+
+    def test_class_matching_follows_beautifulsoup(self):
+        row = lxml_tree.find(lxml_tree.parse_html(self.HTML), "div")
+
+        assert lxml_tree.class_matches(row, "flex")
+        assert lxml_tree.class_matches(row, "border-black-borders flex h-9")
+        assert not lxml_tree.class_matches(row, "border-black")
+        assert lxml_tree.class_matches(row, re.compile(r"^border-black-borders flex h-9"))
+
+    def test_attribute_matching(self):
+        root = lxml_tree.parse_html(self.HTML)
+
+        assert lxml_tree.find(root, "div", attrs={"data-testid": re.compile("over-under")}) is not None
+        assert lxml_tree.find(root, "div", attrs={"title": True}) is not None
+        assert lxml_tree.find(root, "p", attrs={"title": True}) is None
+
+    def test_get_text_separator(self):
+        root = lxml_tree.parse_html("<div><p>Final result</p> 2:0 <span>(1:0, 1:0)</span></div>")
+        assert lxml_tree.get_text(lxml_tree.find(root, "div"), separator=" ") == "Final result 2:0 (1:0, 1:0)"
+
+    @pytest.mark.parametrize("html", ["", "   ", None])
+    def test_nothing_to_parse(self, html):
+        assert lxml_tree.parse_html(html) is None
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from oddsharvester.core.match_budget import MatchBudget, bind_share
+
+
+async def _hold(budget, share, order, release):
+    bind_share(share)
+    await budget.acquire()
+    order.append(share)
+    await release.wait()
+    budget.release()
+
+
+@pytest.mark.asyncio
+async def test_acquire_is_immediate_while_slots_are_free():
+    budget = MatchBudget(capacity=2)
+    await budget.acquire()
+    await budget.acquire()
+
+    assert budget.in_use == 2
+    budget.release()
+    assert budget.in_use == 1
+
+
+@pytest.mark.asyncio
+async def test_capacity_is_never_exceeded():
+    budget = MatchBudget(capacity=3)
+    active = 0
+    peak = 0
+
+    async def scrape(share):
+        nonlocal active, peak
+        bind_share(share)
+        await budget.acquire()
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        budget.release()
+
+    await asyncio.gather(*(scrape(i % 2) for i in range(12)))
+
+    assert peak == 3
+    assert budget.in_use == 0
+    assert budget.granted == {0: 6, 1: 6}
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_go_to_shares_in_turn():
+    """A share with many queued waiters does not get every freed slot ahead of a smaller one."""
+    budget = MatchBudget(capacity=1)
+    order: list[str] = []
+    release = asyncio.Event()
+    bind_share("holder")
+    await budget.acquire()
+
+    tasks = [asyncio.create_task(_hold(budget, "big", order, release)) for _ in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(_hold(budget, "small", order, release)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert budget.waiting == 6
+
+    release.set()
+    budget.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["big", "small", "big", "small", "big", "big"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    budget = MatchBudget(capacity=1)
+    await budget.acquire()
+    waiter = asyncio.create_task(budget.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert budget.waiting == 0
+    budget.release()
+    assert budget.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_granted_to_a_cancelled_waiter_is_given_back():
+    budget = MatchBudget(capacity=1)
+    await budget.acquire()
+    waiter = asyncio.create_task(budget.acquire())
+    await asyncio.sleep(0)
+
+    budget.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert budget.in_use == 0
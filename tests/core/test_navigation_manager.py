@@ -46,7 +46,7 @@ class TestNavigationManager:
         # Assert
         assert result is True
         tab_navigator_mock.navigate_to_tab.assert_called_once_with(
-            page=page_mock, market_tab_name=market_tab_name, timeout=DEFAULT_MARKET_TIMEOUT_MS
+            page=page_mock, market_tab_name=market_tab_name, timeout=DEFAULT_MARKET_TIMEOUT_MS, period_scope=None
         )
 
     @pytest.mark.asyncio
@@ -78,6 +78,21 @@ class TestNavigationManager:
         assert result is True
         page_mock.wait_for_timeout.assert_called_with(MARKET_SWITCH_WAIT_TIME_MS)
 
+    @pytest.mark.asyncio
+    async def test_wait_for_market_switch_returns_once_page_is_ready(self, navigation_manager, page_mock):
+        """When the in-page readiness check passes, the fixed switch wait is not slept."""
+        page_mock.evaluate = AsyncMock(return_value={"ready": True, "waitedMs": 80.0})
+        page_mock.url = "https://www.oddsportal.com/football/a/b/match/#over-under;2"
+        mock_active_tab = AsyncMock()
+        mock_active_tab.text_content = AsyncMock(return_value="Over/Under")
+        page_mock.query_selector = AsyncMock(return_value=mock_active_tab)
+
+        result = await navigation_manager.wait_for_market_switch(page_mock, "Over/Under")
+
+        assert result is True
+        page_mock.wait_for_timeout.assert_not_awaited()
+        assert page_mock.evaluate.call_args.args[1]["timeoutMs"] == MARKET_SWITCH_WAIT_TIME_MS
+
     @pytest.mark.asyncio
     async def test_wait_for_market_switch_wrong_market(self, navigation_manager, page_mock):
         """Test market switch wait with wrong market name."""
@@ -307,3 +307,69 @@ class TestOddsHistoryExtractor:
         """Test that logger is properly initialized."""
         assert odds_history_extractor.logger is not None
         assert odds_history_extractor.logger.name == "OddsHistoryExtractor"
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmakers_in_page(self, odds_history_extractor, page_mock):
+        """All modals are harvested in one evaluate, without per-cell hovers or sleeps."""
+        # Arrange
+        page_mock.evaluate = AsyncMock(
+            return_value={
+                "modals": {"Bookmaker1": ["<div>1</div>", "<div>X</div>"], "Bookmaker2": ["<div>2</div>"]},
+                "missing": {},
+                "cells": 3,
+                "elapsedMs": 180.0,
+            }
+        )
+
+        # Act
+        result = await odds_history_extractor.extract_odds_history_for_bookmakers(
+            page_mock, ["Bookmaker1", "Bookmaker2", "Bookmaker1"]
+        )
+
+        # Assert
+        assert result == {"Bookmaker1": ["<div>1</div>", "<div>X</div>"], "Bookmaker2": ["<div>2</div>"]}
+        page_mock.evaluate.assert_awaited_once()
+        assert page_mock.evaluate.call_args.args[1]["bookmakers"] == ["Bookmaker1", "Bookmaker2"]
+        page_mock.query_selector_all.assert_not_awaited()
+        page_mock.wait_for_timeout.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmakers_rehovers_missing(self, odds_history_extractor, page_mock):
+        """A bookmaker with a modal that never showed up is captured again with real hovers."""
+        # Arrange
+        page_mock.evaluate = AsyncMock(
+            return_value={"modals": {"Bookmaker1": ["<div>1</div>"], "Bookmaker2": []}, "missing": {"Bookmaker2": 2}}
+        )
+        odds_history_extractor.extract_odds_history_for_bookmaker = AsyncMock(return_value=["<div>hovered</div>"])
+
+        # Act
+        result = await odds_history_extractor.extract_odds_history_for_bookmakers(
+            page_mock, ["Bookmaker1", "Bookmaker2"]
+        )
+
+        # Assert
+        assert result == {"Bookmaker1": ["<div>1</div>"], "Bookmaker2": ["<div>hovered</div>"]}
+        odds_history_extractor.extract_odds_history_for_bookmaker.assert_awaited_once_with(page_mock, "Bookmaker2")
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmakers_evaluate_failure(self, odds_history_extractor, page_mock):
+        """Without the in-page script, every bookmaker is hovered one by one."""
+        # Arrange
+        page_mock.evaluate = AsyncMock(side_effect=Exception("Execution context was destroyed"))
+        odds_history_extractor.extract_odds_history_for_bookmaker = AsyncMock(return_value=["<div>hovered</div>"])
+
+        # Act
+        result = await odds_history_extractor.extract_odds_history_for_bookmakers(
+            page_mock, ["Bookmaker1", "Bookmaker2"]
+        )
+
+        # Assert
+        assert result == {"Bookmaker1": ["<div>hovered</div>"], "Bookmaker2": ["<div>hovered</div>"]}
+        assert odds_history_extractor.extract_odds_history_for_bookmaker.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmakers_empty(self, odds_history_extractor, page_mock):
+        result = await odds_history_extractor.extract_odds_history_for_bookmakers(page_mock, [])
+
+        assert result == {}
+        page_mock.evaluate.assert_not_awaited()
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from oddsharvester.core.market_extraction.odds_parser import OddsParser, parse_odds_value
+from oddsharvester.core.parser_backend import BS4_BACKEND, LXML_BACKEND
 
 
 class TestOddsParser:
@@ -515,6 +516,51 @@ class TestOddsParser:
         assert odds_parser.logger.name == "OddsParser"
 
 
+class TestOddsParserLxmlBackend:
+    """The lxml backend reads the same bookmaker rows as BeautifulSoup."""
+
+    SCOPED_TABLE_HTML = """
+    <div class="border-black-borders flex h-9"><img class="bookmaker-logo" title="H2H Team"/></div>
+    <div>
+        <div data-testid="bookmaker-table-header-line"></div>
+        <div class="border-black-borders flex h-9">
+            <a title="Go to Betfair Exchange website!"><img alt="logo"/></a>
+            <div class="flex-center flex-col font-bold"><p>2.10<!-- 9.99 --></p><script>0</script></div>
+            <div class="flex-center flex-col font-bold"><span class="line-through">3.20</span></div>
+        </div>
+        <div class="border-black-borders flex h-9"><img alt="Pinnacle"/>
+            <div class="flex-center flex-col font-bold">&nbsp;1.95 </div>
+        </div>
+    </div>
+    """
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            TestOddsParser.SAMPLE_HTML_ODDS,
+            TestOddsParser.SAMPLE_HTML_BLOCKED_ODDS,
+            TestOddsParser.SAMPLE_HTML_PARTIALLY_BLOCKED_ODDS,
+            TestOddsParser.SAMPLE_HTML_BLOCKED_ODDS_LINK_VARIANT,
+            SCOPED_TABLE_HTML,
+            "<div>No bookmakers found</div>",
+            "",
+        ],
+    )
+    @pytest.mark.parametrize("target_bookmaker", [None, "Bookmaker2", "Betfair Exchange"])
+    def test_same_rows_as_bs4(self, html, target_bookmaker):
+        expected = OddsParser(BS4_BACKEND).parse_bookmaker_rows(html, target_bookmaker)
+
+        assert OddsParser(LXML_BACKEND).parse_bookmaker_rows(html, target_bookmaker) == expected
+
+    def test_reads_scoped_table(self):
+        rows = OddsParser(LXML_BACKEND).parse_bookmaker_rows(self.SCOPED_TABLE_HTML)
+
+        assert rows == [
+            {"bookmaker_name": "Betfair Exchange", "odds": ["2.10", "3.20"], "blocked": [False, True]},
+            {"bookmaker_name": "Pinnacle", "odds": ["1.95"], "blocked": [False]},
+        ]
+
+
 class TestParseOddsValue:
     """Unit tests for the parse_odds_value helper."""
 
@@ -5,7 +5,7 @@ import pytest
 
 from oddsharvester.core.browser.selection import PERIOD_STRATEGY
 from oddsharvester.core.odds_portal_market_extractor import OddsPortalMarketExtractor
-from oddsharvester.core.sport_market_registry import SportMarketRegistry
+from oddsharvester.core.sport_market_registry import SportMarketRegistrar, SportMarketRegistry
 from oddsharvester.core.sport_period_registry import SportPeriodRegistry
 
 # Sample HTML for testing
@@ -226,12 +226,40 @@ class TestOddsPortalMarketExtractor:
 
         # Assert
         extractor.navigation_manager.navigate_to_market_tab.assert_called_once_with(
-            page=page_mock, market_tab_name=main_market
+            page=page_mock, market_tab_name=main_market, period_scope=None
         )
         extractor.odds_parser.parse_market_odds.assert_called_once()
         assert len(result) == 1
         assert result[0]["bookmaker_name"] == "Bookmaker1"
 
+    @pytest.mark.asyncio
+    async def test_extract_market_odds_reads_the_table_in_page(self, extractor, page_mock):
+        """Odds read by the in-page script skip page.content() and the HTML parser."""
+        extractor.navigation_manager.navigate_to_market_tab = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_page_load = AsyncMock()
+        extractor.odds_parser.parse_market_odds = MagicMock()
+        page_mock.evaluate = AsyncMock(
+            return_value={
+                "rows": [{"bookmaker_name": "Bookmaker1", "odds": ["1.90", "3.50", "4.20"], "blocked": [False] * 3}],
+                "blocks": 1,
+            }
+        )
+
+        result = await extractor.extract_market_odds(page=page_mock, main_market="1X2", odds_labels=["1", "X", "2"])
+
+        page_mock.content.assert_not_called()
+        extractor.odds_parser.parse_market_odds.assert_not_called()
+        assert result == [
+            {
+                "1": "1.90",
+                "X": "3.50",
+                "2": "4.20",
+                "bookmaker_name": "Bookmaker1",
+                "period": "FullTime",
+                "submarket_name": "1X2",
+            }
+        ]
+
     @pytest.mark.asyncio
     async def test_extract_market_odds_with_specific_market(self, extractor, page_mock):
         """Test extracting odds with a specific sub-market."""
@@ -842,6 +870,62 @@ class TestOddsPortalMarketExtractor:
         assert result["over_under_1_5_market"] is None
         assert result["over_under_2_5_market"] is None
 
+    @pytest.mark.asyncio
+    async def test_scrape_markets_visits_each_main_market_tab_once(self, extractor, page_mock):
+        """Markets sharing a tab are scraped in one visit: one navigation and period check per tab."""
+        extractor.navigation_manager.navigate_to_market_tab = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_market_switch = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_page_load = AsyncMock()
+        extractor.navigation_manager.select_specific_market = AsyncMock(return_value=True)
+        extractor.navigation_manager.close_specific_market = AsyncMock(return_value=True)
+        extractor.odds_parser.parse_market_odds = MagicMock(return_value=[{"bookmaker_name": "Bookmaker1"}])
+        extractor.period_selector.select_by_scope = AsyncMock(return_value=True)
+        create = SportMarketRegistrar.create_market_lambda
+        market_methods = {
+            "1x2": create("1X2", odds_labels=["1", "X", "2"]),
+            "over_under_2_5": create("Over/Under", "Over/Under +2.5", ["odds_over", "odds_under"]),
+            "btts": create("Both Teams to Score", odds_labels=["btts_yes", "btts_no"]),
+            "over_under_3_5": create("Over/Under", "Over/Under +3.5", ["odds_over", "odds_under"]),
+        }
+
+        with patch.object(SportMarketRegistry, "get_market_mapping", return_value=market_methods):
+            result = await extractor.scrape_markets(page=page_mock, sport="football", markets=list(market_methods))
+
+        tabs = [
+            call.kwargs["market_tab_name"]
+            for call in extractor.navigation_manager.navigate_to_market_tab.call_args_list
+        ]
+        assert tabs == ["1X2", "Over/Under", "Both Teams to Score"]
+        assert extractor.period_selector.select_by_scope.await_count == 3
+        assert [
+            call.kwargs["specific_market"]
+            for call in extractor.navigation_manager.select_specific_market.call_args_list
+        ] == [
+            "Over/Under +2.5",
+            "Over/Under +3.5",
+        ]
+        assert list(result) == ["1x2_market", "over_under_2_5_market", "btts_market", "over_under_3_5_market"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_markets_renavigates_after_failed_market(self, extractor, page_mock):
+        """A market that fails on a tab does not let the next market on it skip navigation."""
+        extractor.navigation_manager.navigate_to_market_tab = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_market_switch = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_page_load = AsyncMock()
+        extractor.navigation_manager.select_specific_market = AsyncMock(side_effect=[Exception("detached"), True])
+        extractor.navigation_manager.close_specific_market = AsyncMock(return_value=True)
+        extractor.odds_parser.parse_market_odds = MagicMock(return_value=[])
+        create = SportMarketRegistrar.create_market_lambda
+        market_methods = {
+            "over_under_2_5": create("Over/Under", "Over/Under +2.5", ["odds_over", "odds_under"]),
+            "over_under_3_5": create("Over/Under", "Over/Under +3.5", ["odds_over", "odds_under"]),
+        }
+
+        with patch.object(SportMarketRegistry, "get_market_mapping", return_value=market_methods):
+            await extractor.scrape_markets(page=page_mock, sport="football", markets=list(market_methods))
+
+        assert extractor.navigation_manager.navigate_to_market_tab.await_count == 2
+
     @pytest.mark.asyncio
     async def test_extract_market_odds_uses_scope_code_when_verified(
         self, extractor, page_mock, selection_manager_mock
@@ -969,6 +1053,34 @@ class TestOddsPortalMarketExtractor:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_extract_market_odds_history_batches_bookmakers(self, extractor, page_mock):
+        """Odds history for every parsed bookmaker is captured in a single batched call."""
+        extractor.navigation_manager.navigate_to_market_tab = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_market_switch = AsyncMock(return_value=True)
+        extractor.navigation_manager.wait_for_page_load = AsyncMock()
+        extractor.odds_parser.parse_market_odds = MagicMock(
+            return_value=[
+                {"bookmaker_name": "Bookmaker1", "1": "1.90", "period": "FullTime"},
+                {"bookmaker_name": "Bookmaker2", "1": "1.85", "period": "FullTime"},
+            ]
+        )
+        extractor.odds_history_extractor.extract_odds_history_for_bookmakers = AsyncMock(
+            return_value={"Bookmaker1": [SAMPLE_HTML_ODDS_HISTORY], "Bookmaker2": []}
+        )
+        extractor.odds_parser.parse_odds_history_modal = MagicMock(return_value={"odds_history": []})
+        page_mock.content = AsyncMock(return_value="<div>test</div>")
+
+        result = await extractor.extract_market_odds(
+            page=page_mock, main_market="1X2", odds_labels=["1"], scrape_odds_history=True
+        )
+
+        extractor.odds_history_extractor.extract_odds_history_for_bookmakers.assert_awaited_once_with(
+            page_mock, ["Bookmaker1", "Bookmaker2"]
+        )
+        assert result[0]["odds_history_data"] == [{"odds_history": []}]
+        assert "odds_history_data" not in result[1]
+
     @pytest.mark.asyncio
     async def test_extract_market_odds_history_skips_filtered_bk(self, extractor, page_mock):
         """Test that odds history is skipped for bookmakers not matching target."""
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date
 import logging
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
@@ -9,8 +10,14 @@ from oddsharvester.core.odds_portal_market_extractor import OddsPortalMarketExtr
 from oddsharvester.core.odds_portal_scraper import LinkCollectionResult, OddsPortalScraper
 from oddsharvester.core.playwright_manager import PlaywrightManager
 from oddsharvester.core.scrape_result import ErrorType, ScrapeResult, ScrapeStats
-from oddsharvester.utils.constants import GOTO_TIMEOUT_LONG_MS, MAX_PAGINATION_PAGES, RESULTS_PAGE_SIZE
+from oddsharvester.utils.constants import (
+    GOTO_TIMEOUT_LONG_MS,
+    LISTING_PAGE_CONCURRENCY,
+    MAX_PAGINATION_PAGES,
+    RESULTS_PAGE_SIZE,
+)
 from oddsharvester.utils.proxy_manager import ProxyManager
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 
 
 @pytest.fixture
@@ -31,6 +38,7 @@ def setup_scraper_mocks():
     playwright_manager_mock.page = page_mock
     playwright_manager_mock.context = context_mock
     playwright_manager_mock.browser = browser_mock
+    playwright_manager_mock.listing_contexts = MagicMock(side_effect=lambda: [playwright_manager_mock.context])
 
     cookie_dismisser_mock = AsyncMock()
 
@@ -63,7 +71,12 @@ async def test_start_playwright(setup_scraper_mocks):
     # Test with default parameters
     await scraper.start_playwright()
     mocks["playwright_manager_mock"].initialize.assert_called_once_with(
-        headless=True, user_agent=None, locale=None, timezone_id=None, proxy_manager=None
+        headless=True,
+        user_agent=None,
+        locale=None,
+        timezone_id=None,
+        proxy_manager=None,
+        block_profile=ResourceBlockProfile.OFF,
     )
 
     # Reset the mock and test with custom parameters
@@ -80,6 +93,7 @@ async def test_start_playwright(setup_scraper_mocks):
         browser_locale_timezone=custom_locale,
         browser_timezone_id=custom_timezone,
         proxy_manager=proxy_manager,
+        block_profile=ResourceBlockProfile.MINIMAL,
     )
 
     mocks["playwright_manager_mock"].initialize.assert_called_once_with(
@@ -88,6 +102,7 @@ async def test_start_playwright(setup_scraper_mocks):
         locale=custom_locale,
         timezone_id=custom_timezone,
         proxy_manager=proxy_manager,
+        block_profile=ResourceBlockProfile.MINIMAL,
     )
 
 
@@ -121,16 +136,27 @@ async def test_scrape_historic(url_builder_mock, setup_scraper_mocks):
         successful_pages=2,
         failed_pages=[],
     )
-    scraper._collect_match_links = AsyncMock(return_value=link_result)
 
-    # Mock extract_match_odds to return ScrapeResult
+    async def collect(**kwargs):
+        await kwargs["on_links"](link_result.links)
+        return link_result
+
+    scraper._collect_match_links = AsyncMock(side_effect=collect)
+
+    # Mock extract_match_odds to drain the link stream and return ScrapeResult
     mock_scrape_result = ScrapeResult(
         success=[{"match": "data1"}, {"match": "data2"}],
         failed=[],
         partial=[],
         stats=ScrapeStats(total_urls=2, successful=2, failed=0, partial=0),
     )
-    scraper.extract_match_odds = AsyncMock(return_value=mock_scrape_result)
+    streamed_links = []
+
+    async def extract(**kwargs):
+        streamed_links.extend([link async for link in kwargs["match_links"]])
+        return mock_scrape_result
+
+    scraper.extract_match_odds = AsyncMock(side_effect=extract)
     scraper._prepare_page_for_scraping = AsyncMock()
 
     # Call the method under test
@@ -156,10 +182,12 @@ async def test_scrape_historic(url_builder_mock, setup_scraper_mocks):
         pages_to_scrape=[1, 2],
         page_limit=2,
         max_pages=2,
+        on_links=ANY,
     )
+    assert streamed_links == ["https://oddsportal.com/match1", "https://oddsportal.com/match2"]
     scraper.extract_match_odds.assert_called_once_with(
         sport="football",
-        match_links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"],
+        match_links=ANY,
         markets=["1x2"],
         scrape_odds_history=True,
         target_bookmaker="bet365",
@@ -168,6 +196,7 @@ async def test_scrape_historic(url_builder_mock, setup_scraper_mocks):
         bookies_filter=ANY,
         period=ANY,
         request_delay=ANY,
+        season="2023",
     )
 
     # Verify the result is a ScrapeResult
@@ -578,8 +607,7 @@ def full_page(prefix: str) -> list[str]:
 def instant_listing_retry():
     """Skip the backoff between a failed listing page and its re-fetch.
 
-    asyncio.sleep is the module's only use of asyncio, so nothing else in the walk
-    depends on this.
+    The re-fetch backoff is the walk's only sleep, so nothing else in it depends on this.
     """
     with patch("oddsharvester.core.odds_portal_scraper.asyncio.sleep", new_callable=AsyncMock) as sleep_mock:
         yield sleep_mock
@@ -1170,3 +1198,189 @@ async def test_collect_match_links_respects_the_page_limit(setup_scraper_mocks,
     assert len(result.links) == 150
     assert result.successful_pages == 3
     assert any("raise --max-pages" in r.message for r in caplog.records)
+
+
+class _ListingTab:
+    """A listing tab whose goto yields to the event loop, so pages fetched in parallel overlap."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self):
+        self.url = None
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        _ListingTab.active += 1
+        _ListingTab.peak = max(_ListingTab.peak, _ListingTab.active)
+        # asyncio.sleep is patched out by instant_listing_retry, so yield through a future.
+        loop = asyncio.get_running_loop()
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+
+    async def wait_for_timeout(self, delay):
+        pass
+
+    async def close(self):
+        _ListingTab.active -= 1
+
+    @property
+    def page_number(self):
+        return int(self.url.rsplit("/", 1)[-1])
+
+
+@pytest.fixture
+def listing_tabs(setup_scraper_mocks):
+    """Serve listing tabs from `context.new_page` and links keyed on the page a tab shows."""
+    mocks = setup_scraper_mocks
+    scraper = mocks["scraper"]
+    _ListingTab.active = _ListingTab.peak = 0
+    mocks["playwright_manager_mock"].context.new_page = AsyncMock(side_effect=lambda: _ListingTab())
+    scraper.scroller.scroll_until_loaded = AsyncMock(return_value=True)
+    scraper.extract_match_links = AsyncMock(side_effect=lambda page: full_page(f"p{page.page_number}-"))
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_collect_match_links_fetches_pages_below_the_frontier_in_parallel(listing_tabs):
+    scraper = listing_tabs
+    scraper.pagination_walker.read_widget = AsyncMock(return_value=list(range(1, 7)))
+    scraper.extract_match_links.side_effect = lambda page: (
+        full_page(f"p{page.page_number}-") if page.page_number < 6 else ["https://oddsportal.com/last"]
+    )
+
+    result = await scraper._collect_match_links(
+        base_url="https://oddsportal.com/x/results/", pages_to_scrape=list(range(1, 7))
+    )
+
+    assert 1 < _ListingTab.peak <= LISTING_PAGE_CONCURRENCY
+    assert result.links == [link for p in range(1, 6) for link in full_page(f"p{p}-")] + ["https://oddsportal.com/last"]
+    assert result.successful_pages == 6
+    assert result.failed_pages == []
+
+
+@pytest.mark.asyncio
+async def test_collect_match_links_parallel_pages_keep_failure_accounting(listing_tabs):
+    """A known page is re-fetched once when short and fails without a re-fetch when it raises."""
+    scraper = listing_tabs
+    scraper.pagination_walker.read_widget = AsyncMock(return_value=list(range(1, 5)))
+    fetches: dict[int, int] = {}
+
+    def links_for(page):
+        number = page.page_number
+        fetches[number] = fetches.get(number, 0) + 1
+        if number == 2:
+            return full_page("p2-")[:5]
+        if number == 3:
+            raise RuntimeError("tab crashed")
+        return full_page(f"p{number}-")[: 10 if number == 4 else RESULTS_PAGE_SIZE]
+
+    scraper.extract_match_links.side_effect = links_for
+
+    result = await scraper._collect_match_links(base_url="https://oddsportal.com/x/results/", pages_to_scrape=[1, 4])
+
+    assert fetches == {1: 1, 2: 2, 3: 1, 4: 1}
+    assert result.failed_pages == [2, 3]
+    assert result.successful_pages == 2
+    assert result.links[RESULTS_PAGE_SIZE : RESULTS_PAGE_SIZE + 5] == full_page("p2-")[:5]
+
+
+@pytest.mark.asyncio
+async def test_collect_match_links_frontier_found_mid_walk_is_fetched_in_parallel(listing_tabs):
+    """Page 1's widget is unreadable; page 2's shows 6 pages, so pages 3-5 go out together."""
+    scraper = listing_tabs
+    scraper.pagination_walker.read_widget = AsyncMock(side_effect=[[], *([list(range(1, 7))] * 5)])
+    scraper.extract_match_links.side_effect = lambda page: full_page(f"p{page.page_number}-")[
+        : RESULTS_PAGE_SIZE if page.page_number < 6 else 7
+    ]
+
+    result = await scraper._collect_match_links(base_url="https://oddsportal.com/x/results/", pages_to_scrape=[1])
+
+    assert _ListingTab.peak == 3
+    assert result.successful_pages == 6
+    assert len(result.links) == 5 * RESULTS_PAGE_SIZE + 7
+
+
+@pytest.mark.asyncio
+async def test_collect_match_links_spreads_known_pages_over_contexts(listing_tabs, setup_scraper_mocks):
+    scraper = listing_tabs
+    other_context = MagicMock()
+    other_context.new_page = AsyncMock(side_effect=lambda: _ListingTab())
+    manager = setup_scraper_mocks["playwright_manager_mock"]
+    manager.listing_contexts = MagicMock(return_value=[manager.context, other_context])
+    scraper.pagination_walker.read_widget = AsyncMock(return_value=list(range(1, 6)))
+    scraper.extract_match_links.side_effect = lambda page: full_page("p-")[: 10 if page.page_number == 5 else None]
+
+    await scraper._collect_match_links(base_url="https://oddsportal.com/x/results/", pages_to_scrape=[5])
+
+    assert other_context.new_page.await_count == 2
+    assert manager.context.new_page.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_collect_and_extract_scrapes_before_walk_finishes(setup_scraper_mocks):
+    """Odds extraction sees the first page's links while the listing walk is still running."""
+    scraper = setup_scraper_mocks["scraper"]
+    second_page = asyncio.Event()
+    seen_during_walk = []
+
+    async def collect(**kwargs):
+        await kwargs["on_links"](["https://oddsportal.com/match1"])
+        await second_page.wait()
+        await kwargs["on_links"](["https://oddsportal.com/match2"])
+        return LinkCollectionResult(links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"])
+
+    async def extract(**kwargs):
+        links = []
+        async for link in kwargs["match_links"]:
+            links.append(link)
+            if not second_page.is_set():
+                seen_during_walk.append(link)
+                second_page.set()
+        return ScrapeResult(success=[{"match_link": link} for link in links])
+
+    scraper._collect_match_links = AsyncMock(side_effect=collect)
+    scraper.extract_match_odds = AsyncMock(side_effect=extract)
+
+    link_result, result = await scraper._collect_and_extract(collect_kwargs={}, sport="football")
+
+    assert seen_during_walk == ["https://oddsportal.com/match1"]
+    assert [row["match_link"] for row in result.success] == link_result.links
+
+
+@pytest.mark.asyncio
+async def test_collect_and_extract_raises_walk_error_after_stream_ends(setup_scraper_mocks):
+    scraper = setup_scraper_mocks["scraper"]
+    streamed = []
+
+    async def collect(**kwargs):
+        await kwargs["on_links"](["https://oddsportal.com/match1"])
+        raise RuntimeError("listing crashed")
+
+    async def extract(**kwargs):
+        streamed.extend([link async for link in kwargs["match_links"]])
+        return ScrapeResult()
+
+    scraper._collect_match_links = AsyncMock(side_effect=collect)
+    scraper.extract_match_odds = AsyncMock(side_effect=extract)
+
+    with pytest.raises(RuntimeError, match="listing crashed"):
+        await scraper._collect_and_extract(collect_kwargs={})
+    assert streamed == ["https://oddsportal.com/match1"]
+
+
+@pytest.mark.asyncio
+async def test_publish_links_skips_links_already_published():
+    published = []
+
+    async def on_links(links):
+        published.append(links)
+
+    seen: set[str] = set()
+    await OddsPortalScraper._publish_links(["a", "b", "a"], seen, on_links)
+    await OddsPortalScraper._publish_links(["b", "c"], seen, on_links)
+    await OddsPortalScraper._publish_links(["c"], seen, on_links)
+    await OddsPortalScraper._publish_links(["d"], seen, None)
+
+    assert published == [["a", "b"], ["c"]]
@@ -0,0 +1,154 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from oddsharvester.core.page_pool import BLANK_URL, PagePool, PagePoolStats
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright Page: sync is_closed/url, async goto/close."""
+
+    def __init__(self, reset_ok=True):
+        self.url = "https://www.oddsportal.com/football/match/"
+        self.closed = False
+        self.reset_ok = reset_ok
+        self.goto = AsyncMock(side_effect=self._goto)
+        self.close = AsyncMock(side_effect=self._close)
+
+    async def _goto(self, url, timeout=None):
+        if not self.reset_ok:
+            raise TimeoutError("navigation timed out")
+        self.url = url
+
+    async def _close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+@pytest.fixture
+def context():
+    ctx = MagicMock()
+    ctx.new_page = AsyncMock(side_effect=lambda: FakePage())
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_first_acquire_is_a_miss_then_reuse_is_a_hit(context):
+    pool = PagePool(context)
+
+    page = await pool.acquire()
+    await pool.release(page)
+    again = await pool.acquire()
+
+    assert again is page
+    assert page.url == BLANK_URL
+    assert context.new_page.await_count == 1
+    assert pool.stats.misses == 1
+    assert pool.stats.hits == 1
+    assert len(pool.stats.creation_ms) == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_prepares_idle_pages(context):
+    pool = PagePool(context)
+    await pool.warm(3)
+
+    pages = [await pool.acquire() for _ in range(3)]
+
+    assert len({id(p) for p in pages}) == 3
+    assert pool.stats.hits == 3
+    assert pool.stats.misses == 0
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_page_recycled_after_max_uses(context):
+    pool = PagePool(context, max_uses=2)
+
+    page = await pool.acquire()
+    await pool.release(page)
+    assert await pool.acquire() is page
+    await pool.release(page)
+
+    assert page.closed
+    assert pool.stats.recycled == 1
+    assert pool.idle_count == 0
+    assert await pool.acquire() is not page
+
+
+@pytest.mark.asyncio
+async def test_failed_reset_discards_page(context):
+    pool = PagePool(context)
+    context.new_page = AsyncMock(return_value=FakePage(reset_ok=False))
+
+    page = await pool.acquire()
+    await pool.release(page)
+
+    assert page.closed
+    assert pool.stats.discarded == 1
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_closed_page_is_not_pooled(context):
+    pool = PagePool(context)
+    page = await pool.acquire()
+    page.closed = True
+
+    await pool.release(page)
+
+    assert pool.idle_count == 0
+    assert pool.stats.discarded == 1
+    page.goto.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_idle_page_closed_meanwhile_is_skipped(context):
+    pool = PagePool(context)
+    await pool.warm(1)
+    pool._idle[0].closed = True
+
+    page = await pool.acquire()
+
+    assert not page.closed
+    assert pool.stats.misses == 1
+    assert pool.stats.discarded == 1
+
+
+@pytest.mark.asyncio
+async def test_not_reusable_page_is_closed(context):
+    pool = PagePool(context)
+    page = await pool.acquire()
+
+    await pool.release(page, reusable=False)
+
+    assert page.closed
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_close_closes_idle_pages(context):
+    pool = PagePool(context)
+    await pool.warm(2)
+    idle = list(pool._idle)
+
+    await pool.close()
+
+    assert all(p.closed for p in idle)
+    assert pool.idle_count == 0
+
+
+def test_stats_merge_and_to_dict():
+    total = PagePoolStats(hits=3, misses=1, creation_ms=[10.0])
+    total.merge(PagePoolStats(hits=1, misses=1, recycled=2, creation_ms=[30.0]))
+
+    as_dict = total.to_dict()
+    assert as_dict["hits"] == 4
+    assert as_dict["misses"] == 2
+    assert as_dict["hit_rate"] == pytest.approx(0.667)
+    assert as_dict["recycled"] == 2
+    assert as_dict["pages_created"] == 2
+    assert as_dict["creation_ms_p95"] == 30.0
+    assert PagePoolStats().hit_rate == 0.0
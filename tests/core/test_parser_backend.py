@@ -0,0 +1,68 @@
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from oddsharvester.core.base_scraper import _parse_event_header_html
+from oddsharvester.core.market_extraction import OddsParser
+from oddsharvester.core.market_extraction.submarket_extractor import parse_visible_submarkets
+from oddsharvester.core.parser_backend import (
+    BS4_BACKEND,
+    LXML_BACKEND,
+    PARSER_BACKEND_ENV_VAR,
+    parser_backend_from_env,
+)
+
+MATCH_DATA_DIR = Path(__file__).parents[1] / "data" / "match"
+
+
+class TestParserBackendFromEnv:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, BS4_BACKEND),
+            ("", BS4_BACKEND),
+            ("lxml", LXML_BACKEND),
+            (" LXML ", LXML_BACKEND),
+            ("bs4", BS4_BACKEND),
+        ],
+    )
+    def test_reads_setting(self, monkeypatch, value, expected):
+        if value is None:
+            monkeypatch.delenv(PARSER_BACKEND_ENV_VAR, raising=False)
+        else:
+            monkeypatch.setenv(PARSER_BACKEND_ENV_VAR, value)
+        assert parser_backend_from_env() == expected
+
+    def test_unknown_backend_falls_back_to_bs4(self, monkeypatch, caplog):
+        monkeypatch.setenv(PARSER_BACKEND_ENV_VAR, "html5lib")
+        assert parser_backend_from_env() == BS4_BACKEND
+        assert "html5lib" in caplog.text
+
+
+class TestBackendParityOnRenderedPages:
+    """Both backends read the same data from the committed rendered match pages."""
+
+    @pytest.mark.parametrize(
+        ("page", "main_market"),
+        [
+            ("match_1x2.html", "1X2"),
+            ("match_over_under.html", "Over/Under"),
+            ("match_correct_score.html", "Correct Score"),
+        ],
+    )
+    def test_same_data_from_both_backends(self, page, main_market):
+        html = (MATCH_DATA_DIR / page).read_text(encoding="utf-8")
+        tz = ZoneInfo("Europe/Paris")
+
+        def parse(backend):
+            return (
+                OddsParser(backend).parse_bookmaker_rows(html),
+                parse_visible_submarkets(html, main_market, "FullTime", None, backend),
+                _parse_event_header_html(html, tz, backend),
+            )
+
+        bs4_rows, bs4_submarkets, bs4_header = parse(BS4_BACKEND)
+        assert parse(LXML_BACKEND) == (bs4_rows, bs4_submarkets, bs4_header)
+        assert bs4_rows if main_market == "1X2" else bs4_submarkets
+        assert bs4_header["dom"]["home_team"] == "Arsenal"
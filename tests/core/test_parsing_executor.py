@@ -0,0 +1,77 @@
+import pytest
+
+from oddsharvester.core.market_extraction.odds_parser import OddsParser
+from oddsharvester.core.parsing_executor import (
+    DEFAULT_INLINE_PARSE_MAX_BYTES,
+    INLINE_PARSE_MAX_BYTES_ENV_VAR,
+    PARSE_WORKERS_ENV_VAR,
+    ParsingExecutor,
+)
+
+ODDS_HTML = """
+<div class="border-black-borders flex h-9">
+    <img class="bookmaker-logo" title="Bookmaker1">
+    <div class="flex-center flex-col font-bold">1.90</div>
+    <div class="flex-center flex-col font-bold">3.50</div>
+    <div class="flex-center flex-col font-bold">4.20</div>
+</div>
+"""
+ODDS_LABELS = ["1", "X", "2"]
+
+
+@pytest.mark.asyncio
+async def test_small_documents_are_parsed_inline():
+    calls = []
+    executor = ParsingExecutor(max_workers=2)
+
+    result = await executor.run(lambda html, n: calls.append((html, n)) or n, "<p>x</p>", 3)
+
+    assert result == 3
+    assert calls == [("<p>x</p>", 3)]
+    assert executor._pool is None
+
+
+@pytest.mark.asyncio
+async def test_zero_workers_parses_everything_inline():
+    executor = ParsingExecutor(max_workers=0, inline_max_bytes=0)
+
+    result = await executor.run(lambda html: len(html), "x" * 10_000)
+
+    assert result == 10_000
+    assert executor._pool is None
+
+
+@pytest.mark.asyncio
+async def test_large_documents_are_parsed_in_a_worker_process():
+    executor = ParsingExecutor(max_workers=1, inline_max_bytes=0)
+    parser = OddsParser()
+    try:
+        pooled = await executor.run(parser.parse_market_odds, ODDS_HTML, period="FullTime", odds_labels=ODDS_LABELS)
+    finally:
+        executor.shutdown()
+
+    assert pooled == parser.parse_market_odds(ODDS_HTML, period="FullTime", odds_labels=ODDS_LABELS)
+    assert pooled[0]["bookmaker_name"] == "Bookmaker1"
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_parse_function_falls_back_inline():
+    executor = ParsingExecutor(max_workers=1, inline_max_bytes=0)
+    try:
+        result = await executor.run(lambda html: html.upper(), "abc")
+    finally:
+        executor.shutdown()
+
+    assert result == "ABC"
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv(PARSE_WORKERS_ENV_VAR, raising=False)
+    monkeypatch.delenv(INLINE_PARSE_MAX_BYTES_ENV_VAR, raising=False)
+    assert ParsingExecutor.from_env().inline_max_bytes == DEFAULT_INLINE_PARSE_MAX_BYTES
+    assert ParsingExecutor.from_env().max_workers >= 1
+
+    monkeypatch.setenv(PARSE_WORKERS_ENV_VAR, "0")
+    monkeypatch.setenv(INLINE_PARSE_MAX_BYTES_ENV_VAR, "1024")
+    executor = ParsingExecutor.from_env()
+    assert (executor.max_workers, executor.inline_max_bytes) == (0, 1024)
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from oddsharvester.core.phase_timing import (
+    LatencyStats,
+    MatchTimings,
+    bind_timings,
+    percentile,
+    timed_market,
+    timed_phase,
+    unbind_timings,
+)
+from oddsharvester.utils.constants import LATENCY_RESERVOIR_SIZE, LATENCY_SLOWEST_MATCHES
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 95) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile(list(range(1, 101)), 99) == 99
+
+
+def test_unbound_timers_are_no_ops():
+    with timed_phase("navigation"), timed_market("1x2"):
+        pass
+
+
+def test_phases_accumulate_and_nest():
+    timings = MatchTimings()
+    token = bind_timings(timings)
+    clock = iter([0.0, 1.0, 2.0, 2.5, 3.0, 4.0, 5.0, 5.25])
+    try:
+        with patch("oddsharvester.core.phase_timing.perf_counter", side_effect=lambda: next(clock)):
+            with timed_phase("navigation"):
+                pass
+            with timed_phase("markets"), timed_market("1x2"):
+                pass
+            with timed_phase("navigation"):
+                pass
+    finally:
+        unbind_timings(token)
+
+    assert timings.phases == {"navigation": 1250.0, "markets": 2000.0}
+    assert timings.markets == {"1x2": 500.0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_time_into_their_own_timings():
+    async def scrape(timings: MatchTimings, name: str) -> None:
+        bind_timings(timings)
+        await asyncio.sleep(0)
+        with timed_market(name):
+            await asyncio.sleep(0)
+
+    first, second = MatchTimings(), MatchTimings()
+    await asyncio.gather(scrape(first, "1x2"), scrape(second, "btts"))
+
+    assert list(first.markets) == ["1x2"]
+    assert list(second.markets) == ["btts"]
+
+
+def test_latency_stats_histograms():
+    stats = LatencyStats()
+    for ms in (100.0, 200.0, 300.0, 400.0):
+        stats.record("url", MatchTimings(phases={"navigation": ms}), duration_s=ms / 100)
+    breakdown = stats.record("failed-before-timing", None, duration_s=0.0)
+
+    as_dict = stats.to_dict()
+    navigation = as_dict["phases"]["navigation"]
+    assert navigation == {"count": 4, "p50_ms": 200.0, "p95_ms": 400.0, "p99_ms": 400.0, "max_ms": 400.0}
+    assert as_dict["phases"]["total"]["count"] == 5
+    assert breakdown == {"url": "failed-before-timing", "total_ms": 0.0, "phases": {}, "markets": {}}
+    assert as_dict["slowest_matches"][-1] == breakdown
+    assert LatencyStats().to_dict() == {"phases": {}, "markets": {}, "slowest_matches": []}
+
+
+def test_latency_stats_keep_a_bounded_sample():
+    stats = LatencyStats()
+    for ms in range(1, 5001):
+        stats.record(f"a{ms}", MatchTimings(phases={"navigation": float(ms)}), duration_s=ms / 1000)
+    other = LatencyStats()
+    for ms in range(5001, 10001):
+        other.record(f"b{ms}", MatchTimings(phases={"navigation": float(ms)}), duration_s=ms / 1000)
+
+    merged = stats.merge(other)
+    navigation = merged.phases["navigation"]
+
+    assert navigation.count == 10000
+    assert navigation.max_ms == 10000.0
+    assert len(navigation.samples) == LATENCY_RESERVOIR_SIZE
+    # Both runs are represented in proportion to their size.
+    assert 0.4 < sum(ms <= 5000 for ms in navigation.samples) / LATENCY_RESERVOIR_SIZE < 0.6
+    assert 4000 < navigation.to_dict()["p50_ms"] < 6000
+    assert [m["url"] for m in merged.slowest] == [f"b{ms}" for ms in range(10000, 10000 - LATENCY_SLOWEST_MATCHES, -1)]
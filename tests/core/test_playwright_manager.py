@@ -1,15 +1,18 @@
-from unittest.mock import AsyncMock, patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from oddsharvester.core.exceptions import AllProxiesExhaustedError
 from oddsharvester.core.playwright_manager import PlaywrightManager
 from oddsharvester.utils.proxy_manager import ProxyManager
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 
 
 @pytest.fixture
-def mock_playwright():
+def mock_playwright(monkeypatch):
     """Mock async_playwright with browser/context/page chain."""
+    monkeypatch.setenv("OH_STORAGE_STATE", "")
     with patch("oddsharvester.core.playwright_manager.async_playwright") as mock_ap:
         playwright = AsyncMock()
         browser = AsyncMock()
@@ -81,6 +84,38 @@ async def test_record_har_kwargs_absent_when_env_var_unset(mock_playwright, monk
     assert "record_har_url_filter" not in call_kwargs
 
 
+@pytest.mark.asyncio
+async def test_resource_blocker_routes_every_context(mock_playwright, monkeypatch):
+    monkeypatch.delenv("ODDSHARVESTER_HAR_RECORD", raising=False)
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, block_profile=ResourceBlockProfile.MINIMAL)
+
+    assert pm.resource_blocker.profile is ResourceBlockProfile.MINIMAL
+    mock_playwright["context"].route.assert_awaited_once_with("**/*", pm.resource_blocker._handle)
+
+
+@pytest.mark.asyncio
+async def test_resource_blocking_off_installs_no_route(mock_playwright, monkeypatch):
+    monkeypatch.delenv("ODDSHARVESTER_HAR_RECORD", raising=False)
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, block_profile=ResourceBlockProfile.OFF)
+
+    mock_playwright["context"].route.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_recorded_context_is_not_blocked(mock_playwright, monkeypatch, tmp_path):
+    """A HAR recording keeps every request, so the fixture can be replayed under any profile."""
+    monkeypatch.setenv("ODDSHARVESTER_HAR_RECORD", str(tmp_path / "snapshot.har"))
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True)
+
+    mock_playwright["context"].route.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_resolves_system_timezone_when_none_requested(mock_playwright):
     """With no explicit timezone, the effective browser timezone is captured."""
@@ -145,6 +180,34 @@ async def test_new_rotated_page_reports_key(mock_playwright):
     assert key in {"http://a.example.com:1", "http://b.example.com:2"}
 
 
+@pytest.mark.asyncio
+async def test_new_rotated_page_holds_lane_until_released(mock_playwright):
+    proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, proxy_manager=proxy_manager)
+    pm.configure_lanes(per_proxy_concurrency=1, request_delay=0)
+
+    _page, key = await pm.new_rotated_page()
+    entry = next(e for e in proxy_manager.entries if e.key == key)
+    assert entry.in_flight == 1
+    assert pm.lane_count() == 2
+
+    pm.release_page(key)
+    assert entry.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_new_rotated_page_releases_lane_on_failure(mock_playwright):
+    proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, proxy_manager=proxy_manager)
+    mock_playwright["context"].new_page = AsyncMock(side_effect=RuntimeError("context closed"))
+
+    with pytest.raises(RuntimeError):
+        await pm.new_rotated_page()
+    assert all(e.in_flight == 0 for e in proxy_manager.entries)
+
+
 @pytest.mark.asyncio
 async def test_new_rotated_page_raises_when_exhausted(mock_playwright):
     proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
@@ -155,3 +218,138 @@ async def test_new_rotated_page_raises_when_exhausted(mock_playwright):
             pm.report_page_result(key, is_proxy_failure=True)
     with pytest.raises(AllProxiesExhaustedError):
         await pm.new_rotated_page()
+
+
+def _pooled_page():
+    page = AsyncMock()
+    page.is_closed = MagicMock(return_value=False)
+    page.url = "about:blank"
+    return page
+
+
+@pytest.mark.asyncio
+async def test_returned_page_is_reused(mock_playwright):
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True)
+    mock_playwright["context"].new_page = AsyncMock(side_effect=lambda: _pooled_page())
+
+    page, key = await pm.new_rotated_page()
+    await pm.return_page(page, key)
+    again, _ = await pm.new_rotated_page()
+
+    assert again is page
+    stats = pm.page_pool_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_warm_page_pools_skips_blacklisted_contexts(mock_playwright):
+    proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, proxy_manager=proxy_manager)
+    mock_playwright["context"].new_page = AsyncMock(side_effect=lambda: _pooled_page())
+    pm.blacklist_proxy("http://b.example.com:2")
+
+    await pm.warm_page_pools(2)
+
+    assert pm.page_pools["http://a.example.com:1"].idle_count == 2
+    assert "http://b.example.com:2" not in pm.page_pools
+
+
+@pytest.mark.asyncio
+async def test_page_of_blacklisted_proxy_is_closed_not_pooled(mock_playwright):
+    proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, proxy_manager=proxy_manager)
+    mock_playwright["context"].new_page = AsyncMock(side_effect=lambda: _pooled_page())
+
+    page, key = await pm.new_rotated_page()
+    pm.blacklist_proxy(key)
+    await pm.return_page(page, key)
+
+    page.close.assert_awaited_once()
+    assert pm.page_pools[key].idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_listing_contexts_are_the_contexts_in_rotation(mock_playwright):
+    proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
+    pm = PlaywrightManager()
+    mock_playwright["browser"].new_context = AsyncMock(side_effect=lambda **kwargs: AsyncMock())
+    await pm.initialize(headless=True, proxy_manager=proxy_manager)
+
+    assert pm.listing_contexts() == list(pm.contexts.values())
+    pm.blacklist_proxy("http://b.example.com:2")
+    assert pm.listing_contexts() == [pm.contexts["http://a.example.com:1"]]
+
+
+@pytest.mark.asyncio
+async def test_listing_contexts_without_proxy_manager(mock_playwright):
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True)
+    assert pm.listing_contexts() == [pm.context]
+
+
+@pytest.mark.asyncio
+async def test_saved_storage_state_is_applied_to_every_context(mock_playwright, monkeypatch, tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"cookies": [{"name": "op_odds", "value": "1"}], "origins": []}))
+    monkeypatch.setenv("OH_STORAGE_STATE", str(state_path))
+    proxy_manager = ProxyManager(proxy_urls=["http://a.example.com:1", "http://b.example.com:2"])
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True, proxy_manager=proxy_manager)
+
+    for call in mock_playwright["browser"].new_context.await_args_list:
+        assert call.kwargs["storage_state"] == {"cookies": [{"name": "op_odds", "value": "1"}], "origins": []}
+
+
+@pytest.mark.asyncio
+async def test_har_replay_ignores_saved_storage_state(mock_playwright, monkeypatch, tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"cookies": [], "origins": []}))
+    monkeypatch.setenv("OH_STORAGE_STATE", str(state_path))
+    har_path = tmp_path / "snapshot.har"
+    har_path.write_text("{}")
+    monkeypatch.setenv("ODDSHARVESTER_HAR_REPLAY", str(har_path))
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True)
+
+    assert "storage_state" not in mock_playwright["browser"].new_context.await_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_storage_state_is_saved_once_per_context_and_on_cleanup(mock_playwright, monkeypatch, tmp_path):
+    state_path = tmp_path / "state.json"
+    monkeypatch.setenv("OH_STORAGE_STATE", str(state_path))
+    context = mock_playwright["context"]
+    context.storage_state = AsyncMock(return_value={"cookies": [{"name": "op_odds", "value": "1"}], "origins": []})
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True)
+    await pm.save_storage_state(context)
+    await pm.save_storage_state(context)
+
+    assert context.storage_state.await_count == 1
+    assert json.loads(state_path.read_text())["cookies"] == [{"name": "op_odds", "value": "1"}]
+
+    await pm.cleanup()
+    assert context.storage_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cleanup_does_not_save_unconfigured_context(mock_playwright, monkeypatch, tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"cookies": [{"name": "op_odds", "value": "1"}], "origins": []}))
+    monkeypatch.setenv("OH_STORAGE_STATE", str(state_path))
+    context = mock_playwright["context"]
+    context.storage_state = AsyncMock(return_value={"cookies": [], "origins": []})
+
+    pm = PlaywrightManager()
+    await pm.initialize(headless=True)
+    # The run failed before any match page set the odds format and bookies filter.
+    await pm.cleanup()
+
+    context.storage_state.assert_not_awaited()
+    assert json.loads(state_path.read_text())["cookies"] == [{"name": "op_odds", "value": "1"}]
@@ -0,0 +1,176 @@
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from oddsharvester.core.queue_worker import QueueWorker, queue_config
+from oddsharvester.core.scrape_result import ErrorType, FailedUrl, ScrapeResult, ScrapeStats
+from oddsharvester.storage.job_queue import JobQueue
+
+LINKS = [f"https://www.oddsportal.com/football/england/premier-league/match-{i}/" for i in range(6)]
+CONFIG = {"command": "scrape_historic", "sport": "football", "markets": ["1x2"]}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = JobQueue(str(tmp_path / "jobs.db"))
+    yield q
+    q.close()
+
+
+def _scraped(links, failed=()):
+    rows = [{"home_team": link} for link in links if link not in failed]
+    failures = [
+        FailedUrl(url=link, error_type=ErrorType.NAVIGATION, error_message="timeout", is_retryable=True)
+        for link in failed
+    ]
+    stats = ScrapeStats(total_urls=len(links), successful=len(rows), failed=len(failures))
+    return ScrapeResult(success=rows, failed=failures, stats=stats)
+
+
+@contextmanager
+def fake_scrapers(scrape):
+    """Patch scraper construction; yields the fake scrapers built, whose `scrape_matches` calls `scrape`."""
+    built = []
+
+    def build(**_settings):
+        scraper = MagicMock()
+        scraper.start_playwright = AsyncMock()
+        scraper.stop_playwright = AsyncMock()
+        scraper.scrape_matches = AsyncMock(side_effect=scrape)
+        built.append(scraper)
+        return scraper
+
+    with patch("oddsharvester.core.scraper_app.build_scraper", side_effect=build):
+        yield built
+
+
+def _calls(built):
+    return [call.kwargs for scraper in built for call in scraper.scrape_matches.call_args_list]
+
+
+def test_queue_config_drops_node_settings():
+    run_kwargs = {
+        **CONFIG,
+        "match_links": None,
+        "links_only": False,
+        "proxy_url": ["http://proxy:8080"],
+        "proxy_pass": "secret",
+        "headless": True,
+        "concurrency_tasks": 3,
+    }
+    assert queue_config(run_kwargs) == CONFIG
+
+
+async def test_scrapes_and_acks_all_jobs(queue):
+    queue.enqueue(LINKS, CONFIG, season_by_link=dict.fromkeys(LINKS, "2023-2024"))
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"])) as built:
+        result = await QueueWorker(queue, node_settings={"headless": True}, batch_size=4, worker_id="w1").run()
+
+    assert result.stats.successful == len(LINKS)
+    assert {row["season"] for row in result.success} == {"2023-2024"}
+    assert queue.counts()["done"] == len(LINKS)
+    assert [len(c["match_links"]) for c in _calls(built)] == [4, 2]
+    assert _calls(built)[-1]["sport"] == "football"
+    # One browser for every batch, launched with the node's settings and closed at the end.
+    assert len(built) == 1
+    assert built[0].start_playwright.call_args.kwargs["headless"] is True
+    built[0].stop_playwright.assert_awaited_once()
+
+
+async def test_one_call_per_config_and_season(queue):
+    queue.enqueue(LINKS[:2], CONFIG, season_by_link={LINKS[0]: "2022-2023", LINKS[1]: "2023-2024"})
+    queue.enqueue(LINKS[2:3], {**CONFIG, "markets": ["btts"]})
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"])) as built:
+        await QueueWorker(queue, worker_id="w1").run()
+
+    assert sorted(len(c["match_links"]) for c in _calls(built)) == [1, 1, 1]
+    assert {tuple(c["markets"]) for c in _calls(built)} == {("1x2",), ("btts",)}
+    assert len(built) == 1
+
+
+async def test_records_go_to_sink(queue):
+    queue.enqueue(LINKS, CONFIG)
+    rows = []
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"])):
+        result = await QueueWorker(queue, record_sink=rows.append, worker_id="w1").run()
+
+    assert len(rows) == len(LINKS)
+    assert result.success == []
+    assert result.stats.successful == len(LINKS)
+
+
+async def test_failed_link_is_retried_then_given_up(queue):
+    queue.enqueue(LINKS[:2], CONFIG)
+    flaky = LINKS[1]
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"], failed={flaky})) as built:
+        result = await QueueWorker(queue, worker_id="w1").run()
+
+    # The first call scrapes both links; later calls retry only the flaky one.
+    assert len(_calls(built)) == queue.max_attempts
+    assert [f.url for f in result.failed] == [flaky]
+    assert result.stats.successful == 1
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 1}
+
+
+async def test_crashed_batch_goes_back_to_pending(queue):
+    queue.enqueue(LINKS[:3], CONFIG)
+
+    with fake_scrapers(RuntimeError("browser died")):
+        result = await QueueWorker(queue, worker_id="w1").run(max_jobs=3)
+
+    assert result.failed == []
+    assert queue.counts()["pending"] == 3
+
+
+async def test_max_jobs_limits_claims(queue):
+    queue.enqueue(LINKS, CONFIG)
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"])):
+        result = await QueueWorker(queue, batch_size=4, worker_id="w1").run(max_jobs=3)
+
+    assert result.stats.successful == 3
+    assert queue.counts()["pending"] == 3
+
+
+async def test_waits_for_leases_held_by_others(queue):
+    """A drained queue with a foreign lease outstanding keeps the worker polling until it can reclaim it."""
+    queue.enqueue(LINKS[:1], CONFIG)
+    queue.claim("crashed", limit=1, visibility_timeout_s=0.05)
+
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"])):
+        result = await QueueWorker(queue, worker_id="w1", poll_interval_s=0.02).run()
+
+    assert result.stats.successful == 1
+    assert queue.counts()["done"] == 1
+
+
+async def test_crashed_batch_relaunches_the_browser(queue):
+    queue.enqueue(LINKS[:3], CONFIG)
+    outcomes = iter([RuntimeError("browser died")])
+
+    def scrape(**kw):
+        error = next(outcomes, None)
+        if error is not None:
+            raise error
+        return _scraped(kw["match_links"])
+
+    with fake_scrapers(scrape) as built:
+        result = await QueueWorker(queue, batch_size=1, worker_id="w1").run()
+
+    assert result.stats.successful == 3
+    # The crashed browser is closed and a new one serves the remaining batches.
+    assert len(built) == 2
+    built[0].stop_playwright.assert_awaited_once()
+    assert len(_calls(built)) == 4
+    assert len(built[1].scrape_matches.call_args_list) == 3
+
+
+async def test_browser_settings_change_opens_a_new_session(queue):
+    queue.enqueue(LINKS[:1], CONFIG)
+    queue.enqueue(LINKS[1:2], {**CONFIG, "browser_locale_timezone": "fr-FR"})
+
+    with fake_scrapers(lambda **kw: _scraped(kw["match_links"])) as built:
+        await QueueWorker(queue, worker_id="w1").run()
+
+    assert len(built) == 2
+    assert all(scraper.stop_playwright.await_count == 1 for scraper in built)
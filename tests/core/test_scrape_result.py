@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from oddsharvester.core.phase_timing import MatchTimings
 from oddsharvester.core.scrape_result import (
     ErrorType,
     FailedUrl,
@@ -265,3 +266,17 @@ def test_merge_does_not_propagate_combo_stats():
     )
     target.merge(other)
     assert target.combo_stats == []
+
+
+def test_latency_included_in_to_dict_and_merged():
+    target = ScrapeResult()
+    target.latency.record("a", MatchTimings(phases={"navigation": 100.0}), duration_s=0.5)
+    other = ScrapeResult()
+    other.latency.record("b", MatchTimings(phases={"navigation": 300.0}, markets={"1x2": 50.0}), duration_s=1.0)
+
+    latency = target.merge(other).to_dict()["latency"]
+
+    assert [m["url"] for m in latency["slowest_matches"]] == ["b", "a"]
+    assert latency["phases"]["navigation"]["count"] == 2
+    assert latency["phases"]["total"]["p99_ms"] == 1000.0
+    assert latency["markets"]["1x2"]["p50_ms"] == 50.0
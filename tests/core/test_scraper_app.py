@@ -12,6 +12,7 @@ from oddsharvester.core.scrape_result import ScrapeResult, ScrapeStats
 from oddsharvester.core.scraper_app import _scrape_league_season_combos, retry_scrape, run_scraper
 from oddsharvester.utils.command_enum import CommandEnum
 from oddsharvester.utils.constants import OPERATION_RETRY_MAX_ATTEMPTS
+from oddsharvester.utils.resource_block_profile_enum import ResourceBlockProfile
 
 
 @pytest.fixture
@@ -76,6 +77,7 @@ async def test_run_scraper_historic(
         browser_locale_timezone=None,
         browser_timezone_id=None,
         proxy_manager=proxy_manager_instance,
+        block_profile=ResourceBlockProfile.OFF,
     )
 
     scraper_mock.scrape_historic.assert_called_once_with(
@@ -137,6 +139,7 @@ async def test_run_scraper_upcoming(
         browser_locale_timezone="Europe/Paris",
         browser_timezone_id=None,
         proxy_manager=proxy_manager_instance,
+        block_profile=ResourceBlockProfile.OFF,
     )
 
     scraper_mock.scrape_upcoming.assert_called_once_with(
@@ -1042,3 +1045,110 @@ async def test_run_scraper_live_requires_sport(
 
     assert result is None
     scraper_mock.scrape_live.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_combos_run_concurrently_and_merge_in_combo_order():
+    """The first combo finishes last, yet results and combo_stats keep league-outer order."""
+    scraper_mock = MagicMock()
+    active = 0
+    peak = 0
+    first_may_finish = asyncio.Event()
+
+    async def scrape(scrape_func, sport, league, season, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        if season == "2020":
+            await first_may_finish.wait()
+        else:
+            first_may_finish.set()
+        await asyncio.sleep(0)
+        active -= 1
+        return ScrapeResult(success=[{"season": season}], stats=ScrapeStats(total_urls=1, successful=1))
+
+    with patch("oddsharvester.core.scraper_app.retry_scrape", AsyncMock(side_effect=scrape)):
+        result = await _scrape_league_season_combos(
+            scraper=scraper_mock,
+            scrape_func=AsyncMock(),
+            leagues=["epl"],
+            sport="football",
+            seasons=["2020", "2021", "2022"],
+            combo_concurrency=2,
+            concurrent_scraping_task=4,
+        )
+
+    assert peak == 2
+    assert [row["season"] for row in result.success] == ["2020", "2021", "2022"]
+    assert [c["season"] for c in result.combo_stats] == ["2020", "2021", "2022"]
+    scraper_mock.share_match_budget.assert_called_once_with(4)
+    assert scraper_mock.match_budget is None, "the shared budget is dropped once the combos are done"
+
+
+@pytest.mark.asyncio
+async def test_combo_concurrency_one_runs_combos_one_at_a_time():
+    scraper_mock = MagicMock()
+    active = 0
+    peak = 0
+
+    async def scrape(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return ScrapeResult()
+
+    with patch("oddsharvester.core.scraper_app.retry_scrape", AsyncMock(side_effect=scrape)):
+        await _scrape_league_season_combos(
+            scraper=scraper_mock,
+            scrape_func=AsyncMock(),
+            leagues=["epl", "laliga", "seriea"],
+            sport="football",
+            combo_concurrency=1,
+        )
+
+    assert peak == 1
+    scraper_mock.share_match_budget.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_combos_share_the_main_page_in_turn():
+    """scrape_historic navigates the single main tab; concurrent combos must not interleave on it."""
+    scraper = OddsPortalScraper(
+        playwright_manager=MagicMock(spec=PlaywrightManager),
+        market_extractor=MagicMock(spec=OddsPortalMarketExtractor),
+        scroller=AsyncMock(),
+        cookie_dismisser=AsyncMock(),
+        selection_manager=AsyncMock(),
+    )
+    scraper.playwright_manager.page = AsyncMock()
+    scraper.playwright_manager.lane_count = MagicMock(return_value=1)
+    visits = []
+
+    async def goto(url, **kwargs):
+        visits.append(("goto", url))
+        await asyncio.sleep(0)
+
+    async def pagination(page, max_pages):
+        visits.append(("pagination", page.goto.await_args.args[0]))
+        return [1]
+
+    scraper.playwright_manager.page.goto = AsyncMock(side_effect=goto)
+    scraper._get_pagination_info = AsyncMock(side_effect=pagination)
+    scraper._collect_and_extract = AsyncMock(return_value=(MagicMock(failed_pages=[], links=[]), ScrapeResult()))
+
+    result = await _scrape_league_season_combos(
+        scraper=scraper,
+        scrape_func=scraper.scrape_historic,
+        leagues=["england-premier-league", "italy-serie-a"],
+        sport="football",
+        seasons=["2022-2023"],
+        combo_concurrency=2,
+    )
+
+    assert not any(combo["errored"] for combo in result.combo_stats)
+
+    assert [kind for kind, _ in visits] == ["goto", "pagination", "goto", "pagination"]
+    assert visits[0][1] == visits[1][1]
+    assert visits[2][1] == visits[3][1]
@@ -0,0 +1,208 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from oddsharvester.core.parsing_executor import PARSE_WORKERS_ENV_VAR
+from oddsharvester.core.scrape_result import ErrorType, FailedUrl, ScrapeResult, ScrapeStats
+from oddsharvester.core.sharding import run_sharded, shard_for, shard_parse_workers, split_into_shards
+
+LINKS = [f"https://www.oddsportal.com/football/england/premier-league/match-{i}/" for i in range(40)]
+
+
+def _result_for(links, record_sink=None):
+    rows = [{"match_link": link, "home_team": link.rsplit("-", 1)[-1].strip("/")} for link in links]
+    if record_sink is not None:
+        for row in rows:
+            record_sink(row)
+        rows = []
+    return ScrapeResult(success=rows, stats=ScrapeStats(total_urls=len(links), successful=len(links)))
+
+
+async def _fake_run_scraper(**kwargs):
+    if kwargs.get("links_only"):
+        rows = [{"match_link": link, "season": "2023-2024" if i % 2 else "2024-2025"} for i, link in enumerate(LINKS)]
+        failed = [FailedUrl(url="listing#/page/3", error_type=ErrorType.LISTING_PAGE, error_message="x")]
+        return ScrapeResult(success=rows, failed=failed, stats=ScrapeStats(successful=len(rows), failed=1))
+    return _result_for(kwargs["match_links"], kwargs.get("record_sink"))
+
+
+@pytest.fixture
+def fake_processes(monkeypatch):
+    """Run shard 'processes' on threads so the patched run_scraper is visible to them."""
+    # The shard entry point sets the parsing pool budget in its (here: the test's) environment.
+    monkeypatch.setenv(PARSE_WORKERS_ENV_VAR, "")
+    with (
+        patch(
+            "oddsharvester.core.sharding.ProcessPoolExecutor",
+            side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(max_workers),
+        ) as executor,
+        patch("oddsharvester.core.sharding.setup_logger"),
+    ):
+        yield executor
+
+
+def test_shard_for_is_deterministic_and_in_range():
+    for link in LINKS:
+        index = shard_for(link, 4)
+        assert 0 <= index < 4
+        assert shard_for(link, 4) == index
+
+
+def test_split_is_a_partition_preserving_order():
+    shards = split_into_shards(LINKS, 4)
+    assert sorted(link for shard in shards for link in shard) == sorted(LINKS)
+    for shard in shards:
+        assert shard == [link for link in LINKS if link in shard]
+    assert sum(1 for shard in shards if shard) > 1
+
+
+def test_assignment_independent_of_other_links():
+    """A rerun with a different link set must still put each link in the same shard."""
+    full = split_into_shards(LINKS, 3)
+    partial = split_into_shards(LINKS[::2], 3)
+    for index, shard in enumerate(partial):
+        assert set(shard) <= set(full[index])
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="workers"):
+        run_sharded(workers=0, run_kwargs={})
+    with pytest.raises(ValueError, match="shard"):
+        run_sharded(workers=2, run_kwargs={}, shard=2)
+
+
+def test_explicit_links_are_sharded_and_merged(fake_processes):
+    run_scraper = AsyncMock(side_effect=_fake_run_scraper)
+    with patch("oddsharvester.core.sharding.run_scraper", run_scraper):
+        result = run_sharded(workers=3, run_kwargs={"command": "scrape_upcoming", "match_links": LINKS})
+
+    assert result.stats.successful == len(LINKS)
+    assert len(result.success) == len(LINKS)
+    shard_calls = [c.kwargs["match_links"] for c in run_scraper.call_args_list]
+    assert sorted(link for links in shard_calls for link in links) == sorted(LINKS)
+    assert all(not c.kwargs.get("links_only") for c in run_scraper.call_args_list)
+
+
+def test_historic_collects_links_then_stamps_season(fake_processes):
+    run_scraper = AsyncMock(side_effect=_fake_run_scraper)
+    with patch("oddsharvester.core.sharding.run_scraper", run_scraper):
+        result = run_sharded(workers=2, run_kwargs={"command": "scrape_historic", "match_links": None})
+
+    assert run_scraper.call_args_list[0].kwargs["links_only"] is True
+    assert result.stats.successful == len(LINKS)
+    assert {row["season"] for row in result.success} == {"2023-2024", "2024-2025"}
+    # Each call covers a single season, so the stamp is never a guess.
+    for call in run_scraper.call_args_list[1:]:
+        indexes = {LINKS.index(link) % 2 for link in call.kwargs["match_links"]}
+        assert len(indexes) == 1
+    # The listing failure from the collection pass is kept.
+    assert [f.error_type for f in result.failed] == [ErrorType.LISTING_PAGE]
+
+
+def test_single_shard_runs_in_process_only_its_links():
+    run_scraper = AsyncMock(side_effect=_fake_run_scraper)
+    with (
+        patch("oddsharvester.core.sharding.run_scraper", run_scraper),
+        patch("oddsharvester.core.sharding.ProcessPoolExecutor") as executor,
+    ):
+        result = run_sharded(workers=4, run_kwargs={"command": "scrape_upcoming", "match_links": LINKS}, shard=1)
+
+    executor.assert_not_called()
+    expected = split_into_shards(LINKS, 4)[1]
+    assert run_scraper.call_args.kwargs["match_links"] == expected
+    assert result.stats.successful == len(expected)
+
+
+def test_no_links_returns_collection_result_without_pool():
+    async def no_links(**kwargs):
+        failed = [FailedUrl(url="listing#/page/2", error_type=ErrorType.LISTING_PAGE, error_message="x")]
+        return ScrapeResult(failed=failed, stats=ScrapeStats(failed=1))
+
+    with (
+        patch("oddsharvester.core.sharding.run_scraper", AsyncMock(side_effect=no_links)),
+        patch("oddsharvester.core.sharding.ProcessPoolExecutor") as executor,
+    ):
+        result = run_sharded(workers=4, run_kwargs={"command": "scrape_historic", "match_links": None})
+
+    executor.assert_not_called()
+    assert result.success == []
+    assert [f.error_type for f in result.failed] == [ErrorType.LISTING_PAGE]
+
+
+def test_shards_split_the_parsing_pool_budget(fake_processes, monkeypatch):
+    monkeypatch.setattr("oddsharvester.core.sharding.os.cpu_count", lambda: 8)
+    assert shard_parse_workers(3) == 2
+    assert shard_parse_workers(16) == 1
+
+    seen = []
+
+    async def record_budget(**kwargs):
+        seen.append(os.environ[PARSE_WORKERS_ENV_VAR])
+        return _result_for(kwargs["match_links"], kwargs["record_sink"])
+
+    with patch("oddsharvester.core.sharding.run_scraper", AsyncMock(side_effect=record_budget)):
+        run_sharded(workers=4, run_kwargs={"command": "scrape_upcoming", "match_links": LINKS})
+    assert set(seen) == {"2"}
+
+    monkeypatch.setenv(PARSE_WORKERS_ENV_VAR, "3")
+    assert shard_parse_workers(4) is None
+
+
+def test_records_go_to_sink_not_result(fake_processes):
+    sink_rows = []
+    run_scraper = AsyncMock(side_effect=_fake_run_scraper)
+    with patch("oddsharvester.core.sharding.run_scraper", run_scraper):
+        result = run_sharded(
+            workers=2,
+            run_kwargs={"command": "scrape_historic", "match_links": None},
+            record_sink=sink_rows.append,
+        )
+
+    # Shards stream their records instead of returning them.
+    assert all(c.kwargs["record_sink"] is not None for c in run_scraper.call_args_list[1:])
+    assert sorted(row["match_link"] for row in sink_rows) == sorted(LINKS)
+    assert {row["season"] for row in sink_rows} == {"2023-2024", "2024-2025"}
+    assert result.success == []
+    assert result.stats.successful == len(LINKS)
+
+
+def test_crashed_shard_keeps_streamed_records(fake_processes):
+    """Records scraped before a shard crashes are already in the sink and are not reported as failed."""
+    shard0 = split_into_shards(LINKS, 2)[0]
+
+    async def crash_midway(**kwargs):
+        links = kwargs["match_links"]
+        if links[0] in shard0:
+            _result_for(links[:3], kwargs["record_sink"])
+            raise RuntimeError("browser died")
+        return _result_for(links, kwargs["record_sink"])
+
+    sink_rows = []
+    with patch("oddsharvester.core.sharding.run_scraper", AsyncMock(side_effect=crash_midway)):
+        result = run_sharded(
+            workers=2,
+            run_kwargs={"command": "scrape_upcoming", "match_links": LINKS},
+            record_sink=sink_rows.append,
+        )
+
+    assert len(sink_rows) == len(LINKS) - len(shard0) + 3
+    assert sorted(f.url for f in result.failed) == sorted(shard0[3:])
+    assert result.stats.successful == len(sink_rows)
+    assert result.stats.total_urls == len(LINKS)
+
+
+def test_failed_shard_reported_per_link(fake_processes):
+    async def flaky(**kwargs):
+        if shard_for(kwargs["match_links"][0], 2) == 0:
+            return None
+        return _result_for(kwargs["match_links"], kwargs["record_sink"])
+
+    with patch("oddsharvester.core.sharding.run_scraper", AsyncMock(side_effect=flaky)):
+        result = run_sharded(workers=2, run_kwargs={"command": "scrape_upcoming", "match_links": LINKS})
+
+    shard0 = split_into_shards(LINKS, 2)[0]
+    assert sorted(f.url for f in result.failed) == sorted(shard0)
+    assert all("Shard 0 failed" in f.error_message for f in result.failed)
+    assert result.stats.total_urls == len(LINKS)
@@ -3,7 +3,8 @@ from unittest.mock import AsyncMock
 from bs4 import BeautifulSoup
 import pytest
 
-from oddsharvester.core.market_extraction.submarket_extractor import SubmarketExtractor
+from oddsharvester.core.market_extraction.submarket_extractor import SubmarketExtractor, parse_visible_submarkets
+from oddsharvester.core.parser_backend import BS4_BACKEND, LXML_BACKEND
 
 # =============================================================================
 # HTML FIXTURES — realistic HTML mimicking OddsPortal structure
@@ -591,3 +592,30 @@ class TestExtractVisibleSubmarketsPassiveHTML:
         )
 
         assert result == []
+
+
+class TestParseVisibleSubmarketsLxmlBackend:
+    """The lxml backend reads the same submarkets as BeautifulSoup."""
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            MULTI_SUBMARKET_PAGE_HTML,
+            SINGLE_SUBMARKET_PAGE_HTML,
+            NO_ODDS_PAGE_HTML,
+            EMPTY_PAGE_HTML,
+            EXTRA_ODDS_HTML,
+            CORRECT_SCORE_PAGE_HTML,
+            f"<html><body>{NO_NAME_ROW_HTML}{OVER_UNDER_FALLBACK_P_HTML}{HANDICAP_FLEX_HTML}</body></html>",
+            f"<html><body>{HANDICAP_FLEX_FALLBACK_HTML}{FONT_BOLD_HTML}{CORRECT_SCORE_HTML}</body></html>",
+            "",
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("main_market", "odds_labels"),
+        [("Over/Under", None), ("Correct Score", None), ("Asian Handicap", ["handicap_team_1", "handicap_team_2"])],
+    )
+    def test_same_result_as_bs4(self, html, main_market, odds_labels):
+        expected = parse_visible_submarkets(html, main_market, "FullTime", odds_labels, BS4_BACKEND)
+
+        assert parse_visible_submarkets(html, main_market, "FullTime", odds_labels, LXML_BACKEND) == expected
@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+
+from oddsharvester.core.worker_pool import WorkerPool, WorkerPoolStats
+
+
+async def _collect(pool, items):
+    return [result async for result in pool.run(items)]
+
+
+@pytest.mark.asyncio
+async def test_runs_every_item():
+    async def double(x):
+        return x * 2
+
+    pool = WorkerPool(double, workers=3)
+    results = await _collect(pool, range(10))
+
+    assert sorted(results) == [x * 2 for x in range(10)]
+    assert pool.processed == 10
+    assert pool.in_flight == 0
+    assert pool.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_input():
+    async def handler(x):
+        return x
+
+    assert await _collect(WorkerPool(handler, workers=2), []) == []
+
+
+def test_rejects_zero_workers():
+    async def handler(x):
+        return x
+
+    with pytest.raises(ValueError, match="at least one worker"):
+        WorkerPool(handler, workers=0)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_never_exceeds_worker_count():
+    active = 0
+    peak = 0
+
+    async def handler(x):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return x
+
+    await _collect(WorkerPool(handler, workers=3), range(20))
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_input_is_consumed_lazily():
+    """The producer must stop at the queue bound instead of draining the whole input up front."""
+    pulled = 0
+    release = asyncio.Event()
+
+    def items():
+        nonlocal pulled
+        for i in range(1000):
+            pulled += 1
+            yield i
+
+    async def handler(x):
+        await release.wait()
+        return x
+
+    pool = WorkerPool(handler, workers=2, queue_size=4)
+    stream = pool.run(items())
+    first = asyncio.ensure_future(anext(stream))
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # 2 held by workers + 4 queued + 1 blocked on put.
+    assert pulled <= 7
+    assert pool.in_flight == 2
+    assert pool.queue_depth == 4
+
+    release.set()
+    await first
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_set_limit_caps_active_workers():
+    active = 0
+    peak = 0
+
+    async def handler(x):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return x
+
+    pool = WorkerPool(handler, workers=4)
+    pool.set_limit(2)
+    results = await _collect(pool, range(12))
+
+    assert sorted(results) == list(range(12))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_raising_limit_wakes_parked_workers():
+    active = 0
+    peak = 0
+
+    async def handler(x):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return x
+
+    pool = WorkerPool(handler, workers=3)
+    pool.set_limit(1)
+    seen = []
+    async for result in pool.run(range(12)):
+        seen.append(result)
+        if len(seen) == 2:
+            pool.set_limit(3)
+
+    assert len(seen) == 12
+    assert peak == 3
+
+
+def test_set_limit_is_clamped():
+    async def handler(x):
+        return x
+
+    pool = WorkerPool(handler, workers=3)
+    pool.set_limit(0)
+    assert pool.limit == 1
+    pool.set_limit(10)
+    assert pool.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_handler_error_is_raised():
+    async def handler(x):
+        if x == 3:
+            raise RuntimeError("boom")
+        return x
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await _collect(WorkerPool(handler, workers=2), range(10))
+
+
+@pytest.mark.asyncio
+async def test_input_error_is_raised():
+    def items():
+        yield 1
+        raise RuntimeError("bad input")
+
+    async def handler(x):
+        return x
+
+    with pytest.raises(RuntimeError, match="bad input"):
+        await _collect(WorkerPool(handler, workers=2), items())
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_workers():
+    cancelled = 0
+
+    async def handler(x):
+        nonlocal cancelled
+        if x == 0:
+            return x
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    stream = WorkerPool(handler, workers=3).run(range(3))
+    assert await anext(stream) == 0
+    await stream.aclose()
+
+    assert cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_stats_report_utilisation():
+    async def handler(x):
+        await asyncio.sleep(0.01)
+        return x
+
+    pool = WorkerPool(handler, workers=2)
+    await _collect(pool, range(4))
+    stats = pool.stats()
+
+    assert stats.workers == 2
+    assert stats.processed == 4
+    assert len(stats.utilisation) == 2
+    assert all(0 < u <= 1 for u in stats.utilisation)
+    assert stats.to_dict()["processed"] == 4
+
+
+def test_stats_utilisation_zero_elapsed():
+    stats = WorkerPoolStats(
+        workers=2, limit=2, queue_depth=0, in_flight=0, processed=0, elapsed_s=0.0, busy_s=[0.0, 0.0]
+    )
+    assert stats.utilisation == [0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_async_iterable_input():
+    async def source():
+        for x in range(5):
+            await asyncio.sleep(0)
+            yield x
+
+    async def handler(x):
+        return x + 1
+
+    assert sorted(await _collect(WorkerPool(handler, workers=2), source())) == [1, 2, 3, 4, 5]
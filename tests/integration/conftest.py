@@ -40,6 +40,7 @@ def run_scraper():
         timeout: int = 300,
         har_path: Path | None = None,
         local_kickoff: bool = False,
+        block_resources: str | None = None,
     ) -> tuple[int, str, str]:
         cmd = [
             "uv",
@@ -66,6 +67,9 @@ def run_scraper():
         if local_kickoff:
             cmd.append("--local-kickoff")
 
+        if block_resources:
+            cmd.extend(["--block-resources", block_resources])
+
         if period:
             cmd.extend(["--period", period])
 
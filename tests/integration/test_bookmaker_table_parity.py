@@ -0,0 +1,50 @@
+"""Parity of the in-page bookmaker table extraction with the HTML parser, on the captured HARs.
+
+Each match fixture with a sibling HAR is replayed offline; on the rendered match page the rows
+read by `BookmakerTableExtractor` must equal the rows `OddsParser` parses from `page.content()`.
+"""
+
+import json
+
+import pytest
+
+from oddsharvester.core.browser.readiness import PageReadiness
+from oddsharvester.core.market_extraction import BookmakerTableExtractor, OddsParser
+from oddsharvester.core.playwright_manager import HAR_REPLAY_ENV_VAR, PlaywrightManager
+from oddsharvester.utils.constants import DYNAMIC_CONTENT_WAIT_MS
+from tests.integration.conftest import FIXTURES_DIR
+
+
+def _match_hars() -> list:
+    params = []
+    for metadata_path in sorted(FIXTURES_DIR.glob("*/*/*/metadata.json")):
+        metadata = json.loads(metadata_path.read_text())
+        for har_path in sorted(metadata_path.parent.glob("*.har")):
+            params.append(pytest.param(har_path, metadata, id=f"{metadata_path.parent.name}/{har_path.stem}"))
+    return params
+
+
+MATCH_HARS = _match_hars()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.skipif(not MATCH_HARS, reason="No match HARs captured")
+@pytest.mark.parametrize(("har_path", "metadata"), MATCH_HARS or [pytest.param(None, None, id="none")])
+async def test_in_page_rows_match_parsed_html(har_path, metadata, monkeypatch):
+    monkeypatch.setenv(HAR_REPLAY_ENV_VAR, str(har_path))
+    manager = PlaywrightManager()
+    await manager.initialize(headless=True, timezone_id="UTC")
+    try:
+        page = manager.page
+        await page.goto(metadata["match_url"], wait_until="domcontentloaded")
+        await PageReadiness().odds_rendered(page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
+
+        in_page = await BookmakerTableExtractor().read_rows(page)
+        parsed = OddsParser().parse_bookmaker_rows(await page.content())
+    finally:
+        await manager.cleanup()
+
+    assert in_page is not None, "in-page extraction script failed"
+    assert parsed, "no bookmaker rows parsed from the HAR"
+    assert in_page["rows"] == parsed
@@ -0,0 +1,104 @@
+"""Parity of the lxml parser backend with BeautifulSoup, on every captured page.
+
+Both backends must return the same data from the hot parsers (bookmaker rows, passive
+submarkets, match event header) for each HTML body recorded in the fixture HARs, for the
+committed rendered match pages under tests/data/match and, where a match HAR exists, for the
+rendered match page it replays. The recorded HAR bodies are server-rendered shells without
+odds rows, so each parser must also find data in at least one of the pages compared.
+"""
+
+import json
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from oddsharvester.core.base_scraper import _parse_event_header_html
+from oddsharvester.core.browser.readiness import PageReadiness
+from oddsharvester.core.market_extraction import OddsParser
+from oddsharvester.core.market_extraction.submarket_extractor import parse_visible_submarkets
+from oddsharvester.core.parser_backend import BS4_BACKEND, LXML_BACKEND
+from oddsharvester.core.playwright_manager import HAR_REPLAY_ENV_VAR, PlaywrightManager
+from oddsharvester.utils.constants import DYNAMIC_CONTENT_WAIT_MS
+from tests.integration.conftest import FIXTURES_DIR
+
+
+def _har_html_bodies() -> list:
+    params = []
+    for har_path in sorted(FIXTURES_DIR.rglob("*.har")):
+        entries = json.loads(har_path.read_text(encoding="utf-8"))["log"]["entries"]
+        for index, entry in enumerate(entries):
+            content = entry["response"].get("content", {})
+            if "html" in content.get("mimeType", "") and content.get("text") and content.get("encoding") != "base64":
+                params.append(pytest.param(content["text"], id=f"{har_path.relative_to(FIXTURES_DIR)}#{index}"))
+    return params
+
+
+def _match_hars() -> list:
+    params = []
+    for metadata_path in sorted(FIXTURES_DIR.glob("*/*/*/metadata.json")):
+        metadata = json.loads(metadata_path.read_text())
+        for har_path in sorted(metadata_path.parent.glob("*.har")):
+            params.append(pytest.param(har_path, metadata, id=f"{metadata_path.parent.name}/{har_path.stem}"))
+    return params
+
+
+RENDERED_MATCH_PAGES = sorted((Path(__file__).parents[1] / "data" / "match").glob("match_*.html"))
+
+
+def _recorded_pages() -> list:
+    return _har_html_bodies() + [
+        pytest.param(path.read_text(encoding="utf-8"), id=f"data/match/{path.name}") for path in RENDERED_MATCH_PAGES
+    ]
+
+
+RECORDED_PAGES = _recorded_pages()
+MATCH_HARS = _match_hars()
+
+
+def _parse_with(html: str, backend: str) -> tuple:
+    return (
+        OddsParser(backend).parse_bookmaker_rows(html),
+        OddsParser(backend).parse_market_odds(html, "FullTime", ["1", "X", "2"]),
+        parse_visible_submarkets(html, "Over/Under", "FullTime", None, backend),
+        parse_visible_submarkets(html, "Correct Score", "FullTime", None, backend),
+        _parse_event_header_html(html, ZoneInfo("Europe/Paris"), backend),
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("html", RECORDED_PAGES)
+def test_lxml_backend_matches_bs4_on_recorded_pages(html):
+    assert _parse_with(html, LXML_BACKEND) == _parse_with(html, BS4_BACKEND)
+
+
+@pytest.mark.integration
+def test_recorded_pages_exercise_every_hot_parser():
+    """Parity on empty results proves nothing: each parser must find data in some page."""
+    parsed = [_parse_with(param.values[0], BS4_BACKEND) for param in RECORDED_PAGES]
+    names = ["bookmaker rows", "1X2 odds", "Over/Under submarkets", "Correct Score submarkets", "event header"]
+    for index, name in enumerate(names):
+        outputs = [result[index] for result in parsed]
+        if name == "event header":
+            outputs = [output for output in outputs if "error" not in output]
+        assert any(outputs), f"no recorded page yields {name}"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.skipif(not MATCH_HARS, reason="No match HARs captured")
+@pytest.mark.parametrize(("har_path", "metadata"), MATCH_HARS or [pytest.param(None, None, id="none")])
+async def test_lxml_backend_matches_bs4_on_rendered_match_pages(har_path, metadata, monkeypatch):
+    monkeypatch.setenv(HAR_REPLAY_ENV_VAR, str(har_path))
+    manager = PlaywrightManager()
+    await manager.initialize(headless=True, timezone_id="UTC")
+    try:
+        await manager.page.goto(metadata["match_url"], wait_until="domcontentloaded")
+        await PageReadiness().odds_rendered(manager.page, timeout_ms=DYNAMIC_CONTENT_WAIT_MS)
+        html = await manager.page.content()
+    finally:
+        await manager.cleanup()
+
+    parsed = _parse_with(html, BS4_BACKEND)
+    assert parsed[0], "no bookmaker rows parsed from the HAR"
+    assert _parse_with(html, LXML_BACKEND) == parsed
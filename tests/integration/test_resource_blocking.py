@@ -0,0 +1,74 @@
+"""Parity of the network blocking profiles against the captured HARs.
+
+Every fixture must scrape to the same record whatever `--block-resources` drops:
+the profiles only abort requests the scraper never reads (images, fonts, media,
+third-party hosts; for `minimal`, everything but first-party documents, scripts,
+stylesheets and XHR). HARs are recorded with blocking disabled, so one capture
+replays under every profile.
+"""
+
+import json
+
+import pytest
+
+from tests.integration.helpers.comparison import compare_match_data
+
+PARITY_MATCHES = [
+    {
+        "sport": "football",
+        "league": "premier-league",
+        "match_id": "leicester-brentford-xQ77QTN0",
+        "url": "https://www.oddsportal.com/football/england/premier-league/leicester-brentford-xQ77QTN0",
+        "markets": ["1x2"],
+        "period": "full_time",
+        "fixture_name": "1x2_full_time_all.json",
+    },
+    {
+        "sport": "football",
+        "league": "laliga",
+        "match_id": "leganes-Mi0rXQg7",
+        "url": "https://www.oddsportal.com/football/h2h/barcelona-SKbpVP5K/leganes-Mi0rXQg7/#hYV97ShC",
+        "markets": ["1x2"],
+        "period": "full_time",
+        "fixture_name": "1x2_full_time_all.json",
+    },
+]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("profile", ["balanced", "minimal"])
+@pytest.mark.parametrize("match", PARITY_MATCHES, ids=lambda m: m["match_id"])
+def test_blocking_profile_keeps_every_field(
+    match,
+    profile,
+    run_scraper,
+    load_fixture,
+    har_for_match,
+    temp_output_dir,
+    monkeypatch,
+):
+    monkeypatch.setenv("OH_TIMEZONE", "UTC")
+    har_path = har_for_match(match["sport"], match["league"], match["match_id"], match["fixture_name"])
+    if har_path is None:
+        pytest.skip(f"No HAR captured for {match['match_id']}")
+
+    output_path = temp_output_dir / "output"
+    exit_code, _stdout, stderr = run_scraper(
+        sport=match["sport"],
+        match_link=match["url"],
+        markets=match["markets"],
+        output_path=output_path,
+        period=match["period"],
+        har_path=har_path,
+        block_resources=profile,
+    )
+
+    assert exit_code == 0, f"Scraper failed with --block-resources {profile}: {stderr}"
+    assert "requests blocked" in stderr
+
+    with open(f"{output_path}.json") as f:
+        actual = json.load(f)
+    expected = load_fixture(match["sport"], match["league"], match["match_id"], match["fixture_name"])
+
+    result = compare_match_data(actual[0], expected[0])
+    assert result.passed, str(result)
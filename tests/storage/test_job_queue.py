@@ -0,0 +1,142 @@
+import pytest
+
+from oddsharvester.storage.job_queue import JobQueue
+
+LINKS = [f"https://www.oddsportal.com/football/england/premier-league/match-{i}/" for i in range(5)]
+CONFIG = {"command": "scrape_historic", "sport": "football", "markets": ["1x2"]}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    q = JobQueue(str(tmp_path / "queue" / "jobs.db"), max_attempts=2, clock=clock)
+    yield q
+    q.close()
+
+
+def test_enqueue_skips_duplicates(queue):
+    assert queue.enqueue(LINKS, CONFIG) == 5
+    assert queue.enqueue([*LINKS, "https://www.oddsportal.com/new/"], CONFIG) == 1
+    assert queue.counts() == {"pending": 6, "leased": 0, "done": 0, "failed": 0}
+
+
+def test_same_link_with_other_config_is_a_new_job(queue):
+    queue.enqueue(LINKS[:1], CONFIG)
+    assert queue.enqueue(LINKS[:1], {**CONFIG, "markets": ["btts"]}) == 1
+
+
+def test_claim_leases_jobs_with_config_and_season(queue):
+    queue.enqueue(LINKS, CONFIG, season_by_link={LINKS[0]: "2023-2024"})
+
+    jobs = queue.claim("w1", limit=2)
+
+    assert [j.link for j in jobs] == LINKS[:2]
+    assert jobs[0].config == CONFIG
+    assert jobs[0].season == "2023-2024"
+    assert jobs[1].season is None
+    assert jobs[0].attempts == 1
+    assert queue.counts()["leased"] == 2
+
+
+def test_leased_jobs_are_not_claimed_twice(queue):
+    queue.enqueue(LINKS, CONFIG)
+    first = queue.claim("w1", limit=3)
+    second = queue.claim("w2", limit=10)
+    assert {j.id for j in first}.isdisjoint(j.id for j in second)
+    assert len(second) == 2
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    queue.enqueue(LINKS[:1], CONFIG)
+    (job,) = queue.claim("w1", limit=1, visibility_timeout_s=60)
+
+    clock.now += 30
+    assert queue.claim("w2", limit=1, visibility_timeout_s=60) == []
+
+    clock.now += 31
+    (reclaimed,) = queue.claim("w2", limit=1, visibility_timeout_s=60)
+    assert reclaimed.id == job.id
+    assert reclaimed.attempts == 2
+    # The crashed worker's late ack does not override the new owner.
+    assert queue.ack("w1", [job.id]) == 0
+    assert queue.ack("w2", [job.id]) == 1
+
+
+def test_job_whose_lease_keeps_expiring_is_given_up(queue, clock):
+    """A link that kills or stalls every worker that claims it is not reclaimed forever."""
+    queue.enqueue(LINKS[:2], CONFIG)
+    queue.claim("w1", limit=1, visibility_timeout_s=60)
+    clock.now += 61
+    (job,) = queue.claim("w2", limit=1, visibility_timeout_s=60)
+    assert job.attempts == queue.max_attempts
+
+    clock.now += 61
+    (other,) = queue.claim("w3", limit=1, visibility_timeout_s=60)
+
+    assert other.link == LINKS[1]
+    assert queue.counts()["failed"] == 1
+    assert queue.failed_jobs() == [{"link": LINKS[0], "attempts": 2, "last_error": "lease expired"}]
+    # The stalled worker's late ack does not resurrect the job.
+    assert queue.ack("w2", [job.id]) == 0
+
+
+def test_renew_keeps_the_lease(queue, clock):
+    queue.enqueue(LINKS[:1], CONFIG)
+    (job,) = queue.claim("w1", limit=1, visibility_timeout_s=60)
+
+    clock.now += 50
+    assert queue.renew("w1", [job.id], visibility_timeout_s=60) == 1
+    clock.now += 50
+    assert queue.claim("w2", limit=1, visibility_timeout_s=60) == []
+
+
+def test_ack_marks_done(queue):
+    queue.enqueue(LINKS, CONFIG)
+    jobs = queue.claim("w1", limit=5)
+    assert queue.ack("w1", [j.id for j in jobs]) == 5
+    assert queue.counts()["done"] == 5
+    assert not queue.has_unfinished()
+
+
+def test_retryable_failure_returns_to_pending_until_max_attempts(queue):
+    queue.enqueue(LINKS[:1], CONFIG)
+
+    (job,) = queue.claim("w1", limit=1)
+    assert queue.fail("w1", job, "timeout", retryable=True) == "pending"
+
+    (job,) = queue.claim("w1", limit=1)
+    assert queue.fail("w1", job, "timeout again", retryable=True) == "failed"
+
+    assert queue.counts()["failed"] == 1
+    assert queue.failed_jobs() == [{"link": LINKS[0], "attempts": 2, "last_error": "timeout again"}]
+
+
+def test_non_retryable_failure_is_final(queue):
+    queue.enqueue(LINKS[:1], CONFIG)
+    (job,) = queue.claim("w1", limit=1)
+    assert queue.fail("w1", job, "parse error", retryable=False) == "failed"
+
+
+def test_queue_is_shared_between_connections(tmp_path, clock):
+    path = str(tmp_path / "jobs.db")
+    producer = JobQueue(path, clock=clock)
+    consumer = JobQueue(path, clock=clock)
+    try:
+        producer.enqueue(LINKS, CONFIG)
+        assert len(consumer.claim("w1", limit=10)) == 5
+        assert producer.counts()["leased"] == 5
+    finally:
+        producer.close()
+        consumer.close()
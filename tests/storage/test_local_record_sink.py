@@ -0,0 +1,112 @@
+import csv
+import json
+import os
+
+import pytest
+
+from oddsharvester.storage.local_data_storage import LocalDataStorage
+from oddsharvester.storage.local_record_sink import LocalRecordSink
+
+
+@pytest.fixture
+def sample_data():
+    return [{"team": "Team A", "odds": 2.5}, {"team": "Team B", "odds": 1.8}]
+
+
+def test_invalid_format_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Invalid storage format"):
+        LocalRecordSink(file_path=str(tmp_path / "out"), storage_format="xml")
+
+
+def test_extension_added(tmp_path):
+    sink = LocalRecordSink(file_path=str(tmp_path / "out"), storage_format="csv")
+    assert sink.file_path.endswith("out.csv")
+    assert sink.spool_path.endswith("out.csv.partial.jsonl")
+
+
+def test_write_rejects_non_dict(tmp_path):
+    sink = LocalRecordSink(file_path=str(tmp_path / "out"))
+    with pytest.raises(ValueError, match="Record must be a dictionary"):
+        sink.write(["not", "a", "dict"])
+
+
+def test_close_without_records_leaves_target_untouched(tmp_path):
+    target = tmp_path / "out.json"
+    target.write_text('[{"kept": 1}]')
+
+    sink = LocalRecordSink(file_path=str(target))
+
+    assert sink.close() == 0
+    assert target.read_text() == '[{"kept": 1}]'
+    assert not os.path.exists(sink.spool_path)
+
+
+def test_records_hit_disk_before_close(tmp_path, sample_data):
+    """A crash mid-run must not lose what was already scraped."""
+    sink = LocalRecordSink(file_path=str(tmp_path / "out"))
+    for row in sample_data:
+        sink.write(row)
+
+    with open(sink.spool_path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == sample_data
+    sink.close()
+
+
+def test_json_matches_buffered_output(tmp_path, sample_data):
+    """The streamed file must be byte-identical to what the buffered path writes."""
+    sink = LocalRecordSink(file_path=str(tmp_path / "streamed"), storage_format="json")
+    for row in sample_data:
+        sink.write(row)
+    assert sink.close() == 2
+
+    LocalDataStorage().save_data(sample_data, file_path=str(tmp_path / "buffered"), storage_format="json")
+
+    assert (tmp_path / "streamed.json").read_text() == (tmp_path / "buffered.json").read_text()
+    assert not os.path.exists(sink.spool_path)
+
+
+def test_json_append_keeps_existing_rows(tmp_path, sample_data):
+    target = tmp_path / "out.json"
+    target.write_text(json.dumps([{"team": "Existing", "odds": 3.0}]))
+
+    sink = LocalRecordSink(file_path=str(target), storage_format="json", append=True)
+    for row in sample_data:
+        sink.write(row)
+    sink.close()
+
+    assert json.loads(target.read_text()) == [{"team": "Existing", "odds": 3.0}, *sample_data]
+
+
+def test_csv_header_is_union_of_keys(tmp_path):
+    """Line markets give matches different columns; the header must cover all of them (issue #78)."""
+    sink = LocalRecordSink(file_path=str(tmp_path / "out"), storage_format="csv")
+    sink.write({"team": "A", "odds": 2.5})
+    sink.write({"team": "B", "odds": 1.8, "line": "+1.5"})
+    sink.close()
+
+    with open(tmp_path / "out.csv", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == ["team", "odds", "line"]
+        rows = list(reader)
+    assert rows[0]["line"] == ""
+    assert rows[1]["line"] == "+1.5"
+
+
+def test_csv_append_skips_header_on_existing_file(tmp_path, sample_data):
+    target = tmp_path / "out.csv"
+    target.write_text("team,odds\nExisting,3.0\n")
+
+    sink = LocalRecordSink(file_path=str(target), storage_format="csv", append=True)
+    for row in sample_data:
+        sink.write(row)
+    sink.close()
+
+    assert target.read_text().splitlines() == ["team,odds", "Existing,3.0", "Team A,2.5", "Team B,1.8"]
+
+
+def test_creates_missing_directory(tmp_path, sample_data):
+    sink = LocalRecordSink(file_path=str(tmp_path / "nested" / "dir" / "out"), storage_format="json")
+    sink.write(sample_data[0])
+    sink.close()
+
+    assert json.loads((tmp_path / "nested" / "dir" / "out.json").read_text()) == [sample_data[0]]
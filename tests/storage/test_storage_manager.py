@@ -2,8 +2,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from oddsharvester.storage.local_record_sink import LocalRecordSink
 from oddsharvester.storage.storage_format import StorageFormat
-from oddsharvester.storage.storage_manager import store_data
+from oddsharvester.storage.storage_manager import open_record_sink, store_data
 from oddsharvester.storage.storage_type import StorageType
 
 
@@ -64,3 +65,15 @@ def test_store_data_exception_handling(sample_data, mock_storage):
 
         mock_logger.error.assert_called_once_with("Error during data storage: Storage error")
         assert result is False
+
+
+def test_open_record_sink_local():
+    sink = open_record_sink(StorageType.LOCAL.value, StorageFormat.CSV.value, "out", append=True)
+
+    assert isinstance(sink, LocalRecordSink)
+    assert sink.file_path == "out.csv"
+    assert sink.append is True
+
+
+def test_open_record_sink_remote_returns_none():
+    assert open_record_sink(StorageType.REMOTE.value, StorageFormat.JSON.value, "out") is None
@@ -1,10 +1,16 @@
 """Tests for the ProxyManager class."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
-from oddsharvester.utils.proxy_manager import PROXY_CONSECUTIVE_FAILURE_THRESHOLD, ProxyEntry, ProxyManager
+from oddsharvester.utils.proxy_manager import (
+    PROXY_CONSECUTIVE_FAILURE_THRESHOLD,
+    ProxyEntry,
+    ProxyManager,
+    TokenBucket,
+)
 
 
 class TestProxyManagerBasics:
@@ -236,3 +242,111 @@ class TestMultiProxyPool:
         entry = ProxyEntry(key="k", config=None)
         assert entry.consecutive_failures == 0
         assert entry.blacklisted is False
+
+
+class TestTokenBucket:
+    """Test per-lane request pacing."""
+
+    def test_starts_full(self):
+        bucket = TokenBucket(interval_s=2.0, updated_at=100.0)
+        assert bucket.wait_time(100.0) == 0.0
+
+    def test_wait_after_take(self):
+        bucket = TokenBucket(interval_s=2.0, updated_at=100.0)
+        bucket.take(100.0)
+        assert bucket.wait_time(100.0) == pytest.approx(2.0)
+        assert bucket.wait_time(101.5) == pytest.approx(0.5)
+        assert bucket.wait_time(102.0) == 0.0
+
+    def test_jitter_cost_pushes_next_token_out(self):
+        bucket = TokenBucket(interval_s=2.0, updated_at=100.0)
+        bucket.take(100.0, cost=1.5)
+        assert bucket.wait_time(100.0) == pytest.approx(3.0)
+
+    def test_refill_capped_at_capacity(self):
+        bucket = TokenBucket(interval_s=1.0, capacity=2, tokens=0, updated_at=0.0)
+        bucket.wait_time(100.0)
+        assert bucket.tokens == 2
+
+    def test_zero_interval_never_waits(self):
+        bucket = TokenBucket(interval_s=0.0)
+        for _ in range(5):
+            bucket.take(0.0)
+        assert bucket.wait_time(0.0) == 0.0
+
+
+class TestProxyLanes:
+    """Test per-proxy concurrency lanes."""
+
+    URLS = ("http://a.example.com:1", "http://b.example.com:2")
+
+    def test_configure_lanes_sets_limits(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.configure_lanes(per_proxy_concurrency=3, request_delay=1.5)
+        for entry in pm.entries:
+            assert entry.max_in_flight == 3
+            assert entry.bucket.interval_s == pytest.approx(0.5)
+            assert entry.bucket.capacity == 3
+
+    def test_configure_lanes_zero_delay_has_no_bucket(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.configure_lanes(per_proxy_concurrency=2, request_delay=0)
+        assert all(entry.bucket is None for entry in pm.entries)
+
+    @pytest.mark.asyncio
+    async def test_acquire_spreads_across_lanes(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.configure_lanes(per_proxy_concurrency=1, request_delay=0)
+
+        first = await pm.acquire_lane()
+        second = await pm.acquire_lane()
+
+        assert {first.key, second.key} == set(self.URLS)
+        assert all(entry.in_flight == 1 for entry in pm.entries)
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_release_when_lanes_full(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.configure_lanes(per_proxy_concurrency=1, request_delay=0)
+        await pm.acquire_lane()
+        held = await pm.acquire_lane()
+
+        waiter = asyncio.ensure_future(pm.acquire_lane())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        pm.release_lane(held.key)
+        entry = await asyncio.wait_for(waiter, timeout=1)
+        assert entry.key == held.key
+
+    @pytest.mark.asyncio
+    async def test_busy_lane_does_not_block_others(self):
+        """A lane out of tokens is skipped; work goes to the lane that can take it."""
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.configure_lanes(per_proxy_concurrency=1, request_delay=60)
+        pm.entries[0].bucket.tokens = 0
+
+        entry = await asyncio.wait_for(pm.acquire_lane(), timeout=1)
+
+        assert entry.key == self.URLS[1]
+
+    @pytest.mark.asyncio
+    async def test_acquire_skips_blacklisted(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.blacklist_proxy(self.URLS[0])
+        for _ in range(3):
+            entry = await pm.acquire_lane()
+            assert entry.key == self.URLS[1]
+        assert pm.healthy_lane_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_none_when_all_blacklisted(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        for key in self.URLS:
+            pm.blacklist_proxy(key)
+        assert await pm.acquire_lane() is None
+
+    def test_release_never_goes_negative(self):
+        pm = ProxyManager(proxy_urls=list(self.URLS))
+        pm.release_lane(self.URLS[0])
+        assert pm.entries[0].in_flight == 0